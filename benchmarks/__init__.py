@@ -0,0 +1,14 @@
+"""Load and latency benchmarks for the tool surface.
+
+Everything here speaks one trace format — the JSONL lines the server's
+opt-in recorder writes (``openzim_mcp/call_trace.py``, enabled by
+``OPENZIM_MCP_CALL_TRACE_PATH``):
+
+* ``workloads.py`` generates synthetic traces from an archive (a skewed
+  mix of reads, searches, link lookups and ``zim_query`` calls);
+* ``replay.py`` drives a trace — synthetic or recorded in production —
+  through a real server at a chosen concurrency and reports latency
+  percentiles, throughput and cache hit rates;
+* ``test_workloads.py`` runs the synthetic workloads under
+  ``pytest-benchmark`` (``make benchmark``) against the test ZIMs.
+"""
@@ -0,0 +1,52 @@
+"""Archives for the benchmark suite.
+
+The downloaded ZIM testing suite (``make download-test-data``) is used when
+present, so numbers are taken on real content; otherwise a small generated
+archive stands in, which keeps ``make benchmark`` runnable on a fresh
+checkout.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from libzim.writer import Creator  # type: ignore[import-untyped]
+
+from tests.conftest_v2_fixtures import _HtmlItem
+
+_SUITE = Path(__file__).parent.parent / "test_data" / "zim-testing-suite"
+
+
+def _generated_archive(directory: Path) -> Path:
+    zim = directory / "benchmark.zim"
+    with Creator(zim).config_indexing(True, "eng") as creator:
+        for i in range(200):
+            sections = "".join(
+                f"<h2>Part {s}</h2><p>Topic {i} part {s} text. "
+                f'<a href="Topic_{(i * 7 + s) % 200}">related</a></p>'
+                for s in range(6)
+            )
+            creator.add_item(
+                _HtmlItem(
+                    f"Topic_{i}",
+                    f"Topic {i}",
+                    f"<html><body><p>Topic {i} lead.</p>{sections}</body></html>",
+                )
+            )
+        creator.set_mainpath("Topic_0")
+    return zim
+
+
+@pytest.fixture(scope="session")
+def bench_archive(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """The archive every benchmark samples its workload from."""
+    suite = Path(os.environ.get("ZIM_TEST_DATA_DIR") or _SUITE)
+    for candidate in (
+        suite / "withns" / "wikipedia_en_climate_change_mini_2024-06.zim",
+        suite / "withns" / "small.zim",
+    ):
+        if candidate.is_file():
+            return candidate
+    return _generated_archive(tmp_path_factory.mktemp("bench"))
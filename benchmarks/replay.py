@@ -0,0 +1,264 @@
+"""Replay a tool-call trace against a real server and report its latency.
+
+Each record is dispatched through ``server.mcp.call_tool`` — the seam the
+recorder timed it at — so the advanced tools run through their
+``AsyncZimOperations`` wrappers and ``zim_query`` through
+``SimpleToolsHandler``, exactly as a client's call would. ``concurrency``
+workers pull records off the trace in order; the report gives latency
+percentiles overall and per tool, throughput, and the response-cache hit
+rate the trace produced.
+
+    python -m benchmarks.replay trace.jsonl --zim-dir test_data/zim-testing-suite \\
+        --concurrency 16 --repeat 2
+
+Archive arguments in a trace are file names (the recorder drops their
+directories); they are resolved against ``--zim-dir``, searched
+recursively. The server is built from the usual ``OPENZIM_MCP_*``
+environment, with the advanced tool surface and rate limiting off so the
+limiter does not end up being what is measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from openzim_mcp.call_trace import tally_cache_lookups
+from openzim_mcp.config import LoggingConfig, OpenZimMcpConfig
+from openzim_mcp.rate_limiter import RateLimitConfig
+from openzim_mcp.server import OpenZimMcpServer
+
+__all__ = [
+    "CallOutcome",
+    "ReplayReport",
+    "build_server",
+    "format_report",
+    "load_trace",
+    "percentile",
+    "replay",
+    "resolve_archives",
+]
+
+
+@dataclass
+class CallOutcome:
+    """One replayed call."""
+
+    tool: str
+    latency_ms: float
+    ok: bool
+    cache_hits: int
+    cache_misses: int
+
+
+@dataclass
+class ReplayReport:
+    """Every outcome of one replay, plus the wall time it took."""
+
+    concurrency: int
+    wall_seconds: float
+    outcomes: List[CallOutcome] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        """Percentiles, throughput and hit rates as a JSON-able dict."""
+        hits = sum(o.cache_hits for o in self.outcomes)
+        misses = sum(o.cache_misses for o in self.outcomes)
+        tools: Dict[str, List[CallOutcome]] = {}
+        for outcome in self.outcomes:
+            tools.setdefault(outcome.tool, []).append(outcome)
+        return {
+            "calls": len(self.outcomes),
+            "errors": sum(not o.ok for o in self.outcomes),
+            "concurrency": self.concurrency,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_per_s": (
+                round(len(self.outcomes) / self.wall_seconds, 2)
+                if self.wall_seconds > 0
+                else 0.0
+            ),
+            "latency_ms": _latency_summary(self.outcomes),
+            "cache": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                # Calls that never had to compute anything the cache held.
+                "calls_without_miss": sum(
+                    o.cache_misses == 0 and o.cache_hits > 0 for o in self.outcomes
+                ),
+            },
+            "tools": {
+                tool: {
+                    "calls": len(group),
+                    "errors": sum(not o.ok for o in group),
+                    **_latency_summary(group),
+                }
+                for tool, group in sorted(tools.items())
+            },
+        }
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank ``q``-th percentile (0-100) of ``values``; 0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _latency_summary(outcomes: Iterable[CallOutcome]) -> Dict[str, float]:
+    latencies = [o.latency_ms for o in outcomes]
+    return {
+        "p50": round(percentile(latencies, 50), 3),
+        "p95": round(percentile(latencies, 95), 3),
+        "p99": round(percentile(latencies, 99), 3),
+        "max": round(max(latencies, default=0.0), 3),
+    }
+
+
+def load_trace(path: Path) -> List[Dict[str, Any]]:
+    """Read a JSONL trace; blank lines are ignored."""
+    records = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                records.append(json.loads(line))
+    return records
+
+
+def resolve_archives(
+    records: List[Dict[str, Any]], zim_dir: Path
+) -> List[Dict[str, Any]]:
+    """Point each record's archive file name at the copy under ``zim_dir``.
+
+    A name with no match is left as it is; the call then fails the way the
+    server fails any unknown archive and is counted as an error.
+    """
+    found = {p.name: str(p) for p in sorted(Path(zim_dir).rglob("*.zim"))}
+    resolved = []
+    for record in records:
+        args = dict(record.get("args") or {})
+        name = args.get("zim_file_path")
+        if isinstance(name, str) and name in found:
+            args["zim_file_path"] = found[name]
+        resolved.append({"tool": record["tool"], "args": args})
+    return resolved
+
+
+def build_server(zim_dir: Path, **overrides: Any) -> OpenZimMcpServer:
+    """An advanced-surface server over ``zim_dir`` with rate limiting off."""
+    settings: Dict[str, Any] = {
+        "allowed_directories": [str(zim_dir)],
+        "tool_mode": "advanced",
+        "rate_limit": RateLimitConfig(enabled=False),
+    }
+    settings.update(overrides)
+    return OpenZimMcpServer(OpenZimMcpConfig(**settings))
+
+
+async def _dispatch(server: OpenZimMcpServer, record: Dict[str, Any]) -> CallOutcome:
+    started = time.perf_counter()
+    with tally_cache_lookups() as tally:
+        try:
+            result = await server.mcp.call_tool(record["tool"], record["args"])
+            ok = not getattr(result, "is_error", False)
+        except Exception:
+            ok = False
+    return CallOutcome(
+        tool=record["tool"],
+        latency_ms=(time.perf_counter() - started) * 1000.0,
+        ok=ok,
+        cache_hits=tally.hits,
+        cache_misses=tally.misses,
+    )
+
+
+async def replay(
+    server: OpenZimMcpServer,
+    records: List[Dict[str, Any]],
+    *,
+    concurrency: int = 1,
+) -> ReplayReport:
+    """Dispatch ``records`` with at most ``concurrency`` calls in flight."""
+    concurrency = max(1, concurrency)
+    pending = iter(records)
+    outcomes: List[CallOutcome] = []
+
+    async def worker() -> None:
+        for record in pending:
+            outcomes.append(await _dispatch(server, record))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return ReplayReport(
+        concurrency=concurrency,
+        wall_seconds=time.perf_counter() - started,
+        outcomes=outcomes,
+    )
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Render ``ReplayReport.summary()`` as a plain-text table."""
+    latency, cache = summary["latency_ms"], summary["cache"]
+    lines = [
+        f"calls {summary['calls']}  errors {summary['errors']}  "
+        f"concurrency {summary['concurrency']}  "
+        f"wall {summary['wall_seconds']:.2f}s  "
+        f"throughput {summary['throughput_per_s']:.1f}/s",
+        f"latency ms  p50 {latency['p50']:.1f}  p95 {latency['p95']:.1f}  "
+        f"p99 {latency['p99']:.1f}  max {latency['max']:.1f}",
+        f"cache  hit rate {cache['hit_rate']:.1%}  "
+        f"({cache['hits']} hits / {cache['misses']} misses, "
+        f"{cache['calls_without_miss']} calls without a miss)",
+        "",
+        f"{'tool':<18}{'calls':>7}{'errors':>8}{'p50':>10}{'p95':>10}{'p99':>10}",
+    ]
+    for tool, row in summary["tools"].items():
+        lines.append(
+            f"{tool:<18}{row['calls']:>7}{row['errors']:>8}"
+            f"{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point: replay a trace and print the report."""
+    parser = argparse.ArgumentParser(
+        description="Replay a tool-call trace and report latency and cache hits."
+    )
+    parser.add_argument("trace", type=Path, help="JSONL trace to replay")
+    parser.add_argument(
+        "--zim-dir", type=Path, required=True, help="directory holding the archives"
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="replay the trace this many times on one server (warm caches)",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    records = resolve_archives(load_trace(args.trace), args.zim_dir)
+    server = build_server(args.zim_dir, logging=LoggingConfig(level=args.log_level))
+    for run in range(1, max(1, args.repeat) + 1):
+        report = asyncio.run(replay(server, records, concurrency=args.concurrency))
+        summary = report.summary()
+        if args.json:
+            print(json.dumps({"run": run, **summary}, sort_keys=True))
+        else:
+            print(f"== run {run}\n{format_report(summary)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Synthetic workloads replayed under ``pytest-benchmark``.
+
+Each benchmark replays the same seeded trace through a real server. The
+cold variant builds a fresh server per round, so every call pays for
+archive opens, parses and cache fills; the warm variant replays onto one
+server whose caches the warmup round filled, which is the steady state a
+long-running deployment sits in. The latency percentiles and hit rate of
+the last round land in ``extra_info`` next to pytest-benchmark's own
+timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks.replay import build_server, replay
+from benchmarks.workloads import synthetic_trace
+
+_CALLS = 120
+
+
+@pytest.fixture(scope="module")
+def trace(bench_archive: Path) -> List[Dict[str, Any]]:
+    records = synthetic_trace(bench_archive, calls=_CALLS, seed=7)
+    for record in records:
+        record["args"]["zim_file_path"] = str(bench_archive)
+    return records
+
+
+def _record(benchmark: Any, summary: Dict[str, Any]) -> None:
+    assert summary["errors"] == 0, summary["tools"]
+    benchmark.extra_info.update(
+        {
+            "p50_ms": summary["latency_ms"]["p50"],
+            "p95_ms": summary["latency_ms"]["p95"],
+            "p99_ms": summary["latency_ms"]["p99"],
+            "cache_hit_rate": summary["cache"]["hit_rate"],
+        }
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_replay_cold_benchmark(
+    benchmark: Any,
+    bench_archive: Path,
+    trace: List[Dict[str, Any]],
+    concurrency: int,
+) -> None:
+    """A fresh server per round: every call starts from empty caches."""
+    benchmark.group = "replay_cold"
+    summaries: List[Dict[str, Any]] = []
+
+    def run() -> None:
+        server = build_server(bench_archive.parent)
+        report = asyncio.run(replay(server, trace, concurrency=concurrency))
+        summaries.append(report.summary())
+
+    benchmark.pedantic(run, rounds=3, warmup_rounds=0)
+    _record(benchmark, summaries[-1])
+
+
+@pytest.mark.parametrize("concurrency", [1, 8])
+def test_replay_warm_benchmark(
+    benchmark: Any,
+    bench_archive: Path,
+    trace: List[Dict[str, Any]],
+    concurrency: int,
+) -> None:
+    """One server replayed repeatedly: the steady state after warmup."""
+    benchmark.group = "replay_warm"
+    server = build_server(bench_archive.parent)
+    summaries: List[Dict[str, Any]] = []
+
+    def run() -> None:
+        report = asyncio.run(replay(server, trace, concurrency=concurrency))
+        summaries.append(report.summary())
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
+    _record(benchmark, summaries[-1])
+    # The warmup round filled the caches the measured rounds read from.
+    assert summaries[-1]["cache"]["misses"] <= summaries[0]["cache"]["misses"]
@@ -0,0 +1,150 @@
+"""Synthetic tool-call traces built from an archive's own entries.
+
+A synthetic trace is what the recorder would have written for a client
+that reads a handful of popular articles over and over and a long tail
+once: entry popularity follows a Zipf distribution over a sample of the
+archive's articles, and each call is drawn from a weighted mix of tools.
+The result is a list of ``{"tool", "args"}`` records in the recorder's
+format, so ``replay.py`` treats it exactly like recorded traffic.
+
+    python -m benchmarks.workloads wikipedia.zim --calls 500 -o trace.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from libzim.reader import Archive  # type: ignore[import-untyped]
+
+__all__ = ["DEFAULT_MIX", "sample_articles", "synthetic_trace", "write_trace"]
+
+# Relative weight of each call shape in a synthetic trace.
+DEFAULT_MIX: Dict[str, int] = {
+    "get": 30,
+    "summary": 15,
+    "toc": 10,
+    "links": 10,
+    "search": 20,
+    "query": 15,
+}
+
+# Entries looked at when sampling articles: evenly strided over the whole
+# archive, so a multi-million-entry file is not walked end to end.
+_MAX_SCAN = 5000
+
+
+def sample_articles(archive_path: Path, limit: int = 500) -> List[Tuple[str, str]]:
+    """Return up to ``limit`` ``(path, title)`` pairs of HTML articles."""
+    archive = Archive(str(archive_path))
+    total = int(archive.entry_count)
+    stride = max(1, total // _MAX_SCAN)
+    articles: List[Tuple[str, str]] = []
+    for entry_id in range(0, total, stride):
+        try:
+            entry = archive._get_entry_by_id(entry_id)
+            if entry.is_redirect:
+                continue
+            if not entry.get_item().mimetype.startswith("text/html"):
+                continue
+        except Exception:  # nosec B112 - skip an unreadable entry
+            continue
+        articles.append((entry.path, entry.title or entry.path))
+        if len(articles) >= limit:
+            break
+    return articles
+
+
+def _call(
+    shape: str, archive_name: str, path: str, title: str, fulltext: bool
+) -> Dict[str, Any]:
+    if shape == "search":
+        return {
+            "tool": "zim_search",
+            "args": {
+                "query": title,
+                "zim_file_path": archive_name,
+                "mode": "fulltext" if fulltext else "title",
+            },
+        }
+    if shape == "query":
+        return {
+            "tool": "zim_query",
+            "args": {"query": f"tell me about {title}", "zim_file_path": archive_name},
+        }
+    if shape == "links":
+        return {
+            "tool": "zim_links",
+            "args": {"zim_file_path": archive_name, "entry_path": path},
+        }
+    args: Dict[str, Any] = {"zim_file_path": archive_name, "entry_path": path}
+    if shape in ("summary", "toc"):
+        args["view"] = shape
+    return {"tool": "zim_get", "args": args}
+
+
+def synthetic_trace(
+    archive_path: Path,
+    *,
+    calls: int = 200,
+    seed: int = 0,
+    mix: Optional[Dict[str, int]] = None,
+    zipf_s: float = 1.1,
+) -> List[Dict[str, Any]]:
+    """Build a ``calls``-long trace against ``archive_path``.
+
+    The same arguments always produce the same trace. ``zipf_s`` sets how
+    skewed entry popularity is: the entry of popularity rank ``r`` is drawn
+    with weight ``1 / r ** zipf_s``.
+    """
+    archive_path = Path(archive_path)
+    articles = sample_articles(archive_path)
+    if not articles:
+        raise ValueError(f"no HTML articles found in {archive_path}")
+    fulltext = bool(Archive(str(archive_path)).has_fulltext_index)
+    rng = random.Random(seed)
+    rng.shuffle(articles)
+    popularity = [1.0 / (rank**zipf_s) for rank in range(1, len(articles) + 1)]
+    shapes, weights = zip(*(mix or DEFAULT_MIX).items())
+    trace = []
+    for _ in range(calls):
+        shape = rng.choices(shapes, weights)[0]
+        path, title = rng.choices(articles, popularity)[0]
+        trace.append(_call(shape, archive_path.name, path, title, fulltext))
+    return trace
+
+
+def write_trace(records: Sequence[Dict[str, Any]], out: Path) -> None:
+    """Write ``records`` as JSONL, one call per line."""
+    with open(out, "w", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point: write a synthetic trace for one archive."""
+    parser = argparse.ArgumentParser(
+        description="Write a synthetic tool-call trace for benchmarks/replay.py."
+    )
+    parser.add_argument("archive", type=Path, help="ZIM file to sample")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="default: stdout"
+    )
+    args = parser.parse_args(argv)
+    trace = synthetic_trace(args.archive, calls=args.calls, seed=args.seed)
+    if args.output is None:
+        for record in trace:
+            print(json.dumps(record, ensure_ascii=False, sort_keys=True))
+    else:
+        write_trace(trace, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""Which generation of each archive file the server is serving.
+
+Every content-derived cache key embeds ``archive_stat_token`` — the archive's
+``st_mtime_ns`` and ``st_size`` — so that an atomic replacement (the monthly
+Wikipedia refresh) changes every key and nothing stale is served. That
+guarantee cost one ``stat()`` per key *built*, and one request builds many:
+a ten-hit search stats the archive for the search key, the archive open,
+each hit's snippet keys and the path-mapping keys, and ``get_entry`` adds
+bundle, binary-metadata and namespace keys on top. On local disk a ``stat``
+is a dentry-cache hit; on the NFS and CIFS volumes archives are commonly
+served from, each one is a network round trip of a millisecond or more.
+
+The other half of the problem was what happened *after* a swap. The keys of
+the old generation could no longer be hit, but nothing removed them: they
+sat in ``OpenZimMcpCache`` (and the shared tier) holding their bytes until
+LRU or TTL pushed them out, crowding out the new generation's entries while
+the cache warmed up again.
+
+:class:`ArchiveGenerations` is the single place those stats now happen. It
+maps a validated archive path to its *generation* — the ``"<mtime_ns>:<size>"``
+pair the key token has always carried, so existing keys, persisted
+snapshots and the shared tier keep their meaning — and answers repeat
+questions from memory:
+
+* within one tool call, always. :func:`stat_memo` opens a per-call memo on
+  a ``ContextVar`` (the dispatcher enters it around every call), so a call
+  stats each archive once however many keys it builds. The memo follows
+  ``await`` and the worker threads ``asyncio.to_thread`` starts, like
+  ``collect_timings``. A swap landing mid-call is seen by the next call,
+  which is also when the old code would have noticed in practice: the keys
+  already built in the call held the old token.
+* across calls, for ``cache.stat_memo_seconds`` when set. Off by default:
+  a replaced archive is then noticed on the very next call, as before.
+  Operators on a slow mount who run the file watcher can trade a few
+  seconds of staleness for one stat per interval instead of one per call.
+
+When a stat shows a path's generation has moved on, every registered
+listener is told ``(path, old_generation)``. ``OpenZimMcpCache`` registers
+one that drops every key of that old generation at once, through a
+per-generation key index (see :func:`key_generation`). The HTTP transport's
+file watcher calls :meth:`ArchiveGenerations.refresh` for every path it sees
+replaced or removed, so on a watched deployment the purge happens within
+one poll interval of the swap rather than at the next request for it.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "ARCHIVE_GENERATIONS",
+    "ArchiveGenerations",
+    "archive_generation_counters",
+    "archive_generation_stats",
+    "key_generation",
+    "stat_memo",
+]
+
+logger = logging.getLogger(__name__)
+
+# Generation reported for a path that cannot be stat'ed (removed, mid-swap,
+# permission lost). Keys built against it carry the same ``0:0`` the stat
+# token always fell back to.
+MISSING_GENERATION = "0:0"
+
+# The token inside a cache key: ``:<mtime_ns>:<size>:<render epoch>``. The
+# epoch (``r1``, see ``bundle._RENDER_EPOCH``) anchors the match, so the
+# numeric offsets and limits other keys carry (``ns_entries:…:0:50``) are
+# never mistaken for a generation.
+_KEY_TOKEN_RE = re.compile(r":(-?\d+:\d+):r\d+(?::|$)")
+
+Listener = Callable[[str, str], Any]
+
+_memo_var: contextvars.ContextVar[Optional[Dict[str, str]]] = contextvars.ContextVar(
+    "openzim_mcp_stat_memo", default=None
+)
+
+
+def key_generation(key: str) -> Optional[str]:
+    """The ``"<mtime_ns>:<size>"`` generation a cache key was built against.
+
+    ``None`` for keys that do not embed an archive token (server-wide
+    listings, health data), which no archive swap can make stale.
+    """
+    match = _KEY_TOKEN_RE.search(key)
+    return match.group(1) if match else None
+
+
+@contextmanager
+def stat_memo() -> Iterator[None]:
+    """Answer repeated generation lookups inside the block from one stat.
+
+    Re-entrant: a nested block shares the outer one's memo, so a tool that
+    calls another tool's implementation still stats each archive once.
+    """
+    if _memo_var.get() is not None:
+        yield
+        return
+    token = _memo_var.set({})
+    try:
+        yield
+    finally:
+        _memo_var.reset(token)
+
+
+class ArchiveGenerations:
+    """Thread-safe registry of the current generation of each archive path."""
+
+    def __init__(self, memo_seconds: float = 0.0) -> None:
+        """Start with no archive observed."""
+        self._lock = threading.Lock()
+        self._memo_seconds = memo_seconds
+        # path -> (generation, monotonic time of the stat that produced it)
+        self._current: Dict[str, Tuple[str, float]] = {}
+        self._listeners: List[Callable[[], Optional[Listener]]] = []
+        self._stats = 0
+        self._memo_hits = 0
+        self._changes = 0
+
+    def configure(self, memo_seconds: float) -> None:
+        """Set how long a stat answers later calls (``0`` = never)."""
+        self._memo_seconds = max(0.0, float(memo_seconds))
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call ``listener(path, old_generation)`` when a path's generation moves.
+
+        Held weakly, so registering a cache's bound method does not keep a
+        discarded cache (per-test servers, config reloads) alive. Listeners
+        run on the thread that noticed the change, outside the registry lock.
+        """
+        ref: Callable[[], Optional[Listener]]
+        if hasattr(listener, "__self__"):
+            ref = weakref.WeakMethod(listener)  # type: ignore[arg-type]
+        else:
+            ref = weakref.ref(listener)
+        with self._lock:
+            self._listeners.append(ref)
+
+    def generation(self, path: Any) -> str:
+        """The current generation of ``path``, from a memo when one applies."""
+        key = str(path)
+        memo = _memo_var.get()
+        if memo is not None:
+            known = memo.get(key)
+            if known is not None:
+                self._memo_hits += 1
+                return known
+        if self._memo_seconds > 0:
+            current = self._current.get(key)
+            if (
+                current is not None
+                and time.monotonic() - current[1] < self._memo_seconds
+            ):
+                self._memo_hits += 1
+                if memo is not None:
+                    memo[key] = current[0]
+                return current[0]
+        generation = self.refresh(key)
+        if memo is not None:
+            memo[key] = generation
+        return generation
+
+    def refresh(self, path: Any) -> str:
+        """Stat ``path`` now, bypassing every memo, and record the result."""
+        key = str(path)
+        try:
+            st = os.stat(key)
+            generation = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            generation = MISSING_GENERATION
+        self._observe(key, generation)
+        return generation
+
+    def _observe(self, path: str, generation: str) -> None:
+        with self._lock:
+            self._stats += 1
+            previous = self._current.get(path)
+            self._current[path] = (generation, time.monotonic())
+            if previous is None or previous[0] == generation:
+                return
+            self._changes += 1
+            self._listeners = [ref for ref in self._listeners if ref() is not None]
+            listeners = [ref() for ref in self._listeners]
+        logger.info(
+            "Archive %s changed generation %s -> %s", path, previous[0], generation
+        )
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener(path, previous[0])
+            except Exception as e:  # a failed purge must not fail the lookup
+                logger.warning(
+                    "Generation listener failed for %s: %s", path, e, exc_info=True
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        """Stat, memo and change counters, for ``zim_health``."""
+        with self._lock:
+            return {
+                "archives": len(self._current),
+                "memo_seconds": self._memo_seconds,
+                **self.counters(),
+            }
+
+    def counters(self) -> Dict[str, int]:
+        """Cumulative counters read without the lock, for ``/metrics``."""
+        return {
+            "stats": self._stats,
+            "memo_hits": self._memo_hits,
+            "changes": self._changes,
+        }
+
+    def reset(self) -> None:
+        """Forget every archive and counter (tests). Listeners stay."""
+        with self._lock:
+            self._current.clear()
+            self._stats = 0
+            self._memo_hits = 0
+            self._changes = 0
+
+
+ARCHIVE_GENERATIONS = ArchiveGenerations()
+
+
+def archive_generation_stats() -> Dict[str, Any]:
+    """Registry counters for ``zim_health``."""
+    return ARCHIVE_GENERATIONS.stats()
+
+
+def archive_generation_counters() -> Dict[str, int]:
+    """The same counters read without the lock, for ``/metrics``."""
+    return ARCHIVE_GENERATIONS.counters()
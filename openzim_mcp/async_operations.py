@@ -9,7 +9,7 @@ the event loop during I/O-bound operations.
 import asyncio
 import logging
 from functools import partial
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union, cast
 
 from .meta import attach_meta
 from .zim_operations import ZimOperations
@@ -716,6 +716,7 @@ class AsyncZimOperations:
         offset: int = 0,
         *,
         cursor_archive_identity: Optional[str] = None,
+        after: Optional[Sequence[Any]] = None,
     ) -> "RelatedArticlesResponse":
         """Structured variant of inbound link lookup (async)."""
         return await asyncio.to_thread(
@@ -725,6 +726,7 @@ class AsyncZimOperations:
             limit,
             offset,
             cursor_archive_identity=cursor_archive_identity,
+            after=after,
         )
 
     async def get_section_data(
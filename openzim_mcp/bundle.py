@@ -9,17 +9,32 @@ into the bundle without re-parsing.
 This module is intentionally pure: extract_entry_bundle takes an open
 archive and returns the bundle. The cache-aware accessor
 get_or_build_bundle handles cache lookups and is the entry point used
-by the data-layer methods.
+by the data-layer methods; get_or_build_bundle_view is the one for
+callers that only slice the markdown, which under the sectioned cache
+layout loads just the section chunks a slice touches.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from bisect import bisect_left, bisect_right
 from itertools import groupby
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
+from openzim_mcp.archive_generations import ARCHIVE_GENERATIONS
+from openzim_mcp.timings import timed
 from openzim_mcp.tool_schemas import (
     EntryBundle,
     InfoboxData,
@@ -101,16 +116,13 @@ def archive_stat_token(validated_path: Any) -> str:
     so an upgrade invalidates those keys too.
 
     ``validated_path`` is typed loosely so callers don't have to import
-    ``pathlib.Path``; a ``Path`` or a plain ``str`` path both work (a bare
-    ``str`` has no ``.stat()``, so it is coerced to ``Path`` first).
+    ``pathlib.Path``; a ``Path`` or a plain ``str`` path both work.
+
+    The stat itself goes through :data:`ARCHIVE_GENERATIONS`, which answers
+    repeat lookups within one tool call from memory and purges the cache
+    keys of a generation once a newer one is seen.
     """
-    try:
-        if isinstance(validated_path, str):
-            validated_path = Path(validated_path)
-        st = validated_path.stat()
-        return f"{st.st_mtime_ns}:{st.st_size}:{_RENDER_EPOCH}"
-    except OSError:
-        return f"0:0:{_RENDER_EPOCH}"
+    return f"{ARCHIVE_GENERATIONS.generation(validated_path)}:{_RENDER_EPOCH}"
 
 
 def _bundle_cache_key(validated_path: "Path", entry_path: str, compact: bool) -> str:
@@ -513,6 +525,7 @@ def _compute_section_offsets(
     return sections
 
 
+@timed("bundle_build")
 def extract_entry_bundle(
     archive: "Archive",
     entry_path: str,
@@ -563,13 +576,15 @@ def extract_entry_bundle(
     # so ZIMIT/warc2zim site chrome (banner, header nav, footer, aside) does
     # not leak into headings (TOC), links (related articles), or the rendered
     # markdown (summary). No landmark -> the whole document, unchanged.
-    # ``extract_html_links`` is fed the scoped subtree's HTML rather than the
-    # raw entry HTML so nav links are excluded too; capture it BEFORE
-    # ``_extract_infobox`` decomposes the infobox, preserving the prior order
-    # in which links were extracted ahead of infobox removal.
+    # Links are read off the scoped tree itself rather than a
+    # ``str(content_root)`` round-trip through ``extract_html_links``: the
+    # walk is read-only, and re-serialising then re-parsing a whole article
+    # just to enumerate its anchors was the costliest step of a bundle build.
+    # Capture them BEFORE ``_extract_infobox`` decomposes the infobox so
+    # infobox links stay in the buckets, as they always have.
     content_root = select_main_content(soup)
     headings = _build_headings(content_root, include_line_text=True)
-    raw_links = content_processor.extract_html_links(str(content_root))
+    raw_links = content_processor._extract_links_from_soup(content_root)
     link_buckets = _build_link_buckets(raw_links)
     infobox = _extract_infobox(content_root, content_processor)
     # Render in the requested mode. ``compact=True`` (the default, used by
@@ -598,6 +613,45 @@ def extract_entry_bundle(
     return bundle
 
 
+# Per-record allowance for JSON punctuation and key names ("url": "...",
+# "type": "internal", ...) on top of the string values a record carries.
+_LINK_OVERHEAD_BYTES = 48
+_SECTION_OVERHEAD_BYTES = 96
+_BUNDLE_OVERHEAD_BYTES = 256
+
+
+def bundle_size_bytes(bundle: EntryBundle) -> int:
+    """Approximate the JSON size of ``bundle`` without serialising it.
+
+    The cache budgets entries by JSON length, and measuring a 300 KB bundle
+    with ``json.dumps`` is a second full serialisation on every build. The
+    bundle already knows its dominant term — ``char_count`` is the length of
+    ``rendered_markdown`` — so the rest is summed from the string fields of
+    its links, sections and infobox plus a fixed per-record allowance for
+    keys and punctuation.
+    """
+    size = (
+        _BUNDLE_OVERHEAD_BYTES
+        + bundle["char_count"]
+        + len(bundle["entry_path"])
+        + len(bundle["title"])
+        + len(bundle["content_type"])
+    )
+    buckets = cast("Dict[str, List[Dict[str, Any]]]", bundle["links"])
+    for bucket in buckets.values():
+        for link in bucket:
+            size += _LINK_OVERHEAD_BYTES
+            size += sum(len(v) for v in link.values() if isinstance(v, str))
+    for section in bundle["sections"]:
+        size += _SECTION_OVERHEAD_BYTES
+        size += sum(len(v) for v in section.values() if isinstance(v, str))
+    infobox = bundle.get("infobox")
+    if infobox:
+        for field in infobox["fields"]:
+            size += _LINK_OVERHEAD_BYTES + len(field["label"]) + len(field["value"])
+    return size
+
+
 def get_or_build_bundle(
     archive: Archive,
     entry_path: str,
@@ -607,7 +661,24 @@ def get_or_build_bundle(
     content_processor: ContentProcessor,
     compact: bool = True,
 ) -> EntryBundle:
-    """Cache-aware bundle accessor. Builds on miss; returns cached on hit."""
+    """Cache-aware bundle accessor. Builds on miss; returns cached on hit.
+
+    Always returns the whole bundle. Under ``cache.bundle_layout="sectioned"``
+    that means reading every chunk back; callers that slice the markdown
+    should use :func:`get_or_build_bundle_view` instead.
+    """
+    if _bundle_layout(cache) == "sectioned":
+        view = get_or_build_bundle_view(
+            archive,
+            entry_path,
+            cache=cache,
+            validated_path=validated_path,
+            content_processor=content_processor,
+            compact=compact,
+        )
+        whole = {k: v for k, v in view.items() if k != "chunk_bounds"}
+        whole["rendered_markdown"] = bundle_text(view).full()
+        return cast("EntryBundle", whole)
     key = _bundle_cache_key(validated_path, entry_path, compact)
     cached = cache.get(key)
     if cached is not None:
@@ -617,5 +688,327 @@ def get_or_build_bundle(
     bundle = extract_entry_bundle(
         archive, entry_path, content_processor=content_processor, compact=compact
     )
-    cache.set(key, bundle)
+    cache.set(key, bundle, size_bytes=bundle_size_bytes(bundle))
     return bundle
+
+
+# Sectioned layout (``cache.bundle_layout="sectioned"``). A whole bundle is
+# one cache value, so ``get_section`` on a 300 KB article charges the cache
+# — and, with ``compact_storage``, decodes — all 300 KB to return one 2 KB
+# section, and a byte budget full of such articles holds few of them.
+# Sectioned, the bundle is split in two: a header holding everything but
+# the markdown (title, sections with their offsets, links, infobox), and
+# the markdown cut at section headings into chunks, each its own ancillary
+# cache entry. The header is small and hit by every content-shape tool; a
+# chunk is read only when a slice overlaps it, so the chunks nobody asks
+# for are the ones the LRU drops. ``SectionMeta`` offsets are unchanged —
+# they index the concatenated chunks — so nothing downstream of the
+# accessor knows which layout served it.
+#
+# A chunk can be evicted while its header survives. Reading it then
+# re-extracts the entry once and stores every chunk again; the slice is
+# still served from the fresh build, never from a partial one.
+_BUNDLE_HEAD_KEY_PREFIX = "bundle_head:v1"
+_BUNDLE_CHUNK_KEY_PREFIX = "bundle_chunk:v1"
+# Per-chunk allowance for the cache entry around the string.
+_CHUNK_OVERHEAD_BYTES = 64
+
+
+def _bundle_layout(cache: Any) -> str:
+    """``cache.bundle_layout``; ``whole`` for caches without a real config."""
+    layout = getattr(getattr(cache, "config", None), "bundle_layout", "whole")
+    return layout if layout == "sectioned" else "whole"
+
+
+def _chunk_key(head_key: str, index: int) -> str:
+    """Key of chunk ``index`` of the bundle whose header is at ``head_key``."""
+    return (
+        f"{_BUNDLE_CHUNK_KEY_PREFIX}{head_key[len(_BUNDLE_HEAD_KEY_PREFIX):]}:{index}"
+    )
+
+
+def _chunk_bounds(bundle: EntryBundle, min_chars: int) -> List[int]:
+    """Chunk boundaries: section heading starts, merged to ``min_chars``.
+
+    Every chunk but possibly a lone one is at least ``min_chars`` long; a
+    short tail is folded into the chunk before it.
+    """
+    length = len(bundle["rendered_markdown"])
+    starts = sorted(
+        {
+            section.get("heading_start", section["char_start"])
+            for section in bundle["sections"]
+        }
+    )
+    bounds = [0]
+    for start in starts:
+        if start - bounds[-1] >= min_chars and length - start >= min_chars:
+            bounds.append(start)
+    bounds.append(length)
+    return bounds
+
+
+class BundleText:
+    """A bundle's rendered markdown, whole or read chunk by chunk on demand.
+
+    ``bounds[i]:bounds[i + 1]`` is chunk ``i``; ``load(i)`` fetches it and
+    returns ``None`` when it is gone, in which case ``rebuild()`` must
+    return the whole markdown again. Chunks are memoised per instance, so
+    repeated slices of one view read each chunk from the cache once.
+    """
+
+    def __init__(
+        self,
+        bounds: List[int],
+        load: Callable[[int], Optional[str]],
+        rebuild: Optional[Callable[[], str]] = None,
+    ) -> None:
+        """Wrap chunked markdown; nothing is loaded until a slice needs it."""
+        self._bounds = bounds
+        self._load = load
+        self._rebuild = rebuild
+        self._chunks: Dict[int, str] = {}
+        self._whole: Optional[str] = None
+
+    @classmethod
+    def of(cls, markdown: str) -> "BundleText":
+        """Markdown already in memory (the whole layout, or a fresh build)."""
+        text = cls([0, len(markdown)], lambda index: markdown)
+        text._whole = markdown
+        return text
+
+    def __len__(self) -> int:
+        """Length of the whole markdown, without loading any of it."""
+        return self._bounds[-1]
+
+    def _chunk(self, index: int) -> Optional[str]:
+        chunk = self._chunks.get(index)
+        if chunk is None:
+            chunk = self._load(index)
+            if chunk is None:
+                return None
+            self._chunks[index] = chunk
+        return chunk
+
+    def _rebuilt(self) -> str:
+        if self._whole is None:
+            if self._rebuild is None:
+                raise KeyError("bundle chunk missing and no rebuild available")
+            self._whole = self._rebuild()
+        return self._whole
+
+    def slice(self, start: int, end: int) -> str:
+        """``markdown[start:end]``, loading only the chunks it overlaps."""
+        start = max(0, start)
+        end = min(end, len(self))
+        if start >= end:
+            return ""
+        if self._whole is not None:
+            return self._whole[start:end]
+        first = bisect_right(self._bounds, start) - 1
+        last = bisect_left(self._bounds, end)
+        parts: List[str] = []
+        for index in range(first, last):
+            chunk = self._chunk(index)
+            if chunk is None:
+                return self._rebuilt()[start:end]
+            parts.append(chunk)
+        offset = self._bounds[first]
+        return "".join(parts)[start - offset : end - offset]
+
+    def full(self) -> str:
+        """The whole markdown (every chunk)."""
+        return self.slice(0, len(self))
+
+    def chunks(self) -> Iterator[Tuple[int, str]]:
+        """``(offset, text)`` per chunk in document order, each loaded as reached.
+
+        A caller that stops early (a passage found in the first section)
+        never loads the rest.
+        """
+        if self._whole is not None:
+            yield 0, self._whole
+            return
+        for index, offset in enumerate(self._bounds[:-1]):
+            chunk = self._chunk(index)
+            if chunk is None:
+                whole = self._rebuilt()
+                for later in range(index, len(self._bounds) - 1):
+                    yield self._bounds[later], whole[
+                        self._bounds[later] : self._bounds[later + 1]
+                    ]
+                return
+            yield offset, chunk
+
+
+class BundleView(dict):  # type: ignore[type-arg]
+    """A bundle header whose markdown is reached through ``.text``.
+
+    Its ``rendered_markdown`` is empty; read :func:`bundle_text` instead.
+    """
+
+    text: BundleText
+
+
+def bundle_text(bundle: Any) -> BundleText:
+    """The markdown of a bundle or bundle view, as a :class:`BundleText`."""
+    text = getattr(bundle, "text", None)
+    if isinstance(text, BundleText):
+        return text
+    return BundleText.of(bundle.get("rendered_markdown", "") or "")
+
+
+def _store_sectioned(
+    cache: OpenZimMcpCache, head_key: str, bundle: EntryBundle
+) -> BundleView:
+    """Cache ``bundle`` as chunks plus header and return its (in-memory) view.
+
+    Chunks go in first: a header is only ever visible once the chunks it
+    points at have been offered to the cache.
+    """
+    markdown = bundle["rendered_markdown"]
+    bounds = _chunk_bounds(bundle, cache.config.bundle_chunk_min_chars)
+    for index, (start, end) in enumerate(zip(bounds, bounds[1:])):
+        cache.set(
+            _chunk_key(head_key, index),
+            markdown[start:end],
+            ancillary=True,
+            size_bytes=_CHUNK_OVERHEAD_BYTES + end - start,
+        )
+    view = BundleView(bundle)
+    view["rendered_markdown"] = ""
+    view["chunk_bounds"] = bounds
+    cache.set(
+        head_key,
+        dict(view),
+        size_bytes=bundle_size_bytes(bundle) - len(markdown) + 16 * len(bounds),
+    )
+    view.text = BundleText.of(markdown)
+    return view
+
+
+def get_or_build_bundle_view(
+    archive: Archive,
+    entry_path: str,
+    *,
+    cache: OpenZimMcpCache,
+    validated_path: Path,
+    content_processor: ContentProcessor,
+    compact: bool = True,
+) -> EntryBundle:
+    """Bundle accessor for callers that slice the markdown rather than read it.
+
+    Under the whole layout this is :func:`get_or_build_bundle`. Under the
+    sectioned one it returns a :class:`BundleView` of the cached header,
+    whose markdown :func:`bundle_text` reads chunk by chunk. Either way,
+    reach the markdown through :func:`bundle_text`, never
+    ``bundle["rendered_markdown"]``.
+    """
+    if _bundle_layout(cache) != "sectioned":
+        return get_or_build_bundle(
+            archive,
+            entry_path,
+            cache=cache,
+            validated_path=validated_path,
+            content_processor=content_processor,
+            compact=compact,
+        )
+    mode = "compact" if compact else "raw"
+    head_key = (
+        f"{_BUNDLE_HEAD_KEY_PREFIX}:{validated_path}:"
+        f"{archive_stat_token(validated_path)}:{entry_path}:{mode}"
+    )
+
+    def build() -> BundleView:
+        logger.debug("Bundle cache miss: %s (compact=%s) — building", entry_path, mode)
+        bundle = extract_entry_bundle(
+            archive, entry_path, content_processor=content_processor, compact=compact
+        )
+        return _store_sectioned(cache, head_key, bundle)
+
+    header = cache.get(head_key)
+    if header is None:
+        return cast("EntryBundle", build())
+
+    def load(index: int) -> Optional[str]:
+        return cast("Optional[str]", cache.get(_chunk_key(head_key, index)))
+
+    def rebuild() -> str:
+        logger.debug("Bundle chunk evicted: %s — rebuilding", entry_path)
+        return bundle_text(build()).full()
+
+    view = BundleView(header)
+    view.text = BundleText(header["chunk_bounds"], load, rebuild)
+    return cast("EntryBundle", view)
+
+
+# Token counts of a bundle's markdown live beside the bundle, not in it: a
+# TOC or summary build must not pay for a full-article encode it never
+# uses. ``v1`` follows the bundle rule above — bump it when what a count
+# covers changes.
+_SECTION_TOKENS_KEY_PREFIX = "bundle_tokens:v1"
+
+
+def _section_bounds(bundle: EntryBundle) -> List[int]:
+    """Every offset a section slice can start or end at, in order."""
+    bounds = {0, len(bundle_text(bundle))}
+    for section in bundle["sections"]:
+        bounds.add(section.get("heading_start", section["char_start"]))
+        bounds.add(section["char_start"])
+        bounds.add(section["char_end"])
+    return sorted(bounds)
+
+
+def get_or_build_section_tokens(
+    bundle: EntryBundle,
+    *,
+    cache: OpenZimMcpCache,
+    validated_path: Path,
+    compact: bool,
+    render: Callable[[str], str],
+) -> Optional[Dict[str, List[int]]]:
+    """Exact token counts of the bundle's markdown between section bounds.
+
+    Returns ``{"bounds": [...], "tokens": [...]}`` where ``tokens[i]`` is
+    the :func:`~openzim_mcp.meta.json_string_tokens` count of
+    ``render(markdown[bounds[i]:bounds[i + 1]])`` — ``render`` being the
+    transform the caller applies to a slice before serving it. Any slice
+    between two bounds is then counted by :func:`slice_tokens` without
+    encoding it. Segments start at line starts, so the per-segment counts
+    add up to the count of their concatenation to within a token or two.
+
+    Built on first use (one encode of the whole article) and cached under
+    the archive's stat token as an ancillary entry. ``None`` when the
+    tokenizer is unavailable.
+    """
+    from openzim_mcp.meta import json_string_tokens
+
+    mode = "compact" if compact else "raw"
+    key = (
+        f"{_SECTION_TOKENS_KEY_PREFIX}:{validated_path}:"
+        f"{archive_stat_token(validated_path)}:{bundle['entry_path']}:{mode}"
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cast("Dict[str, List[int]]", cached)
+    text = bundle_text(bundle)
+    bounds = _section_bounds(bundle)
+    tokens: List[int] = []
+    for start, end in zip(bounds, bounds[1:]):
+        count = json_string_tokens(render(text.slice(start, end)))
+        if count is None:
+            return None
+        tokens.append(count)
+    counts = {"bounds": bounds, "tokens": tokens}
+    cache.set(key, counts, ancillary=True)
+    return counts
+
+
+def slice_tokens(counts: Dict[str, List[int]], start: int, end: int) -> Optional[int]:
+    """Sum the cached counts covering ``[start, end)``; ``None`` off the bounds."""
+    bounds = counts["bounds"]
+    i = bisect_left(bounds, start)
+    j = bisect_left(bounds, end)
+    if i >= len(bounds) or j >= len(bounds) or bounds[i] != start or bounds[j] != end:
+        return None
+    return sum(counts["tokens"][i:j])
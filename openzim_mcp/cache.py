@@ -2,8 +2,9 @@
 Caching functionality for OpenZIM MCP server.
 
 Provides an in-memory LRU cache with TTL support, optional background
-cleanup to proactively remove expired entries, and optional persistence
-for cache warmup between restarts.
+cleanup to proactively remove expired entries, optional persistence
+for cache warmup between restarts, and an optional second tier shared
+between server processes.
 """
 
 import atexit
@@ -14,12 +15,17 @@ import heapq
 import json
 import logging
 import os
+import sqlite3
 import tempfile
 import threading
 import time
+import zlib
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from .archive_generations import ARCHIVE_GENERATIONS, key_generation
+from .cache_store import SharedCacheStore, SqliteCacheStore
+from .call_trace import note_cache_lookup
 from .config import CacheConfig
 from .defaults import CACHE
 from .exceptions import OpenZimMcpValidationError
@@ -31,6 +37,11 @@ DEFAULT_CLEANUP_INTERVAL = 60
 
 # File extension for persistence files
 CACHE_FILE_EXTENSION = ".json"
+# File extension for ``persistence_backend="sqlite"`` snapshots
+CACHE_SQLITE_FILE_EXTENSION = ".sqlite3"
+
+PERSISTENCE_BACKEND_JSON = "json"
+PERSISTENCE_BACKEND_SQLITE = "sqlite"
 
 
 # The package-wide default persistence path (``~/.cache/openzim-mcp``).
@@ -88,23 +99,242 @@ def _approximate_size_bytes(value: Any) -> int:
     cheap (no full pympler-style traversal). Non-serializable values
     fall back to a conservative ``2 KB`` so they still count toward the
     cap.
+
+    Strings and bytes — the rendered-text entries that dominate the byte
+    budget — are sized from their length directly rather than encoded
+    (``+ 2`` for the JSON quotes; escapes are ignored, which is within the
+    slack of a proxy). Containers still take the ``json.dumps`` route
+    unless the producer passes its own ``size_bytes`` to
+    :meth:`OpenZimMcpCache.set`, as the EntryBundle builder does.
     """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
     try:
         return len(json.dumps(value, ensure_ascii=False, default=str))
     except (TypeError, ValueError):
         return 2048
 
 
+# Compact storage modes (``CacheConfig.compact_storage``).
+def _is_json_exact(value: Any) -> bool:
+    """Whether ``value`` survives a JSON round trip unchanged.
+
+    Gate for the shared tier, which stores JSON: a tuple would come back as
+    a list, an ``int`` dict key as a ``str`` and an object not at all, so a
+    worker reading it would get a different value than the one that wrote
+    it. Only plain dict/list/str/number/bool/None trees are shared; anything
+    else stays in the writing process's own tier.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if item is None or isinstance(item, (str, bool, int)):
+            continue
+        if isinstance(item, float):
+            if item != item or item in (float("inf"), float("-inf")):
+                return False
+            continue
+        if type(item) is list:
+            stack.extend(item)
+        elif type(item) is dict:
+            if not all(isinstance(k, str) for k in item):
+                return False
+            stack.extend(item.values())
+        else:
+            return False
+    return True
+
+
+COMPACT_STORAGE_OFF = "off"
+COMPACT_STORAGE_UTF8 = "utf8"
+COMPACT_STORAGE_ZLIB = "zlib"
+
+# zlib level 1: rendered markdown still shrinks ~3x, at a fraction of the
+# default level's CPU — this runs on every ``set`` of a large entry.
+_ZLIB_LEVEL = 1
+
+
+class _PackedText:
+    """A large string held as UTF-8 bytes, optionally zlib-compressed.
+
+    CPython stores any string containing a non-Latin-1 character at 2 or 4
+    bytes per code point, so a mostly-ASCII article with one em dash costs
+    twice its length; UTF-8 bytes cost ~1 byte per character, and zlib cuts
+    prose to roughly a third of that. The price is a decode (and
+    decompress) on every cache hit, paid outside the cache lock.
+    """
+
+    __slots__ = ("data", "compressed")
+
+    def __init__(self, text: str, compressed: bool) -> None:
+        """Encode ``text`` (and compress it when ``compressed``)."""
+        raw = text.encode("utf-8")
+        self.data = zlib.compress(raw, _ZLIB_LEVEL) if compressed else raw
+        self.compressed = compressed
+
+    def unpack(self) -> str:
+        """Return the original string."""
+        raw = zlib.decompress(self.data) if self.compressed else self.data
+        return raw.decode("utf-8")
+
+
+def _pack_value(value: Any, mode: str, min_chars: int) -> Tuple[Any, int, bool]:
+    """Pack the large strings of ``value`` for compact storage.
+
+    Returns ``(stored_value, bytes_saved, packed)``. Only a top-level string
+    or the top-level string fields of a dict are packed — that covers the
+    payloads that matter (an EntryBundle's ``rendered_markdown``, a rendered
+    entry body) without walking nested structures on every ``set``.
+    ``bytes_saved`` is measured against the string length the size proxy
+    charged, so the entry's budget charge reflects what is actually held.
+    """
+    if mode == COMPACT_STORAGE_OFF:
+        return value, 0, False
+    compressed = mode == COMPACT_STORAGE_ZLIB
+    if isinstance(value, str):
+        if len(value) < min_chars:
+            return value, 0, False
+        packed = _PackedText(value, compressed)
+        return packed, max(0, len(value) - len(packed.data)), True
+    if not isinstance(value, dict):
+        return value, 0, False
+    saved = 0
+    stored: Optional[Dict[Any, Any]] = None
+    for field_name, field_value in value.items():
+        if isinstance(field_value, str) and len(field_value) >= min_chars:
+            if stored is None:
+                stored = dict(value)
+            packed = _PackedText(field_value, compressed)
+            stored[field_name] = packed
+            saved += max(0, len(field_value) - len(packed.data))
+    if stored is None:
+        return value, 0, False
+    return stored, saved, True
+
+
+class _StoredValue:
+    """Placeholder for a value still on disk in the SQLite snapshot.
+
+    Lazily restored entries hold one of these until their first hit, so a
+    restart loads only the key index; ``unpack`` reads (and checksums) the
+    value from the store.
+    """
+
+    __slots__ = ("store", "key")
+
+    def __init__(self, store: SqliteCacheStore, key: str) -> None:
+        """Point at ``key``'s row in ``store``."""
+        self.store = store
+        self.key = key
+
+    def unpack(self) -> Any:
+        """Read the value from the store; raises if it is gone or corrupt."""
+        return self.store.read_value(self.key)
+
+
+def _unpack_value(value: Any) -> Any:
+    """Inverse of :func:`_pack_value`; returns a fresh dict for packed dicts."""
+    if isinstance(value, (_PackedText, _StoredValue)):
+        return value.unpack()
+    return {
+        k: v.unpack() if isinstance(v, _PackedText) else v for k, v in value.items()
+    }
+
+
+# Segment names. Entries at or above ``CacheConfig.large_entry_bytes`` live
+# in the large segment; everything else (path mappings, metadata, suggestion
+# lists, snippet fragments) in the small one.
+SEGMENT_SMALL = "small"
+SEGMENT_LARGE = "large"
+
+# Per-prefix statistics are keyed on the text before a key's first ``:``
+# (``bundle``, ``entry``, ``snippet_render`` ...). Key families are a fixed,
+# small set in this codebase; the cap only guards against a caller that
+# builds prefix-less keys from request data.
+_MAX_TRACKED_PREFIXES = 64
+_OTHER_PREFIX = "_other"
+
+
+def _key_prefix(key: str) -> str:
+    """Key family used for per-prefix statistics."""
+    prefix, sep, _ = key.partition(":")
+    return prefix if sep else _OTHER_PREFIX
+
+
+class _FrequencySketch:
+    """Approximate per-key access frequency (TinyLFU's count-min sketch).
+
+    Four rows of small saturating counters indexed by independent hashes of
+    the key; the estimate is the minimum across rows, so collisions can only
+    over-count. Every ``sample_size`` increments all counters are halved,
+    which ages out popularity that is no longer current — without it a
+    bundle that was hot an hour ago would block today's hot bundles from
+    being admitted forever.
+    """
+
+    _DEPTH = 4
+    _MAX_COUNT = 15
+
+    def __init__(self, width: int) -> None:
+        """Create a sketch with ``width`` counters per row (rounded up to 2^n)."""
+        size = 1
+        while size < max(16, width):
+            size <<= 1
+        self._mask = size - 1
+        self._rows: List[List[int]] = [[0] * size for _ in range(self._DEPTH)]
+        self._sample_size = 10 * size
+        self._additions = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        return [hash((seed, key)) & self._mask for seed in range(self._DEPTH)]
+
+    def increment(self, key: str) -> None:
+        """Record one access to ``key``."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            for row in self._rows:
+                for i, count in enumerate(row):
+                    row[i] = count >> 1
+            self._additions //= 2
+
+    def estimate(self, key: str) -> int:
+        """Estimated access count of ``key`` (never an under-count)."""
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def reset(self) -> None:
+        """Forget every recorded access."""
+        for row in self._rows:
+            row[:] = [0] * len(row)
+        self._additions = 0
+
+
 class CacheEntry:
     """Represents a single cache entry with TTL."""
 
-    def __init__(self, value: Any, ttl_seconds: int):
+    def __init__(
+        self,
+        value: Any,
+        ttl_seconds: int,
+        *,
+        size_bytes: Optional[int] = None,
+        packed: bool = False,
+    ):
         """
         Initialize cache entry.
 
         Args:
             value: Value to cache
             ttl_seconds: Time to live in seconds
+            size_bytes: Budget charge for the entry. ``None`` estimates it
+                with ``_approximate_size_bytes``.
+            packed: ``value`` holds ``_PackedText`` parts (compact storage)
+                or is a ``_StoredValue`` (lazy restore) and must go through
+                ``_unpack_value`` before it is handed out.
 
         Example:
             >>> entry = CacheEntry("cached_value", ttl_seconds=3600)
@@ -112,7 +342,12 @@ class CacheEntry:
             False
         """
         self.value = value
-        self.size_bytes = _approximate_size_bytes(value)
+        self.size_bytes = (
+            _approximate_size_bytes(value) if size_bytes is None else size_bytes
+        )
+        self.packed = packed
+        # Assigned by the owning cache when the entry is stored.
+        self.segment = SEGMENT_SMALL
         # Use monotonic clock for in-memory expiry/LRU so wall-clock
         # adjustments (NTP, DST, manual changes) can't break expiry.
         self.created_at = time.monotonic()
@@ -122,6 +357,10 @@ class CacheEntry:
         """Check if cache entry has expired."""
         return time.monotonic() - self.created_at > self.ttl_seconds
 
+    def materialize(self) -> Any:
+        """Return the value as it was stored, unpacking compact parts."""
+        return _unpack_value(self.value) if self.packed else self.value
+
 
 class OpenZimMcpCache:
     """Simple in-memory cache with TTL support and hit/miss statistics.
@@ -129,10 +368,21 @@ class OpenZimMcpCache:
     This cache implements LRU (Least Recently Used) eviction with TTL-based
     expiration. It tracks cache hits and misses for performance monitoring.
 
+    Under a byte budget the cache is segmented by entry size. Small entries
+    (path mappings, metadata, suggestion lists) and large ones (EntryBundles,
+    rendered pages) share ``max_bytes``, but the large segment may use at
+    most ``large_segment_fraction`` of it: a burst of long-article reads
+    evicts older articles, not the thousands of cheap, high-hit-rate small
+    keys. A large entry is only admitted over a full large segment when a
+    TinyLFU frequency sketch says it is requested more often than the entry
+    it would evict, so a one-off scan cannot flush popular articles.
+
     Features:
     - Thread-safe operations with locking
     - Background cleanup thread for proactive expiration
     - LRU eviction using heap for O(log n) performance
+    - Small/large segments with TinyLFU admission for large entries
+    - Per-key-prefix hit/miss/byte statistics
     - Hit/miss statistics for monitoring
     - Optional persistence for cache warmup between restarts
 
@@ -182,11 +432,33 @@ class OpenZimMcpCache:
         # lexicographic key comparison.
         self._access_counter: int = 0
         self._access_order: Dict[str, int] = {}
-        # Heap for O(log n) LRU eviction: (access_counter, key)
-        # Uses lazy deletion - entries may be stale if key was updated or removed
+        # Heaps for O(log n) LRU eviction: (access_counter, key), one per
+        # segment so the large segment can shed its own LRU entry without
+        # scanning past small ones. Uses lazy deletion - entries may be stale
+        # if key was updated, removed, or moved segment.
         self._lru_heap: List[Tuple[int, str]] = []
+        self._large_lru_heap: List[Tuple[int, str]] = []
+        self._large_bytes: int = 0
+        self._large_count: int = 0
         self._hits: int = 0
         self._misses: int = 0
+        self._evictions: int = 0
+        self._admission_rejections: int = 0
+        self._prefix_stats: Dict[str, Dict[str, int]] = {}
+        # Keys by the archive generation embedded in them (see
+        # ``archive_generations.key_generation``), so a replaced archive's
+        # whole generation is dropped in one pass instead of ageing out.
+        # Indexed by generation rather than by (path, generation) because
+        # the path cannot be told apart from the key prefix without knowing
+        # it; two archives sharing an ``mtime_ns:size`` pair are rare, and
+        # ``purge_generation`` filters by path anyway.
+        self._generation_keys: Dict[str, Set[str]] = {}
+        self._generation_purged = 0
+        self._sketch: Optional[_FrequencySketch] = (
+            _FrequencySketch(min(16 * config.max_size, 1 << 18))
+            if getattr(config, "admission_filter", False)
+            else None
+        )
         self._lock = threading.RLock()  # Reentrant lock for thread safety
 
         # Background cleanup thread
@@ -196,6 +468,19 @@ class OpenZimMcpCache:
 
         # Persistence settings
         self._persistence_enabled = getattr(config, "persistence_enabled", False)
+        self._persistence_backend = getattr(
+            config, "persistence_backend", PERSISTENCE_BACKEND_JSON
+        )
+        # SQLite backend: the open store, plus what changed since the last
+        # checkpoint. Only ``set`` dirties a key; only ``_remove`` deletes
+        # one; ``clear`` resets the whole store on the next checkpoint.
+        self._store: Optional[SqliteCacheStore] = None
+        self._dirty_keys: Set[str] = set()
+        self._deleted_keys: Set[str] = set()
+        self._store_reset = False
+        self._checkpoint_lock = threading.Lock()
+        self._lazy_loads = 0
+        self._lazy_load_failures = 0
         configured_path = getattr(config, "persistence_path", None)
         if configured_path:
             self._persistence_path = Path(configured_path).expanduser()
@@ -241,10 +526,32 @@ class OpenZimMcpCache:
                 )
                 self._persistence_enabled = False
 
+        # Shared tier: consulted on a local miss, written through on set.
+        self._shared: Optional[SharedCacheStore] = None
+        self._shared_hits = 0
+        self._shared_skipped = 0
+        shared_path = getattr(config, "shared_path", None)
+        if config.enabled and shared_path:
+            try:
+                self._shared = SharedCacheStore(
+                    Path(shared_path).expanduser(),
+                    getattr(config, "shared_max_bytes", CACHE.SHARED_MAX_BYTES),
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(
+                    "Shared cache tier %s could not be opened (%s); "
+                    "continuing with the in-process cache only.",
+                    shared_path,
+                    e,
+                )
+
         # Load persisted cache if enabled
         if config.enabled and self._persistence_enabled:
             self._load_from_disk()
 
+        if config.enabled:
+            ARCHIVE_GENERATIONS.add_listener(self.purge_generation)
+
         # atexit handlers fire in LIFO order, so register persistence FIRST
         # and the cleanup-thread stop SECOND. That way at shutdown the cleanup
         # thread is signalled to stop *before* _save_to_disk runs, so the save
@@ -277,7 +584,8 @@ class OpenZimMcpCache:
             f"Cache initialized: enabled={config.enabled}, "
             f"max_size={config.max_size}, ttl={config.ttl_seconds}s, "
             f"background_cleanup={enable_background_cleanup}, "
-            f"persistence={self._persistence_enabled}"
+            f"persistence={self._persistence_enabled}, "
+            f"shared={self._shared is not None}"
         )
 
     def _start_cleanup_thread(self) -> None:
@@ -318,6 +626,10 @@ class OpenZimMcpCache:
 
                 # Perform cleanup
                 self._cleanup_expired()
+                if self._store is not None:
+                    self._checkpoint()
+                if self._shared is not None:
+                    self._shared.prune()
             except Exception as e:
                 # Log but don't crash the cleanup thread
                 logger.debug(f"Error in cache cleanup thread: {e}")
@@ -336,23 +648,98 @@ class OpenZimMcpCache:
             return None
 
         with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return None
-
-            entry = self._cache[key]
-
-            # Check if expired
-            if entry.is_expired():
+            if self._sketch is not None:
+                self._sketch.increment(key)
+            entry = self._cache.get(key)
+            if entry is not None and entry.is_expired():
                 self._remove(key)
-                self._misses += 1
                 logger.debug(f"Cache entry expired: {key}")
-                return None
-
-            self._touch(key)
+                entry = None
+            if entry is None:
+                if self._shared is None:
+                    self._record_miss(key)
+                    return None
+            else:
+                self._touch(key)
+                self._hits += 1
+                self._prefix_stat(key)["hits"] += 1
+                note_cache_lookup(True)
+                logger.debug(f"Cache hit: {key}")
+                if not entry.packed:
+                    return entry.value
+        if entry is None:
+            # The shared tier is read outside the lock: it is a SQLite
+            # lookup, possibly waiting on another process's write.
+            return self._get_shared(key)
+        # Compact entries decode outside the lock: a zlib inflate of a long
+        # article must not serialise every other cache operation behind it.
+        if isinstance(entry.value, _StoredValue):
+            return self._load_stored(key, entry)
+        return entry.materialize()
+
+    def _record_miss(self, key: str) -> None:
+        """Count a miss globally and against its prefix (lock held)."""
+        self._misses += 1
+        self._prefix_stat(key)["misses"] += 1
+        note_cache_lookup(False)
+
+    def _get_shared(self, key: str) -> Optional[Any]:
+        """Serve a local miss from the shared tier, keeping a local copy.
+
+        A shared hit counts as a hit, like any other lookup the cache
+        answered; ``shared.hits`` in :meth:`stats` says how many came from
+        the tier. The local copy keeps the writer's expiry rather than
+        starting a fresh TTL, so no process serves a value for longer than
+        the one that produced it would have.
+        """
+        assert self._shared is not None  # nosec B101 - checked by the caller
+        shared = self._shared.get(key)
+        if shared is None:
+            with self._lock:
+                self._record_miss(key)
+            return None
+        entry = self._make_entry(shared.value, shared.ttl_seconds, shared.size_bytes)
+        entry.created_at -= max(0.0, time.time() - shared.created_at)
+        with self._lock:
+            if key not in self._cache:
+                self._insert(key, entry, ancillary=shared.ancillary)
             self._hits += 1
-            logger.debug(f"Cache hit: {key}")
-            return entry.value
+            self._shared_hits += 1
+            self._prefix_stat(key)["hits"] += 1
+            note_cache_lookup(True)
+        logger.debug(f"Shared cache hit: {key}")
+        return shared.value
+
+    def _load_stored(self, key: str, entry: CacheEntry) -> Optional[Any]:
+        """Fetch a lazily restored entry's value from the snapshot store.
+
+        Runs outside the lock. On success the value replaces the placeholder
+        in place (compact-packed under the current config), so later hits
+        are served from memory; the entry's charged size is unchanged — it
+        was already charged at its full size when the index was loaded. A
+        row that is gone or fails its checksum turns the hit into a miss
+        and drops the entry.
+        """
+        try:
+            value = entry.value.unpack()
+        except Exception as exc:
+            logger.debug(f"Lazy cache restore failed for {key}: {exc}")
+            with self._lock:
+                self._lazy_load_failures += 1
+                if self._cache.get(key) is entry:
+                    self._remove(key)
+                self._hits = max(0, self._hits - 1)
+                self._misses += 1
+                stat = self._prefix_stat(key)
+                stat["hits"] = max(0, stat["hits"] - 1)
+                stat["misses"] += 1
+            return None
+        loaded = self._make_entry(value, entry.ttl_seconds, entry.size_bytes)
+        with self._lock:
+            self._lazy_loads += 1
+            if self._cache.get(key) is entry and isinstance(entry.value, _StoredValue):
+                entry.value, entry.packed = loaded.value, loaded.packed
+        return value
 
     def _counts_toward_cap(self, ancillary: bool) -> bool:
         """Whether an entry flagged ``ancillary`` is charged to ``max_size``.
@@ -367,16 +754,18 @@ class OpenZimMcpCache:
         """Entries charged to ``max_size`` (must be called with lock held)."""
         return len(self._cache) - len(self._ancillary_keys)
 
-    def _validate_persistable(self, key: str, value: Any) -> None:
+    def _validate_persistable(self, key: str, value: Any) -> Optional[int]:
         """Reject a value the persisted cache could not round-trip.
 
         Only the persisted path needs JSON guarantees; pure in-memory caches
-        still accept arbitrary Python objects.
+        still accept arbitrary Python objects. Returns the encoded length
+        when a check ran, so ``set`` can size the entry from this one
+        serialisation instead of running a second.
         """
         if not self._persistence_enabled:
-            return
+            return None
         try:
-            json.dumps(value)
+            return len(json.dumps(value, ensure_ascii=False))
         except (TypeError, ValueError) as exc:
             raise OpenZimMcpValidationError(
                 f"Cache value for key {key!r} is not JSON-serializable; "
@@ -384,23 +773,84 @@ class OpenZimMcpCache:
                 details=str(exc),
             ) from exc
 
-    def _release_bytes(self, size_bytes: int) -> None:
-        """Uncharge a departing entry's bytes, clamped at zero (lock held)."""
-        self._total_bytes -= size_bytes
-        if self._total_bytes < 0:
-            self._total_bytes = 0
+    def _prefix_stat(self, key: str) -> Dict[str, int]:
+        """Counters for ``key``'s prefix, created on first use (lock held)."""
+        prefix = _key_prefix(key)
+        stat = self._prefix_stats.get(prefix)
+        if stat is None:
+            if len(self._prefix_stats) >= _MAX_TRACKED_PREFIXES:
+                prefix = _OTHER_PREFIX
+                stat = self._prefix_stats.get(prefix)
+            if stat is None:
+                stat = dict.fromkeys(
+                    (
+                        "hits",
+                        "misses",
+                        "evictions",
+                        "admission_rejected",
+                        "entries",
+                        "size_bytes",
+                    ),
+                    0,
+                )
+                self._prefix_stats[prefix] = stat
+        return stat
+
+    def _large_segment_cap(self) -> int:
+        """Byte cap of the large segment; 0 when segmentation is off."""
+        max_bytes = getattr(self.config, "max_bytes", 0)
+        if max_bytes <= 0 or getattr(self.config, "large_entry_bytes", 0) <= 0:
+            return 0
+        return int(max_bytes * getattr(self.config, "large_segment_fraction", 1.0))
+
+    def _segment_for(self, size_bytes: int) -> str:
+        """Segment an entry of ``size_bytes`` belongs to."""
+        if self._large_segment_cap() and size_bytes >= self.config.large_entry_bytes:
+            return SEGMENT_LARGE
+        return SEGMENT_SMALL
+
+    def _charge(self, key: str, entry: CacheEntry) -> None:
+        """Account a newly stored entry's bytes (lock held).
+
+        Every path that puts an entry into ``_cache`` — ``set`` and the
+        persistence restore — goes through here, and every path that takes
+        one out through ``_release``, so the total, segment and per-prefix
+        figures cannot drift apart.
+        """
+        entry.segment = self._segment_for(entry.size_bytes)
+        self._total_bytes += entry.size_bytes
+        if entry.segment == SEGMENT_LARGE:
+            self._large_bytes += entry.size_bytes
+            self._large_count += 1
+        stat = self._prefix_stat(key)
+        stat["entries"] += 1
+        stat["size_bytes"] += entry.size_bytes
+
+    def _release(self, key: str, entry: CacheEntry) -> None:
+        """Uncharge a departing entry, clamping every figure at zero (lock held)."""
+        self._total_bytes = max(0, self._total_bytes - entry.size_bytes)
+        if entry.segment == SEGMENT_LARGE:
+            self._large_bytes = max(0, self._large_bytes - entry.size_bytes)
+            self._large_count = max(0, self._large_count - 1)
+        stat = self._prefix_stat(key)
+        stat["entries"] = max(0, stat["entries"] - 1)
+        stat["size_bytes"] = max(0, stat["size_bytes"] - entry.size_bytes)
 
     def _touch(self, key: str) -> None:
         """Stamp ``key`` as most recently used (must be called with lock held).
 
-        Pushes a fresh ``(counter, key)`` pair onto the heap; any older pair
-        for the same key is now stale and gets skipped lazily by
-        ``_evict_lru``.
+        Pushes a fresh ``(counter, key)`` pair onto the heap of the entry's
+        segment; any older pair for the same key is now stale and gets
+        skipped lazily by ``_evict_lru``.
         """
         self._access_counter += 1
         access_counter = self._access_counter
         self._access_order[key] = access_counter
-        heapq.heappush(self._lru_heap, (access_counter, key))
+        entry = self._cache.get(key)
+        if entry is not None and entry.segment == SEGMENT_LARGE:
+            heapq.heappush(self._large_lru_heap, (access_counter, key))
+        else:
+            heapq.heappush(self._lru_heap, (access_counter, key))
 
     def _make_room_for_charged(self, key: str) -> None:
         """Free a ``max_size`` slot before a charged entry lands (lock held).
@@ -418,17 +868,55 @@ class OpenZimMcpCache:
     def _enforce_byte_budget(self) -> None:
         """Evict LRU entries until ``_total_bytes`` fits ``max_bytes`` (lock held).
 
-        Skipped when the cap is 0 (disabled) or when the cache only holds a
-        single entry: one oversized value can legitimately exceed the cap,
-        and the count cap still bounds entry count.
+        The large segment is trimmed to its own cap first, from its own LRU
+        end, so large entries pay for large-entry pressure. The overall loop
+        then evicts the globally least recently used entry as before.
+
+        Skipped when the cap is 0 (disabled) or when the cache (or the large
+        segment) only holds a single entry: one oversized value can
+        legitimately exceed the cap, and the count cap still bounds entry
+        count.
         """
         max_bytes = getattr(self.config, "max_bytes", 0)
         if max_bytes <= 0:
             return
+        large_cap = self._large_segment_cap()
+        if large_cap:
+            while self._large_bytes > large_cap and self._large_count > 1:
+                self._evict_lru(SEGMENT_LARGE)
         while self._total_bytes > max_bytes and len(self._cache) > 1:
             self._evict_lru()
 
-    def set(self, key: str, value: Any, *, ancillary: bool = False) -> None:
+    def _admits(self, key: str, entry: CacheEntry) -> bool:
+        """TinyLFU admission check for a new large entry (lock held).
+
+        Only a large entry that is new to the cache and would push the large
+        segment over its cap is gated: it is admitted unless the sketch has
+        seen the segment's LRU victim requested more often than the
+        candidate. A one-off scan therefore cannot displace an article that
+        keeps being read, while ties fall back to plain LRU so a fresh
+        working set still rotates in. Small entries and overwrites are
+        always admitted.
+        """
+        if self._sketch is None or key in self._cache:
+            return True
+        if self._segment_for(entry.size_bytes) != SEGMENT_LARGE:
+            return True
+        if self._large_bytes + entry.size_bytes <= self._large_segment_cap():
+            return True
+        victim = self._heap_top(self._large_lru_heap)
+        if victim is None:
+            return True
+        return self._sketch.estimate(key) >= self._sketch.estimate(victim)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ancillary: bool = False,
+        size_bytes: Optional[int] = None,
+    ) -> None:
         """
         Set value in cache (thread-safe).
 
@@ -442,6 +930,10 @@ class OpenZimMcpCache:
                 single wide search cannot flush every other client's warm
                 responses while memory sits far below the byte budget.
                 They still participate in LRU eviction under byte pressure.
+            size_bytes: Producer-supplied estimate of the value's JSON size.
+                Large structured values (EntryBundles) know their own size
+                far more cheaply than ``json.dumps`` can measure it; when
+                omitted the cache estimates it.
 
         Raises:
             OpenZimMcpValidationError: When persistence is enabled and the
@@ -454,35 +946,83 @@ class OpenZimMcpCache:
         if not self.config.enabled:
             return
 
-        self._validate_persistable(key, value)
+        encoded_size = self._validate_persistable(key, value)
+        if size_bytes is None:
+            size_bytes = (
+                encoded_size
+                if encoded_size is not None
+                else _approximate_size_bytes(value)
+            )
+        # Packing (and zlib) runs before the lock is taken.
+        entry = self._make_entry(value, self.config.ttl_seconds, size_bytes)
 
         with self._lock:
-            charged = self._counts_toward_cap(ancillary)
-            if charged:
-                self._make_room_for_charged(key)
-
-            # Replace path: drop the old entry's byte count first so
-            # ``_total_bytes`` stays accurate when the same key is reset
-            # with a value of different size.
-            prior = self._cache.get(key)
-            if prior is not None:
-                self._release_bytes(prior.size_bytes)
-
-            # Add/update entry
-            entry = CacheEntry(value, self.config.ttl_seconds)
-            self._cache[key] = entry
-            if charged:
-                self._ancillary_keys.discard(key)
+            self._insert(key, entry, ancillary=ancillary)
+        if self._shared is not None:
+            # Written through even when local admission turned the entry
+            # away: the tier has its own, much larger, budget.
+            if _is_json_exact(value):
+                self._shared.put(
+                    key,
+                    value,
+                    ttl_seconds=self.config.ttl_seconds,
+                    ancillary=ancillary,
+                    size_bytes=size_bytes,
+                )
             else:
-                self._ancillary_keys.add(key)
-            self._total_bytes += entry.size_bytes
-            self._touch(key)
-            logger.debug(
-                f"Cache set: {key} ({entry.size_bytes} bytes, total "
-                f"{self._total_bytes} bytes)"
-            )
+                self._shared_skipped += 1
+
+    def _insert(self, key: str, entry: CacheEntry, *, ancillary: bool) -> None:
+        """Admit and store ``entry`` under ``key`` (lock held)."""
+        if not self._admits(key, entry):
+            self._admission_rejections += 1
+            self._prefix_stat(key)["admission_rejected"] += 1
+            logger.debug(f"Cache admission rejected: {key}")
+            return
 
-            self._enforce_byte_budget()
+        charged = self._counts_toward_cap(ancillary)
+        if charged:
+            self._make_room_for_charged(key)
+
+        # Replace path: drop the old entry's byte count first so
+        # ``_total_bytes`` stays accurate when the same key is reset
+        # with a value of different size.
+        prior = self._cache.get(key)
+        if prior is not None:
+            self._release(key, prior)
+
+        # Add/update entry
+        self._cache[key] = entry
+        self._index_generation(key)
+        if charged:
+            self._ancillary_keys.discard(key)
+        else:
+            self._ancillary_keys.add(key)
+        self._charge(key, entry)
+        self._touch(key)
+        if self._store is not None:
+            self._dirty_keys.add(key)
+            self._deleted_keys.discard(key)
+        logger.debug(
+            f"Cache set: {key} ({entry.size_bytes} bytes, total "
+            f"{self._total_bytes} bytes)"
+        )
+
+        self._enforce_byte_budget()
+
+    def _make_entry(
+        self, value: Any, ttl_seconds: int, size_bytes: Optional[int] = None
+    ) -> CacheEntry:
+        """Build a ``CacheEntry``, packing large strings under compact storage."""
+        mode = getattr(self.config, "compact_storage", COMPACT_STORAGE_OFF)
+        stored, saved, packed = _pack_value(
+            value, mode, getattr(self.config, "compact_min_chars", 0)
+        )
+        if size_bytes is None:
+            size_bytes = _approximate_size_bytes(value)
+        return CacheEntry(
+            stored, ttl_seconds, size_bytes=max(0, size_bytes - saved), packed=packed
+        )
 
     def delete(self, key: str) -> None:
         """
@@ -498,14 +1038,63 @@ class OpenZimMcpCache:
             if key in self._cache:
                 self._remove(key)
                 logger.debug(f"Cache entry deleted: {key}")
+        if self._shared is not None:
+            self._shared.delete(key)
 
     def _remove(self, key: str) -> None:
         """Remove entry from cache (must be called with lock held)."""
         entry = self._cache.pop(key, None)
         if entry is not None:
-            self._release_bytes(entry.size_bytes)
+            self._release(key, entry)
         self._access_order.pop(key, None)
         self._ancillary_keys.discard(key)
+        generation = key_generation(key)
+        if generation is not None:
+            keys = self._generation_keys.get(generation)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._generation_keys[generation]
+        if self._store is not None:
+            self._dirty_keys.discard(key)
+            self._deleted_keys.add(key)
+
+    def _index_generation(self, key: str) -> None:
+        """File ``key`` under the archive generation it embeds (lock held)."""
+        generation = key_generation(key)
+        if generation is not None:
+            self._generation_keys.setdefault(generation, set()).add(key)
+
+    def purge_generation(self, path: str, generation: str) -> int:
+        """Drop every key built against ``generation`` of the archive at ``path``.
+
+        Registered with ``ARCHIVE_GENERATIONS`` and called when it sees the
+        archive move on to a new generation: those keys can never be hit
+        again, so they would only hold bytes until LRU reached them. Also
+        removes them from the shared tier, where the other workers would
+        otherwise keep them until its own trim. Returns the number of local
+        entries removed.
+        """
+        if not self.config.enabled:
+            return 0
+        marker = f"{path}:{generation}:"
+        with self._lock:
+            stale = [
+                key
+                for key in self._generation_keys.get(generation, ())
+                if marker in key
+            ]
+            for key in stale:
+                self._remove(key)
+            self._generation_purged += len(stale)
+        if self._shared is not None:
+            self._shared.delete_matching(marker)
+        if stale:
+            logger.info(
+                f"Purged {len(stale)} cache entries of replaced archive "
+                f"generation {path} ({generation})"
+            )
+        return len(stale)
 
     def _cleanup_expired(self) -> None:
         """Remove all expired entries (thread-safe).
@@ -529,31 +1118,58 @@ class OpenZimMcpCache:
             # Compact the heap when it grew well past the live cache size.
             # 4x is a cheap heuristic — small enough to keep memory bounded,
             # large enough that we don't rebuild the heap on every cleanup.
-            if len(self._lru_heap) > 4 * max(len(self._access_order), 1):
-                self._lru_heap = [(t, k) for k, t in self._access_order.items()]
+            heap_size = len(self._lru_heap) + len(self._large_lru_heap)
+            if heap_size > 4 * max(len(self._access_order), 1):
+                self._lru_heap = []
+                self._large_lru_heap = []
+                for k, t in self._access_order.items():
+                    entry = self._cache.get(k)
+                    if entry is not None and entry.segment == SEGMENT_LARGE:
+                        self._large_lru_heap.append((t, k))
+                    else:
+                        self._lru_heap.append((t, k))
                 heapq.heapify(self._lru_heap)
-                logger.debug(f"Compacted LRU heap to {len(self._lru_heap)} entries")
+                heapq.heapify(self._large_lru_heap)
+                logger.debug(
+                    f"Compacted LRU heaps to {len(self._access_order)} entries"
+                )
 
-    def _evict_lru(self) -> None:
-        """Evict least recently used entry using heap (must be called with lock held).
+    def _heap_top(self, heap: List[Tuple[int, str]]) -> Optional[str]:
+        """Least recently used live key in ``heap`` (lock held).
 
-        Uses lazy deletion: entries in heap may be stale if key was accessed again
-        or removed. We skip invalid entries until we find a valid one to evict.
+        Uses lazy deletion: pairs may be stale if the key was accessed
+        again, removed, or re-set into the other segment. Stale pairs are
+        popped until a valid one surfaces; that one stays on the heap.
         """
-        while self._lru_heap:
-            # Pop the oldest entry from heap
-            access_counter, key = heapq.heappop(self._lru_heap)
-
-            # Check if this entry is still valid (not stale)
-            # An entry is valid if:
-            # 1. The key still exists in cache
-            # 2. The access counter matches (not updated since)
-            if key in self._access_order and self._access_order[key] == access_counter:
-                self._remove(key)
-                logger.debug(f"Evicted LRU cache entry: {key}")
-                return
+        while heap:
+            access_counter, key = heap[0]
+            # Valid while the key still exists and its access counter
+            # matches (not updated since).
+            if self._access_order.get(key) == access_counter:
+                return key
+            heapq.heappop(heap)
+        return None
+
+    def _evict_lru(self, segment: Optional[str] = None) -> None:
+        """Evict least recently used entry using heap (must be called with lock held).
 
-            # Entry is stale (key was removed or accessed more recently), skip it
+        ``segment`` restricts the choice to one segment; by default the
+        older of the two segments' LRU entries goes.
+        """
+        if segment == SEGMENT_LARGE:
+            candidates = [self._heap_top(self._large_lru_heap)]
+        else:
+            candidates = [
+                self._heap_top(self._lru_heap),
+                self._heap_top(self._large_lru_heap),
+            ]
+        live = [k for k in candidates if k is not None]
+        if live:
+            key = min(live, key=lambda k: self._access_order[k])
+            self._remove(key)
+            self._record_eviction(key)
+            logger.debug(f"Evicted LRU cache entry: {key}")
+            return
 
         # Fallback: if heap is empty but cache has entries, use linear scan
         # This shouldn't happen in normal operation but provides safety
@@ -562,18 +1178,42 @@ class OpenZimMcpCache:
                 self._access_order.keys(), key=lambda k: self._access_order[k]
             )
             self._remove(lru_key)
+            self._record_eviction(lru_key)
             logger.debug(f"Evicted LRU cache entry (fallback): {lru_key}")
 
+    def _record_eviction(self, key: str) -> None:
+        """Count a capacity eviction globally and against its prefix."""
+        self._evictions += 1
+        self._prefix_stat(key)["evictions"] += 1
+
     def clear(self) -> None:
         """Clear all cache entries and reset statistics (thread-safe)."""
         with self._lock:
             self._cache.clear()
             self._access_order.clear()
             self._lru_heap.clear()
+            self._large_lru_heap.clear()
             self._ancillary_keys.clear()
+            self._generation_keys.clear()
+            self._generation_purged = 0
             self._total_bytes = 0
+            self._large_bytes = 0
+            self._large_count = 0
             self._hits = 0
             self._misses = 0
+            self._evictions = 0
+            self._admission_rejections = 0
+            self._prefix_stats.clear()
+            if self._sketch is not None:
+                self._sketch.reset()
+            if self._store is not None:
+                self._dirty_keys.clear()
+                self._deleted_keys.clear()
+                self._store_reset = True
+            self._shared_hits = 0
+            self._shared_skipped = 0
+        if self._shared is not None:
+            self._shared.clear()
         logger.info("Cache cleared")
 
     def stats(self) -> Dict[str, Any]:
@@ -598,6 +1238,41 @@ class OpenZimMcpCache:
                 "hits": self._hits,
                 "misses": self._misses,
                 "hit_rate": round(hit_rate, 4),
+                "evictions": self._evictions,
+                "segments": {
+                    "large_entry_bytes": (
+                        getattr(self.config, "large_entry_bytes", 0)
+                        if self._large_segment_cap()
+                        else 0
+                    ),
+                    SEGMENT_SMALL: {
+                        "entries": len(self._cache) - self._large_count,
+                        "size_bytes": self._total_bytes - self._large_bytes,
+                    },
+                    SEGMENT_LARGE: {
+                        "entries": self._large_count,
+                        "size_bytes": self._large_bytes,
+                        "max_bytes": self._large_segment_cap(),
+                    },
+                },
+                "admission": {
+                    "enabled": self._sketch is not None,
+                    "rejected": self._admission_rejections,
+                },
+                # Archive generations this cache holds keys of, entries
+                # dropped because their archive was replaced, and the
+                # process-wide stat registry behind both.
+                "generations": {
+                    "indexed": len(self._generation_keys),
+                    "purged": self._generation_purged,
+                    "registry": ARCHIVE_GENERATIONS.stats(),
+                },
+                # Per key family (``bundle``, ``entry``, ``search_v2c`` ...):
+                # which kinds of keys earn their bytes.
+                "prefixes": {
+                    prefix: dict(stat)
+                    for prefix, stat in sorted(self._prefix_stats.items())
+                },
                 "background_cleanup": (
                     self._cleanup_thread is not None and self._cleanup_thread.is_alive()
                 ),
@@ -607,16 +1282,57 @@ class OpenZimMcpCache:
             # Add persistence file info if enabled
             if self._persistence_enabled:
                 persistence_file = self._get_persistence_file()
+                stats["persistence_backend"] = self._persistence_backend
                 stats["persistence_path"] = str(persistence_file)
                 stats["persistence_file_exists"] = persistence_file.exists()
+                if self._store is not None:
+                    stats["persistence_pending"] = {
+                        "dirty": len(self._dirty_keys),
+                        "deleted": len(self._deleted_keys),
+                    }
+                    stats["lazy_loads"] = self._lazy_loads
+                    stats["lazy_load_failures"] = self._lazy_load_failures
+
+            if self._shared is not None:
+                # ``skipped``: sets kept local because their value would
+                # not survive JSON unchanged (see ``_is_json_exact``).
+                stats["shared"] = {
+                    **self._shared.stats(),
+                    "skipped": self._shared_skipped,
+                }
 
             return stats
 
+    def counters(self) -> Dict[str, int]:
+        """Cumulative counters and current size, read without the lock.
+
+        ``stats`` takes the lock every lookup takes; the ``/metrics`` scrape
+        reads these instead so it never queues behind, or holds up, a live
+        request. Each field is one read, atomic under the GIL; together they
+        may straddle a concurrent update, which is fine for a sample.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "admission_rejected": self._admission_rejections,
+            "entries": len(self._cache),
+            "size_bytes": self._total_bytes,
+            "shared_hits": self._shared_hits,
+            "generation_purged": self._generation_purged,
+        }
+
     def shutdown(self) -> None:
         """Shutdown the cache and stop background threads."""
         self._stop_cleanup_thread()
         if self._persistence_enabled:
             self._save_to_disk()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
         # Deregister our atexit handlers now that we've run their work
         # explicitly — prevents accumulation across repeated construction
         # and stops stale handlers from clobbering a newer instance's
@@ -636,12 +1352,18 @@ class OpenZimMcpCache:
         ``openzim.dev`` would silently collide onto one ``openzim.json``
         snapshot — breaking the per-instance isolation an explicit
         ``persistence_path`` promises.
+
+        The extension follows the backend (``.json`` or ``.sqlite3``), so
+        switching backends never feeds one format to the other's reader.
         """
-        if self._persistence_path.suffix == CACHE_FILE_EXTENSION:
-            return self._persistence_path
-        return self._persistence_path.with_name(
-            self._persistence_path.name + CACHE_FILE_EXTENSION
+        extension = (
+            CACHE_SQLITE_FILE_EXTENSION
+            if self._persistence_backend == PERSISTENCE_BACKEND_SQLITE
+            else CACHE_FILE_EXTENSION
         )
+        if self._persistence_path.suffix == extension:
+            return self._persistence_path
+        return self._persistence_path.with_name(self._persistence_path.name + extension)
 
     def _save_to_disk(self) -> None:
         """Save cache contents to disk for persistence.
@@ -650,6 +1372,9 @@ class OpenZimMcpCache:
         """
         if not self._persistence_enabled:
             return
+        if self._persistence_backend == PERSISTENCE_BACKEND_SQLITE:
+            self._checkpoint()
+            return
 
         try:
             # Hold the lock for the whole snapshot+write so concurrent set/
@@ -671,7 +1396,9 @@ class OpenZimMcpCache:
                     age = max(0.0, now_monotonic - entry.created_at)
                     if age <= entry.ttl_seconds:
                         saved: Dict[str, Any] = {
-                            "value": entry.value,
+                            # Snapshots always hold plain values, so a file
+                            # written in one storage mode loads in any other.
+                            "value": entry.materialize(),
                             "created_at": now_wall - age,
                             "ttl_seconds": entry.ttl_seconds,
                         }
@@ -782,9 +1509,24 @@ class OpenZimMcpCache:
         # Restore entry. CacheEntry.__init__ stamps a monotonic created_at;
         # rewind it by the entry's age so remaining TTL is preserved across
         # the restart.
-        entry = CacheEntry(entry_data["value"], ttl_seconds)
+        stored_value = entry_data["value"]
+        if isinstance(stored_value, _StoredValue):
+            # Lazy restore: the value stays on disk, charged at the size it
+            # had when it was checkpointed.
+            entry = CacheEntry(
+                stored_value,
+                ttl_seconds,
+                size_bytes=int(entry_data.get("size_bytes", 0)),
+                packed=True,
+            )
+        else:
+            entry = self._make_entry(stored_value, ttl_seconds)
         entry.created_at = now_monotonic - age
+        prior = self._cache.get(key)
+        if prior is not None:
+            self._release(key, prior)
         self._cache[key] = entry
+        self._index_generation(key)
         # Re-apply the fragment marker under the *current* config: a
         # snapshot written with a byte budget may be loaded without one, in
         # which case fragments must be charged to the count cap again.
@@ -797,7 +1539,7 @@ class OpenZimMcpCache:
         # silently inoperative until enough new sets accumulate to cross
         # the threshold from zero. ``set()`` and ``_remove()`` maintain
         # this invariant; ``_restore_entry`` was the lone gap.
-        self._total_bytes += entry.size_bytes
+        self._charge(key, entry)
 
         # Assign a fresh access_counter value to preserve LRU ordering across
         # restart. Loaded entries get successively higher counters in
@@ -813,6 +1555,9 @@ class OpenZimMcpCache:
         """
         if not self._persistence_enabled:
             return
+        if self._persistence_backend == PERSISTENCE_BACKEND_SQLITE:
+            self._load_from_store()
+            return
 
         persistence_file = self._get_persistence_file()
         if not persistence_file.exists():
@@ -883,3 +1628,133 @@ class OpenZimMcpCache:
             logger.warning(f"Failed to parse cache persistence file: {e}")
         except Exception as e:
             logger.warning(f"Failed to load cache from disk: {e}")
+
+    def _load_from_store(self) -> None:
+        """Open the SQLite snapshot and restore its key index lazily.
+
+        Only index rows are read; every value stays on disk until its first
+        hit (see ``_load_stored``). Rows that expired while the server was
+        down, or that the configured caps evict straight away, are queued
+        for deletion at the first checkpoint. Any failure leaves the cache
+        empty and persistence disabled for this process rather than failing
+        startup.
+        """
+        try:
+            store = SqliteCacheStore(self._get_persistence_file())
+            rows = store.load_index()
+        except Exception as e:
+            logger.warning(f"Failed to open cache snapshot store: {e}")
+            self._persistence_enabled = False
+            return
+
+        with self._lock:
+            self._store = store
+            now_wall = time.time()
+            now_monotonic = time.monotonic()
+            loaded_count = 0
+            skipped_count = 0
+            for row in rows:
+                entry_data = {
+                    "value": _StoredValue(store, row.key),
+                    "created_at": row.created_at,
+                    "ttl_seconds": row.ttl_seconds,
+                    "ancillary": row.ancillary,
+                    "size_bytes": row.size_bytes,
+                }
+                try:
+                    if self._restore_entry(
+                        row.key, entry_data, now_wall, now_monotonic
+                    ):
+                        loaded_count += 1
+                        continue
+                except Exception as entry_err:
+                    skipped_count += 1
+                    logger.debug(
+                        f"Skipped malformed cache entry {row.key!r}: {entry_err}"
+                    )
+                self._deleted_keys.add(row.key)
+
+            while self._cache and self._primary_count() > self.config.max_size:
+                self._evict_lru()
+            self._enforce_byte_budget()
+
+        logger.info(
+            f"Indexed {loaded_count} cache entries from {store.path} "
+            f"(values load on first use; {skipped_count} malformed)"
+        )
+
+    def _checkpoint(self) -> None:
+        """Write changes since the last checkpoint to the SQLite store.
+
+        The change set is captured under the cache lock; encoding and the
+        SQLite transaction run outside it, serialised by
+        ``_checkpoint_lock`` so two checkpoints (cleanup thread and
+        shutdown) cannot land out of order. A failed write re-queues its
+        changes for the next attempt.
+        """
+        if self._store is None:
+            return
+        with self._checkpoint_lock:
+            store = self._store
+            if store is None:
+                return
+            with self._lock:
+                now_monotonic = time.monotonic()
+                now_wall = time.time()
+                captured: List[Tuple[Any, ...]] = []
+                deletes = set(self._deleted_keys)
+                # Oldest access first: the store hands rows back in write
+                # order, which becomes the restored LRU order.
+                dirty = sorted(
+                    (k for k in self._dirty_keys if k in self._cache),
+                    key=lambda k: self._access_order.get(k, 0),
+                )
+                for key in dirty:
+                    entry = self._cache.get(key)
+                    if entry is None:
+                        continue
+                    # Same clamp as the JSON save: never persist a future
+                    # timestamp.
+                    age = max(0.0, now_monotonic - entry.created_at)
+                    if age > entry.ttl_seconds:
+                        deletes.add(key)
+                        continue
+                    # Only references here: unpacking a compact value
+                    # inflates it, which must not stall every get/put.
+                    captured.append(
+                        (
+                            key,
+                            entry.value,
+                            entry.packed,
+                            now_wall - age,
+                            entry.ttl_seconds,
+                            key in self._ancillary_keys,
+                            entry.size_bytes,
+                        )
+                    )
+                reset = self._store_reset
+                self._dirty_keys = set()
+                self._deleted_keys = set()
+                self._store_reset = False
+
+            if not (captured or deletes or reset):
+                return
+            upserts = []
+            try:
+                for key, value, packed, *row in captured:
+                    upserts.append(
+                        (key, _unpack_value(value) if packed else value, *row)
+                    )
+                written = store.checkpoint(upserts, deletes, reset=reset)
+            except Exception as e:
+                logger.warning(f"Failed to checkpoint cache to disk: {e}")
+                with self._lock:
+                    for key, *_rest in captured:
+                        if key in self._cache and key not in self._deleted_keys:
+                            self._dirty_keys.add(key)
+                    self._deleted_keys.update(
+                        key for key in deletes if key not in self._dirty_keys
+                    )
+                    self._store_reset = self._store_reset or reset
+                return
+            logger.debug(f"Cache checkpoint: {written} written, {len(deletes)} deleted")
@@ -0,0 +1,510 @@
+"""SQLite snapshot store behind ``persistence_backend="sqlite"``.
+
+The JSON snapshot rewrites one document holding every entry on each save
+and parses the whole document on startup, so a multi-hundred-MB warm cache
+costs seconds at both ends, and a crash mid-save loses the lot. This store
+keeps one row per key instead:
+
+- ``checkpoint`` writes only what changed since the previous checkpoint
+  (upserts and deletes) in a single transaction, so a crash loses at most
+  one checkpoint interval and never leaves a half-written snapshot.
+- ``load_index`` reads the key index (timestamps, TTL, charged size)
+  without touching any value, so startup cost scales with the key count,
+  not with the bytes cached. Values are fetched by ``read_value`` on first
+  use.
+- Each value blob carries a CRC-32; a row that fails it is deleted and
+  reported as missing rather than served.
+
+The file is a disposable cache: an unreadable file or a schema mismatch is
+discarded and recreated empty, never surfaced as a startup error.
+
+:class:`SharedCacheStore` is the other use of the same file format: the
+second cache tier every worker of a multi-worker HTTP deployment reads on a
+local miss and writes through on every set, so an article one worker
+rendered is a disk read, not a re-render, for the others.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "SCHEMA_VERSION",
+    "SharedCacheStore",
+    "SharedEntry",
+    "SqliteCacheStore",
+    "StoredEntry",
+    "encode_value",
+]
+
+# Bump on any incompatible layout or encoding change; a mismatching file is
+# dropped and recreated (it only ever held a warm cache).
+SCHEMA_VERSION = 1
+
+# Values are JSON, zlib-compressed at the fastest level: snapshot bytes are
+# mostly rendered prose, which level 1 already shrinks about 3x, and the
+# checkpoint runs on the cleanup thread where a slower level would only
+# lengthen the window in which the store lock is held.
+_ZLIB_LEVEL = 1
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) STRICT;
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    checksum INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    ttl_seconds INTEGER NOT NULL,
+    ancillary INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL
+) STRICT;
+"""
+
+# One pending upsert: (key, value, created_at_wall, ttl_seconds, ancillary,
+# size_bytes).
+Upsert = Tuple[str, Any, float, int, bool, int]
+
+
+@dataclass
+class StoredEntry:
+    """Index row for one persisted entry — everything but the value."""
+
+    key: str
+    created_at: float
+    ttl_seconds: int
+    ancillary: bool
+    size_bytes: int
+
+
+def encode_value(value: Any) -> Tuple[bytes, int]:
+    """Encode ``value`` as a compressed JSON blob plus its CRC-32."""
+    blob = zlib.compress(
+        json.dumps(value, ensure_ascii=False).encode("utf-8"), _ZLIB_LEVEL
+    )
+    return blob, zlib.crc32(blob)
+
+
+class SqliteCacheStore:
+    """One SQLite file of cache rows, shared by the cache's threads.
+
+    A single connection is used from the request threads (lazy value reads)
+    and the cleanup thread (checkpoints), serialised by an internal lock.
+    WAL journaling lets a second server process pointed at the same file
+    read while this one checkpoints.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (creating or resetting as needed) the store at ``path``."""
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._conn = self._open()
+        except sqlite3.DatabaseError as exc:
+            logger.warning(
+                f"Cache snapshot {self.path} is unreadable ({exc}); starting empty"
+            )
+            self.path.unlink(missing_ok=True)
+            self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=5.0, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # NORMAL under WAL still never corrupts the file on a crash; it
+            # only risks the last checkpoint on power loss, which a warm
+            # cache can afford.
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_DDL)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                with conn:
+                    conn.execute("DELETE FROM entries")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                        (str(SCHEMA_VERSION),),
+                    )
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def load_index(self) -> List[StoredEntry]:
+        """Every stored row's metadata, oldest write first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, created_at, ttl_seconds, ancillary, size_bytes "
+                "FROM entries ORDER BY rowid"
+            ).fetchall()
+        return [
+            StoredEntry(
+                key=key,
+                created_at=created_at,
+                ttl_seconds=ttl_seconds,
+                ancillary=bool(ancillary),
+                size_bytes=size_bytes,
+            )
+            for key, created_at, ttl_seconds, ancillary, size_bytes in rows
+        ]
+
+    def read_value(self, key: str) -> Any:
+        """Decode the stored value of ``key``.
+
+        Raises:
+            LookupError: The row is gone (deleted by a checkpoint since the
+                index was read) or failed its checksum; a corrupt row is
+                deleted so it is not read again.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, checksum FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                raise LookupError(f"cache snapshot has no row for {key!r}")
+            blob, checksum = row
+            if zlib.crc32(blob) != checksum:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                raise LookupError(f"cache snapshot row for {key!r} is corrupt")
+        try:
+            return json.loads(zlib.decompress(blob).decode("utf-8"))
+        except (zlib.error, UnicodeDecodeError, ValueError) as exc:
+            raise LookupError(f"cache snapshot row for {key!r} is corrupt") from exc
+
+    def checkpoint(
+        self, upserts: Iterable[Upsert], deletes: Iterable[str], *, reset: bool
+    ) -> int:
+        """Apply one incremental checkpoint atomically; returns rows written.
+
+        ``reset`` empties the store first (the cache was cleared since the
+        previous checkpoint). Values are encoded before the store lock is
+        taken so lazy reads are not held up behind JSON encoding.
+        """
+        rows = []
+        for key, value, created_at, ttl_seconds, ancillary, size_bytes in upserts:
+            blob, checksum = encode_value(value)
+            rows.append(
+                (
+                    key,
+                    blob,
+                    checksum,
+                    created_at,
+                    ttl_seconds,
+                    int(ancillary),
+                    size_bytes,
+                )
+            )
+        delete_rows = [(key,) for key in deletes]
+        with self._lock, self._conn:
+            if reset:
+                self._conn.execute("DELETE FROM entries")
+            if delete_rows:
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", delete_rows)
+            if rows:
+                # DELETE + INSERT rather than an in-place UPDATE so a rewritten
+                # key gets a fresh rowid: ``load_index`` orders by rowid, which
+                # keeps recently written keys at the warm end of the LRU.
+                self._conn.executemany(
+                    "DELETE FROM entries WHERE key = ?", [(r[0],) for r in rows]
+                )
+                self._conn.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+        return len(rows)
+
+    def count(self) -> int:
+        """Number of stored rows."""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def close(self) -> None:
+        """Close the connection; later reads raise ``sqlite3.ProgrammingError``."""
+        with self._lock:
+            self._conn.close()
+
+
+_SHARED_DDL = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) STRICT;
+CREATE TABLE IF NOT EXISTS shared_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    checksum INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    ttl_seconds INTEGER NOT NULL,
+    ancillary INTEGER NOT NULL DEFAULT 0,
+    size_bytes INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL
+) STRICT;
+"""
+
+# How long a worker waits for another worker's write transaction before
+# giving up. Kept short on purpose: both reads and writes here are
+# optional — a lookup that cannot get in is a miss, a write that cannot get
+# in is skipped — and a request thread must never stall behind a peer's
+# prune.
+_SHARED_BUSY_TIMEOUT_S = 0.25
+
+
+@dataclass
+class SharedEntry:
+    """One value read back from the shared tier."""
+
+    value: Any
+    created_at: float
+    ttl_seconds: int
+    ancillary: bool
+    size_bytes: int
+
+
+class SharedCacheStore:
+    """SQLite file of cache rows that several server processes share.
+
+    Unlike :class:`SqliteCacheStore`, which one process checkpoints into, every
+    process with the file open reads and writes rows directly: ``get`` on a
+    local miss, ``put`` on every local set. WAL journaling lets readers in
+    every process proceed while one of them writes; writers serialise on
+    SQLite's own lock. Each process holds one connection, serialised by an
+    internal lock like the snapshot store's.
+
+    Rows carry their wall-clock creation time and TTL, so a worker never
+    serves a value past the expiry the writing worker gave it. Keys are the
+    response cache's own keys, which embed the archive's stat token: a
+    replaced archive is simply looked up under new keys, and the worker that
+    first sees the new generation drops the old rows with
+    :meth:`delete_matching` (those it misses age out by TTL or by the
+    ``max_bytes`` prune).
+
+    Every failure — a busy peer, a corrupt row, a full disk — degrades to
+    a miss or a skipped write and is counted, never raised.
+    """
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        """Open (creating or resetting as needed) the shared file at ``path``."""
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._conn = self._open()
+        except sqlite3.DatabaseError as exc:
+            logger.warning(
+                f"Shared cache {self.path} is unreadable ({exc}); starting empty"
+            )
+            self.path.unlink(missing_ok=True)
+            self._conn = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.path), timeout=_SHARED_BUSY_TIMEOUT_S, check_same_thread=False
+        )
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SHARED_DDL)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'shared_schema_version'"
+            ).fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                with conn:
+                    conn.execute("DELETE FROM shared_entries")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta "
+                        "VALUES ('shared_schema_version', ?)",
+                        (str(SCHEMA_VERSION),),
+                    )
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def get(self, key: str) -> Optional[SharedEntry]:
+        """The live row for ``key``, or ``None`` (absent, expired, corrupt, busy)."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, checksum, created_at, ttl_seconds, ancillary, "
+                    "size_bytes FROM shared_entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.debug(f"Shared cache read failed for {key}: {exc}")
+            self.errors += 1
+            self.misses += 1
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        blob, checksum, created_at, ttl_seconds, ancillary, size_bytes = row
+        value: Any = None
+        intact = zlib.crc32(blob) == checksum
+        if intact:
+            try:
+                value = json.loads(zlib.decompress(blob).decode("utf-8"))
+            except (zlib.error, UnicodeDecodeError, ValueError):
+                intact = False
+        if not intact or time.time() - created_at > ttl_seconds:
+            # Expired rows are left to ``prune``; a corrupt one goes now so
+            # no worker decodes it again.
+            if not intact:
+                self.errors += 1
+                self.delete(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return SharedEntry(
+            value=value,
+            created_at=created_at,
+            ttl_seconds=ttl_seconds,
+            ancillary=bool(ancillary),
+            size_bytes=size_bytes,
+        )
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl_seconds: int,
+        ancillary: bool,
+        size_bytes: int,
+    ) -> bool:
+        """Write ``value`` under ``key``; ``False`` when the write was skipped.
+
+        The value is encoded before the lock is taken, as in
+        :meth:`SqliteCacheStore.checkpoint`.
+        """
+        blob, checksum = encode_value(value)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO shared_entries "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        blob,
+                        checksum,
+                        time.time(),
+                        ttl_seconds,
+                        int(ancillary),
+                        size_bytes,
+                        len(blob),
+                    ),
+                )
+        except sqlite3.Error as exc:
+            logger.debug(f"Shared cache write skipped for {key}: {exc}")
+            self.errors += 1
+            return False
+        self.writes += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        """Drop ``key`` for every process."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM shared_entries WHERE key = ?", (key,))
+        except sqlite3.Error as exc:
+            logger.debug(f"Shared cache delete failed for {key}: {exc}")
+            self.errors += 1
+
+    def delete_matching(self, fragment: str) -> int:
+        """Drop every key containing ``fragment``, for every process.
+
+        A table scan, but only run when an archive is replaced, and
+        ``instr`` is a plain substring test: no ``LIKE`` wildcards to escape
+        in a path that may contain ``%`` or ``_``.
+        """
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.execute(
+                    "DELETE FROM shared_entries WHERE instr(key, ?) > 0", (fragment,)
+                )
+        except sqlite3.Error as exc:
+            logger.debug(f"Shared cache purge failed for {fragment}: {exc}")
+            self.errors += 1
+            return 0
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Drop every row, for every process."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM shared_entries")
+        except sqlite3.Error as exc:
+            logger.warning(f"Shared cache clear failed: {exc}")
+            self.errors += 1
+
+    def prune(self) -> int:
+        """Drop expired rows, then the oldest writes past ``max_bytes``.
+
+        Every worker's cleanup thread calls this; whichever gets the write
+        lock does the work and the rest find little left to do. Returns the
+        number of rows removed.
+        """
+        try:
+            with self._lock, self._conn:
+                removed = self._conn.execute(
+                    "DELETE FROM shared_entries WHERE created_at + ttl_seconds < ?",
+                    (time.time(),),
+                ).rowcount
+                total = self._conn.execute(
+                    "SELECT COALESCE(SUM(stored_bytes), 0) FROM shared_entries"
+                ).fetchone()[0]
+                if self.max_bytes > 0 and total > self.max_bytes:
+                    # Oldest writes first (``INSERT OR REPLACE`` gives a
+                    # rewritten key a fresh rowid), down to 90% of the cap
+                    # so the next few writes do not trigger another prune.
+                    excess = total - int(self.max_bytes * 0.9)
+                    doomed = []
+                    for rowid, stored in self._conn.execute(
+                        "SELECT rowid, stored_bytes FROM shared_entries "
+                        "ORDER BY rowid"
+                    ):
+                        if excess <= 0:
+                            break
+                        doomed.append((rowid,))
+                        excess -= stored
+                    self._conn.executemany(
+                        "DELETE FROM shared_entries WHERE rowid = ?", doomed
+                    )
+                    removed += len(doomed)
+        except sqlite3.Error as exc:
+            logger.debug(f"Shared cache prune skipped: {exc}")
+            self.errors += 1
+            return 0
+        return removed
+
+    def stats(self) -> dict:
+        """Counters for ``zim_health``, per process.
+
+        Bumped outside the lock, so a concurrent burst can lose the odd
+        increment — close enough for the monitoring they exist for.
+        """
+        return {
+            "path": str(self.path),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        """Close this process's connection; the file and its rows remain."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,190 @@
+"""Opt-in recording of tool calls as replayable JSONL traces.
+
+Correctness tests say nothing about how long a real client's mix of calls
+takes, and synthetic benchmarks only approximate that mix. With
+``call_trace_path`` set, every ``tools/call`` the server dispatches is
+appended to that file as one JSON line::
+
+    {"ts": 1760000000.123, "tool": "zim_get",
+     "args": {"zim_file_path": "wikipedia_en.zim", "entry_path": "A/Paris"},
+     "latency_ms": 41.7, "ok": true,
+     "cache": {"hits": 3, "misses": 1}}
+
+``benchmarks/replay.py`` drives a trace back through a server at any
+concurrency and reports the latency percentiles, throughput and cache hit
+rates, so a regression shows up against recorded production traffic.
+
+Arguments are sanitized before they are written: an archive path keeps only
+its file name (the replay resolves it against its own directory, and the
+server's directory layout stays out of the file), and every string passes
+through ``sanitize_for_log`` — control characters collapsed, length capped
+— the same treatment the server's own logs give caller-supplied text. No
+client identity is recorded.
+
+``cache`` counts the response-cache lookups made while the call ran. The
+tally rides a ``ContextVar``, so it follows the call into the worker threads
+``asyncio.to_thread`` and ``run_with_timeout`` start for it and never mixes
+concurrent calls; work handed to a pool that does not copy the context goes
+uncounted.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path, PurePath
+from typing import Any, Dict, Iterator, Optional
+
+from .security import sanitize_for_log
+
+__all__ = [
+    "CacheTally",
+    "CallTraceRecorder",
+    "note_cache_lookup",
+    "sanitize_arguments",
+    "tally_cache_lookups",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class CacheTally:
+    """Response-cache hits and misses seen during one tool call."""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """Start both counters at zero."""
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """The counters as written to a trace line."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_tally_var: contextvars.ContextVar[Optional[CacheTally]] = contextvars.ContextVar(
+    "openzim_mcp_cache_tally", default=None
+)
+
+
+def note_cache_lookup(hit: bool) -> None:
+    """Count one cache lookup against the current call, if one is tallied."""
+    tally = _tally_var.get()
+    if tally is None:
+        return
+    if hit:
+        tally.hits += 1
+    else:
+        tally.misses += 1
+
+
+@contextmanager
+def tally_cache_lookups() -> Iterator[CacheTally]:
+    """Count the cache lookups made inside the ``with`` block."""
+    tally = CacheTally()
+    token = _tally_var.set(tally)
+    try:
+        yield tally
+    finally:
+        _tally_var.reset(token)
+
+
+def _is_archive_argument(name: str) -> bool:
+    return name in ("zim_file_path", "zim_file_paths")
+
+
+def _sanitize_value(value: Any, *, archive: bool) -> Any:
+    if isinstance(value, str):
+        if archive:
+            # ``PurePath`` splits on the host separator only; a Windows path
+            # recorded elsewhere still loses its directories.
+            value = PurePath(value.replace("\\", "/")).name
+        return sanitize_for_log(value)
+    if isinstance(value, (list, tuple)):
+        return [_sanitize_value(v, archive=archive) for v in value]
+    if isinstance(value, dict):
+        return {
+            str(k): _sanitize_value(v, archive=archive or _is_archive_argument(k))
+            for k, v in value.items()
+        }
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return sanitize_for_log(repr(value))
+
+
+def sanitize_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``arguments`` as safe to write to a trace (see module docstring)."""
+    return {
+        str(name): _sanitize_value(value, archive=_is_archive_argument(name))
+        for name, value in arguments.items()
+    }
+
+
+class CallTraceRecorder:
+    """Append tool-call records to a JSONL file; safe to share across threads.
+
+    Lines are written whole under a lock and flushed as they are written, so
+    a crash loses at most the line in progress and a reader tailing the
+    file never sees a partial record. A write that fails (disk full, file
+    removed) is logged once and recording stops — tracing must never fail
+    the call it observes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open ``path`` for appending, creating parent directories."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh: Any = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def record(
+        self,
+        tool: str,
+        arguments: Dict[str, Any],
+        *,
+        latency_ms: float,
+        ok: bool,
+        cache: Optional[CacheTally] = None,
+    ) -> None:
+        """Write one call; ``arguments`` are sanitized here."""
+        line = json.dumps(
+            {
+                "ts": round(time.time(), 3),
+                "tool": tool,
+                "args": sanitize_arguments(arguments),
+                "latency_ms": round(latency_ms, 3),
+                "ok": ok,
+                "cache": (cache or CacheTally()).as_dict(),
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                self._fh.write(line + "\n")
+                self._fh.flush()
+                self.recorded += 1
+            except OSError as e:
+                logger.warning("Call tracing to %s stopped: %s", self.path, e)
+                self._close_locked()
+
+    def close(self) -> None:
+        """Stop recording and close the file. Idempotent."""
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except OSError:  # pragma: no cover - close after a failed write
+                pass
+            self._fh = None
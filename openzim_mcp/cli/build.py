@@ -1,7 +1,8 @@
 """`openzim-mcp build <artifact> ...` — offline build artifacts.
 
-``build`` is a namespace so future artifacts (e.g. ``build embeddings`` under
-sub-D-4) slot in beside ``link-graph``.
+``build`` is a namespace so artifacts slot in side by side: ``link-graph``
+(inbound links) and ``title-index`` (title lookups), with future ones (e.g.
+``build embeddings`` under sub-D-4) beside them.
 """
 
 from __future__ import annotations
@@ -10,19 +11,38 @@ import argparse
 import os
 import sqlite3
 import sys
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 from openzim_mcp.exceptions import OpenZimMcpArchiveError
 from openzim_mcp.linkgraph.builder import build_link_graph
 from openzim_mcp.linkgraph.reader import sidecar_path_for
+from openzim_mcp.titleindex.builder import build_title_index
+from openzim_mcp.titleindex.reader import sidecar_path_for as title_index_path_for
+
+
+def _check_archive(archive: str) -> Optional[int]:
+    """Pre-flight the archive argument; return an exit code on failure.
+
+    Separates "missing" from "exists-but-invalid" so each gets a distinct,
+    actionable message instead of surfacing from deep in the libzim open
+    path.
+    """
+    if not os.path.exists(archive):
+        print(f"error: archive not found: {archive}", file=sys.stderr)
+        return 1
+    if not os.path.isfile(archive):
+        print(f"error: not a file: {archive}", file=sys.stderr)
+        return 1
+    return None
 
 
 def _link_graph(args: argparse.Namespace) -> int:
     """Run the link-graph build for one archive and print a summary.
 
     Exit codes: 0 success; 1 user-fixable precondition (archive not found /
-    not a file / not a valid ZIM / sidecar exists without --force / cannot
-    write the sidecar); 2 unexpected build failure.
+    not a file / not a valid ZIM / ``--reuse`` sidecar not found / sidecar
+    exists without --force / cannot write the sidecar); 2 unexpected build
+    failure.
     """
 
     def _progress(done: int, total: int) -> None:
@@ -30,20 +50,23 @@ def _link_graph(args: argparse.Namespace) -> int:
         if not args.quiet:
             print(f"  …walked {done}/{total} entries", file=sys.stderr)
 
-    # Pre-flight separates "missing" from "exists-but-invalid" so each gets a
-    # distinct, actionable message instead of surfacing from deep in the
-    # libzim open path.
-    if not os.path.exists(args.archive):
-        print(f"error: archive not found: {args.archive}", file=sys.stderr)
-        return 1
-    if not os.path.isfile(args.archive):
-        print(f"error: not a file: {args.archive}", file=sys.stderr)
+    failed = _check_archive(args.archive)
+    if failed is not None:
+        return failed
+    if args.reuse and not os.path.isfile(args.reuse):
+        print(f"error: previous sidecar not found: {args.reuse}", file=sys.stderr)
         return 1
 
     out = args.output or sidecar_path_for(args.archive)
     try:
         stats = build_link_graph(
-            args.archive, args.output, force=args.force, progress=_progress
+            args.archive,
+            args.output,
+            force=args.force,
+            progress=_progress,
+            workers=args.workers,
+            resume=args.resume,
+            reuse=args.reuse,
         )
     except FileExistsError:
         # FileExistsError is an OSError subclass, so it MUST precede the
@@ -72,18 +95,108 @@ def _link_graph(args: argparse.Namespace) -> int:
     return 0
 
 
+def _title_index(args: argparse.Namespace) -> int:
+    """Run the title-index build for one archive and print a summary.
+
+    Exit codes match ``_link_graph``: 0 success; 1 user-fixable
+    precondition; 2 unexpected build failure.
+    """
+
+    def _progress(done: int, total: int) -> None:
+        """Emit a one-line progress message to stderr."""
+        if not args.quiet:
+            print(f"  …indexed {done} titles ({total} entries)", file=sys.stderr)
+
+    failed = _check_archive(args.archive)
+    if failed is not None:
+        return failed
+
+    out = args.output or title_index_path_for(args.archive)
+    try:
+        stats = build_title_index(
+            args.archive, args.output, force=args.force, progress=_progress
+        )
+    except FileExistsError:
+        # Must precede the OSError clause (FileExistsError subclasses it).
+        print(
+            f"error: sidecar already exists: {out}; pass --force to overwrite.",
+            file=sys.stderr,
+        )
+        return 1
+    except OpenZimMcpArchiveError:
+        print(f"error: not a valid ZIM archive: {args.archive}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"error: cannot write sidecar to {out}: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:  # noqa: BLE001 — operator CLI: report + nonzero exit
+        print(f"error: title-index build failed: {e}", file=sys.stderr)
+        return 2
+    print(f"built {out}: {stats.record_count} titles, {stats.bytes_written} bytes")
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    """``argparse`` type for a count that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {number})")
+    return number
+
+
+def _add_sidecar_parser(
+    sub: Any, name: str, help_text: str, func: Callable[[argparse.Namespace], int]
+) -> argparse.ArgumentParser:
+    """Register one ``build <artifact>`` subcommand with the shared flags."""
+    parser: argparse.ArgumentParser = sub.add_parser(name, help=help_text)
+    parser.add_argument("archive", help="Path to the .zim archive.")
+    parser.add_argument("--output", default=None, help="Sidecar output path.")
+    parser.add_argument(
+        "--force", action="store_true", help="Overwrite an existing sidecar."
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Suppress progress output."
+    )
+    parser.set_defaults(func=func)
+    return parser
+
+
 def build_main(argv: Optional[List[str]] = None) -> int:
     """Entry point for ``openzim-mcp build ...``. Returns a process exit code."""
     parser = argparse.ArgumentParser(prog="openzim-mcp build")
     sub = parser.add_subparsers(dest="artifact", required=True)
-    lg = sub.add_parser("link-graph", help="Build the inbound link-graph sidecar.")
-    lg.add_argument("archive", help="Path to the .zim archive.")
-    lg.add_argument("--output", default=None, help="Sidecar output path.")
-    lg.add_argument(
-        "--force", action="store_true", help="Overwrite an existing sidecar."
+    link_graph = _add_sidecar_parser(
+        sub, "link-graph", "Build the inbound link-graph sidecar.", _link_graph
+    )
+    link_graph.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help=(
+            "Parse the archive in N processes and merge with bounded memory "
+            "(default 1: the serial build). The sidecar is the same either way."
+        ),
+    )
+    link_graph.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue an interrupted build of the same archive from its last "
+            "checkpoint instead of starting over."
+        ),
+    )
+    link_graph.add_argument(
+        "--reuse",
+        metavar="PREVIOUS_SIDECAR",
+        default=None,
+        help=(
+            "Take the edges of entries whose content is unchanged from a "
+            "sidecar built for an earlier revision of the archive."
+        ),
+    )
+    _add_sidecar_parser(
+        sub, "title-index", "Build the title-lookup sidecar.", _title_index
     )
-    lg.add_argument("--quiet", action="store_true", help="Suppress progress output.")
-    lg.set_defaults(func=_link_graph)
     try:
         args = parser.parse_args(argv)
     except SystemExit as e:  # unknown artifact / bad args -> nonzero, no traceback
@@ -9,7 +9,15 @@ from typing import List, Literal, Optional
 from pydantic import BaseModel, Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .defaults import CACHE, CONTENT, META, SEARCH, VALID_TOOL_MODES
+from .defaults import (
+    CACHE,
+    CONTENT,
+    META,
+    SEARCH,
+    SERVER,
+    VALID_TOOL_MODES,
+    WARMUP,
+)
 from .exceptions import OpenZimMcpConfigurationError
 from .rate_limiter import RateLimitConfig
 
@@ -25,6 +33,7 @@ __all__ = [
     "RerankerConfig",
     "SearchConfig",
     "SynthesizeConfig",
+    "WarmupConfig",
 ]
 
 
@@ -35,13 +44,23 @@ class CacheConfig(BaseModel):
     max_size: int = Field(default=CACHE.MAX_SIZE, ge=1, le=10000)
     # Soft byte cap. The count-based ``max_size`` remains a hard upper
     # bound; ``max_bytes`` adds an approximate-size eviction trigger so
-    # a few large bundles can't pin hundreds of MB. Computed via
-    # ``len(json.dumps(value))`` — cheap, deterministic, and accurate
-    # enough for budgeting. ``0`` disables the byte cap entirely.
+    # a few large bundles can't pin hundreds of MB. Sized as approximate
+    # JSON length — from the length of string values, a producer-supplied
+    # estimate (EntryBundles), or ``len(json.dumps(value))`` otherwise —
+    # and at stored size under ``compact_storage``. ``0`` disables the
+    # byte cap entirely.
     max_bytes: int = Field(default=CACHE.MAX_BYTES, ge=0, le=8 * 1024 * 1024 * 1024)
     ttl_seconds: int = Field(default=CACHE.TTL_SECONDS, ge=60, le=86400)
     persistence_enabled: bool = Field(default=CACHE.PERSISTENCE_ENABLED)
     persistence_path: str = Field(default_factory=lambda: CACHE.PERSISTENCE_PATH)
+    # ``json`` rewrites one snapshot document at shutdown and parses all of
+    # it at startup. ``sqlite`` keeps one checksummed row per entry, writes
+    # incremental checkpoints from the background cleanup thread, and
+    # restores only the key index at startup — values load on first use.
+    persistence_backend: Literal["json", "sqlite"] = Field(
+        default="json",
+        description="Snapshot format for cache persistence: json or sqlite.",
+    )
 
     # Optional libzim reader cache tuning. These are independent of the
     # MCP-level response cache above; they size libzim's internal read
@@ -70,6 +89,114 @@ class CacheConfig(BaseModel):
         ),
     )
 
+    # Persistent archive handle pool. ``zim_archive`` reuses one open
+    # ``libzim.Archive`` per validated path while the file's stat token is
+    # unchanged, so libzim's dirent/cluster caches stay warm across calls.
+    archive_pool_max_open: int = Field(
+        default=CACHE.ARCHIVE_POOL_MAX_OPEN,
+        ge=0,
+        le=1024,
+        description=(
+            "Maximum archive handles kept open between calls (LRU-closed "
+            "beyond this). 0 disables pooling and opens per call."
+        ),
+    )
+    archive_pool_idle_seconds: float = Field(
+        default=CACHE.ARCHIVE_POOL_IDLE_SECONDS,
+        ge=0.0,
+        le=86400.0,
+        description=(
+            "Close a pooled archive handle unused for this many seconds. "
+            "0 disables idle eviction."
+        ),
+    )
+
+    # Compact storage: large strings (an EntryBundle's rendered markdown, a
+    # rendered entry body) are held as UTF-8 bytes — or zlib-compressed —
+    # and charged to ``max_bytes`` at their stored size, so the same budget
+    # holds several times more bundles (zlib shrinks prose roughly 3x).
+    # Values are decoded on every hit.
+    compact_storage: Literal["off", "utf8", "zlib"] = Field(
+        default="off",
+        description=(
+            "Storage form for large cached strings: off (as-is), utf8 "
+            "(UTF-8 bytes), or zlib (compressed UTF-8)."
+        ),
+    )
+    compact_min_chars: int = Field(
+        default=CACHE.COMPACT_MIN_CHARS,
+        ge=0,
+        le=10_000_000,
+        description="Only strings at least this long are stored compactly.",
+    )
+
+    # Size segmentation under ``max_bytes``: entries of at least
+    # ``large_entry_bytes`` (bundles, rendered pages) may use at most
+    # ``large_segment_fraction`` of the byte budget, so a burst of long
+    # articles cannot flush the small, high-hit-rate keys (path mappings,
+    # metadata). ``admission_filter`` additionally keeps a new large entry
+    # out of a full large segment when it is requested less often than the
+    # entry it would evict. ``large_entry_bytes=0`` disables segmentation.
+    large_entry_bytes: int = Field(
+        default=CACHE.LARGE_ENTRY_BYTES,
+        ge=0,
+        le=1024 * 1024 * 1024,
+        description="Entries at least this many bytes go to the large segment.",
+    )
+    large_segment_fraction: float = Field(
+        default=CACHE.LARGE_SEGMENT_FRACTION,
+        ge=0.05,
+        le=1.0,
+        description="Share of max_bytes the large segment may occupy.",
+    )
+    admission_filter: bool = Field(
+        default=CACHE.ADMISSION_FILTER,
+        description="Frequency-gate admission of large entries (TinyLFU).",
+    )
+    # Second cache tier shared between processes: a SQLite file every
+    # process reads on a local miss and writes through on every set. The
+    # multi-worker HTTP mode points all its workers at one (a per-run file
+    # when this is unset); setting it explicitly keeps the tier across
+    # restarts, or shares it between separately launched servers.
+    shared_path: Optional[str] = Field(
+        default=None,
+        description="SQLite file for the cross-process cache tier.",
+    )
+    shared_max_bytes: int = Field(
+        default=CACHE.SHARED_MAX_BYTES,
+        ge=0,
+        le=64 * 1024 * 1024 * 1024,
+        description="Stored-byte cap on the shared tier; 0 disables the cap.",
+    )
+    # Cross-call memo of archive stats. Within one call an archive is always
+    # stat'ed once; above zero, that stat also answers the calls of the next
+    # few seconds, which is what a slow network mount wants and what delays
+    # noticing an archive swap by as long.
+    stat_memo_seconds: float = Field(
+        default=CACHE.STAT_MEMO_SECONDS,
+        ge=0.0,
+        le=60.0,
+        description="Seconds an archive stat is reused across tool calls.",
+    )
+    # Bundle layout: ``whole`` caches an EntryBundle as one value, markdown
+    # included. ``sectioned`` caches its header (TOC, links, infobox) as a
+    # small entry and the markdown as per-section chunks loaded on demand,
+    # so ``get_section`` and synthesize attribution touch only the chunks
+    # they read and ``max_bytes`` holds the hot parts of many more articles.
+    bundle_layout: Literal["whole", "sectioned"] = Field(
+        default="whole",
+        description=(
+            "How entry bundles are cached: whole (one value) or sectioned "
+            "(header plus lazily loaded section chunks)."
+        ),
+    )
+    bundle_chunk_min_chars: int = Field(
+        default=CACHE.BUNDLE_CHUNK_MIN_CHARS,
+        ge=256,
+        le=1_000_000,
+        description="Smallest section chunk of a sectioned bundle, in characters.",
+    )
+
     @field_validator("persistence_path")
     @classmethod
     def normalize_persistence_path(cls, v: str) -> str:
@@ -91,6 +218,10 @@ class ContentConfig(BaseModel):
     table_row_threshold: int = Field(default=CONTENT.TABLE_ROW_THRESHOLD, ge=1)
     table_char_threshold: int = Field(default=CONTENT.TABLE_CHAR_THRESHOLD, ge=50)
     infobox_kv_limit: int = Field(default=CONTENT.INFOBOX_KV_LIMIT, ge=1, le=200)
+    lead_snippets: bool = Field(
+        default=CONTENT.LEAD_SNIPPETS,
+        description="Render search snippets from the entry's lead when possible.",
+    )
 
 
 class MetaConfig(BaseModel):
@@ -98,6 +229,26 @@ class MetaConfig(BaseModel):
 
     footer_enabled: bool = Field(default=META.FOOTER_ENABLED)
     tokenizer_encoding: str = Field(default=META.TOKENIZER_ENCODING)
+    timings_enabled: bool = Field(
+        default=META.TIMINGS_ENABLED,
+        description=(
+            "Attach a per-stage latency breakdown (intent parse, archive "
+            "open, Xapian, snippet render, bundle build, rerank, token "
+            "count) to each tool response as `_meta.timings`."
+        ),
+    )
+    token_estimator: Literal["exact", "approx", "auto"] = Field(
+        default="auto",
+        description=(
+            "How `_meta.tokens_est` is computed: `exact` tokenises the whole "
+            "response, `approx` extrapolates from sampled windows and reports "
+            "the error bound as `_meta.tokens_est_error`, `auto` approximates "
+            "only responses of at least `token_approx_min_chars`."
+        ),
+    )
+    token_approx_min_chars: int = Field(
+        default=META.TOKEN_APPROX_MIN_CHARS, ge=1024, le=10_000_000
+    )
 
 
 class SearchConfig(BaseModel):
@@ -116,12 +267,97 @@ class SearchConfig(BaseModel):
     # per-archive search adds up — 10 ZIM files × 3 s ≈ 30 s in one
     # threadpool slot. When this budget elapses, the fan-out stops
     # iterating and the caller gets the partial result so the threadpool
-    # slot frees up. ``0`` disables the timeout (legacy behavior).
+    # slot frees up. ``0`` lifts the budget up to the hard
+    # ``SEARCH_ALL_MAX_WAIT_SECONDS`` ceiling, which always applies.
     search_all_total_timeout_seconds: float = Field(
         default=20.0,
         ge=0.0,
         le=300.0,
-        description="Aggregate timeout for search_all fan-out (seconds). 0 disables.",
+        description=(
+            "Aggregate timeout for search_all fan-out (seconds). 0 falls back "
+            "to the 300 s ceiling."
+        ),
+    )
+    # Archives are searched concurrently on the dedicated ``fanout`` pool
+    # (libzim's Xapian calls release the GIL), so wall time tracks the
+    # slowest archive rather than the sum. Results keep archive-list order.
+    search_all_max_concurrency: int = Field(
+        default=SEARCH.SEARCH_ALL_MAX_CONCURRENCY,
+        ge=1,
+        le=64,
+        description="Archives searched at once by search_all. 1 searches serially.",
+    )
+    search_all_per_archive_timeout_seconds: float = Field(
+        default=SEARCH.SEARCH_ALL_PER_ARCHIVE_TIMEOUT_SECONDS,
+        ge=0.0,
+        le=300.0,
+        description=(
+            "Abandon one archive's search_all leg this many seconds after it "
+            "was queued and report it as failed. 0 disables."
+        ),
+    )
+    # Paginated full-text search keeps each query's ranked hit list between
+    # cursor hops so the next page is a slice rather than a fresh Xapian
+    # query. Either knob at ``0`` disables sessions (every page re-runs).
+    session_ttl_seconds: float = Field(
+        default=SEARCH.SESSION_TTL_SECONDS,
+        ge=0.0,
+        le=3600.0,
+        description="Idle lifetime of a search session (seconds). 0 disables.",
+    )
+    session_max_ids: int = Field(
+        default=SEARCH.SESSION_MAX_IDS,
+        ge=0,
+        le=10_000_000,
+        description="Total ranked entry paths held across search sessions.",
+    )
+
+
+class WarmupConfig(BaseModel):
+    """Opt-in cache prewarming at startup and after an archive is replaced.
+
+    Every cache key carries the archive's stat token, so a server start or
+    an archive swap leaves the bundle, snippet and path-mapping caches cold
+    for that file. When enabled, a low-priority background thread renders
+    the ``top_n`` most popular entries of each archive ahead of the first
+    requests, ranked by ``signal``:
+
+    * ``inbound_degree`` — most-linked entries, from the link-graph sidecar;
+    * ``access_log`` — most frequent lines of ``access_log_path``, one entry
+      path per line, optionally prefixed ``<archive file name><TAB>``;
+    * ``main_page`` — the main page, then the pages it links to in order.
+
+    An archive the chosen signal knows nothing about (no sidecar, no log
+    lines) is warmed from its main page instead. Progress is reported by
+    ``zim_health`` under ``prewarm``.
+    """
+
+    enabled: bool = Field(default=WARMUP.ENABLED)
+    signal: Literal["inbound_degree", "access_log", "main_page"] = Field(
+        default="inbound_degree",
+        description="Popularity signal that ranks the entries to warm.",
+    )
+    top_n: int = Field(
+        default=WARMUP.TOP_N,
+        ge=1,
+        le=100_000,
+        description="Entries warmed per archive (also capped by cache.max_size).",
+    )
+    time_budget_seconds: float = Field(
+        default=WARMUP.TIME_BUDGET_SECONDS,
+        ge=0.0,
+        le=86400.0,
+        description="Wall-clock budget for warming one archive. 0 disables.",
+    )
+    cpu_share: float = Field(
+        default=WARMUP.CPU_SHARE,
+        gt=0.0,
+        le=1.0,
+        description="Fraction of one core the warmup thread may use.",
+    )
+    access_log_path: Optional[Path] = Field(
+        default=None,
+        description="Entry-path log replayed by signal='access_log'.",
     )
 
 
@@ -183,6 +419,16 @@ class SynthesizeConfig(BaseModel):
             "on a default install. Primary-archive hits are exempt."
         ),
     )
+    parallelism: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description=(
+            "Archives searched, and top-hit bundles built, concurrently per "
+            "synthesize call on the shared fan-out pool. 1 runs every stage "
+            "serially."
+        ),
+    )
 
 
 class RerankerConfig(BaseModel):
@@ -357,6 +603,7 @@ class OpenZimMcpConfig(BaseSettings):
     meta: MetaConfig = Field(default_factory=MetaConfig)
     search: SearchConfig = Field(default_factory=SearchConfig)
     synthesize: SynthesizeConfig = Field(default_factory=SynthesizeConfig)
+    warmup: WarmupConfig = Field(default_factory=WarmupConfig)
 
     # Server settings
     server_name: str = "openzim-mcp"
@@ -387,6 +634,16 @@ class OpenZimMcpConfig(BaseSettings):
         le=65535,
         description="HTTP bind port (only used when transport='http' or 'sse')",
     )
+    workers: int = Field(
+        default=SERVER.WORKERS,
+        ge=1,
+        le=SERVER.MAX_WORKERS,
+        description=(
+            "HTTP worker processes (only used when transport='http'). Above "
+            "1, a router on host:port pins each MCP session to one worker "
+            "and the workers share a SQLite cache tier."
+        ),
+    )
     auth_token: Optional[SecretStr] = Field(
         default=None,
         description=(
@@ -430,7 +687,10 @@ class OpenZimMcpConfig(BaseSettings):
         default=5,
         ge=1,
         le=60,
-        description="Polling interval for resource subscriptions (seconds).",
+        description=(
+            "Polling interval (seconds) of the HTTP archive watcher behind "
+            "resource subscriptions and replaced-archive cache purges."
+        ),
     )
     resource_cache_ttl_seconds: int = Field(
         default=3600,
@@ -456,12 +716,21 @@ class OpenZimMcpConfig(BaseSettings):
         default=True,
         description=(
             "Master switch for resource subscriptions. When False, the "
-            "polling watcher is not started and the `subscriptions/listen` "
-            "handler is not registered, so listen requests fail with "
-            "method-not-found and the capability is not advertised. Only "
-            "meaningful on the HTTP transport: the watcher runs under the "
-            "HTTP lifespan, so a stdio server withholds the capability "
-            "regardless of this setting."
+            "polling watcher publishes no change notifications (it still "
+            "runs to purge a replaced archive's cache entries) and the "
+            "`subscriptions/listen` handler is not registered, so listen "
+            "requests fail with method-not-found and the capability is not "
+            "advertised. Only meaningful on the HTTP transport: the watcher "
+            "runs under the HTTP lifespan, so a stdio server withholds the "
+            "capability regardless of this setting."
+        ),
+    )
+    call_trace_path: Path | None = Field(
+        default=None,
+        description=(
+            "Append every tool call (tool, sanitized arguments, latency, "
+            "cache hits) to this JSONL file for benchmarks/replay.py. "
+            "Loaded from OPENZIM_MCP_CALL_TRACE_PATH. Absent => no recording."
         ),
     )
     presets_override_path: Path | None = Field(
@@ -413,13 +413,30 @@ def _drop_boilerplate_paragraphs(
     whichever term matches them.
     """
 
+    keep = [
+        paragraphs[index] for index in _kept_paragraph_indices(paragraphs, is_query_hit)
+    ]
+    return keep or list(paragraphs)
+
+
+def _kept_paragraph_indices(
+    paragraphs: List[str],
+    is_query_hit: Optional[Callable[[str], bool]] = None,
+) -> List[int]:
+    """Indices ``_drop_boilerplate_paragraphs`` keeps, without its fallback.
+
+    Each decision reads the paragraph itself and at most the next one, which
+    is what lets ``create_lead_snippet`` tell which decisions a truncated
+    document settles.
+    """
+
     def _is_droppable_nav(index: int) -> bool:
         paragraph = paragraphs[index]
         if is_query_hit is not None and is_query_hit(paragraph):
             return False
         return _is_nav_list_paragraph(paragraph)
 
-    keep: List[str] = []
+    keep: List[int] = []
     for index, paragraph in enumerate(paragraphs):
         visible = _LINK_TO_TEXT_RE.sub(r"\1", paragraph).strip()
         if not visible and index > 0:
@@ -436,8 +453,8 @@ def _drop_boilerplate_paragraphs(
             and _is_droppable_nav(index + 1)
         ):
             continue
-        keep.append(paragraph)
-    return keep or list(paragraphs)
+        keep.append(index)
+    return keep
 
 
 # An empty-text markdown link: what html2text leaves of a zimit
@@ -1816,6 +1833,72 @@ class ContentProcessor:
 
         return snippet_text
 
+    def create_lead_snippet(
+        self,
+        lead: str,
+        *,
+        query: Optional[str] = None,
+        max_paragraphs: int = 2,
+        title: Optional[str] = None,
+        snippet_length: Optional[int] = None,
+    ) -> Optional[str]:
+        """``create_snippet`` over a rendered lead, or ``None`` if it can't tell.
+
+        ``lead`` is the render of a document prefix cut by
+        :func:`openzim_mcp.lead_snippet.extract_lead_html`. Its paragraphs
+        are the full render's, except that the last one may be cut short and
+        the boilerplate check on the one before it looks at that last one.
+        Only the paragraphs before those two are settled. The snippet is
+        returned when ``create_snippet`` over the full render would choose
+        its paragraphs among the settled ones, which makes the two results
+        identical. Otherwise the result is ``None`` and the caller renders
+        the whole entry: a query with no whole-word hit in the settled
+        paragraphs may hit past the cut, or fall back to a stem match there.
+        """
+        content = self._strip_leading_title_heading(lead, title) if title else lead
+        if not content:
+            return None
+        typed = _keep_highlightable_terms(query) if query else []
+        raw = content.split("\n\n")
+        kept_indices = _kept_paragraph_indices(
+            raw,
+            is_query_hit=(
+                (lambda p: any(_word_in(_fold(p), t, prefix=pfx) for t, pfx in typed))
+                if typed
+                else None
+            ),
+        )
+        kept = [raw[i] for i in kept_indices]
+        settled = sum(1 for i in kept_indices if i < len(raw) - 2)
+        start_idx = 0
+        if typed:
+            hit = next(
+                (
+                    i
+                    for i, p in enumerate(kept[:settled])
+                    if any(_word_in(_fold(p), t, prefix=pfx) for t, pfx in typed)
+                ),
+                None,
+            )
+            if hit is None:
+                return None
+            start_idx = hit
+        # Mirror _select_snippet_paragraphs: it stops at the paragraph after
+        # the ``max_paragraphs``-th content one, so that one must be settled.
+        content_count = 0
+        for paragraph in kept[start_idx:settled]:
+            if not _MARKDOWN_HEADING_RE.match(paragraph):
+                content_count += 1
+                if content_count >= max_paragraphs:
+                    return self.create_snippet(
+                        lead,
+                        query=query,
+                        max_paragraphs=max_paragraphs,
+                        title=title,
+                        snippet_length=snippet_length,
+                    )
+        return None
+
     @staticmethod
     def _strip_leading_title_heading(content: str, title: str) -> str:
         """Drop a leading ``# <title>`` line that duplicates the entry title.
@@ -2167,9 +2250,25 @@ class ContentProcessor:
             "media_links": [],
         }
         try:
-            for link in soup.find_all("a", href=True):
-                if not isinstance(link, Tag):
+            # One descendant walk instead of a ``find_all`` per anchor/media
+            # tag (seven full-tree scans on a long article). Elements are
+            # bucketed by tag name in document order and then emitted anchors
+            # first, media in ``_MEDIA_SELECTORS`` order — the exact sequence
+            # the per-tag scans produced.
+            anchors: List[Tag] = []
+            media: Dict[str, List[Tag]] = {tag: [] for tag, _, _ in _MEDIA_SELECTORS}
+            for node in soup.descendants:
+                if not isinstance(node, Tag):
+                    continue
+                if node.name == "a":
+                    if node.get("href") is not None:
+                        anchors.append(node)
                     continue
+                bucket = media.get(node.name)
+                if bucket is not None:
+                    bucket.append(node)
+
+            for link in anchors:
                 try:
                     _classify_anchor(link, links_data)
                 except Exception as e:  # one bad anchor must not truncate
@@ -2177,9 +2276,7 @@ class ContentProcessor:
                     links_data["error"] = str(e)
 
             for tag, attr, media_type in _MEDIA_SELECTORS:
-                for element in soup.find_all(tag):
-                    if not isinstance(element, Tag):
-                        continue
+                for element in media[tag]:
                     _append_media_link(element, attr, media_type, links_data)
 
         except Exception as e:
@@ -37,6 +37,38 @@ class CacheDefaults:
     MAX_BYTES: int = 64 * 1024 * 1024
     PERSISTENCE_ENABLED: bool = False
     PERSISTENCE_PATH: str = field(default_factory=_default_persistence_path)
+    # Open ``libzim.Archive`` handles kept between tool calls (see
+    # ``zim/archive_pool.py``). Each costs one file descriptor plus libzim's
+    # per-archive dirent cache; 16 covers a typical multi-archive library
+    # without letting a 40-archive fan-out pin every file open. ``0``
+    # disables pooling and restores open-per-call.
+    ARCHIVE_POOL_MAX_OPEN: int = 16
+    # A handle nobody has asked for in this long is closed, so an archive
+    # touched once does not hold its descriptor for the process lifetime.
+    ARCHIVE_POOL_IDLE_SECONDS: float = 600.0
+    # Compact cache storage (``CacheConfig.compact_storage``): strings
+    # shorter than this stay as ``str`` — packing a snippet saves nothing
+    # worth a decode on every hit.
+    COMPACT_MIN_CHARS: int = 4096
+    # Size segmentation (``CacheConfig.large_entry_bytes``). 16 KB sits well
+    # above path mappings, metadata and suggestion lists and below almost
+    # every EntryBundle; bundles may take 80% of ``MAX_BYTES``, leaving the
+    # rest to keys that are cheap to hold and hit constantly.
+    LARGE_ENTRY_BYTES: int = 16 * 1024
+    LARGE_SEGMENT_FRACTION: float = 0.8
+    ADMISSION_FILTER: bool = True
+    # Cap on the shared cache tier (``CacheConfig.shared_path``), in stored
+    # (compressed) bytes. It sits on disk, not in each worker's heap, so it
+    # can afford to be several times ``MAX_BYTES``.
+    SHARED_MAX_BYTES: int = 512 * 1024 * 1024
+    # How long one ``stat()`` of an archive answers later tool calls. Zero
+    # keeps every call checking the file afresh (each call still stats an
+    # archive only once); see ``archive_generations``.
+    STAT_MEMO_SECONDS: float = 0.0
+    # ``cache.bundle_layout="sectioned"``: section bodies are grouped into
+    # chunks of at least this many characters, so a run of stub sections
+    # is one cache entry rather than a dozen 200-character ones.
+    BUNDLE_CHUNK_MIN_CHARS: int = 4096
 
 
 @dataclass(frozen=True)
@@ -57,6 +89,9 @@ class ContentDefaults:
     TABLE_ROW_THRESHOLD: int = 8
     TABLE_CHAR_THRESHOLD: int = 600
     INFOBOX_KV_LIMIT: int = 30
+    # Render only the lead of an HTML entry for a search snippet when the
+    # lead alone determines it (see openzim_mcp.lead_snippet).
+    LEAD_SNIPPETS: bool = True
 
 
 @dataclass(frozen=True)
@@ -133,6 +168,10 @@ class ServerDefaults:
     TOOL_MODE: str = "simple"
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # HTTP worker processes. One keeps the historical single-process server;
+    # more runs a session-affine router in front of that many workers.
+    WORKERS: int = 1
+    MAX_WORKERS: int = 64
 
 
 @dataclass(frozen=True)
@@ -148,6 +187,13 @@ class MetaDefaults:
 
     FOOTER_ENABLED: bool = True
     TOKENIZER_ENCODING: str = "cl100k_base"
+    # Per-stage latency breakdown in ``_meta.timings``; off because it makes
+    # otherwise identical responses differ byte-for-byte.
+    TIMINGS_ENABLED: bool = False
+    # ``meta.token_estimator="auto"`` approximates ``_meta.tokens_est`` for
+    # responses of at least this many characters — about 5 ms of cl100k
+    # encoding, below which an exact count is cheap enough to keep.
+    TOKEN_APPROX_MIN_CHARS: int = 32768
 
 
 @dataclass(frozen=True)
@@ -166,6 +212,37 @@ class SearchDefaults:
     # caller at ``offset`` pagination instead. Generous (10x the legacy
     # cap) so no legitimate single-page request is affected.
     MAX_RESULT_LIMIT: int = 1000
+    # ``search_all`` fan-out: how many archives one call searches at once,
+    # and how long any single archive may run before it is abandoned and
+    # reported as a per-file failure. Concurrency 1 searches one archive at a
+    # time, as the serial loop did.
+    SEARCH_ALL_MAX_CONCURRENCY: int = 8
+    SEARCH_ALL_PER_ARCHIVE_TIMEOUT_SECONDS: float = 10.0
+    # Hard ceiling on one ``search_all`` call's wait, applied even when the
+    # aggregate budget is ``0``: abandoned legs keep their pool workers, so
+    # without it a call could wait forever behind stragglers.
+    SEARCH_ALL_MAX_WAIT_SECONDS: float = 300.0
+    # Search sessions (``zim/search_sessions.py``): how long an idle query's
+    # ranked hit list is kept for its next cursor page, and how many entry
+    # paths all held sessions may total. A path is ~50-100 bytes, so the
+    # default budget is a few MB.
+    SESSION_TTL_SECONDS: float = 120.0
+    SESSION_MAX_IDS: int = 50_000
+
+
+@dataclass(frozen=True)
+class WarmupDefaults:
+    """Default values for the cache prewarmer (``zim/prewarm.py``)."""
+
+    # Off by default: warming spends CPU (and cache budget) on a guess about
+    # what will be read, which only pays on a server that serves traffic.
+    ENABLED: bool = False
+    TOP_N: int = 200
+    # Wall-clock cap on warming one archive, duty-cycle pauses included.
+    TIME_BUDGET_SECONDS: float = 120.0
+    # Fraction of one core the warmup thread may use: after an entry that
+    # took ``t`` seconds of CPU it sleeps ``t * (1 / share - 1)``.
+    CPU_SHARE: float = 0.25
 
 
 # Instantiate defaults for easy access
@@ -180,6 +257,7 @@ NAMESPACE_SAMPLING = NamespaceSamplingDefaults()
 BATCH = BatchDefaults()
 META = MetaDefaults()
 SEARCH = SearchDefaults()
+WARMUP = WarmupDefaults()
 
 # Tool mode constants
 TOOL_MODE_ADVANCED = "advanced"
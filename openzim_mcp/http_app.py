@@ -18,6 +18,7 @@ import warnings
 from collections import deque
 from concurrent.futures import Future
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -33,11 +34,13 @@ from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 from starlette.routing import Route
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from .archive_generations import ARCHIVE_GENERATIONS
 from .exceptions import OpenZimMcpConfigurationError, OpenZimMcpTimeoutError
+from .metrics import render_metrics
 from .timeout_utils import _get_executor, run_with_timeout
 
 if TYPE_CHECKING:
@@ -48,6 +51,7 @@ logger = logging.getLogger(__name__)
 
 HEALTHZ_PATH = "/healthz"
 READYZ_PATH = "/readyz"
+METRICS_PATH = "/metrics"
 
 # The one route the SDK mints sessions on — its ``streamable_http_path``
 # default, which the app builder below is left to apply. The sessionless gate
@@ -56,9 +60,14 @@ READYZ_PATH = "/readyz"
 # of a 404. A test asserts the built app really routes this path.
 MCP_PATH = "/mcp"
 
-# Health endpoints exempt from auth.
+# Health endpoints exempt from auth. ``/metrics`` is deliberately not among
+# them: stage names and call volumes describe the deployment, so a scraper
+# authenticates with the same bearer token as any other client.
 AUTH_EXEMPT_PATHS = {HEALTHZ_PATH, READYZ_PATH}
 
+# Content type of the Prometheus text exposition format, version 0.0.4.
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 # Request headers a browser client may send to the MCP endpoint. A module
 # constant rather than an inline literal so the policy is inspectable — see
 # ``test_header_bearing_tool_params_are_cors_allowed``, which holds the one
@@ -194,6 +203,22 @@ async def healthz(request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
+def _make_metrics(
+    server: "OpenZimMcpServer",
+) -> Callable[[Request], Awaitable[PlainTextResponse]]:
+    # Rendered on the event loop, not a worker thread: the per-tool series
+    # are loop-confined (see ``metrics.ToolMetrics``) and every other read
+    # is lock-free or a short copy, so there is nothing here worth a thread
+    # hop — and a scrape never waits behind a saturated tool pool.
+    async def metrics(request: Request) -> PlainTextResponse:
+        """Prometheus scrape endpoint: tool, cache, pool and stage metrics."""
+        return PlainTextResponse(
+            render_metrics(server), media_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+    return metrics
+
+
 def _make_readyz(
     server: "OpenZimMcpServer",
 ) -> Callable[[Request], Awaitable[JSONResponse]]:
@@ -448,12 +473,14 @@ def apply_cors_middleware(app: Starlette, config: object) -> None:
 def build_starlette_app(server: "OpenZimMcpServer") -> Starlette:
     """Build the Starlette app served by streamable-HTTP transport.
 
-    Includes /healthz, /readyz, and (later tasks) auth/CORS middleware.
+    Includes /healthz, /readyz, /metrics, and (later tasks) auth/CORS
+    middleware.
     """
     return Starlette(
         routes=[
             Route(HEALTHZ_PATH, healthz),
             Route(READYZ_PATH, _make_readyz(server)),
+            Route(METRICS_PATH, _make_metrics(server)),
         ]
     )
 
@@ -784,9 +811,9 @@ def serve_streamable_http(
 ) -> None:
     """Serve OpenZIM MCP over streamable-HTTP transport.
 
-    Validates the safe-startup matrix, registers /healthz and /readyz on the
-    underlying MCPServer Starlette app, applies bearer-token auth and CORS,
-    then runs uvicorn.
+    Validates the safe-startup matrix, registers /healthz, /readyz and
+    /metrics on the underlying MCPServer Starlette app, applies bearer-token
+    auth and CORS, then runs uvicorn.
 
     Args:
         server: the OpenZIM MCP server to serve.
@@ -810,6 +837,8 @@ def serve_streamable_http(
         server.mcp.custom_route(HEALTHZ_PATH, methods=["GET"])(healthz)
     if READYZ_PATH not in _registered:
         server.mcp.custom_route(READYZ_PATH, methods=["GET"])(_make_readyz(server))
+    if METRICS_PATH not in _registered:
+        server.mcp.custom_route(METRICS_PATH, methods=["GET"])(_make_metrics(server))
 
     # Transport configuration is an argument to the app builder on the v2 SDK
     # (there is no ``settings`` object to mutate). ``host`` feeds the SDK's
@@ -838,8 +867,11 @@ def serve_streamable_http(
     app.add_middleware(BearerTokenAuthMiddleware, config=server.config)
     apply_cors_middleware(app, server.config)
 
-    # Wire the resource-change watcher when subscriptions are enabled (the bus
-    # exists) and there are allowed dirs to watch.
+    # Wire the resource-change watcher whenever there are allowed dirs to
+    # watch. The archive generation registry is always active, and the
+    # watcher's on_stale hook is what purges a replaced archive's cache
+    # entries within one poll interval; subscriptions (the bus) and cache
+    # warmup (the prewarmer) only add listeners to it.
     #
     # Why we wrap lifespan_context instead of using add_event_handler:
     # streamable_http_app() supplies its own Starlette lifespan, so
@@ -847,16 +879,28 @@ def serve_streamable_http(
     # on_startup/on_shutdown — is never installed and
     # add_event_handler('startup', ...) silently does nothing.
     bus = server.subscription_bus
-    if bus is not None and server.config.allowed_directories:
+    prewarmer = getattr(server.zim_operations, "prewarmer", None)
+    if prewarmer is not None and not prewarmer.enabled:
+        prewarmer = None
+    if server.config.allowed_directories:
         from . import subscriptions as _subs
 
         async def _on_change(uri: str, change_type: str) -> None:
-            await _subs.publish_change(bus, uri, change_type)
+            if bus is not None:
+                await _subs.publish_change(bus, uri, change_type)
+
+        def _refresh_generations(paths: list[str]) -> None:
+            # Registry keys are validated (resolved) paths; the watcher's
+            # are as globbed under the allowed directories.
+            for path in paths:
+                ARCHIVE_GENERATIONS.refresh(Path(path).resolve())
 
         watcher = _subs.MtimeWatcher(
             server.config.allowed_directories,
             server.config.watch_interval_seconds,
             on_change=_on_change,
+            on_replaced=prewarmer.schedule if prewarmer is not None else None,
+            on_stale=_refresh_generations,
         )
 
         inner_lifespan = app.router.lifespan_context
@@ -0,0 +1,765 @@
+"""Multi-worker serving for the streamable-HTTP transport.
+
+One uvicorn process is one core of Python: HTML rendering, intent parsing and
+snippet assembly all hold the GIL, so a single-process server saturates long
+before the disk does. ``workers > 1`` runs that many full server processes
+instead, each on its own Unix socket in a private runtime directory, behind
+a small router that owns the public ``host:port``.
+
+The router exists because streamable-HTTP sessions are process-local. The SDK
+mints an ``Mcp-Session-Id`` inside the process that handled ``initialize`` and
+keeps the transport in that process's session table; a follow-up request
+that lands on any other process is answered ``404 Session not found``. Plain
+``SO_REUSEPORT`` or uvicorn's own ``--workers`` spread *connections*, not
+sessions, so they break every stateful client. :class:`StickyRouter` instead:
+
+* sends a request without a session (``initialize``, the stateless
+  2026-07-28 path, health probes) to the worker with the fewest requests in
+  flight;
+* learns the session id from the response that minted it and pins every
+  later request carrying that id — POSTs, the long-lived GET stream, the
+  closing DELETE — to the same worker;
+* forgets a session on its DELETE or when its worker answers 404, and
+  bounds the table LRU-wise, so an abandoned session costs one entry until
+  it ages out.
+
+Everything else — auth, Host/Origin checks, the sessionless-request gate,
+CORS — still happens in the workers, exactly as in single-process mode; the
+router forwards headers untouched apart from hop-by-hop ones and sets
+``X-Forwarded-For`` so per-client rate limiting keeps seeing the real peer.
+``/metrics`` is the one path the router answers itself: it scrapes every
+worker and relabels each series with ``worker``, so a scrape sees the whole
+pool rather than whichever worker it happened to land on.
+
+The workers share one cache tier (``CacheConfig.shared_path``, a SQLite file;
+see ``cache_store.SharedCacheStore``), so an article one worker rendered is
+a disk read rather than a re-render for the rest. Each worker's in-process
+cache, rate limiter and archive handle pool remain its own; the rate limiter
+runs on a ``1/workers`` share of the configured rate and burst.
+
+:class:`WorkerPool` restarts a worker that dies. Sessions it held are lost —
+their clients get the protocol's 404 and re-initialize — but the pool keeps
+its size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import multiprocessing
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from .exceptions import OpenZimMcpConfigurationError
+from .http_app import (
+    METRICS_PATH,
+    PROMETHEUS_CONTENT_TYPE,
+    SHUTDOWN_GRACE_SECONDS,
+    _default_uvicorn_runner,
+    check_safe_startup,
+)
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .config import OpenZimMcpConfig
+    from .rate_limiter import RateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "RouterForwardedHeaders",
+    "SessionTable",
+    "StickyRouter",
+    "WorkerPool",
+    "merge_worker_metrics",
+    "serve_multi_worker",
+    "worker_config",
+]
+
+# Sessions the router remembers. Far above any realistic count of live
+# sessions; an entry evicted while its session is still in use routes that
+# session by hash, which reaches the owning worker only by luck — the client
+# then sees a 404 and re-initializes.
+MAX_SESSIONS = 100_000
+
+# How long the supervisor waits for every worker to bind its socket. A cold
+# start imports the package and may load the reranker, so this is generous.
+WORKER_START_TIMEOUT_S = 60.0
+
+# Minimum gap between restarts of the same worker, so a worker that dies on
+# startup (bad archive directory, missing dependency) does not spin.
+WORKER_RESTART_BACKOFF_S = 5.0
+
+# Headers that describe one hop of the connection, not the message; the
+# router's own uvicorn and httpx frame each side themselves.
+_HOP_BY_HOP = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-connection",
+        b"te",
+        b"trailer",
+        b"transfer-encoding",
+        b"upgrade",
+    }
+)
+
+# Set by the router itself: httpx recomputes the length of the buffered
+# body, and the forwarding headers carry the peer the router resolved.
+_REPLACED = frozenset({b"content-length", b"x-forwarded-for", b"x-forwarded-proto"})
+
+# Stamped on every response by uvicorn itself; the router's own uvicorn adds
+# them again, so the worker's copies would be duplicates.
+_STAMPED = frozenset({b"date", b"server"})
+
+_SESSION_HEADER = "mcp-session-id"
+
+
+class SessionTable:
+    """Which worker owns each live session, and how busy each worker is.
+
+    Only ever touched from the router's event loop, so it needs no lock.
+    """
+
+    def __init__(self, workers: int, max_sessions: int = MAX_SESSIONS) -> None:
+        """Track ``workers`` workers and at most ``max_sessions`` sessions."""
+        self.workers = workers
+        self.max_sessions = max_sessions
+        self._owners: "OrderedDict[str, int]" = OrderedDict()
+        self._in_flight = [0] * workers
+        self._rotation = 0
+
+    def __len__(self) -> int:
+        """Number of sessions currently pinned."""
+        return len(self._owners)
+
+    def route(self, session_id: Optional[str]) -> int:
+        """The worker a request carrying ``session_id`` (or none) goes to."""
+        if session_id is not None:
+            owner = self._owners.get(session_id)
+            if owner is not None:
+                self._owners.move_to_end(session_id)
+                return owner
+            # Unknown id (expired from the table, or never minted here): any
+            # worker answers 404 for it, but a stable choice keeps a retry
+            # storm for one id on one worker.
+            return zlib.crc32(session_id.encode("utf-8")) % self.workers
+        # Least in flight; the rotating start breaks ties so an idle pool
+        # still spreads new sessions instead of stacking them on worker 0.
+        start = self._rotation
+        self._rotation = (self._rotation + 1) % self.workers
+        order = [(start + i) % self.workers for i in range(self.workers)]
+        return min(order, key=lambda w: self._in_flight[w])
+
+    def learn(self, session_id: str, worker: int) -> None:
+        """Pin ``session_id`` to the worker that minted it."""
+        self._owners[session_id] = worker
+        self._owners.move_to_end(session_id)
+        while len(self._owners) > self.max_sessions:
+            self._owners.popitem(last=False)
+
+    def forget(self, session_id: str) -> None:
+        """Drop ``session_id`` (closed, or unknown to its worker)."""
+        self._owners.pop(session_id, None)
+
+    def forget_worker(self, worker: int) -> None:
+        """Drop every session of a worker that was restarted."""
+        for session_id in [s for s, w in self._owners.items() if w == worker]:
+            del self._owners[session_id]
+
+    def started(self, worker: int) -> None:
+        """Count a request as in flight on ``worker``."""
+        self._in_flight[worker] += 1
+
+    def finished(self, worker: int) -> None:
+        """Count a request on ``worker`` as done."""
+        self._in_flight[worker] -= 1
+
+    def in_flight(self) -> List[int]:
+        """Requests in flight per worker."""
+        return list(self._in_flight)
+
+
+def _with_worker_label(line: str, worker: int) -> str:
+    series, _, value = line.rpartition(" ")
+    label = f'worker="{worker}"'
+    if "{" in series:
+        name, _, rest = series.partition("{")
+        joined = label if rest.startswith("}") else f"{label},"
+        return f"{name}{{{joined}{rest} {value}"
+    return f"{series}{{{label}}} {value}"
+
+
+def merge_worker_metrics(texts: Dict[int, str]) -> str:
+    """Merge per-worker Prometheus text into one exposition.
+
+    Each sample gains a ``worker`` label. The text format requires a
+    family's samples to follow its ``# TYPE`` line contiguously, so samples
+    are regrouped by family rather than concatenated worker by worker.
+    """
+    families: "OrderedDict[str, Tuple[List[str], List[str]]]" = OrderedDict()
+    for worker, text in sorted(texts.items()):
+        current: Optional[str] = None
+        for line in text.splitlines():
+            if not line:
+                continue
+            if line.startswith("# "):
+                parts = line.split(" ", 3)
+                if len(parts) < 3:
+                    continue
+                current = parts[2]
+                meta, _ = families.setdefault(current, ([], []))
+                if line not in meta:
+                    meta.append(line)
+                continue
+            if current is None:
+                current = line.split("{", 1)[0].split(" ", 1)[0]
+                families.setdefault(current, ([], []))
+            families[current][1].append(_with_worker_label(line, worker))
+    lines: List[str] = []
+    for meta, samples in families.values():
+        lines.extend(meta)
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+class _BodyTooLarge(Exception):
+    """The request body crossed the router's size cap."""
+
+
+async def _read_body(receive: Receive, limit: int) -> Optional[bytes]:
+    """The whole request body, or ``None`` if the client went away."""
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            return None
+        body.extend(message.get("body", b""))
+        if len(body) > limit:
+            raise _BodyTooLarge()
+        if not message.get("more_body", False):
+            return bytes(body)
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+class StickyRouter:
+    """ASGI app that forwards each request to the worker owning its session.
+
+    ``sockets`` are the workers' Unix socket paths, by worker index. Request
+    bodies are buffered (MCP messages are small, and the cap mirrors the
+    SDK's own) so an upstream connect failure can still be answered with a
+    clean 502; responses stream through unbuffered, which is what keeps a
+    ``subscriptions/listen`` SSE stream live.
+    """
+
+    def __init__(
+        self,
+        sockets: Sequence[str],
+        *,
+        pool: Optional["WorkerPool"] = None,
+        max_body_size: Optional[int] = None,
+        max_sessions: int = MAX_SESSIONS,
+    ) -> None:
+        """Route across the workers listening on ``sockets``."""
+        from mcp.server.streamable_http_manager import DEFAULT_MAX_REQUEST_BODY_SIZE
+
+        self.sockets = list(sockets)
+        self.sessions = SessionTable(len(self.sockets), max_sessions)
+        self._pool = pool
+        self._max_body_size = (
+            max_body_size
+            if max_body_size is not None
+            else DEFAULT_MAX_REQUEST_BODY_SIZE
+        )
+        self._clients: Dict[int, "httpx.AsyncClient"] = {}
+        self._generations: Dict[int, int] = {}
+
+    def _client(self, worker: int) -> "httpx.AsyncClient":
+        import httpx
+
+        if self._pool is not None:
+            # A restarted worker has none of its predecessor's sessions;
+            # unpin them so they fail fast with a 404 on the new process.
+            generation = self._pool.generation(worker)
+            if self._generations.setdefault(worker, generation) != generation:
+                self._generations[worker] = generation
+                self.sessions.forget_worker(worker)
+        client = self._clients.get(worker)
+        if client is None:
+            client = self._clients[worker] = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=self.sockets[worker]),
+                base_url="http://openzim-mcp-worker",
+                # No read timeout: an SSE stream is idle between events by
+                # design. The workers enforce their own tool timeouts.
+                timeout=httpx.Timeout(None, connect=5.0),
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """Close the upstream connections."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve one ASGI connection."""
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            # No websocket endpoints exist on the workers either.
+            await send({"type": "websocket.close", "code": 1003})
+            return
+        if scope["path"] == METRICS_PATH and scope["method"] == "GET":
+            await self._metrics(scope, receive, send)
+            return
+        await self._proxy(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _upstream_headers(self, scope: Scope) -> List[Tuple[bytes, bytes]]:
+        """Client headers minus hop-by-hop ones, with the real peer attached.
+
+        ``X-Forwarded-For`` is replaced, never appended to: the router's own
+        uvicorn has already resolved the peer (honouring a trusted proxy in
+        front of it), and a value the client supplied must not reach a
+        worker that trusts the router.
+        """
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in _HOP_BY_HOP and name not in _REPLACED
+        ]
+        client = scope.get("client")
+        if client:
+            headers.append((b"x-forwarded-for", client[0].encode("latin-1")))
+        headers.append((b"x-forwarded-proto", scope["scheme"].encode("latin-1")))
+        return headers
+
+    async def _proxy(self, scope: Scope, receive: Receive, send: Send) -> None:
+        import httpx
+
+        try:
+            body = await _read_body(receive, self._max_body_size)
+        except _BodyTooLarge:
+            await Response("Request body too large", status_code=413)(
+                scope, receive, send
+            )
+            return
+        if body is None:
+            return
+        method = scope["method"]
+        session_id = Headers(scope=scope).get(_SESSION_HEADER)
+        worker = self.sessions.route(session_id)
+        client = self._client(worker)
+        target = scope.get("raw_path") or scope["path"].encode("utf-8")
+        if scope.get("query_string"):
+            target += b"?" + scope["query_string"]
+        request = client.build_request(
+            method,
+            target.decode("latin-1"),
+            headers=self._upstream_headers(scope),
+            content=body,
+        )
+        self.sessions.started(worker)
+        try:
+            try:
+                upstream = await client.send(request, stream=True)
+            except httpx.HTTPError as exc:
+                logger.warning("Worker %d unreachable: %s", worker, exc)
+                await JSONResponse({"error": "worker unavailable"}, status_code=502)(
+                    scope, receive, send
+                )
+                return
+            try:
+                self._note_session(method, session_id, upstream, worker)
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": upstream.status_code,
+                        "headers": [
+                            (name, value)
+                            for name, value in upstream.headers.raw
+                            if name.lower() not in _HOP_BY_HOP
+                            and name.lower() not in _STAMPED
+                        ],
+                    }
+                )
+                await self._stream(upstream, receive, send)
+            finally:
+                await upstream.aclose()
+        finally:
+            self.sessions.finished(worker)
+
+    def _note_session(
+        self,
+        method: str,
+        session_id: Optional[str],
+        upstream: "httpx.Response",
+        worker: int,
+    ) -> None:
+        if session_id is None:
+            minted = upstream.headers.get(_SESSION_HEADER)
+            if minted:
+                self.sessions.learn(minted, worker)
+        elif upstream.status_code == 404 or (
+            method == "DELETE" and upstream.status_code < 300
+        ):
+            self.sessions.forget(session_id)
+
+    async def _stream(
+        self, upstream: "httpx.Response", receive: Receive, send: Send
+    ) -> None:
+        """Relay the body until it ends or the client disconnects."""
+
+        async def pump() -> None:
+            async for chunk in upstream.aiter_raw():
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        relay = asyncio.ensure_future(pump())
+        watcher = asyncio.ensure_future(_wait_for_disconnect(receive))
+        try:
+            await asyncio.wait({relay, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (relay, watcher):
+                if not task.done():
+                    task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+        if relay.done() and not relay.cancelled() and relay.exception() is not None:
+            # Headers are already out; all that is left is to end the
+            # response, which returning does.
+            logger.debug("Upstream stream ended early: %s", relay.exception())
+
+    async def _metrics(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = self._upstream_headers(scope)
+
+        async def scrape(worker: int) -> Tuple[int, Any]:
+            try:
+                response = await self._client(worker).get(METRICS_PATH, headers=headers)
+            except Exception as exc:  # noqa: BLE001 - a down worker is data
+                return worker, exc
+            return worker, response
+
+        results = await asyncio.gather(*(scrape(w) for w in range(len(self.sockets))))
+        texts: Dict[int, str] = {}
+        for worker, response in results:
+            if isinstance(response, Exception):
+                continue
+            if response.status_code != 200:
+                # Auth is the workers' call: relay their refusal verbatim.
+                await Response(
+                    response.content,
+                    status_code=response.status_code,
+                    headers={
+                        k: v
+                        for k, v in response.headers.items()
+                        if k.lower() in ("content-type", "www-authenticate")
+                    },
+                )(scope, receive, send)
+                return
+            texts[worker] = response.text
+        router_lines = [
+            "# HELP openzim_mcp_worker_up 1 when the worker answered this scrape.",
+            "# TYPE openzim_mcp_worker_up gauge",
+            *(
+                f'openzim_mcp_worker_up{{worker="{w}"}} {1 if w in texts else 0}'
+                for w in range(len(self.sockets))
+            ),
+            "# HELP openzim_mcp_router_sessions Sessions pinned to a worker.",
+            "# TYPE openzim_mcp_router_sessions gauge",
+            f"openzim_mcp_router_sessions {len(self.sessions)}",
+        ]
+        body = merge_worker_metrics(texts) + "\n".join(router_lines) + "\n"
+        await PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)(
+            scope, receive, send
+        )
+
+
+class RouterForwardedHeaders:
+    """Take the client address from the router's forwarding headers.
+
+    Workers listen only on a Unix socket in a 0700 directory, so the sole
+    peer is the router, which replaces ``X-Forwarded-For`` with the client
+    it resolved. uvicorn's own proxy-header handling cannot be limited to
+    that peer — a Unix-socket connection has no address to allow-list — so
+    trusting it meant ``forwarded_allow_ips="*"``, which would honour the
+    header from any peer. Here it is honoured only on a connection with no
+    network address, i.e. one that came in over the socket.
+    """
+
+    def __init__(self, app: Any) -> None:
+        """Wrap the worker's ASGI ``app``."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Rewrite ``client`` / ``scheme`` for requests relayed by the router."""
+        if scope["type"] == "http" and not scope.get("client"):
+            headers = Headers(scope=scope)
+            forwarded_for = headers.get("x-forwarded-for", "").strip()
+            if forwarded_for:
+                scope = dict(scope, client=(forwarded_for, 0))
+            proto = headers.get("x-forwarded-proto", "").strip()
+            if proto in ("http", "https"):
+                scope = dict(scope, scheme=proto)
+        await self.app(scope, receive, send)
+
+
+def _serve_on_socket(path: str, app: Any, host: str, port: int) -> None:
+    """uvicorn runner for a worker: listen on ``path`` instead of host:port."""
+    import uvicorn
+
+    config = uvicorn.Config(
+        RouterForwardedHeaders(app),
+        uds=path,
+        log_level="info",
+        timeout_graceful_shutdown=SHUTDOWN_GRACE_SECONDS,
+        # Forwarding headers are applied by ``RouterForwardedHeaders``, for
+        # the router's socket connections only.
+        proxy_headers=False,
+    )
+    uvicorn.Server(config).run()
+
+
+def _worker_main(config: "OpenZimMcpConfig", socket_path: str) -> None:
+    """Entry point of one worker process."""
+    from .server import OpenZimMcpServer
+
+    server = OpenZimMcpServer(config)
+    server.run(http_runner=functools.partial(_serve_on_socket, socket_path))
+
+
+class WorkerPool:
+    """The worker processes, started with ``spawn`` and kept at full size."""
+
+    def __init__(self, config: "OpenZimMcpConfig", sockets: Sequence[str]) -> None:
+        """Prepare one worker per socket path; nothing starts yet."""
+        self.config = config
+        self.sockets = list(sockets)
+        # ``spawn`` rather than ``fork``: the supervisor may already hold
+        # threads (logging, a cache cleanup thread) and libzim state that a
+        # forked child would inherit half-initialised.
+        self._ctx = multiprocessing.get_context("spawn")
+        self._procs: List[Optional[BaseProcess]] = [None] * len(self.sockets)
+        self._started_at = [0.0] * len(self.sockets)
+        self._generations = [0] * len(self.sockets)
+        self._stopping = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def generation(self, worker: int) -> int:
+        """How many times ``worker`` has been (re)started."""
+        return self._generations[worker]
+
+    def _spawn(self, worker: int) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.sockets[worker])
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(self.config, self.sockets[worker]),
+            name=f"openzim-mcp-worker-{worker}",
+            daemon=True,
+        )
+        proc.start()
+        self._procs[worker] = proc
+        self._started_at[worker] = time.monotonic()
+        self._generations[worker] += 1
+
+    def start(self) -> None:
+        """Start every worker and the thread that restarts dead ones."""
+        for worker in range(len(self.sockets)):
+            self._spawn(worker)
+        self._monitor = threading.Thread(
+            target=self._watch, name="openzim-mcp-worker-monitor", daemon=True
+        )
+        self._monitor.start()
+
+    def wait_ready(self, timeout: float = WORKER_START_TIMEOUT_S) -> None:
+        """Block until every worker has bound its socket.
+
+        Raises:
+            OpenZimMcpConfigurationError: A worker exited during startup, or
+                the pool was not ready within ``timeout``.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            pending = [
+                w for w, path in enumerate(self.sockets) if not os.path.exists(path)
+            ]
+            if not pending:
+                return
+            for worker in pending:
+                proc = self._procs[worker]
+                if proc is not None and proc.exitcode is not None:
+                    raise OpenZimMcpConfigurationError(
+                        f"HTTP worker {worker} exited during startup "
+                        f"(exit code {proc.exitcode}); see its log above."
+                    )
+            if time.monotonic() >= deadline:
+                raise OpenZimMcpConfigurationError(
+                    f"HTTP workers {pending} did not start within {timeout:.0f}s."
+                )
+            time.sleep(0.05)
+
+    def _watch(self) -> None:
+        while not self._stopping.wait(1.0):
+            for worker, proc in enumerate(self._procs):
+                if proc is None or proc.is_alive() or self._stopping.is_set():
+                    continue
+                since = time.monotonic() - self._started_at[worker]
+                if since < WORKER_RESTART_BACKOFF_S:
+                    continue
+                logger.warning(
+                    "HTTP worker %d exited (code %s); restarting it",
+                    worker,
+                    proc.exitcode,
+                )
+                self._spawn(worker)
+
+    def stop(self) -> None:
+        """Stop the workers: SIGTERM, the shutdown grace, then SIGKILL."""
+        self._stopping.set()
+        if self._monitor is not None:
+            self._monitor.join()
+        procs = [p for p in self._procs if p is not None]
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+        deadline = time.monotonic() + SHUTDOWN_GRACE_SECONDS + 2.0
+        for proc in procs:
+            proc.join(max(0.0, deadline - time.monotonic()))
+            if proc.is_alive():
+                proc.kill()
+                proc.join()
+
+
+def _split_rate_limit(limits: "RateLimitConfig", workers: int) -> "RateLimitConfig":
+    """``limits`` with every bucket's rate and burst divided across workers."""
+    return limits.model_copy(
+        update={
+            "requests_per_second": limits.requests_per_second / workers,
+            "burst_size": max(1, limits.burst_size // workers),
+            "per_operation_limits": {
+                name: _split_rate_limit(op, workers)
+                for name, op in limits.per_operation_limits.items()
+            },
+        }
+    )
+
+
+def worker_config(config: "OpenZimMcpConfig", runtime_dir: Path) -> "OpenZimMcpConfig":
+    """The configuration each worker runs with.
+
+    One worker each, all on one shared cache tier — a per-run file in the
+    runtime directory unless ``cache.shared_path`` names one — and without
+    per-process cache snapshots, which N workers would only overwrite in
+    turn at shutdown. An explicit ``shared_path`` is the warm-restart story
+    for multi-worker deployments.
+
+    Each worker keeps its own token buckets, so the configured rate and
+    burst are divided by the worker count: a client spread over all of them
+    gets the configured budget, not ``workers`` times it.
+    """
+    cache_update: Dict[str, Any] = {"persistence_enabled": False}
+    if not config.cache.shared_path:
+        cache_update["shared_path"] = str(runtime_dir / "shared-cache.sqlite3")
+    if config.cache.persistence_enabled:
+        logger.warning(
+            "cache.persistence_enabled is ignored with workers > 1; set "
+            "cache.shared_path to keep the shared cache across restarts."
+        )
+    return config.model_copy(
+        update={
+            "workers": 1,
+            "cache": config.cache.model_copy(update=cache_update),
+            "rate_limit": _split_rate_limit(config.rate_limit, config.workers),
+        }
+    )
+
+
+def serve_multi_worker(
+    config: "OpenZimMcpConfig",
+    runner: Callable[[Any, str, int], None] = _default_uvicorn_runner,
+) -> None:
+    """Serve ``config.workers`` worker processes behind a :class:`StickyRouter`.
+
+    Args:
+        config: the server configuration; ``workers`` sets the pool size.
+        runner: callable that takes (app, host, port) and runs the router.
+            Defaults to a uvicorn runner; tests inject one that drives the
+            app directly.
+    """
+    check_safe_startup(config)
+    if not hasattr(socket, "AF_UNIX"):
+        raise OpenZimMcpConfigurationError(
+            "workers > 1 needs Unix domain sockets, which this platform "
+            "lacks; run one worker per port behind your own load balancer."
+        )
+    from .cache_store import SharedCacheStore
+
+    runtime_dir = Path(tempfile.mkdtemp(prefix="openzim-mcp-"))
+    try:
+        per_worker = worker_config(config, runtime_dir)
+        # Create the shared file (schema, WAL mode) once, before any worker
+        # races another to do it.
+        shared_path = per_worker.cache.shared_path
+        if per_worker.cache.enabled and shared_path:
+            SharedCacheStore(
+                Path(shared_path).expanduser(), per_worker.cache.shared_max_bytes
+            ).close()
+        sockets = [str(runtime_dir / f"worker-{i}.sock") for i in range(config.workers)]
+        pool = WorkerPool(per_worker, sockets)
+        logger.info(
+            "Starting %d HTTP workers behind a session-affine router on %s:%d",
+            config.workers,
+            config.host,
+            config.port,
+        )
+        pool.start()
+        try:
+            pool.wait_ready()
+            runner(StickyRouter(sockets, pool=pool), config.host, config.port)
+        finally:
+            pool.stop()
+    finally:
+        shutil.rmtree(runtime_dir, ignore_errors=True)
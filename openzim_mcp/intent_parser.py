@@ -9,13 +9,27 @@ or any I/O, which makes it cheap to unit-test in isolation.
 import logging
 import re
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import unquote
 
-from .constants import REGEX_TIMEOUT_SECONDS
+from .constants import MAX_QUERY_LENGTH, REGEX_TIMEOUT_SECONDS
 from .exceptions import RegexTimeoutError
 from .query_rewrite_data import load_exclusions, load_misspellings
+from .regex_shape import AT, GROUP, LITERAL, REPEAT, backtracking_risk
+from .regex_shape import parse as parse_pattern
 from .timeout_utils import run_with_timeout
+from .timings import timed
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +41,142 @@ __all__ = [
 ]
 
 
+# Inline fast path for the ``safe_regex_*`` helpers. Every helper call used
+# to be a thread handoff: submit to the ``regex`` pool, wait on a Future,
+# bounce the GIL back — dozens of times per ``parse_intent``. The timeout
+# bought nothing for the patterns that matter, since (as the docstrings
+# below explain) it cannot interrupt a running ``re`` match anyway. Each
+# pattern is now compiled once and *vetted* (``regex_shape.backtracking_risk``):
+# a pattern with no nested repeat, no repeated ambiguous alternation, no
+# backreference and no run of unbounded repeats over the same characters
+# is at worst quadratic, and on input no longer than ``_INLINE_MAX_CHARS``
+# that is bounded, so it runs inline on the calling thread. Patterns that
+# fail the vetting, and over-long inputs (article bodies through
+# ``compact_format``), keep the pooled timeout.
+_INLINE_MAX_CHARS = MAX_QUERY_LENGTH
+# Flipped off by the parse_intent microbenchmark to measure the pooled path.
+_INLINE_FAST_PATH = True
+# Patterns are almost all module literals; the cap only bounds a caller that
+# builds patterns from request data.
+_VETTED_CACHE_MAX = 2048
+
+
+class _VettedPattern(NamedTuple):
+    """A compiled pattern plus whether it may run inline."""
+
+    regex: "re.Pattern[str]"
+    linear: bool
+
+
+_VETTED: Dict[Tuple[Any, int], _VettedPattern] = {}
+
+_T = TypeVar("_T")
+
+
+def _vet(pattern: Union[str, "re.Pattern[str]"], flags: int = 0) -> _VettedPattern:
+    """Compile and vet ``pattern`` once; later calls are a dict lookup.
+
+    Compilation errors propagate as ``re.error``, as ``re.search`` would
+    raise them.
+    """
+    key = (pattern, flags)
+    vetted = _VETTED.get(key)
+    if vetted is not None:
+        return vetted
+    if isinstance(pattern, re.Pattern):
+        regex = pattern
+    else:
+        regex = re.compile(pattern, flags)
+    try:
+        linear = not backtracking_risk(
+            parse_pattern(regex.pattern, regex.flags), regex.flags
+        )
+    except ValueError:  # syntax regex_shape does not model: assume the worst
+        linear = False
+    vetted = _VettedPattern(regex, linear)
+    if len(_VETTED) < _VETTED_CACHE_MAX:
+        _VETTED[key] = vetted
+    if not linear:
+        logger.debug("Regex kept on the timeout pool: %.60s", regex.pattern)
+    return vetted
+
+
+def _run_regex(
+    vetted: _VettedPattern,
+    text: str,
+    func: Callable[[], _T],
+    timeout_seconds: float,
+) -> _T:
+    """Run ``func`` inline when ``vetted`` allows it, else on the regex pool."""
+    if _INLINE_FAST_PATH and vetted.linear and len(text) <= _INLINE_MAX_CHARS:
+        return func()
+    return run_with_timeout(
+        func,
+        timeout_seconds,
+        f"Regex operation timed out after {timeout_seconds} seconds",
+        RegexTimeoutError,
+        pool="regex",
+    )
+
+
+def _required_literals(items: Any) -> Optional[FrozenSet[str]]:
+    """Literal strings of which every match must contain at least one.
+
+    Walks a parsed pattern: a run of consecutive literal characters is
+    required wherever the run itself is (zero-width assertions such as
+    ``\b`` do not break a run); a group or a repeat with ``min >= 1``
+    passes up its body's requirement; an alternation is required only if
+    every branch has a requirement, and then any branch's will do. The
+    most selective candidate — longest shortest literal — wins. ``None``
+    means no literal is guaranteed (the pattern can never be skipped).
+    Literals are lowercased; candidates with non-ASCII characters are
+    dropped, since ``re.IGNORECASE`` folds some of those onto ASCII.
+    """
+    candidates: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def close_run() -> None:
+        if run:
+            candidates.append(frozenset(["".join(run).lower()]))
+            run.clear()
+
+    def walk(nodes: Any) -> None:
+        for node in nodes:
+            kind = node[0]
+            if kind == LITERAL:
+                run.append(node[1])
+                continue
+            if kind == AT:
+                continue
+            if kind == GROUP and len(node[1]) == 1:
+                # A plain group is just its contents: the run carries on.
+                walk(node[1][0])
+                continue
+            close_run()
+            required: Optional[FrozenSet[str]] = None
+            if kind == REPEAT and node[1] >= 1:
+                required = _required_literals(node[3])
+            elif kind == GROUP:
+                branches = [_required_literals(b) for b in node[1]]
+                known = [b for b in branches if b is not None]
+                if len(known) == len(branches):
+                    required = frozenset().union(*known)
+            if required is not None:
+                candidates.append(required)
+
+    walk(items)
+    close_run()
+
+    usable = [
+        c
+        for c in candidates
+        if c and all(literal and literal.isascii() for literal in c)
+    ]
+    if not usable:
+        return None
+    return max(usable, key=lambda c: min(len(literal) for literal in c))
+
+
 def safe_regex_search(
     pattern: str,
     text: str,
@@ -35,9 +185,11 @@ def safe_regex_search(
 ) -> Optional[re.Match[str]]:
     """Perform a regex search with cross-platform timeout protection.
 
-    Always uses a threading-based timeout so it works on every platform and
-    on any thread (asyncio executors, worker threads, etc.). Signal-based
-    timeouts are not safe outside the main thread.
+    Vetted-linear patterns on input up to ``_INLINE_MAX_CHARS`` run inline
+    (see the module notes above ``_INLINE_MAX_CHARS``). Everything else uses
+    a threading-based timeout so it works on every platform and on any
+    thread (asyncio executors, worker threads, etc.). Signal-based timeouts
+    are not safe outside the main thread.
 
     IMPORTANT — this is NOT a wall-clock bound on the match. ``re`` holds the
     GIL for the whole operation and CPython cannot cancel a running thread, so
@@ -59,13 +211,8 @@ def safe_regex_search(
     Raises:
         RegexTimeoutError: If the operation exceeds the time limit
     """
-    return run_with_timeout(
-        lambda: re.search(pattern, text, flags),
-        timeout_seconds,
-        f"Regex operation timed out after {timeout_seconds} seconds",
-        RegexTimeoutError,
-        pool="regex",
-    )
+    vetted = _vet(pattern, flags)
+    return _run_regex(vetted, text, lambda: vetted.regex.search(text), timeout_seconds)
 
 
 # Character class covering ASCII and common Unicode "smart" quotes that LLMs
@@ -139,13 +286,8 @@ def safe_regex_findall(
     Same protections as safe_regex_search; returns the list of capture groups
     (re.findall semantics).
     """
-    return run_with_timeout(
-        lambda: re.findall(pattern, text, flags),
-        timeout_seconds,
-        f"Regex operation timed out after {timeout_seconds} seconds",
-        RegexTimeoutError,
-        pool="regex",
-    )
+    vetted = _vet(pattern, flags)
+    return _run_regex(vetted, text, lambda: vetted.regex.findall(text), timeout_seconds)
 
 
 def safe_regex_sub(
@@ -159,8 +301,8 @@ def safe_regex_sub(
 
     Accepts either a string pattern or a pre-compiled :class:`re.Pattern`.
     When a pre-compiled pattern is passed, ``flags`` is ignored (use the
-    pattern's own flags). Same threading-based timeout as
-    :func:`safe_regex_search`.
+    pattern's own flags). Same inline fast path and threading-based timeout
+    as :func:`safe_regex_search`.
 
     Used by the compact-rendering layer to bound how long a caller waits on
     adversarial article bodies (long unclosed markdown links, pathological
@@ -168,20 +310,9 @@ def safe_regex_sub(
     the warning on :func:`safe_regex_search` — the match still runs to
     completion on its worker thread. Keep the patterns linear.
     """
-    if isinstance(pattern, re.Pattern):
-        return run_with_timeout(
-            lambda: pattern.sub(repl, text),
-            timeout_seconds,
-            f"Regex operation timed out after {timeout_seconds} seconds",
-            RegexTimeoutError,
-            pool="regex",
-        )
-    return run_with_timeout(
-        lambda: re.sub(pattern, repl, text, flags=flags),
-        timeout_seconds,
-        f"Regex operation timed out after {timeout_seconds} seconds",
-        RegexTimeoutError,
-        pool="regex",
+    vetted = _vet(pattern, 0 if isinstance(pattern, re.Pattern) else flags)
+    return _run_regex(
+        vetted, text, lambda: vetted.regex.sub(repl, text), timeout_seconds
     )
 
 
@@ -1775,6 +1906,7 @@ class IntentParser:
         return params
 
     @classmethod
+    @timed("intent_parse")
     def parse_intent(
         cls,
         query: str,
@@ -1855,12 +1987,19 @@ class IntentParser:
 
         # Collect all matching patterns
         matches: List[Tuple[str, Dict[str, Any], float, int]] = []
+        # Several table rows share an intent (get_section has three); the
+        # extractor only depends on the intent, so run it once per intent.
+        extracted: Dict[str, Dict[str, Any]] = {}
 
-        for pattern, intent, base_confidence, specificity in cls.INTENT_PATTERNS:
+        for pattern, intent, base_confidence, specificity in _intent_candidates(
+            cls.INTENT_PATTERNS, query_lower
+        ):
             try:
                 match = safe_regex_search(pattern, query_lower, re.IGNORECASE)
                 if match:
-                    params = cls._extract_params(query, intent)
+                    if intent not in extracted:
+                        extracted[intent] = cls._extract_params(query, intent)
+                    params = dict(extracted[intent])
                     # Boost confidence only when params extract AND base is
                     # below 0.8 — the boost is a tie-breaker for ambiguous
                     # low-priority matches, not a way to lift them above
@@ -2613,3 +2752,59 @@ class IntentParser:
         if title_probe is not None and title_probe(query):
             return query, None
         return f"{entity} {attr}", {"entity": entity, "attribute": attr}
+
+
+# Compiled dispatch stage for ``parse_intent``. Each table row is paired with
+# the literal trigger words (``search``, ``namespace``, ``section`` ...) that
+# any match of its pattern must contain; a row none of whose triggers occurs
+# in the query cannot match and is skipped without running its regex. The
+# triggers are derived from the patterns themselves (``_required_literals``),
+# so the table and the prefilter cannot drift apart, and the result is
+# identical to scanning every row — ``tests/test_intent_prefilter.py`` checks
+# that on every query in ``tests/dispatch_eval/probes.jsonl``.
+#
+# The table is compiled and vetted on the first ``parse_intent`` rather than
+# at import, so CLI starts and worker spawns do not pay for it; which table
+# patterns stay on the timeout pool is pinned by
+# ``tests/test_intent_regex_fast_path.py``.
+IntentRow = Tuple[str, str, float, int]
+_INTENT_PREFILTER = True
+_intent_table_source: Optional[List[IntentRow]] = None
+_intent_table: List[Tuple[IntentRow, Optional[FrozenSet[str]]]] = []
+
+
+def _compile_intent_table(
+    patterns: List[IntentRow],
+) -> List[Tuple[IntentRow, Optional[FrozenSet[str]]]]:
+    """Vet every row's pattern and pair the row with its trigger literals."""
+    table = []
+    for row in patterns:
+        vetted = _vet(row[0], re.IGNORECASE)
+        try:
+            triggers = _required_literals(
+                parse_pattern(vetted.regex.pattern, vetted.regex.flags)
+            )
+        except ValueError:  # unmodelled syntax: never skip the row
+            triggers = None
+        table.append((row, triggers))
+    return table
+
+
+def _intent_candidates(patterns: List[IntentRow], query_lower: str) -> List[IntentRow]:
+    """Rows of ``patterns`` that can match ``query_lower``, in table order.
+
+    Non-ASCII queries skip the prefilter: ``re.IGNORECASE`` matches a few
+    non-ASCII characters against ASCII literals (``ſ`` against ``s``), which
+    a plain substring test would miss.
+    """
+    global _intent_table_source, _intent_table
+    if not _INTENT_PREFILTER or not query_lower.isascii():
+        return patterns
+    if _intent_table_source is not patterns:
+        _intent_table = _compile_intent_table(patterns)
+        _intent_table_source = patterns
+    return [
+        row
+        for row, triggers in _intent_table
+        if triggers is None or any(t in query_lower for t in triggers)
+    ]
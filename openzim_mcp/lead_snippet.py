@@ -0,0 +1,195 @@
+"""Cut an article's HTML down to its lead before rendering a search snippet.
+
+A search snippet is two paragraphs, but ``_get_entry_snippet`` used to parse
+the whole article with BeautifulSoup and run html2text over all of it before
+``create_snippet`` threw everything past the lead away. On Wikipedia that
+is a few hundred kilobytes of HTML per result, so a cold ten-hit search
+rendered ten complete articles to show twenty paragraphs.
+
+:func:`extract_lead_html` runs an incremental ``html.parser`` tokenizer over
+the document, fed a chunk at a time, and stops at the end of the N-th
+content paragraph. Paragraphs inside tables, infoboxes, navigation boxes,
+figures and similar furniture are not counted, and the scan does not look
+inside those subtrees. What comes back is a *prefix* of the document, cut
+on the closing tag of that paragraph, and the caller renders it through the
+exact pipeline the full article would have gone through. BeautifulSoup and
+html2text both read front to back, so the prefix renders to the same
+paragraphs as the full document up to the cut; only the last one or two can
+differ, and ``ContentProcessor.create_lead_snippet`` refuses to answer from
+those. Snippet cost therefore scales with the length of the lead, not of the
+article, and the text returned is the text the full render would have given.
+
+The cut is only safe when nothing past it changes how the prefix renders.
+Two things can, and both make the function return ``None`` so the caller
+renders the whole document as before:
+
+* a main-content landmark (``<article>``, ``<main>``, ``role=main``).
+  ``select_main_content`` scopes to it only when it is the single one in
+  the document, which a prefix cannot tell;
+* an infobox after the cut. Compact rendering lifts the first infobox
+  anywhere in the document to the top of the text, so unless the prefix
+  already holds a ``table.infobox``, the rest must not mention
+  ``infobox`` or ``vcard`` at all. That check is a substring search, not
+  a parse.
+
+A document that runs out before enough paragraphs turn up also returns
+``None``. At that point nothing has been saved, and the full render is the
+answer anyway.
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import FrozenSet, List, Optional, Tuple
+
+from openzim_mcp.timings import timed
+
+__all__ = ["LEAD_SLACK_PARAGRAPHS", "extract_lead_html"]
+
+# Paragraphs scanned past the ones a snippet shows. The last two rendered
+# paragraphs of a lead are never used (see ``create_lead_snippet``), and a
+# boilerplate line or two may be dropped from the rest.
+LEAD_SLACK_PARAGRAPHS = 3
+
+# Characters handed to the tokenizer per ``feed``. The scan stops inside the
+# chunk where the lead ends, so this bounds the overshoot.
+_CHUNK_CHARS = 16 * 1024
+
+_LANDMARK_RE = re.compile(
+    r"<(?:article|main)\b|\brole\s*=\s*[\"']?main\b", re.IGNORECASE
+)
+
+# Subtrees whose paragraphs are not lead prose. Tags first, then classes;
+# a class match on any element starts a skip.
+_SKIP_TAGS: FrozenSet[str] = frozenset(
+    {"table", "nav", "figure", "aside", "header", "footer", "noscript"}
+)
+_SKIP_CLASSES: FrozenSet[str] = frozenset(
+    {
+        "infobox",
+        "vcard",
+        "navbox",
+        "sidebar",
+        "hatnote",
+        "thumb",
+        "gallery",
+        "reflist",
+        "metadata",
+    }
+)
+_VOID_TAGS: FrozenSet[str] = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+class _Enough(Exception):
+    """Raised from a handler to stop the tokenizer mid-chunk."""
+
+
+class _LeadScanner(HTMLParser):
+    """Counts lead paragraphs and remembers where the last one closed."""
+
+    def __init__(self, paragraphs: int) -> None:
+        super().__init__(convert_charrefs=True)
+        self._want = paragraphs
+        self._skip_tag: Optional[str] = None
+        self._skip_depth = 0
+        self._in_p = False
+        self._p_has_text = False
+        self.found = 0
+        self.cut_at: Optional[Tuple[int, int]] = None
+        self.saw_infobox_table = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+        classes: FrozenSet[str] = frozenset()
+        for name, value in attrs:
+            if name == "class" and value:
+                classes = frozenset(value.split())
+                break
+        if tag == "table" and "infobox" in classes:
+            self.saw_infobox_table = True
+        if tag not in _VOID_TAGS and (tag in _SKIP_TAGS or classes & _SKIP_CLASSES):
+            self._skip_tag = tag
+            self._skip_depth = 1
+            self._in_p = False
+        elif tag == "p":
+            self._in_p = True
+            self._p_has_text = False
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if self._skip_depth == 0:
+                    self._skip_tag = None
+            return
+        if tag != "p" or not self._in_p:
+            return
+        self._in_p = False
+        if self._p_has_text:
+            self.found += 1
+            if self.found >= self._want:
+                # getpos() is the start of this ``</p>`` while the handler
+                # runs; the caller finds its closing ``>``.
+                self.cut_at = self.getpos()
+                raise _Enough
+
+    def handle_data(self, data: str) -> None:
+        if self._in_p and self._skip_tag is None and not self._p_has_text:
+            self._p_has_text = bool(data.strip())
+
+
+def _offset(html: str, position: Tuple[int, int]) -> int:
+    """Absolute index of a 1-based ``(line, column)`` tokenizer position."""
+    line, column = position
+    start = 0
+    for _ in range(line - 1):
+        start = html.index("\n", start) + 1
+    return start + column
+
+
+@timed("snippet_lead_scan")
+def extract_lead_html(html: str, paragraphs: int) -> Optional[str]:
+    """Return the prefix of ``html`` that ends with its ``paragraphs``-th
+    lead paragraph, or ``None`` when only a full render is safe."""
+    if paragraphs < 1 or _LANDMARK_RE.search(html):
+        return None
+    scanner = _LeadScanner(paragraphs)
+    try:
+        for start in range(0, len(html), _CHUNK_CHARS):
+            scanner.feed(html[start : start + _CHUNK_CHARS])
+        scanner.close()
+    except _Enough:
+        pass
+    except Exception:  # malformed markup the tokenizer gives up on
+        return None
+    if scanner.cut_at is None:
+        return None
+    close = html.find(">", _offset(html, scanner.cut_at))
+    if close < 0:
+        return None
+    cut = close + 1
+    if not scanner.saw_infobox_table:
+        rest = html[cut:]
+        if "infobox" in rest or "vcard" in rest:
+            return None
+    return html[:cut]
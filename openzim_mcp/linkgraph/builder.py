@@ -7,6 +7,7 @@ real stream from an archive and orchestrate the two.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import sqlite3
@@ -14,6 +15,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -22,16 +24,38 @@ from typing import (
     List,
     Optional,
     Tuple,
+    Union,
 )
 
 from openzim_mcp import __version__
 
-from .schema import SCHEMA_VERSION, apply_build_pragmas, create_schema
+if TYPE_CHECKING:
+    from .reuse import ReusableLinks
+
+from .related import RELATED_FANOUT, score_related
+from .schema import (
+    NODE_ORDER_RANK,
+    RELATED_META_KEY,
+    SCHEMA_VERSION,
+    apply_build_pragmas,
+    create_schema,
+)
 
 logger = logging.getLogger(__name__)
 
 _BATCH = 50_000
 
+# One source's links as the builders consume them: ``(source_path,
+# [(target, anchor_text), ...])``, optionally followed by a hash of the
+# source's content and by its archive title (either ``None`` when unknown).
+# The hash is stored in the sidecar so a later ``reuse`` rebuild can
+# recognise unchanged entries; the title is what outbound queries display.
+LinkRecord = Union[
+    Tuple[str, List[Tuple[str, str]]],
+    Tuple[str, List[Tuple[str, str]], Optional[bytes]],
+    Tuple[str, List[Tuple[str, str]], Optional[bytes], Optional[str]],
+]
+
 
 @dataclass
 class BuildStats:
@@ -42,84 +66,296 @@ class BuildStats:
     bytes_written: int
 
 
+def _distinct_targets(
+    source_path: str, targets: Iterable[Tuple[str, str]]
+) -> Iterator[Tuple[str, str]]:
+    """Yield ``source_path``'s targets once each, dropping self-links.
+
+    The first anchor seen for a target wins. Every builder routes edges
+    through here, which is what keeps ``(source, target)`` unique without a
+    UNIQUE index (see ``schema``).
+    """
+    seen: set[str] = set()
+    for target, anchor in targets:
+        if target == source_path or target in seen:
+            continue
+        seen.add(target)
+        yield target, anchor
+
+
+def _meta_rows(
+    *,
+    archive_uuid: str,
+    node_count: int,
+    edge_count: int,
+    now_iso: Optional[str],
+    builder_version: Optional[str],
+) -> List[Tuple[str, str]]:
+    """The ``meta`` rows every build writes, in insertion order."""
+    return [
+        ("schema_version", str(SCHEMA_VERSION)),
+        ("archive_uuid", archive_uuid),
+        ("built_at", now_iso or datetime.now(timezone.utc).isoformat()),
+        ("node_count", str(node_count)),
+        ("edge_count", str(edge_count)),
+        ("builder_version", builder_version or __version__),
+        ("node_order", NODE_ORDER_RANK),
+        (RELATED_META_KEY, str(RELATED_FANOUT)),
+    ]
+
+
+# Layout of the checkpointed staging database (``<out>.stage``). Bump on any
+# change so a stage left by an older build is discarded instead of resumed.
+STAGE_VERSION = 2
+
+_STAGE_DDL = """
+CREATE TABLE checkpoint (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE paths (id INTEGER PRIMARY KEY, path TEXT NOT NULL);
+CREATE TABLE edges (target_id INTEGER, source_id INTEGER, anchor_text TEXT);
+CREATE TABLE sources (id INTEGER PRIMARY KEY, content_hash BLOB, title TEXT);
+"""
+
+
+def stage_path_for(out_path: str) -> str:
+    """Return the checkpointed staging database a build of ``out_path`` uses."""
+    return out_path + ".stage"
+
+
+def _remove_stage(stage_path: str) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(stage_path + suffix):
+            os.remove(stage_path + suffix)
+
+
+def _read_checkpoint(stage_path: str) -> Dict[str, str]:
+    """The stage's checkpoint rows, or ``{}`` when it is absent or unreadable."""
+    if not os.path.isfile(stage_path):
+        return {}
+    try:
+        conn = sqlite3.connect(stage_path)
+        try:
+            return dict(conn.execute("SELECT key, value FROM checkpoint"))
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return {}
+
+
+def load_checkpoint(out_path: str, *, archive_uuid: str) -> Optional[int]:
+    """Return where an interrupted build of ``out_path`` can resume, if anywhere.
+
+    The value is the ``position`` the last committed checkpoint recorded
+    (for ``build_link_graph``, the next archive entry id to walk). ``None``
+    when there is no stage, it belongs to another archive or stage layout,
+    or it was written without a position — the build must start over.
+    """
+    checkpoint = _read_checkpoint(stage_path_for(out_path))
+    if (
+        checkpoint.get("stage_version") != str(STAGE_VERSION)
+        or checkpoint.get("archive_uuid") != archive_uuid
+        or not checkpoint.get("position")
+    ):
+        return None
+    return int(checkpoint["position"])
+
+
 def build_from_link_stream(
     out_path: str,
     *,
     archive_uuid: str,
-    link_stream: Iterable[Tuple[str, List[Tuple[str, str]]]],
+    link_stream: Iterable[LinkRecord],
     force: bool = False,
     now_iso: Optional[str] = None,
     builder_version: Optional[str] = None,
+    resume: bool = False,
+    position: Optional[Callable[[], int]] = None,
 ) -> BuildStats:
-    """Invert ``link_stream`` into the sidecar at ``out_path`` (atomic write)."""
+    """Invert ``link_stream`` into the sidecar at ``out_path`` (atomic write).
+
+    Edges are streamed into a staging database (``stage_path_for``) under
+    provisional ids while inbound degrees are counted in memory. Once the
+    stream ends, nodes are renumbered in rank order (``inbound_degree``
+    desc, ``path`` asc) and the edges copied into the sidecar under the final
+    ids, sorted by ``(target_id, source_id)`` — which makes each target's
+    ranked inbound list a plain ``edges_by_target`` range (see ``schema``).
+
+    The stage is a checkpoint. Every ``_BATCH`` edges the new paths, edges
+    and source hashes and titles are committed together with a checkpoint row holding
+    ``position()`` (the caller's resume point, opaque here), the interned
+    node watermark and the edge count, in WAL mode so a killed process
+    leaves the last commit intact. ``resume=True`` reloads that state and
+    appends ``link_stream`` — which the caller has restarted from the
+    position ``load_checkpoint`` returned — instead of starting over. A
+    stage that does not match this archive is discarded either way.
+    """
     if Path(out_path).exists() and not force:
         raise FileExistsError(
             f"{out_path} already exists; pass force=True to overwrite."
         )
     tmp_path = out_path + ".tmp"
+    stage_path = stage_path_for(out_path)
     if os.path.exists(tmp_path):
         os.remove(tmp_path)
+    checkpoint = _read_checkpoint(stage_path) if resume else {}
+    if (
+        checkpoint.get("stage_version") != str(STAGE_VERSION)
+        or checkpoint.get("archive_uuid") != archive_uuid
+    ):
+        checkpoint = {}
+        _remove_stage(stage_path)
 
     ids: Dict[str, int] = {}
+    # ``degree[i]`` counts the edges into provisional id ``i`` (slot 0 unused).
+    degree: List[int] = [0]
+    # Interned since the last checkpoint, so not yet in ``paths``.
+    new_paths: List[Tuple[int, str]] = []
 
     def _intern(path: str) -> int:
         node_id = ids.get(path)
         if node_id is None:
             node_id = len(ids) + 1
             ids[path] = node_id
+            degree.append(0)
+            new_paths.append((node_id, path))
         return node_id
 
-    conn = sqlite3.connect(tmp_path)
+    stage = sqlite3.connect(stage_path)
     try:
-        apply_build_pragmas(conn)
-        create_schema(conn)
+        stage.execute("PRAGMA journal_mode=WAL")
+        stage.execute("PRAGMA synchronous=NORMAL")
         edge_count = 0
+        if checkpoint:
+            for node_id, path in stage.execute(
+                "SELECT id, path FROM paths ORDER BY id"
+            ):
+                ids[path] = node_id
+                degree.append(0)
+            for target_id, count in stage.execute(
+                "SELECT target_id, COUNT(*) FROM edges GROUP BY target_id"
+            ):
+                degree[target_id] = count
+            edge_count = int(checkpoint.get("edge_count") or 0)
+            logger.info(
+                "resuming link-graph build of %s at position %s (%d nodes, "
+                "%d edges already staged)",
+                out_path,
+                checkpoint.get("position"),
+                len(ids),
+                edge_count,
+            )
+        else:
+            stage.executescript(_STAGE_DDL)
+            stage.executemany(
+                "INSERT INTO checkpoint(key, value) VALUES (?,?)",
+                [
+                    ("stage_version", str(STAGE_VERSION)),
+                    ("archive_uuid", archive_uuid),
+                ],
+            )
+            stage.commit()
+
         batch: List[Tuple[int, int, str]] = []
-        for source_path, targets in link_stream:
+        sources: List[Tuple[int, Optional[bytes], Optional[str]]] = []
+
+        def _checkpoint() -> None:
+            stage.executemany("INSERT INTO paths(id, path) VALUES (?,?)", new_paths)
+            stage.executemany("INSERT INTO edges VALUES (?,?,?)", batch)
+            stage.executemany("INSERT INTO sources VALUES (?,?,?)", sources)
+            stage.executemany(
+                "INSERT OR REPLACE INTO checkpoint(key, value) VALUES (?,?)",
+                [
+                    ("position", str(position()) if position else ""),
+                    ("node_watermark", str(len(ids))),
+                    ("edge_count", str(edge_count)),
+                ],
+            )
+            stage.commit()
+            new_paths.clear()
+            batch.clear()
+            sources.clear()
+
+        for record in link_stream:
+            source_path, targets = record[0], record[1]
             source_id = _intern(source_path)
-            seen: set[str] = set()
-            for target, anchor in targets:
-                if target == source_path or target in seen:
-                    continue
-                seen.add(target)
+            digest = record[2] if len(record) > 2 else None
+            title = record[3] if len(record) > 3 else None
+            if digest is not None or title is not None:
+                sources.append((source_id, digest, title))
+            for target, anchor in _distinct_targets(source_path, targets):
                 target_id = _intern(target)
+                degree[target_id] += 1
                 batch.append((target_id, source_id, anchor))
                 edge_count += 1
-                if len(batch) >= _BATCH:
-                    conn.executemany(
-                        "INSERT INTO edges(target_id, source_id, anchor_text) "
-                        "VALUES (?,?,?)",
-                        batch,
-                    )
-                    batch.clear()
-        if batch:
-            conn.executemany(
-                "INSERT INTO edges(target_id, source_id, anchor_text) VALUES (?,?,?)",
-                batch,
-            )
-        conn.executemany(
-            "INSERT INTO nodes(id, path) VALUES (?,?)",
-            [(node_id, path) for path, node_id in ids.items()],
+            # Checkpoint between sources only, so a resume never replays
+            # half of one source's edges.
+            if len(batch) >= _BATCH:
+                _checkpoint()
+        _checkpoint()
+    finally:
+        stage.close()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        apply_build_pragmas(conn)
+        create_schema(conn)
+        conn.execute("ATTACH DATABASE ? AS stage", (stage_path,))
+        # Left behind when a previous attempt died inside this phase.
+        conn.execute("DROP TABLE IF EXISTS stage.remap")
+
+        # Rank order == final id order. ``ids`` iterates in provisional-id
+        # order, so ``paths[i - 1]`` is the path of provisional id ``i``;
+        # Python's code-point order on ``str`` matches SQLite's BINARY
+        # collation on the UTF-8 bytes, so readers may rely on either.
+        paths = list(ids)
+        ranked = sorted(
+            range(1, len(paths) + 1), key=lambda i: (-degree[i], paths[i - 1])
         )
         conn.execute(
-            """UPDATE nodes SET inbound_degree =
-                 COALESCE((SELECT COUNT(*) FROM edges WHERE target_id = nodes.id), 0)"""
+            "CREATE TABLE stage.remap (old INTEGER PRIMARY KEY, new INTEGER NOT NULL)"
         )
+        conn.executemany(
+            "INSERT INTO stage.remap(old, new) VALUES (?,?)",
+            ((old, new) for new, old in enumerate(ranked, 1)),
+        )
+        conn.executemany(
+            "INSERT INTO nodes(id, path, inbound_degree) VALUES (?,?,?)",
+            ((new, paths[old - 1], degree[old]) for new, old in enumerate(ranked, 1)),
+        )
+        ranked.clear()
+        paths.clear()
+        conn.execute("""INSERT INTO edges(target_id, source_id, anchor_text)
+               SELECT t.new, s.new, e.anchor_text
+                 FROM stage.edges e
+                 JOIN stage.remap t ON t.old = e.target_id
+                 JOIN stage.remap s ON s.old = e.source_id
+                ORDER BY t.new, s.new""")
+        conn.execute("""INSERT INTO source_hashes(node_id, content_hash)
+               SELECT r.new, s.content_hash
+                 FROM stage.sources s JOIN stage.remap r ON r.old = s.id
+                WHERE s.content_hash IS NOT NULL
+                ORDER BY r.new""")
+        conn.execute("""INSERT INTO titles(node_id, title)
+               SELECT r.new, s.title
+                 FROM stage.sources s JOIN stage.remap r ON r.old = s.id
+                WHERE s.title IS NOT NULL
+                ORDER BY r.new""")
+        score_related(conn)
         conn.executemany(
             "INSERT INTO meta(key, value) VALUES (?,?)",
-            [
-                ("schema_version", str(SCHEMA_VERSION)),
-                ("archive_uuid", archive_uuid),
-                ("built_at", now_iso or datetime.now(timezone.utc).isoformat()),
-                ("node_count", str(len(ids))),
-                ("edge_count", str(edge_count)),
-                ("builder_version", builder_version or __version__),
-            ],
+            _meta_rows(
+                archive_uuid=archive_uuid,
+                node_count=len(ids),
+                edge_count=edge_count,
+                now_iso=now_iso,
+                builder_version=builder_version,
+            ),
         )
         conn.commit()
+        conn.execute("DETACH DATABASE stage")
     finally:
         conn.close()
     os.replace(tmp_path, out_path)
+    _remove_stage(stage_path)
     return BuildStats(
         node_count=len(ids),
         edge_count=edge_count,
@@ -150,17 +386,46 @@ def _is_content_source(path: str, *, has_new_scheme: bool) -> bool:
     return namespace.upper() in {"A", "C"}
 
 
-def iter_article_links(archive: Any) -> Iterator[Tuple[str, List[Tuple[str, str]]]]:
-    """Yield ``(source_path, [(target, anchor_text), ...])`` per content entry.
+@dataclass
+class SourceLinks:
+    """One content entry's outbound links, as ``iter_article_sources`` yields it."""
+
+    entry_id: int
+    path: str
+    targets: List[Tuple[str, str]]
+    content_hash: Optional[bytes]
+    title: Optional[str] = None
+
+
+def content_hash(content: bytes) -> bytes:
+    """Digest an entry's raw content for ``source_hashes`` (16-byte BLAKE2b)."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
 
-    Walk the open archive once via ``_get_entry_by_id`` over ``entry_count``,
-    keep only content sources (scheme-aware: see ``_is_content_source``), skip
-    redirects-as-source, and reuse ``_parse_internal_link_edges`` for
-    extraction + redirect canonicalization. The yielded ``source_path`` is the
-    raw ``entry.path`` exactly as libzim returns it for that scheme
-    (``"C/Evolution"`` old-scheme, ``"Evolution"`` new-scheme) so it stays
-    consistent with what the runtime query layer looks up. Per-entry read
-    failures are skipped so one bad entry never aborts the whole build.
+def iter_article_sources(
+    archive: Any,
+    *,
+    start: int = 0,
+    stop: Optional[int] = None,
+    reuse: Optional["ReusableLinks"] = None,
+) -> Iterator[SourceLinks]:
+    """Yield one ``SourceLinks`` per content entry, in entry-id order.
+
+    Walk the open archive once via ``_get_entry_by_id`` over ``entry_count``
+    (or the ``[start, stop)`` id range of it — one shard of a ``--workers``
+    build, or the remainder of a resumed one), keep only content sources
+    (scheme-aware: see ``_is_content_source``), skip redirects-as-source,
+    and reuse ``_parse_internal_link_edges`` for extraction + redirect
+    canonicalization. The yielded ``path`` is the raw ``entry.path`` exactly
+    as libzim returns it for that scheme (``"C/Evolution"`` old-scheme,
+    ``"Evolution"`` new-scheme) so it stays consistent with what the runtime
+    query layer looks up. Per-entry read failures are skipped so one bad
+    entry never aborts the whole build.
+
+    With ``reuse``, an entry whose content hash matches the previous
+    sidecar's takes that sidecar's targets instead of being parsed; each is
+    re-canonicalized through this archive, so a page that became a redirect
+    since is still credited to its new canonical target.
     """
     # Imported here (not at module scope) so the pure ``build_from_link_stream``
     # core keeps no dependency on the ZIM/structure layer.
@@ -168,7 +433,8 @@ def iter_article_links(archive: Any) -> Iterator[Tuple[str, List[Tuple[str, str]
 
     has_new_scheme = bool(getattr(archive, "has_new_namespace_scheme", False))
     total = int(getattr(archive, "entry_count", 0) or 0)
-    for entry_id in range(total):
+    end = total if stop is None else min(stop, total)
+    for entry_id in range(max(0, start), end):
         try:
             entry = archive._get_entry_by_id(entry_id)
         except Exception:  # nosec B112 - skip unreadable entry, keep walking
@@ -179,12 +445,27 @@ def iter_article_links(archive: Any) -> Iterator[Tuple[str, List[Tuple[str, str]
         if getattr(entry, "is_redirect", False):
             continue
         try:
-            html = bytes(entry.get_item().content).decode("utf-8", "replace")
+            raw = bytes(entry.get_item().content)
         except Exception:  # nosec B112 - skip entry whose content won't read
             continue
+        digest = content_hash(raw)
+        if reuse is not None:
+            previous = reuse.links_for(path, digest)
+            if previous is not None:
+                yield SourceLinks(
+                    entry_id,
+                    path,
+                    [
+                        (_StructureMixin._canonical_target_path(archive, t), a)
+                        for t, a in previous
+                    ],
+                    digest,
+                    getattr(entry, "title", None) or None,
+                )
+                continue
         try:
             edges = _StructureMixin._parse_internal_link_edges(
-                html, source_path=path, archive=archive
+                raw.decode("utf-8", "replace"), source_path=path, archive=archive
             )
         except Exception as exc:  # nosec B112 - one bad entry must not abort
             # ``_classify_anchor`` can still raise on pathological markup
@@ -192,7 +473,20 @@ def iter_article_links(archive: Any) -> Iterator[Tuple[str, List[Tuple[str, str]
             # A multi-hour link-graph build must not die on one article.
             logger.warning("Skipping link extraction for %s: %s", path, exc)
             continue
-        yield (path, edges)
+        yield SourceLinks(
+            entry_id, path, edges, digest, getattr(entry, "title", None) or None
+        )
+
+
+def iter_article_links(
+    archive: Any, *, start: int = 0, stop: Optional[int] = None
+) -> Iterator[Tuple[str, List[Tuple[str, str]]]]:
+    """Yield ``(source_path, [(target, anchor_text), ...])`` per content entry.
+
+    The plain-pair view of ``iter_article_sources``.
+    """
+    for source in iter_article_sources(archive, start=start, stop=stop):
+        yield (source.path, source.targets)
 
 
 def build_link_graph(
@@ -201,36 +495,105 @@ def build_link_graph(
     *,
     force: bool = False,
     progress: Optional[Callable[[int, int], None]] = None,
+    workers: int = 1,
+    resume: bool = False,
+    reuse: Optional[str] = None,
 ) -> BuildStats:
     """Open ``archive_path`` once, walk it, and write the sidecar atomically.
 
-    Streams ``iter_article_links`` straight into ``build_from_link_stream`` so
-    EDGES are written in batches rather than buffered whole. Note that NODES are
-    still held in memory: ``build_from_link_stream`` interns every node path in
-    an in-memory id map and materialises the full node list for insertion, so
-    peak RSS scales with the article count (GB-scale on a full Wikipedia build),
-    not with the edge count. ``progress`` (if given) is invoked as
-    ``progress(processed, total)`` every 10,000 source entries.
+    Streams ``iter_article_sources`` straight into ``build_from_link_stream``
+    so EDGES are written in batches rather than buffered whole. Note that
+    NODES are still held in memory: ``build_from_link_stream`` interns every
+    node path in an in-memory id map and materialises the full node list for
+    insertion, so peak RSS scales with the article count (GB-scale on a full
+    Wikipedia build), not with the edge count. ``progress`` (if given) is
+    invoked as ``progress(processed, total)`` every 10,000 source entries.
+
+    ``resume=True`` continues an interrupted build of the same archive from
+    its last checkpoint (the next entry id to walk, see ``load_checkpoint``)
+    rather than from entry 0; without a usable checkpoint it is a fresh
+    build. ``reuse`` names a previous sidecar whose edges are taken for every
+    entry whose content is unchanged (see ``reuse``).
+
+    ``workers > 1`` hands the build to ``sharded.build_link_graph_sharded``
+    instead: parallel parsing and a merge whose memory stays bounded however
+    large the archive, producing the same sidecar.
     """
+    if workers > 1:
+        from openzim_mcp.linkgraph.sharded import build_link_graph_sharded
+
+        return build_link_graph_sharded(
+            archive_path,
+            out_path,
+            force=force,
+            progress=progress,
+            workers=workers,
+            resume=resume,
+            reuse=reuse,
+        )
+
     from openzim_mcp.linkgraph.reader import sidecar_path_for
+    from openzim_mcp.linkgraph.reuse import (
+        ReusableLinks,
+        prepare_reuse,
+        reuse_path_for,
+    )
     from openzim_mcp.zim_operations import zim_archive
 
     out = out_path or sidecar_path_for(archive_path)
+    if Path(out).exists() and not force:
+        # Fail before preparing reuse or walking the archive.
+        raise FileExistsError(f"{out} already exists; pass force=True to overwrite.")
     with zim_archive(Path(archive_path)) as archive:
         archive_uuid = str(archive.uuid)
         total = int(getattr(archive, "entry_count", 0) or 0)
+        start = load_checkpoint(out, archive_uuid=archive_uuid) if resume else None
 
-        def _stream() -> Iterator[Tuple[str, List[Tuple[str, str]]]]:
-            for i, pair in enumerate(iter_article_links(archive)):
+        reusable: Optional[ReusableLinks] = None
+        if reuse:
+            reuse_path = reuse_path_for(out)
+            prepare_reuse(reuse, reuse_path)
+            reusable = ReusableLinks(reuse_path)
+        # The next entry id to walk: what a checkpoint records, so a resume
+        # restarts after the last source whose edges it committed.
+        next_entry = [start or 0]
+
+        def _stream() -> Iterator[LinkRecord]:
+            for i, source in enumerate(
+                iter_article_sources(archive, start=start or 0, reuse=reusable)
+            ):
                 # ``i and`` guards against the spurious 0 % 10_000 == 0 call at
                 # the very first entry; report every 10,000 thereafter.
                 if progress and i and i % 10_000 == 0:
                     progress(i, total)
-                yield pair
+                next_entry[0] = source.entry_id + 1
+                yield (
+                    source.path,
+                    source.targets,
+                    source.content_hash,
+                    source.title,
+                )
 
-        stats = build_from_link_stream(
-            out, archive_uuid=archive_uuid, link_stream=_stream(), force=force
-        )
+        try:
+            stats = build_from_link_stream(
+                out,
+                archive_uuid=archive_uuid,
+                link_stream=_stream(),
+                force=force,
+                resume=start is not None,
+                position=lambda: next_entry[0],
+            )
+        finally:
+            if reusable is not None:
+                logger.info(
+                    "link-graph build of %s reused %d unchanged sources, "
+                    "parsed %d new or changed",
+                    out,
+                    reusable.reused,
+                    reusable.changed,
+                )
+                reusable.close()
+                os.remove(reuse_path_for(out))
         if total and not stats.node_count:
             # A non-empty archive that yields no content sources means the
             # sidecar will answer every inbound query with a silent zero —
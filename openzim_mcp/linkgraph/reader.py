@@ -2,18 +2,28 @@
 
 ``open_for`` returns ``None`` for an absent file OR a fingerprint mismatch
 (schema version / archive UUID) — the caller treats both identically (the
-strict staleness decision). ``query_inbound`` is a ranked, paginated lookup.
+strict staleness decision). ``query_inbound`` is a ranked, paginated lookup;
+``query_related`` is the outbound one ``get_related_articles`` answers from.
+
+``open_cached`` is the request-path entry point: one long-lived, validated
+reader per sidecar for the whole process, revalidated by a single ``stat``
+per call, instead of a connect + fingerprint + close on every request.
 """
 
 from __future__ import annotations
 
+import os
+import queue
 import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.request import pathname2url
 
-from .schema import SCHEMA_VERSION
+from .schema import NODE_ORDER_RANK, RELATED_META_KEY, SCHEMA_VERSION
 
 
 class LinkGraphUnavailable(Exception):
@@ -33,12 +43,117 @@ class InboundPage:
     total: int
 
 
+# Per-connection ``PRAGMA mmap_size``: SQLite reads the sidecar's pages
+# straight out of the OS page cache instead of copying them into its own
+# cache, so a hub article's inbound pages share memory across the pooled
+# connections. A ceiling, not an allocation; sidecars larger than this fall
+# back to ordinary reads past it.
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Connections one reader will open for concurrent tool calls. Extra callers
+# wait for a free connection rather than opening more.
+POOL_SIZE = 4
+
+# The statements every inbound page runs. Kept as module constants so each
+# pooled connection's statement cache (``cached_statements``) prepares them
+# once and reuses the compiled form for the life of the connection.
+_SQL_TARGET = "SELECT id, inbound_degree FROM nodes WHERE path = ?"
+_SQL_NODE_ID = "SELECT id FROM nodes WHERE path = ?"
+# Rank-ordered ids (``meta.node_order = rank``): the ranked list is the
+# ``edges_by_target`` range itself; ``after`` resumes it with an index seek.
+_SQL_RANKED_PAGE = """
+    SELECT n.path, n.inbound_degree, e.anchor_text
+      FROM edges e JOIN nodes n ON n.id = e.source_id
+     WHERE e.target_id = ? AND e.source_id > ?
+     ORDER BY e.source_id
+     LIMIT ?
+"""
+# Older sidecars: the same order, computed by a join + top-k sort. The
+# keyset predicate keeps the sorter at ``limit`` rows however deep the page.
+_SQL_SORTED_PAGE = """
+    SELECT n.path, n.inbound_degree, e.anchor_text
+      FROM edges e JOIN nodes n ON n.id = e.source_id
+     WHERE e.target_id = ?
+       AND (n.inbound_degree < ? OR (n.inbound_degree = ? AND n.path > ?))
+     ORDER BY n.inbound_degree DESC, n.path ASC
+     LIMIT ?
+"""
+_SQL_OFFSET_PAGE = """
+    SELECT n.path, n.inbound_degree, e.anchor_text
+      FROM edges e JOIN nodes n ON n.id = e.source_id
+     WHERE e.target_id = ?
+     ORDER BY n.inbound_degree DESC, n.path ASC
+     LIMIT ? OFFSET ?
+"""
+# One source's link targets, most related first (co-citation + coupling,
+# see ``linkgraph.related``), then by the target's own rank. An
+# ``edges_by_source`` range plus primary-key probes; the sort only ever
+# sees one article's links.
+_SQL_RELATED = """
+    SELECT t.path, COALESCE(ti.title, t.path), e.anchor_text, t.inbound_degree,
+           COALESCE(r.cocitation, 0), COALESCE(r.coupling, 0)
+      FROM edges e
+      JOIN nodes t ON t.id = e.target_id
+      LEFT JOIN related r
+             ON r.source_id = e.source_id AND r.target_id = e.target_id
+      LEFT JOIN titles ti ON ti.node_id = e.target_id
+     WHERE e.source_id = ?
+     ORDER BY COALESCE(r.cocitation, 0) + COALESCE(r.coupling, 0) DESC,
+              e.target_id
+     LIMIT ?
+"""
+_SQL_OUT_DEGREE = "SELECT COUNT(*) FROM edges WHERE source_id = ?"
+# The most-linked nodes: the head of the id order on a rank-ordered file,
+# a top-k sort over ``nodes`` otherwise.
+_SQL_TOP_RANKED = "SELECT path FROM nodes ORDER BY id LIMIT ?"
+_SQL_TOP_SORTED = """
+    SELECT path FROM nodes ORDER BY inbound_degree DESC, path ASC LIMIT ?
+"""
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open one read-only, mmap-enabled connection to the sidecar at ``path``."""
+    # Percent-encode the path for the file: URI so archives whose path
+    # contains a space or other URI-significant character still open
+    # read-only (otherwise the URI is malformed and a valid sidecar would
+    # silently look absent).
+    uri = f"file:{pathname2url(str(Path(path).resolve()))}?mode=ro"
+    # ``check_same_thread=False``: pooled connections are handed to whichever
+    # worker thread checks one out; the pool guarantees one user at a time.
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    conn.execute("PRAGMA query_only=1")
+    return conn
+
+
 class LinkGraphReader:
-    """Open and query a link-graph sidecar. Construct via ``open_for``."""
+    """Query a link-graph sidecar. Construct via ``open_for`` / ``open_cached``.
+
+    Holds a small pool of read-only connections (the one ``open_for``
+    validated, plus up to ``POOL_SIZE - 1`` opened on demand), so one reader
+    can be shared across threads for the life of the process.
+    """
 
-    def __init__(self, conn: sqlite3.Connection) -> None:
-        """Store the open read-only SQLite connection."""
-        self._conn = conn
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        path: Optional[str] = None,
+        meta: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Wrap an open connection; ``path`` lets the pool grow beyond it."""
+        self._path = path
+        self.meta: Dict[str, str] = meta or {}
+        self._ranked = self.meta.get("node_order") == NODE_ORDER_RANK
+        # Written together with ``titles`` and ``related``: only such a file
+        # can answer ``query_related``.
+        self.has_related = RELATED_META_KEY in self.meta
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._idle.put(conn)
+        self._opened = 1
+        self._max_open = POOL_SIZE if path is not None else 1
+        self._lock = threading.Lock()
+        self._closed = False
 
     @classmethod
     def open_for(
@@ -48,12 +163,7 @@ class LinkGraphReader:
         path = sidecar_path_for(archive_path)
         if not Path(path).is_file():
             return None
-        # Percent-encode the path for the file: URI so archives whose path
-        # contains a space or other URI-significant character still open
-        # read-only (otherwise the URI is malformed and a valid sidecar would
-        # silently look absent).
-        uri = f"file:{pathname2url(str(Path(path).resolve()))}?mode=ro"
-        conn = sqlite3.connect(uri, uri=True)
+        conn = _connect(path)
         try:
             meta = dict(conn.execute("SELECT key, value FROM meta"))
         except sqlite3.DatabaseError:
@@ -65,37 +175,180 @@ class LinkGraphReader:
         if meta.get("archive_uuid") != live_archive_uuid:
             conn.close()
             return None
-        return cls(conn)
+        return cls(conn, path=path, meta=meta)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Check a pooled connection out for the duration of one query."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = self._path is not None and self._opened < self._max_open
+                if grow:
+                    self._opened += 1
+            if grow:
+                assert self._path is not None  # nosec B101 - narrowed by ``grow``
+                try:
+                    conn = _connect(self._path)
+                except BaseException:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
 
     def query_inbound(
-        self, target_path: str, *, limit: int, offset: int
+        self,
+        target_path: str,
+        *,
+        limit: int,
+        offset: int = 0,
+        after: Optional[Tuple[int, str]] = None,
     ) -> InboundPage:
-        """Return the inbound linkers of ``target_path``, ranked + paginated."""
-        row = self._conn.execute(
-            "SELECT id FROM nodes WHERE path = ?", (target_path,)
-        ).fetchone()
-        if row is None:
-            return InboundPage(rows=[], total=0)
-        target_id = row[0]
-        total = self._conn.execute(
-            "SELECT COUNT(*) FROM edges WHERE target_id = ?", (target_id,)
-        ).fetchone()[0]
-        cur = self._conn.execute(
-            """
-            SELECT n.path, n.inbound_degree, e.anchor_text
-              FROM edges e JOIN nodes n ON n.id = e.source_id
-             WHERE e.target_id = ?
-             ORDER BY n.inbound_degree DESC, n.path ASC
-             LIMIT ? OFFSET ?
-            """,
-            (target_id, limit, offset),
-        )
-        rows = [
-            {"path": p, "inbound_degree": d, "anchor_text": a}
-            for (p, d, a) in cur.fetchall()
-        ]
+        """Return the inbound linkers of ``target_path``, ranked + paginated.
+
+        ``after`` is the ``(inbound_degree, path)`` of the last row of the
+        previous page; when given, the page resumes strictly after it
+        (keyset pagination) and ``offset`` is ignored unless that path is
+        not a node of this file. Without it the page starts ``offset`` rows
+        in. The total is the target's stored
+        ``inbound_degree`` — the builder counts exactly these edges — so no
+        ``COUNT(*)`` runs per page.
+        """
+        with self._connection() as conn:
+            row = conn.execute(_SQL_TARGET, (target_path,)).fetchone()
+            if row is None:
+                return InboundPage(rows=[], total=0)
+            target_id, total = row
+            last_id: Optional[int] = None
+            if after is not None and self._ranked:
+                last = conn.execute(_SQL_NODE_ID, (after[1],)).fetchone()
+                # An unknown ``after`` path cannot come from a page of this
+                # file; resume at the cursor's offset rather than at page 1.
+                last_id = last[0] if last is not None else None
+            if last_id is not None:
+                cur = conn.execute(_SQL_RANKED_PAGE, (target_id, last_id, limit))
+            elif after is not None and not self._ranked:
+                degree, path = int(after[0]), after[1]
+                cur = conn.execute(
+                    _SQL_SORTED_PAGE, (target_id, degree, degree, path, limit)
+                )
+            elif self._ranked and offset == 0:
+                cur = conn.execute(_SQL_RANKED_PAGE, (target_id, 0, limit))
+            else:
+                cur = conn.execute(_SQL_OFFSET_PAGE, (target_id, limit, offset))
+            rows = [
+                {"path": p, "inbound_degree": d, "anchor_text": a}
+                for (p, d, a) in cur.fetchall()
+            ]
+        return InboundPage(rows=rows, total=int(total))
+
+    def query_related(self, source_path: str, *, limit: int) -> Optional[InboundPage]:
+        """Return ``source_path``'s link targets, most related first.
+
+        Each row carries the target's ``path``, display ``title`` (its path
+        when the archive had none to record), the source's ``anchor_text``,
+        the target's ``inbound_degree`` and the ``cocitation`` /
+        ``coupling`` scores of the edge. ``total`` counts all of the
+        source's targets. ``None`` when the file predates the outbound
+        tables or ``source_path`` is not a node of it — the caller parses
+        the article instead.
+        """
+        if not self.has_related:
+            return None
+        with self._connection() as conn:
+            row = conn.execute(_SQL_NODE_ID, (source_path,)).fetchone()
+            if row is None:
+                return None
+            source_id = row[0]
+            total = conn.execute(_SQL_OUT_DEGREE, (source_id,)).fetchone()[0]
+            rows = [
+                {
+                    "path": p,
+                    "title": t,
+                    "anchor_text": a,
+                    "inbound_degree": d,
+                    "cocitation": cc,
+                    "coupling": cp,
+                }
+                for (p, t, a, d, cc, cp) in conn.execute(
+                    _SQL_RELATED, (source_id, limit)
+                )
+            ]
         return InboundPage(rows=rows, total=int(total))
 
+    def top_paths(self, limit: int) -> List[str]:
+        """Return the ``limit`` most-linked node paths, most-linked first.
+
+        Nodes are link targets as well as sources, so a path here can name
+        an entry the archive does not hold; callers skip those.
+        """
+        sql = _SQL_TOP_RANKED if self._ranked else _SQL_TOP_SORTED
+        with self._connection() as conn:
+            return [p for (p,) in conn.execute(sql, (limit,))]
+
     def close(self) -> None:
-        """Close the underlying connection."""
-        self._conn.close()
+        """Close every idle connection; checked-out ones close on return."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# Process-wide readers for the request path, keyed by sidecar path. Each
+# entry remembers the (mtime, size, inode) it was opened against and the
+# archive UUID it was fingerprinted for, so a rebuilt sidecar or a replaced
+# archive is reopened rather than served stale — the same contract as the
+# title-index ``open_cached``. Bounded because every archive in the allowed
+# directories can carry one.
+_CACHE_MAX = 16
+_cache: (
+    "OrderedDict[str, Tuple[Tuple[int, int, int], str, Optional[LinkGraphReader]]]"
+) = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def open_cached(
+    archive_path: Any, *, live_archive_uuid: str
+) -> Optional[LinkGraphReader]:
+    """Return the shared reader for ``archive_path``'s sidecar, or ``None``.
+
+    Costs one ``stat`` when the sidecar is absent or unchanged; only a new
+    or rebuilt file pays for ``open_for``'s connect + fingerprint. A
+    negative result for a present-but-stale sidecar is cached too. Callers
+    must not ``close()`` the returned reader. Superseded readers are dropped
+    rather than closed, since another thread may still be mid-query on one;
+    their connections close when the last reference goes.
+    """
+    path = sidecar_path_for(archive_path)
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        with _cache_lock:
+            _cache.pop(path, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _cache_lock:
+        held = _cache.get(path)
+        if held is not None and held[0] == stamp and held[1] == live_archive_uuid:
+            _cache.move_to_end(path)
+            return held[2]
+    reader = LinkGraphReader.open_for(
+        str(archive_path), live_archive_uuid=live_archive_uuid
+    )
+    with _cache_lock:
+        _cache[path] = (stamp, live_archive_uuid, reader)
+        _cache.move_to_end(path)
+        while len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return reader
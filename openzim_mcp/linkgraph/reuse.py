@@ -0,0 +1,147 @@
+"""Diff-based link-graph rebuilds: reuse a previous sidecar's edges.
+
+A new archive revision mostly carries the same articles as the last one,
+yet a full build parses every one of them again. Sidecars record a content
+hash per parsed source (``source_hashes``), so a rebuild pointed at the
+previous sidecar (``build link-graph --reuse OLD``) can take the stored
+targets of every entry whose content hash is unchanged and parse only the
+entries that are new or edited.
+
+``prepare_reuse`` copies what that lookup needs out of the previous sidecar
+into a scratch database keyed by source path, once per build (the sidecar's
+own edge index is by target, not source). ``ReusableLinks`` answers the
+per-entry question. Reused targets are the previous build's canonical
+paths; ``iter_article_sources`` re-canonicalizes them through the new
+archive, so a target that became a redirect is credited to its new
+canonical page. What a reused entry cannot pick up is a link whose old
+target was a redirect and is now an article of its own — it stays credited
+to the article it used to redirect to until the source itself changes — so
+a periodic full build remains the reference.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.request import pathname2url
+
+from .schema import SCHEMA_VERSION, apply_build_pragmas
+
+logger = logging.getLogger(__name__)
+
+
+def reuse_path_for(out_path: str) -> str:
+    """Return the scratch database a ``--reuse`` build of ``out_path`` uses."""
+    return out_path + ".reuse"
+
+
+def _file_uri(path: str) -> str:
+    """Return the SQLite ``file:`` URI of ``path``."""
+    return f"file:{pathname2url(str(Path(path).resolve()))}"
+
+
+def prepare_reuse(previous_sidecar: str, work_path: str) -> int:
+    """Index ``previous_sidecar``'s per-source edges into ``work_path``.
+
+    Returns the number of sources whose edges can be reused. A previous
+    sidecar from another schema version (its stored paths may be spelled
+    differently) or from before content hashes were recorded yields an
+    empty index, and the build parses everything. A missing
+    ``previous_sidecar`` raises ``FileNotFoundError``: attaching it would
+    create an empty file and silently turn the rebuild into a full one.
+    """
+    if not os.path.isfile(previous_sidecar):
+        raise FileNotFoundError(f"previous sidecar not found: {previous_sidecar}")
+    if os.path.exists(work_path):
+        os.remove(work_path)
+    conn = sqlite3.connect(_file_uri(work_path), uri=True)
+    try:
+        apply_build_pragmas(conn)
+        conn.executescript("""
+            CREATE TABLE sources (path TEXT PRIMARY KEY, node_id INTEGER NOT NULL,
+                                  content_hash BLOB NOT NULL) WITHOUT ROWID;
+            CREATE TABLE links (source_id INTEGER NOT NULL, target TEXT NOT NULL,
+                                anchor_text TEXT NOT NULL);
+            """)
+        conn.execute(
+            "ATTACH DATABASE ? AS prev", (_file_uri(previous_sidecar) + "?mode=ro",)
+        )
+        tables = {
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM prev.sqlite_master WHERE type = 'table'"
+            )
+        }
+        meta = (
+            dict(conn.execute("SELECT key, value FROM prev.meta"))
+            if "meta" in tables
+            else {}
+        )
+        if meta.get("schema_version") != str(SCHEMA_VERSION):
+            logger.warning(
+                "not reusing %s: sidecar schema %s, this build writes %s",
+                previous_sidecar,
+                meta.get("schema_version"),
+                SCHEMA_VERSION,
+            )
+        elif "source_hashes" not in tables:
+            logger.warning(
+                "not reusing %s: it predates per-source content hashes",
+                previous_sidecar,
+            )
+        else:
+            conn.execute("""INSERT INTO sources(path, node_id, content_hash)
+                   SELECT n.path, n.id, h.content_hash
+                     FROM prev.source_hashes h JOIN prev.nodes n ON n.id = h.node_id""")
+            conn.execute("""INSERT INTO links(source_id, target, anchor_text)
+                   SELECT e.source_id, t.path, e.anchor_text
+                     FROM prev.edges e JOIN prev.nodes t ON t.id = e.target_id
+                    WHERE e.source_id IN (SELECT node_id FROM prev.source_hashes)
+                    ORDER BY e.source_id""")
+        conn.execute("CREATE INDEX links_by_source ON links(source_id)")
+        conn.commit()
+        conn.execute("DETACH DATABASE prev")
+        return int(conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0])
+    finally:
+        conn.close()
+
+
+class ReusableLinks:
+    """Look up a previous build's targets for an unchanged source."""
+
+    def __init__(self, work_path: str) -> None:
+        """Open a ``prepare_reuse`` index read-only."""
+        self._conn = sqlite3.connect(_file_uri(work_path) + "?mode=ro", uri=True)
+        self.reused = 0
+        self.changed = 0
+
+    def links_for(
+        self, path: str, content_hash: bytes
+    ) -> Optional[List[Tuple[str, str]]]:
+        """The previous ``(target, anchor_text)`` list, or ``None`` to re-parse.
+
+        ``None`` when ``path`` was not a parsed source last time or its
+        content hash differs. An unchanged source with no links returns ``[]``.
+        """
+        row = self._conn.execute(
+            "SELECT node_id, content_hash FROM sources WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None or bytes(row[1]) != content_hash:
+            self.changed += 1
+            return None
+        self.reused += 1
+        return [
+            (target, anchor)
+            for target, anchor in self._conn.execute(
+                "SELECT target, anchor_text FROM links WHERE source_id = ? "
+                "ORDER BY rowid",
+                (row[0],),
+            )
+        ]
+
+    def close(self) -> None:
+        """Close the index connection."""
+        self._conn.close()
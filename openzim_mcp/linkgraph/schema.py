@@ -6,6 +6,25 @@ carries the precomputed ``inbound_degree`` used to rank linkers by importance;
 for the inbound lookup (``anchor_text`` is the visible link text of each edge).
 ``meta`` holds the archive UUID + schema version the reader fingerprints against
 (strict staleness check).
+
+Node ids are assigned in rank order — ``inbound_degree`` descending, then
+``path`` ascending — by every builder that records ``node_order = rank`` in
+``meta``. On such a file the ranked inbound list of a target is simply its
+edges in ``source_id`` order, which ``edges_by_target`` serves as an index
+range scan, so any page of a hub article's linkers costs O(page) rather than
+a sort over every linker. Files without the marker (built before it was
+introduced) are still valid; the reader ranks them with a join + sort.
+
+Outbound queries (``get_related_articles``) read the same ``edges`` through
+``edges_by_source``, take display titles from ``titles`` and rank each
+article's link targets by the ``related`` scores computed at build time
+(see ``linkgraph.related``). Builders that write those tables record
+``related_fanout`` in ``meta``; the reader falls back to parsing the article
+on a file without it.
+
+``source_hashes`` records a content hash per parsed source for diff-based
+rebuilds (``linkgraph.reuse``); it is build-time metadata the reader never
+touches, so sidecars without it stay valid too.
 """
 
 from __future__ import annotations
@@ -25,6 +44,16 @@ import sqlite3
 # for one article of the shipped test corpus) instead of being reported stale.
 SCHEMA_VERSION = 3
 
+# ``meta.node_order`` value recorded by builders that assign node ids in rank
+# order. Additive, so no version bump: a file without it is read correctly,
+# just without the index-only inbound ranking.
+NODE_ORDER_RANK = "rank"
+
+# ``meta`` key recording the per-edge fan-out cap the ``related`` scores were
+# computed with (see ``linkgraph.related``). Its presence is what marks a
+# sidecar able to answer outbound queries; additive, so no version bump.
+RELATED_META_KEY = "related_fanout"
+
 _DDL = """
 CREATE TABLE meta  (key TEXT PRIMARY KEY, value TEXT) STRICT;
 CREATE TABLE nodes (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE,
@@ -36,7 +65,25 @@ CREATE TABLE nodes (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE,
 -- COUNT over these rows, so the by-construction uniqueness keeps it accurate.
 CREATE TABLE edges (target_id INTEGER NOT NULL, source_id INTEGER NOT NULL,
                     anchor_text TEXT NOT NULL DEFAULT '') STRICT;
-CREATE INDEX edges_by_target ON edges(target_id);
+-- (target_id, source_id): with rank-ordered node ids this index IS the
+-- ranked inbound list, and keyset pagination resumes it with a seek.
+CREATE INDEX edges_by_target ON edges(target_id, source_id);
+-- The outbound direction: one source's targets as an index range.
+CREATE INDEX edges_by_source ON edges(source_id, target_id);
+-- Archive title of each parsed source (targets the archive cannot serve
+-- have none and display as their path).
+CREATE TABLE titles (node_id INTEGER PRIMARY KEY, title TEXT NOT NULL) STRICT;
+-- Relatedness of each edge's endpoints: co-citation (sources linking to
+-- both) and bibliographic coupling (targets both link to). Only edges with
+-- a non-zero score have a row.
+CREATE TABLE related (source_id INTEGER NOT NULL, target_id INTEGER NOT NULL,
+                      cocitation INTEGER NOT NULL, coupling INTEGER NOT NULL,
+                      PRIMARY KEY (source_id, target_id)) STRICT, WITHOUT ROWID;
+-- Hash of each parsed source's content. Not read by the server: a later
+-- build with ``--reuse`` copies the edges of every entry whose content hash
+-- is unchanged instead of parsing it again.
+CREATE TABLE source_hashes (node_id INTEGER PRIMARY KEY,
+                            content_hash BLOB NOT NULL) STRICT;
 """
 
 
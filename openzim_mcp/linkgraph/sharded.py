@@ -0,0 +1,383 @@
+"""Parallel, bounded-memory link-graph build (``build link-graph --workers N``).
+
+The serial builder parses every article in one process and interns every
+node path in a Python dict, so a full Wikipedia build takes hours and its
+RSS grows with the article count. This build splits the work in two:
+
+* **Parse (parallel).** The archive's entry ids are cut into contiguous
+  shards. Each worker process opens the archive itself, runs
+  ``iter_article_sources`` over its id range and spills the source paths
+  (with their content hashes) and ``(target, source, anchor_text)`` edges it
+  found — by path, no ids — to a per-shard SQLite file (``write_spill``).
+* **Merge (bounded memory).** ``build_from_spills`` loads the spills into a
+  staging database and lets SQLite assign node ids: degrees come from a
+  ``GROUP BY`` over the edges, rank-ordered ids from ``ROW_NUMBER()`` over
+  ``(degree DESC, path)``, and edges are rewritten to those ids through the
+  ``nodes.path`` index. Each of those is an external merge sort inside
+  SQLite, spilling to temporary files past ``_MERGE_CACHE_KIB`` rather than
+  growing the heap, so no step holds the whole path map in RAM.
+
+A spill is renamed into place only once its shard is fully parsed, and the
+shard directory carries a ``manifest.json`` of the archive and ranges it
+was cut for, so ``--resume`` after an interrupted build re-parses only the
+shards that have no spill yet.
+
+The merge writes the sidecar's tables with the same rows, in the same
+order, as ``build_from_link_stream``: a sharded build is interchangeable
+with a serial one of the same archive. SQLite puts its sort temporaries in
+``SQLITE_TMPDIR`` (else ``TMPDIR``), which therefore needs room for a few
+times the edge table on a large build.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .builder import (
+    _BATCH,
+    BuildStats,
+    LinkRecord,
+    _distinct_targets,
+    _meta_rows,
+    iter_article_sources,
+)
+from .related import score_related
+from .schema import apply_build_pragmas, create_schema
+
+logger = logging.getLogger(__name__)
+
+# Shards per worker. More shards than workers keeps every process busy
+# when some id ranges are denser in long articles than others.
+SHARDS_PER_WORKER = 4
+
+# Page cache for the merge connection (KiB; SQLite's negative
+# ``cache_size`` form). Also the memory SQLite's sorter may use before it
+# spills a run to disk, so this is the merge's working-set ceiling.
+_MERGE_CACHE_KIB = 256 * 1024
+
+_SPILL_DDL = """
+CREATE TABLE sources (path TEXT NOT NULL, content_hash BLOB, title TEXT);
+CREATE TABLE edges (target TEXT NOT NULL, source TEXT NOT NULL,
+                    anchor_text TEXT NOT NULL);
+"""
+
+
+def shard_dir_for(out_path: str) -> str:
+    """Return the directory a sharded build of ``out_path`` spills into."""
+    return f"{out_path}.shards"
+
+
+def shard_ranges(total: int, shards: int) -> List[Tuple[int, int]]:
+    """Cut ``[0, total)`` into at most ``shards`` contiguous, non-empty ranges."""
+    shards = max(1, min(shards, total))
+    if total <= 0:
+        return []
+    size, extra = divmod(total, shards)
+    ranges: List[Tuple[int, int]] = []
+    start = 0
+    for index in range(shards):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def write_spill(spill_path: str, link_stream: Iterable[LinkRecord]) -> Tuple[int, int]:
+    """Write one shard's sources and edges to ``spill_path``.
+
+    Edges go through the same ``_distinct_targets`` filter as the serial
+    build. Returns ``(source_count, edge_count)``.
+    """
+    if os.path.exists(spill_path):
+        os.remove(spill_path)
+    conn = sqlite3.connect(spill_path)
+    try:
+        apply_build_pragmas(conn)
+        conn.executescript(_SPILL_DDL)
+        sources = 0
+        edge_count = 0
+        source_batch: List[Tuple[str, Optional[bytes], Optional[str]]] = []
+        batch: List[Tuple[str, str, str]] = []
+        for record in link_stream:
+            source_path, targets = record[0], record[1]
+            sources += 1
+            source_batch.append(
+                (
+                    source_path,
+                    record[2] if len(record) > 2 else None,
+                    record[3] if len(record) > 3 else None,
+                )
+            )
+            for target, anchor in _distinct_targets(source_path, targets):
+                batch.append((target, source_path, anchor))
+                edge_count += 1
+            if len(batch) >= _BATCH:
+                conn.executemany("INSERT INTO edges VALUES (?,?,?)", batch)
+                batch.clear()
+            if len(source_batch) >= _BATCH:
+                conn.executemany("INSERT INTO sources VALUES (?,?,?)", source_batch)
+                source_batch.clear()
+        conn.executemany("INSERT INTO edges VALUES (?,?,?)", batch)
+        conn.executemany("INSERT INTO sources VALUES (?,?,?)", source_batch)
+        conn.commit()
+    finally:
+        conn.close()
+    return sources, edge_count
+
+
+def build_from_spills(
+    out_path: str,
+    *,
+    archive_uuid: str,
+    spill_paths: Iterable[str],
+    force: bool = False,
+    now_iso: Optional[str] = None,
+    builder_version: Optional[str] = None,
+) -> BuildStats:
+    """Merge shard spills into the sidecar at ``out_path`` (atomic write).
+
+    The pure, ZIM-free core of the sharded build; the output matches
+    ``build_from_link_stream`` fed the same edges in any order.
+    """
+    if Path(out_path).exists() and not force:
+        raise FileExistsError(
+            f"{out_path} already exists; pass force=True to overwrite."
+        )
+    tmp_path = out_path + ".tmp"
+    stage_path = out_path + ".stage"
+    for leftover in (tmp_path, stage_path):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        apply_build_pragmas(conn)
+        create_schema(conn)
+        conn.execute(f"PRAGMA cache_size=-{_MERGE_CACHE_KIB}")
+        conn.execute("ATTACH DATABASE ? AS stage", (stage_path,))
+        conn.execute("PRAGMA stage.journal_mode=OFF")
+        conn.execute("PRAGMA stage.synchronous=OFF")
+        conn.executescript(_SPILL_DDL.replace("CREATE TABLE ", "CREATE TABLE stage."))
+        for spill in spill_paths:
+            conn.execute("ATTACH DATABASE ? AS spill", (spill,))
+            conn.execute("INSERT INTO stage.sources SELECT * FROM spill.sources")
+            conn.execute("INSERT INTO stage.edges SELECT * FROM spill.edges")
+            # DETACH refuses to run inside the implicit transaction.
+            conn.commit()
+            conn.execute("DETACH DATABASE spill")
+
+        edge_count = conn.execute("SELECT COUNT(*) FROM stage.edges").fetchone()[0]
+        conn.execute("""CREATE TABLE stage.degrees AS
+               SELECT path, SUM(hit) AS degree
+                 FROM (SELECT target AS path, 1 AS hit FROM stage.edges
+                       UNION ALL
+                       SELECT path, 0 FROM stage.sources)
+                GROUP BY path""")
+        conn.execute("""INSERT INTO nodes(id, path, inbound_degree)
+               SELECT ROW_NUMBER() OVER (ORDER BY degree DESC, path), path, degree
+                 FROM stage.degrees
+                ORDER BY degree DESC, path""")
+        node_count = conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+        conn.execute("""INSERT INTO edges(target_id, source_id, anchor_text)
+               SELECT t.id, s.id, e.anchor_text
+                 FROM stage.edges e
+                 JOIN nodes t ON t.path = e.target
+                 JOIN nodes s ON s.path = e.source
+                ORDER BY t.id, s.id""")
+        conn.execute("""INSERT INTO source_hashes(node_id, content_hash)
+               SELECT n.id, s.content_hash
+                 FROM stage.sources s JOIN nodes n ON n.path = s.path
+                WHERE s.content_hash IS NOT NULL
+                ORDER BY n.id""")
+        conn.execute("""INSERT INTO titles(node_id, title)
+               SELECT n.id, s.title
+                 FROM stage.sources s JOIN nodes n ON n.path = s.path
+                WHERE s.title IS NOT NULL
+                ORDER BY n.id""")
+        score_related(conn)
+        conn.executemany(
+            "INSERT INTO meta(key, value) VALUES (?,?)",
+            _meta_rows(
+                archive_uuid=archive_uuid,
+                node_count=node_count,
+                edge_count=edge_count,
+                now_iso=now_iso,
+                builder_version=builder_version,
+            ),
+        )
+        conn.commit()
+        conn.execute("DETACH DATABASE stage")
+    finally:
+        conn.close()
+        if os.path.exists(stage_path):
+            os.remove(stage_path)
+    os.replace(tmp_path, out_path)
+    return BuildStats(
+        node_count=node_count,
+        edge_count=edge_count,
+        bytes_written=Path(out_path).stat().st_size,
+    )
+
+
+def _parse_shard(
+    archive_path: str,
+    start: int,
+    stop: int,
+    spill_path: str,
+    reuse_path: Optional[str] = None,
+) -> Tuple[int, int]:
+    """Worker entry point: spill the links of entries ``[start, stop)``.
+
+    The spill is written under a temporary name and renamed when complete,
+    so an existing ``spill_path`` always holds a whole shard.
+    """
+    from openzim_mcp.zim_operations import zim_archive
+
+    from .reuse import ReusableLinks
+
+    reusable = ReusableLinks(reuse_path) if reuse_path else None
+    try:
+        with zim_archive(Path(archive_path)) as archive:
+            counts = write_spill(
+                spill_path + ".tmp",
+                (
+                    (source.path, source.targets, source.content_hash, source.title)
+                    for source in iter_article_sources(
+                        archive, start=start, stop=stop, reuse=reusable
+                    )
+                ),
+            )
+    finally:
+        if reusable is not None:
+            reusable.close()
+    os.replace(spill_path + ".tmp", spill_path)
+    return counts
+
+
+def _prepare_shard_dir(shard_dir: str, manifest: Dict[str, Any], resume: bool) -> None:
+    """Keep ``shard_dir``'s finished spills only when resuming the same cut."""
+    manifest_path = os.path.join(shard_dir, "manifest.json")
+    if resume:
+        try:
+            with open(manifest_path, encoding="utf-8") as fh:
+                if json.load(fh) == manifest:
+                    return
+        except (OSError, ValueError):
+            pass
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    os.makedirs(shard_dir)
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh)
+
+
+def build_link_graph_sharded(
+    archive_path: str,
+    out_path: Optional[str] = None,
+    *,
+    force: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+    workers: int = 2,
+    resume: bool = False,
+    reuse: Optional[str] = None,
+) -> BuildStats:
+    """Build the sidecar for ``archive_path`` with ``workers`` parser processes.
+
+    Spills go to ``shard_dir_for(out)`` next to the output (same
+    filesystem, so the space a build needs is visible where the sidecar
+    lands) and are removed once the merge succeeds. Workers are started
+    with the ``spawn`` method: each opens its own libzim ``Archive`` and
+    none inherits the parent's handles or threads. ``progress`` is invoked
+    as ``progress(processed, total)`` as each shard finishes.
+
+    ``resume=True`` keeps the spills of an interrupted build cut for the
+    same archive, worker count and ranges and parses only the missing
+    shards; the spills are kept on failure for exactly that reason.
+    ``reuse`` names a previous sidecar whose edges every worker takes for
+    unchanged entries (see ``reuse``).
+    """
+    from openzim_mcp.linkgraph.reader import sidecar_path_for
+    from openzim_mcp.zim_operations import zim_archive
+
+    from .reuse import prepare_reuse, reuse_path_for
+
+    out = out_path or sidecar_path_for(archive_path)
+    if Path(out).exists() and not force:
+        # Fail before spending hours parsing; the merge re-checks.
+        raise FileExistsError(f"{out} already exists; pass force=True to overwrite.")
+    with zim_archive(Path(archive_path)) as archive:
+        archive_uuid = str(archive.uuid)
+        total = int(getattr(archive, "entry_count", 0) or 0)
+
+    shard_dir = shard_dir_for(out)
+    ranges = shard_ranges(total, workers * SHARDS_PER_WORKER)
+    _prepare_shard_dir(
+        shard_dir,
+        {
+            "archive_uuid": archive_uuid,
+            "total": total,
+            "ranges": [list(r) for r in ranges],
+        },
+        resume,
+    )
+    spills = [
+        os.path.join(shard_dir, f"shard-{index:05d}.sqlite")
+        for index in range(len(ranges))
+    ]
+    reuse_path = None
+    if reuse:
+        reuse_path = reuse_path_for(out)
+        prepare_reuse(reuse, reuse_path)
+    try:
+        done = sum(
+            stop - start
+            for (start, stop), spill in zip(ranges, spills)
+            if os.path.exists(spill)
+        )
+        if done:
+            logger.info(
+                "resuming sharded link-graph build of %s: %d of %d entries "
+                "already parsed",
+                out,
+                done,
+                total,
+            )
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _parse_shard, archive_path, start, stop, spill, reuse_path
+                ): stop
+                - start
+                for (start, stop), spill in zip(ranges, spills)
+                if not os.path.exists(spill)
+            }
+            for future in as_completed(futures):
+                future.result()
+                done += futures[future]
+                if progress:
+                    progress(done, total)
+        stats = build_from_spills(
+            out, archive_uuid=archive_uuid, spill_paths=spills, force=force
+        )
+    finally:
+        if reuse_path and os.path.exists(reuse_path):
+            os.remove(reuse_path)
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    if total and not stats.node_count:
+        logger.warning(
+            "link-graph build for %s produced 0 nodes despite %d archive "
+            "entries; inbound queries against this sidecar will return "
+            "empty results",
+            archive_path,
+            total,
+        )
+    return stats
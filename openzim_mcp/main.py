@@ -126,6 +126,15 @@ Environment Variables:
         default=None,
         help=("HTTP/SSE bind port (default 8000). Env: OPENZIM_MCP_PORT"),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "HTTP worker processes behind a session-affine router (default 1; "
+            "--transport http only). Env: OPENZIM_MCP_WORKERS"
+        ),
+    )
     return parser
 
 
@@ -140,6 +149,8 @@ def _config_kwargs_from_args(args: argparse.Namespace) -> dict:
         kwargs["host"] = args.host
     if args.port is not None:
         kwargs["port"] = args.port
+    if args.workers is not None:
+        kwargs["workers"] = args.workers
     return kwargs
 
 
@@ -45,6 +45,7 @@ from __future__ import annotations
 
 import difflib
 import json
+import time
 from typing import Any
 
 import pydantic_core
@@ -62,7 +63,11 @@ from mcp_types import (
 )
 from pydantic import ValidationError
 
+from .archive_generations import stat_memo
+from .call_trace import CallTraceRecorder, tally_cache_lookups
+from .metrics import ToolMetrics
 from .responses import tool_error
+from .timings import collect_timings
 
 __all__ = ["EnvelopeAwareMCPServer", "is_tool_error_envelope"]
 
@@ -269,16 +274,37 @@ class EnvelopeAwareMCPServer(MCPServer):
     return value passes through — so tools keep returning plain dicts and no
     registration site has to know about the protocol envelope.
 
+    The same seam times every call for the opt-in trace recorder
+    (``call_trace.py``), so a recorded latency covers exactly the tool body
+    and not the protocol framing around it, and collects the per-stage spans
+    (``timings.py``) that ``timings_enabled`` ships as ``_meta.timings``.
+
     Args:
         archive_read_ttl_ms: TTL stamped on reads of archive-backed ``zim://``
             URIs. ``0`` leaves the result alone, so those reads fall back to
             the server-wide ``resources/read`` hint.
+        call_trace: Recorder that every dispatched tool call is written to;
+            ``None`` (the default) records nothing.
+        timings_enabled: Attach each successful call's stage breakdown as
+            ``_meta.timings``: inside the ``_meta`` of a dict payload, and on
+            the result's protocol-level ``_meta`` for a text return, which
+            has no envelope of its own to carry it.
     """
 
-    def __init__(self, *args: Any, archive_read_ttl_ms: int = 0, **kwargs: Any) -> None:
-        """Capture the archive TTL, then defer to the SDK constructor."""
+    def __init__(
+        self,
+        *args: Any,
+        archive_read_ttl_ms: int = 0,
+        call_trace: CallTraceRecorder | None = None,
+        timings_enabled: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Capture the archive TTL, recorder and timings flag, then defer."""
         super().__init__(*args, **kwargs)
         self._archive_read_ttl_ms = archive_read_ttl_ms
+        self.call_trace = call_trace
+        self.timings_enabled = timings_enabled
+        self.tool_metrics = ToolMetrics()
 
     async def _handle_read_resource(
         self, ctx: Any, params: Any
@@ -441,6 +467,27 @@ class EnvelopeAwareMCPServer(MCPServer):
         # is still visible. ``get_tool`` returning ``None`` falls through, so an
         # unknown *tool* name keeps raising the SDK's ``ToolError`` as before.
         tool = self._tool_manager.get_tool(name)
+        if tool is None:
+            return await self._run_tool(None, name, arguments, context)
+        # Metered only once the name is known to be registered, which keeps
+        # the ``tool`` label of the ``/metrics`` series to a fixed set.
+        self.tool_metrics.started(name)
+        started = time.perf_counter()
+        ok = False
+        try:
+            outcome = await self._run_tool(tool, name, arguments, context)
+            ok = not (isinstance(outcome, CallToolResult) and outcome.is_error)
+            return outcome
+        finally:
+            self.tool_metrics.finished(name, time.perf_counter() - started, ok)
+
+    async def _run_tool(
+        self,
+        tool: Any,
+        name: str,
+        arguments: dict[str, Any],
+        context: Context[Any, Any],
+    ) -> CallToolResult | InputRequiredResult:
         if tool is not None:
             rejected = _unknown_argument_error(tool, name, arguments)
             if rejected is not None:
@@ -449,15 +496,64 @@ class EnvelopeAwareMCPServer(MCPServer):
         # the success path is then converted by the same
         # ``fn_metadata.convert_result`` the base class would have used, which
         # keeps that path byte-identical to a stock server.
-        result = await self._tool_manager.call_tool(
-            name, arguments, context, convert_result=False
-        )
+        if not self.timings_enabled:
+            result = await self._dispatch_tool(name, arguments, context)
+            timings = None
+        else:
+            with collect_timings() as collected:
+                result = await self._dispatch_tool(name, arguments, context)
+            timings = collected.as_meta()
         if is_tool_error_envelope(result):
             return error_result(result)
 
         if tool is None:  # pragma: no cover - call_tool raises on unknown names
             return result  # type: ignore[no-any-return]
+        if timings is not None and isinstance(result, dict):
+            meta = result.get("_meta")
+            if isinstance(meta, dict):
+                # Copy rather than stamp: the payload may be the very object
+                # the response cache holds.
+                result = {**result, "_meta": {**meta, "timings": timings}}
+                timings = None
         converted: CallToolResult | InputRequiredResult = (
             tool.fn_metadata.convert_result(result)
         )
+        if timings is not None and isinstance(converted, CallToolResult):
+            converted.meta = {**(converted.meta or {}), "timings": timings}
         return converted
+
+    async def _dispatch_tool(
+        self, name: str, arguments: dict[str, Any], context: Context[Any, Any]
+    ) -> Any:
+        # One ``stat()`` per archive per call: every cache key the call builds
+        # embeds the archive's generation, and a search builds dozens.
+        with stat_memo():
+            if self.call_trace is None:
+                return await self._tool_manager.call_tool(
+                    name, arguments, context, convert_result=False
+                )
+            return await self._call_tool_recorded(name, arguments, context)
+
+    async def _call_tool_recorded(
+        self, name: str, arguments: dict[str, Any], context: Context[Any, Any]
+    ) -> Any:
+        """Dispatch one tool call and write it to ``call_trace``."""
+        recorder = self.call_trace
+        assert recorder is not None  # nosec B101 - checked by the caller
+        ok = False
+        started = time.perf_counter()
+        with tally_cache_lookups() as tally:
+            try:
+                result = await self._tool_manager.call_tool(
+                    name, arguments, context, convert_result=False
+                )
+                ok = not is_tool_error_envelope(result)
+                return result
+            finally:
+                recorder.record(
+                    name,
+                    arguments,
+                    latency_ms=(time.perf_counter() - started) * 1000.0,
+                    ok=ok,
+                    cache=tally,
+                )
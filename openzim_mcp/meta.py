@@ -6,6 +6,15 @@ summary on prose-returning tools in compact mode. Token estimates use
 tiktoken's cl100k_base encoding as a model-agnostic budget signal —
 not exact for any specific model, but close enough for context
 budgeting across Anthropic, OpenAI, and Llama tokenizers.
+
+Counting is tiered (:class:`TokenEstimator`, ``meta.token_estimator``).
+Encoding a 100 KB article body costs ~16 ms — a top-five cost of a long
+``get_zim_entry`` — for a number that is only ever a budget hint, so
+large responses are estimated from sampled windows instead and carry
+their error bound in ``_meta.tokens_est_error``. Exact counts of large
+strings are memoised, and callers that already know the count of a
+field (``get_section``, from the bundle's cached per-section counts)
+pass it in rather than have it re-encoded.
 """
 
 from __future__ import annotations
@@ -13,7 +22,13 @@ from __future__ import annotations
 import functools
 import json as _json
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .defaults import META
+from .timings import timed
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +62,7 @@ def _get_encoder() -> Any:
         return None
 
 
+@timed("token_count")
 def _raw_tokens_est(rendered: str) -> Optional[int]:
     """Tokenize ``rendered``. Returns ``None`` when the tokenizer is
     unavailable or the encode fails, so callers can distinguish
@@ -71,6 +87,162 @@ def _raw_tokens_est(rendered: str) -> Optional[int]:
         return None
 
 
+# Sampled estimation reads this many evenly spaced windows of this many
+# characters. Calibrated against exact cl100k counts of markdown and JSON
+# payloads in English, code, and 20 other languages across eight scripts:
+# worst observed error 5%, and the reported bound covered every sample.
+# A fixed byte/word-class formula fitted to the same corpus was off by 15%
+# on English markdown and by up to 60% on Armenian or Russian: the
+# chars-per-token ratio varies too much by script and markup for constant
+# weights, so the ratio is measured on the text itself.
+_SAMPLE_WINDOWS = 16
+_SAMPLE_CHARS = 512
+# Below this a sample would encode more than half the text anyway.
+_SAMPLE_MIN_CHARS = 2 * _SAMPLE_WINDOWS * _SAMPLE_CHARS
+# Floor on the reported relative error: window edges cut tokens in two, a
+# bias the spread between windows does not show.
+_APPROX_ERROR_FLOOR = 0.02
+# Exact counts of strings this long are memoised by (length, hash), so a
+# response re-rendered on a cache hit is not re-encoded. Shorter strings
+# are cheaper to encode than to hash and look up.
+_MEMO_MIN_CHARS = 4096
+_MEMO_SIZE = 256
+
+TOKEN_ESTIMATOR_MODES = ("exact", "approx", "auto")
+
+
+@timed("token_count")
+def _sampled_tokens_est(text: str) -> Optional[Tuple[int, float]]:
+    """Estimate ``text``'s token count from evenly spaced windows.
+
+    Returns ``(count, relative_error)``: the windows' combined
+    tokens-per-character ratio scaled to the whole text, and three
+    standard errors of the per-window ratios (never below
+    ``_APPROX_ERROR_FLOOR``). ``None`` when the tokenizer is unavailable.
+    """
+    encoder = _get_encoder()
+    if encoder is None:
+        return None
+    step = len(text) / _SAMPLE_WINDOWS
+    sampled_chars = sampled_tokens = 0
+    ratios: List[float] = []
+    try:
+        for i in range(_SAMPLE_WINDOWS):
+            start = int(i * step)
+            # Start on a word boundary so the first token is a whole word.
+            space = text.find(" ", start, start + 64)
+            window = text[space if space != -1 else start :][:_SAMPLE_CHARS]
+            count = len(encoder.encode(window, disallowed_special=()))
+            sampled_chars += len(window)
+            sampled_tokens += count
+            ratios.append(count / len(window))
+    except Exception as e:
+        logger.warning("token estimation failed; omitting tokens_est: %s", e)
+        return None
+    mean = sum(ratios) / len(ratios)
+    spread = math.sqrt(sum((r - mean) ** 2 for r in ratios) / (len(ratios) - 1))
+    error = 3 * spread / (mean * math.sqrt(len(ratios))) if mean else 1.0
+    # Round the bound up, never down, to three decimals.
+    error = math.ceil(max(error, _APPROX_ERROR_FLOOR) * 1000) / 1000
+    return round(len(text) * sampled_tokens / sampled_chars), error
+
+
+class TokenEstimator:
+    """Pick exact or sampled counting per string, and memoise exact counts."""
+
+    def __init__(
+        self,
+        mode: str = "auto",
+        approx_min_chars: int = META.TOKEN_APPROX_MIN_CHARS,
+    ) -> None:
+        """Start in ``mode`` with an empty memo."""
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+        self._exact = 0
+        self._approx = 0
+        self._memo_hits = 0
+        self.configure(mode, approx_min_chars)
+
+    def configure(self, mode: str, approx_min_chars: int) -> None:
+        """Set the tier (``exact`` / ``approx`` / ``auto``) and its threshold."""
+        if mode not in TOKEN_ESTIMATOR_MODES:
+            raise ValueError(f"unknown token estimator mode: {mode!r}")
+        self.mode = mode
+        self.approx_min_chars = approx_min_chars
+
+    def _approximates(self, chars: int) -> bool:
+        if self.mode == "exact" or chars < _SAMPLE_MIN_CHARS:
+            return False
+        return self.mode == "approx" or chars >= self.approx_min_chars
+
+    def estimate(self, text: str) -> Optional[Tuple[int, Optional[float]]]:
+        """``(tokens, relative_error)`` for ``text``; the error is ``None`` if exact.
+
+        ``None`` when the tokenizer is unavailable or fails.
+        """
+        if not text:
+            return 0, None
+        if self._approximates(len(text)):
+            approx = _sampled_tokens_est(text)
+            if approx is not None:
+                self._approx += 1
+                return approx
+            return None
+        key = (len(text), hash(text)) if len(text) >= _MEMO_MIN_CHARS else None
+        if key is not None:
+            with self._lock:
+                known = self._memo.get(key)
+                if known is not None:
+                    self._memo.move_to_end(key)
+                    self._memo_hits += 1
+                    return known, None
+        count = _raw_tokens_est(text)
+        if count is None:
+            return None
+        self._exact += 1
+        if key is not None:
+            with self._lock:
+                self._memo[key] = count
+                if len(self._memo) > _MEMO_SIZE:
+                    self._memo.popitem(last=False)
+        return count, None
+
+    def counters(self) -> Dict[str, int]:
+        """Cumulative counters read without the lock, for ``/metrics``."""
+        return {
+            "exact": self._exact,
+            "approx": self._approx,
+            "memo_hits": self._memo_hits,
+        }
+
+    def reset(self) -> None:
+        """Forget the memo and counters (tests). The mode stays."""
+        with self._lock:
+            self._memo.clear()
+            self._exact = 0
+            self._approx = 0
+            self._memo_hits = 0
+
+
+TOKEN_ESTIMATOR = TokenEstimator()
+
+
+def token_estimator_counters() -> Dict[str, int]:
+    """Exact / sampled / memoised count totals, for ``/metrics``."""
+    return TOKEN_ESTIMATOR.counters()
+
+
+def json_string_tokens(text: str) -> Optional[int]:
+    """Exact token count of ``text`` as it appears inside a JSON response.
+
+    Escaping (``\\n``, ``\\"``) adds 4-8% to the tokens of English
+    markdown, so a count a caller hands to :func:`attach_meta` through
+    ``token_counts`` is taken of the escaped form. Always exact: it is
+    meant to be computed once and cached, not per response.
+    """
+    return _raw_tokens_est(_json.dumps(text, ensure_ascii=False)[1:-1])
+
+
 def tokens_est(rendered: str) -> int:
     """Estimate the token count of a rendered string using cl100k_base.
 
@@ -94,6 +266,8 @@ def build_meta(
     detected_type: Optional[str] = None,
     detection_confidence: Optional[str] = None,
     preset_applied: Optional[str] = None,
+    token_text: Optional[str] = None,
+    known_tokens: int = 0,
 ) -> Dict[str, Any]:
     """Construct a `_meta` envelope for a tool response.
 
@@ -110,9 +284,16 @@ def build_meta(
     emitted: tools whose ``truncated`` means "value omitted, no
     continuation" (binary cap, section-content cap, summary word cap)
     must leave it ``None``.
+
+    ``tokens_est`` counts ``token_text`` (default ``rendered``) through
+    :data:`TOKEN_ESTIMATOR` and adds ``known_tokens``, the already-known
+    count of whatever the caller left out of ``token_text``. A sampled
+    estimate adds ``tokens_est_method: "approx"`` and its relative error
+    bound as ``tokens_est_error``; exact counts add neither.
     """
     chars = len(rendered)
-    raw_tokens = _raw_tokens_est(rendered)
+    estimate = TOKEN_ESTIMATOR.estimate(rendered if token_text is None else token_text)
+    raw_tokens = None if estimate is None else estimate[0] + known_tokens
 
     meta: Dict[str, Any] = {
         "chars": chars,
@@ -130,6 +311,9 @@ def build_meta(
             meta["tokens_est"] = 0
         else:
             meta["tokens_est"] = int(raw_tokens * 1.05) + 1
+        if estimate is not None and estimate[1] is not None:
+            meta["tokens_est_method"] = "approx"
+            meta["tokens_est_error"] = estimate[1]
     if truncated:
         if content_chars is not None:
             meta["more_at_offset"] = current_offset + content_chars
@@ -289,6 +473,7 @@ def attach_meta(
     detected_type: Optional[str] = None,
     detection_confidence: Optional[str] = None,
     preset_applied: Optional[str] = None,
+    token_counts: Optional[Dict[str, int]] = None,
 ) -> Dict[str, Any]:
     """Attach a `_meta` envelope built from the JSON-rendered payload (sans _meta).
 
@@ -306,12 +491,24 @@ def attach_meta(
     or default JSON-of-payload). Pagination is driven by ``content_chars``
     — pass the length of the paginable field (e.g. ``len(payload["content"])``)
     so ``more_at_offset`` is computed from content bytes, not envelope bytes.
+
+    ``token_counts`` maps top-level string fields to their known token
+    counts (:func:`json_string_tokens` of the value). Those fields are
+    blanked in the text that is tokenised and their counts added back, so
+    a large body whose count is cached is never re-encoded. Ignored when
+    ``rendered`` is supplied, which need not be the payload's JSON.
     """
+    token_text: Optional[str] = None
+    known_tokens = 0
     if rendered is None:
-        rendered = _json.dumps(
-            {k: v for k, v in payload.items() if k != "_meta"},
-            ensure_ascii=False,
-        )
+        body = {k: v for k, v in payload.items() if k != "_meta"}
+        rendered = _json.dumps(body, ensure_ascii=False)
+        if token_counts:
+            token_text = _json.dumps(
+                {k: "" if k in token_counts else v for k, v in body.items()},
+                ensure_ascii=False,
+            )
+            known_tokens = sum(token_counts.values())
     payload["_meta"] = build_meta(
         rendered=rendered,
         truncated=truncated,
@@ -323,5 +520,7 @@ def attach_meta(
         detected_type=detected_type,
         detection_confidence=detection_confidence,
         preset_applied=preset_applied,
+        token_text=token_text,
+        known_tokens=known_tokens,
     )
     return payload
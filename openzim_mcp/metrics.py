@@ -0,0 +1,287 @@
+"""Prometheus exposition of the server's runtime counters.
+
+Everything an operator wants to alert on already existed, but only behind
+a ``zim_health`` tool call: cache hit rates in ``OpenZimMcpCache.stats``,
+rate-limit state in ``RateLimiter.get_status``, reranker and heuristic
+counters in ``SimpleToolsHandler.get_telemetry``. A Prometheus scraper
+cannot speak MCP, and a tool call is metered, rate limited and logged like
+any other. :func:`render_metrics` gathers the same signals, plus per-tool
+call counts, latency histograms and in-flight calls, thread-pool backlog
+and open archive handles, into the text format ``/metrics`` serves.
+
+A scrape every five seconds must cost live traffic nothing, so nothing here
+takes a lock a request path takes:
+
+* per-tool figures live in :class:`ToolMetrics`, which only the event loop
+  ever touches (the dispatcher updates it there, and the HTTP handler that
+  renders it runs there), so it needs no lock at all;
+* cache, rate-limiter and archive-pool figures come from their
+  ``counters()`` methods, which read single fields without the component's
+  lock — atomic under the GIL, though not one consistent instant;
+* thread-pool backlog is read off the executors' work queues;
+* stage histograms (``timings.py``) are copied under the registry's own
+  lock, which no request waits on for longer than one histogram update.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from .archive_generations import archive_generation_counters
+from .meta import token_estimator_counters
+from .timeout_utils import executor_stats
+from .timings import Histogram, histogram_lines, render_prometheus
+from .zim.archive import archive_pool_counters
+
+if TYPE_CHECKING:
+    from .server import OpenZimMcpServer
+
+__all__ = ["ToolMetrics", "render_metrics"]
+
+_PREFIX = "openzim_mcp"
+
+
+class ToolMetrics:
+    """Call counts, latency histograms and in-flight calls per tool.
+
+    Confined to the event loop: ``EnvelopeAwareMCPServer.call_tool`` updates
+    it before and after each dispatch and the ``/metrics`` handler reads it,
+    both as coroutines on the one loop, so there is nothing to lock. Only
+    registered tool names are recorded — an unknown name is rejected before
+    it gets here — which bounds the label set.
+    """
+
+    def __init__(self) -> None:
+        """Start with no tools seen."""
+        self._calls: Dict[Tuple[str, str], int] = {}
+        self._latency: Dict[str, Histogram] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def started(self, tool: str) -> None:
+        """Count ``tool`` as in flight."""
+        self._in_flight[tool] = self._in_flight.get(tool, 0) + 1
+
+    def finished(self, tool: str, seconds: float, ok: bool) -> None:
+        """Record one finished call of ``tool``."""
+        self._in_flight[tool] = self._in_flight.get(tool, 1) - 1
+        key = (tool, "ok" if ok else "error")
+        self._calls[key] = self._calls.get(key, 0) + 1
+        histogram = self._latency.get(tool)
+        if histogram is None:
+            histogram = self._latency[tool] = Histogram()
+        histogram.observe(seconds)
+
+    def render(self) -> List[str]:
+        """Prometheus text lines for the per-tool series."""
+        calls = f"{_PREFIX}_tool_calls_total"
+        duration = f"{_PREFIX}_tool_duration_seconds"
+        in_flight = f"{_PREFIX}_tool_calls_in_flight"
+        lines = [
+            f"# HELP {calls} Tool calls finished, by outcome.",
+            f"# TYPE {calls} counter",
+        ]
+        for (tool, outcome), count in sorted(self._calls.items()):
+            lines.append(f'{calls}{{tool="{tool}",outcome="{outcome}"}} {count}')
+        lines += [
+            f"# HELP {duration} Tool call latency at the dispatch seam.",
+            f"# TYPE {duration} histogram",
+        ]
+        for tool, histogram in sorted(self._latency.items()):
+            lines.extend(
+                histogram_lines(
+                    duration,
+                    f'tool="{tool}"',
+                    histogram.buckets,
+                    histogram.count,
+                    histogram.total,
+                )
+            )
+        lines += [
+            f"# HELP {in_flight} Tool calls currently being handled.",
+            f"# TYPE {in_flight} gauge",
+        ]
+        for tool, count in sorted(self._in_flight.items()):
+            lines.append(f'{in_flight}{{tool="{tool}"}} {count}')
+        return lines
+
+
+def _metric(
+    lines: List[str], name: str, kind: str, help_text: str, samples: Dict[str, Any]
+) -> None:
+    """Append one metric family; ``samples`` maps rendered labels to values."""
+    full = f"{_PREFIX}_{name}"
+    lines.append(f"# HELP {full} {help_text}")
+    lines.append(f"# TYPE {full} {kind}")
+    for labels, value in samples.items():
+        series = f"{full}{{{labels}}}" if labels else full
+        lines.append(f"{series} {float(value)!r}")  # bools render as 1.0/0.0
+
+
+# (metric name, type, help, counters() key) per component. Names follow the
+# Prometheus conventions: ``_total`` for counters, base units for gauges.
+_CACHE_SERIES = (
+    ("cache_hits_total", "counter", "Response-cache hits.", "hits"),
+    ("cache_misses_total", "counter", "Response-cache misses.", "misses"),
+    (
+        "cache_evictions_total",
+        "counter",
+        "Entries evicted from the response cache.",
+        "evictions",
+    ),
+    (
+        "cache_admission_rejected_total",
+        "counter",
+        "Writes the admission filter turned away.",
+        "admission_rejected",
+    ),
+    (
+        "cache_shared_hits_total",
+        "counter",
+        "Local misses answered by the cross-process cache tier.",
+        "shared_hits",
+    ),
+    (
+        "cache_generation_purged_total",
+        "counter",
+        "Entries dropped because their archive was replaced.",
+        "generation_purged",
+    ),
+    ("cache_entries", "gauge", "Entries held by the response cache.", "entries"),
+    ("cache_size_bytes", "gauge", "Bytes held by the response cache.", "size_bytes"),
+)
+
+_RATE_LIMIT_SERIES = (
+    ("rate_limit_enabled", "gauge", "1 when rate limiting is on.", "enabled"),
+    ("rate_limit_clients", "gauge", "Clients with a rate-limit bucket.", "clients"),
+    (
+        "rate_limit_rejected_total",
+        "counter",
+        "Tool calls denied by the rate limiter.",
+        "rejected",
+    ),
+)
+
+_ARCHIVE_SERIES = (
+    (
+        "archive_handles_open",
+        "gauge",
+        "Archive handles held open by the handle pool.",
+        "open_handles",
+    ),
+    (
+        "archive_pool_reopens_total",
+        "counter",
+        "Pooled handles retired because their file was replaced.",
+        "reopens",
+    ),
+)
+
+_GENERATION_SERIES = (
+    ("archive_stats_total", "counter", "stat() calls on archive files.", "stats"),
+    (
+        "archive_stat_memo_hits_total",
+        "counter",
+        "Archive generation lookups answered without a stat() call.",
+        "memo_hits",
+    ),
+    (
+        "archive_generation_changes_total",
+        "counter",
+        "Archive replacements seen by the generation registry.",
+        "changes",
+    ),
+)
+
+
+_TOKEN_SERIES = (
+    (
+        "tokens_exact_total",
+        "counter",
+        "Strings tokenised in full for _meta.tokens_est.",
+        "exact",
+    ),
+    (
+        "tokens_approx_total",
+        "counter",
+        "Strings whose _meta.tokens_est was estimated from sampled windows.",
+        "approx",
+    ),
+    (
+        "tokens_memo_hits_total",
+        "counter",
+        "Exact token counts answered from the memo without encoding.",
+        "memo_hits",
+    ),
+)
+
+
+def _series_lines(
+    lines: List[str],
+    series: Tuple[Tuple[str, str, str, str], ...],
+    counters: Dict[str, Any],
+) -> None:
+    for name, kind, help_text, key in series:
+        _metric(lines, name, kind, help_text, {"": counters[key]})
+
+
+def _archive_lines(lines: List[str], counters: Dict[str, int]) -> None:
+    _series_lines(lines, _ARCHIVE_SERIES, counters)
+    _metric(
+        lines,
+        "archive_pool_lookups_total",
+        "counter",
+        "Archive handle requests, by whether a pooled handle served them.",
+        {'result="hit"': counters["hits"], 'result="open"': counters["opens"]},
+    )
+    _metric(
+        lines,
+        "archive_pool_evictions_total",
+        "counter",
+        "Pooled handles closed, by reason.",
+        {
+            'reason="lru"': counters["evicted_lru"],
+            'reason="idle"': counters["evicted_idle"],
+        },
+    )
+
+
+def _executor_lines(lines: List[str], pools: Dict[str, Dict[str, int]]) -> None:
+    for field, kind, help_text in (
+        ("queue_depth", "gauge", "Work items waiting for a pool thread."),
+        ("workers", "gauge", "Threads started by the pool."),
+        ("max_workers", "gauge", "Thread limit of the pool."),
+    ):
+        _metric(
+            lines,
+            f"thread_pool_{field}",
+            kind,
+            help_text,
+            {f'pool="{pool}"': stats[field] for pool, stats in sorted(pools.items())},
+        )
+
+
+def render_metrics(server: "OpenZimMcpServer") -> str:
+    """Render every exported series for ``server`` as Prometheus text."""
+    lines: List[str] = []
+    tool_metrics = getattr(server.mcp, "tool_metrics", None)
+    if isinstance(tool_metrics, ToolMetrics):
+        lines.extend(tool_metrics.render())
+    _series_lines(lines, _CACHE_SERIES, server.cache.counters())
+    _series_lines(lines, _RATE_LIMIT_SERIES, server.rate_limiter.counters())
+    _archive_lines(lines, archive_pool_counters())
+    _series_lines(lines, _GENERATION_SERIES, archive_generation_counters())
+    _series_lines(lines, _TOKEN_SERIES, token_estimator_counters())
+    _executor_lines(lines, executor_stats())
+    handler = getattr(server, "simple_tools_handler", None)
+    if handler is not None:
+        # Reranker engagement/skip counters and the heuristic-branch
+        # counters share one family, labelled by event name.
+        telemetry = handler.get_telemetry()
+        _metric(
+            lines,
+            "simple_tools_events_total",
+            "counter",
+            "Heuristic-branch and reranker events in query handling.",
+            {f'event="{event}"': count for event, count in sorted(telemetry.items())},
+        )
+    return "\n".join(lines) + "\n" + render_prometheus()
@@ -24,6 +24,7 @@ from typing import (
 from openzim_mcp.config import RerankerConfig
 from openzim_mcp.ml import detect
 from openzim_mcp.ml.fallback import ml_fallback
+from openzim_mcp.timings import timed
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +120,7 @@ class BGEReranker:
                 scores[i] = float(s)
         return scores
 
+    @timed("rerank")
     @ml_fallback(
         feature="reranker_inference",
         on_failure=_rerank_passthrough,
@@ -31,7 +31,7 @@ import base64
 import hashlib
 import json
 from pathlib import Path
-from typing import TypedDict, Union, cast
+from typing import Any, TypedDict, Union, cast
 
 CURRENT_VERSION = 2
 
@@ -48,6 +48,23 @@ def archive_identity(validated_path: Union[Path, str]) -> str:
     return hashlib.sha256(raw).hexdigest()[:12]
 
 
+def is_inbound_keyset(value: Any) -> bool:
+    """True when ``value`` is a well-formed ``ka`` ``[inbound_degree, path]``.
+
+    ``ka`` arrives from a client-held token, so its shape is checked before
+    any ``int()`` / SQL use rather than trusted from the cursor.
+    """
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) == 2
+        and isinstance(value[0], int)
+        and not isinstance(value[0], bool)
+        and value[0] >= 0
+        and isinstance(value[1], str)
+        and bool(value[1])
+    )
+
+
 class CursorState(TypedDict, total=False):
     """Tool-specific state inside a cursor payload."""
 
@@ -60,6 +77,7 @@ class CursorState(TypedDict, total=False):
     k: str  # kind: "internal" | "external" | "media"
     ct: str  # content_type (search_with_filters)
     ai: str  # archive identity (short SHA-256 token of validated_path)
+    ka: list  # keyset resume point [inbound_degree, path] (inbound links)
 
 
 class CursorPayload(TypedDict):
@@ -200,6 +200,9 @@ class RateLimiter:
         # the per-op race — but during the gap a third caller can be
         # spuriously denied at the global layer (H5).
         self._coarse_lock = threading.Lock()
+        # Calls denied since startup; bumped under ``_coarse_lock`` and read
+        # without it by ``counters``.
+        self._rejected = 0
 
         logger.info(
             f"Rate limiter initialized: enabled={self.config.enabled}, "
@@ -359,6 +362,7 @@ class RateLimiter:
 
             # Check global limit first
             if not global_bucket.acquire(global_cost):
+                self._rejected += 1
                 wait_s = _displayable_wait(global_bucket.get_wait_time(global_cost))
                 raise OpenZimMcpRateLimitError(
                     f"Rate limit exceeded for operation '{operation}'. "
@@ -374,6 +378,7 @@ class RateLimiter:
                 # Refund the amount actually debited, or the global bucket
                 # leaks tokens whenever the two clamps differ.
                 global_bucket.refund(global_cost)
+                self._rejected += 1
                 raise OpenZimMcpRateLimitError(
                     f"Per-operation rate limit exceeded for "
                     f"'{operation}'. Please wait {wait_s} "
@@ -429,6 +434,21 @@ class RateLimiter:
             "max_clients": self._max_clients,
         }
 
+    def counters(self) -> Dict[str, Any]:
+        """Denial count and tracked clients, read without either lock.
+
+        For the ``/metrics`` scrape: every tool call passes through
+        ``check_rate_limit``, so a scrape that queued on its locks would
+        add latency to live traffic. Each field is a single read, atomic
+        under the GIL; the set is not one consistent instant, which a
+        monitoring sample does not need.
+        """
+        return {
+            "enabled": self.config.enabled,
+            "clients": len(self._global_buckets),
+            "rejected": self._rejected,
+        }
+
     def reset(self) -> None:
         """Reset all rate limit buckets to full capacity."""
         # Hold the coarse lock too: ``check_rate_limit`` resolves bucket
@@ -0,0 +1,512 @@
+"""Structural view of a regular expression, for vetting and prefiltering.
+
+``intent_parser`` needs two facts about its patterns that ``re`` does not
+expose: whether a pattern can backtrack badly enough to hang a request
+thread (which decides if the ``safe_regex_*`` helpers may run it inline),
+and which literal words every match must contain (the ``parse_intent``
+prefilter). Both used to come from ``re._parser``, an undocumented module
+whose tree shape changes between Python releases. :func:`parse` is a small
+parser for the ``re`` syntax this server writes, producing a tree that
+belongs to this module; anything it does not understand raises
+``ValueError``, and callers treat that as "unknown, assume the worst".
+
+Tree nodes are tuples whose first item is the node kind:
+
+* ``(LITERAL, char, flags)`` — one character.
+* ``(CLASS, source, flags)`` — any other single-character matcher: a
+  ``[...]`` set, ``.``, or a category escape such as ``\\s``; ``source``
+  compiles on its own under ``flags``.
+* ``(AT, source)`` — a zero-width anchor: ``^ $ \\b \\B \\A \\Z``.
+* ``(GROUP, branches)`` — a parenthesised group or a top-level
+  alternation; each branch is a sequence (list) of nodes.
+* ``(REPEAT, low, high, body)`` — a quantified sequence; ``high`` is
+  :data:`UNBOUNDED` for ``*``, ``+`` and ``{m,}``.
+* ``(ASSERT, branches)`` — a lookahead or lookbehind.
+* ``(BACKREF,)`` — ``\\1`` or ``(?P=name)``.
+
+:func:`backtracking_risk` is deliberately conservative. A pattern is risky
+when a repeat nests a repeat or repeats an ambiguous alternation (``(a|a)*``,
+``(a|aa)*``) — the exponential cases — or when unbounded repeats that can
+match the same characters follow one another closely enough to compound
+(``\\s*\\s*x`` is cubic: a minute on 4 KB of spaces). One unbounded repeat
+left to scan, or two anchored behind a literal, stays quadratic at worst,
+which the inline input cap keeps to well under a second.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import unicodedata
+from typing import Any, Iterator, List, Optional, Tuple
+
+__all__ = [
+    "ASSERT",
+    "AT",
+    "BACKREF",
+    "CLASS",
+    "GROUP",
+    "LITERAL",
+    "REPEAT",
+    "UNBOUNDED",
+    "backtracking_risk",
+    "parse",
+]
+
+LITERAL = "literal"
+CLASS = "class"
+AT = "at"
+GROUP = "group"
+REPEAT = "repeat"
+ASSERT = "assert"
+BACKREF = "backref"
+
+Node = Tuple[Any, ...]
+Sequence = List[Node]
+
+UNBOUNDED = 1 << 32
+# A repeat allowing more than this many iterations is treated as unbounded
+# when counting how repeats compound; ``{0,3}`` multiplies the work by a
+# constant and is ignored.
+_COMPOUNDING_MIN = 16
+# Polynomial degree from which a pattern is kept off the inline path: the
+# number of compounding repeats, plus one when the match can start at any
+# offset. Degree 2 on a 4 KB input is ~16M steps (tens of milliseconds);
+# degree 3 is already a minute.
+_RISKY_DEGREE = 3
+
+_SCOPED_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE}
+_GLOBAL_ONLY_FLAGS = "aLu"
+_QUANTIFIER_RE = re.compile(r"\{(\d*)(,?)(\d*)\}")
+_CATEGORY_ESCAPES = frozenset("dDwWsS")
+_ANCHOR_ESCAPES = frozenset("bBAZ")
+_CONTROL_ESCAPES = {
+    "a": "\a",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+}
+
+
+class _Parser:
+    """Recursive-descent parser over one pattern string."""
+
+    def __init__(self, pattern: str, flags: int) -> None:
+        self.source = pattern
+        self.pos = 0
+        self.flags = flags
+
+    def parse(self) -> Sequence:
+        branches = self._alternation(self.flags)
+        if self.pos != len(self.source):
+            raise ValueError(f"unbalanced ')' at {self.pos}")
+        return branches[0] if len(branches) == 1 else [(GROUP, branches)]
+
+    def _peek(self, ahead: int = 0) -> str:
+        at = self.pos + ahead
+        return self.source[at] if at < len(self.source) else ""
+
+    def _alternation(self, flags: int) -> List[Sequence]:
+        branches = [self._sequence(flags)]
+        while self._peek() == "|":
+            self.pos += 1
+            branches.append(self._sequence(flags))
+        return branches
+
+    def _sequence(self, flags: int) -> Sequence:
+        items: Sequence = []
+        while self.pos < len(self.source):
+            if flags & re.VERBOSE and self._skip_verbose():
+                continue
+            char = self._peek()
+            if char in "|)":
+                break
+            node = self._atom(flags)
+            if node is None:
+                continue
+            items.append(self._quantified(node, flags))
+        return items
+
+    def _skip_verbose(self) -> bool:
+        char = self._peek()
+        if char.isspace():
+            self.pos += 1
+            return True
+        if char == "#":
+            end = self.source.find("\n", self.pos)
+            self.pos = len(self.source) if end < 0 else end + 1
+            return True
+        return False
+
+    def _atom(self, flags: int) -> Optional[Node]:
+        char = self._peek()
+        if char == "(":
+            return self._group(flags)
+        if char == "[":
+            return self._class(flags)
+        self.pos += 1
+        if char == ".":
+            return (CLASS, ".", flags)
+        if char in "^$":
+            return (AT, char)
+        if char == "\\":
+            return self._escape(flags)
+        if char in "*+?":
+            raise ValueError(f"nothing to repeat at {self.pos - 1}")
+        return (LITERAL, char, flags)
+
+    def _quantified(self, node: Node, flags: int) -> Node:
+        char = self._peek()
+        if char == "*":
+            low, high, width = 0, UNBOUNDED, 1
+        elif char == "+":
+            low, high, width = 1, UNBOUNDED, 1
+        elif char == "?":
+            low, high, width = 0, 1, 1
+        elif char == "{":
+            match = _QUANTIFIER_RE.match(self.source, self.pos)
+            if match is None:
+                return node
+            first, comma, second = match.groups()
+            low = int(first) if first else 0
+            if comma:
+                high = int(second) if second else UNBOUNDED
+            else:
+                high = low
+            width = match.end() - self.pos
+        else:
+            return node
+        self.pos += width
+        if self._peek() in ("?", "+"):  # lazy / possessive
+            self.pos += 1
+        if self._peek() and self._peek() in "*+?":
+            raise ValueError(f"multiple repeat at {self.pos}")
+        return (REPEAT, low, high, [node])
+
+    def _escape(self, flags: int) -> Node:
+        char = self._peek()
+        if not char:
+            raise ValueError("bad escape (end of pattern)")
+        self.pos += 1
+        if char in _CATEGORY_ESCAPES:
+            return (CLASS, "\\" + char, flags)
+        if char in _ANCHOR_ESCAPES:
+            return (AT, "\\" + char)
+        if char in _CONTROL_ESCAPES:
+            return (LITERAL, _CONTROL_ESCAPES[char], flags)
+        if char.isdigit():
+            return self._numeric_escape(char, flags)
+        if char in "xuU":
+            width = {"x": 2, "u": 4, "U": 8}[char]
+            digits = self.source[self.pos : self.pos + width]
+            self.pos += width
+            return (LITERAL, chr(int(digits, 16)), flags)
+        if char == "N":
+            end = self.source.index("}", self.pos)
+            name = self.source[self.pos + 1 : end]
+            self.pos = end + 1
+            return (LITERAL, unicodedata.lookup(name), flags)
+        if char.isalpha():
+            raise ValueError(f"unknown escape \\{char}")
+        return (LITERAL, char, flags)
+
+    def _numeric_escape(self, first: str, flags: int) -> Node:
+        digits = first
+        while len(digits) < 3 and self._peek() and self._peek() in "01234567":
+            digits += self._peek()
+            self.pos += 1
+        if first == "0" or (len(digits) == 3 and first in "01234567"):
+            return (LITERAL, chr(int(digits, 8)), flags)
+        # Not octal: a group reference of up to two digits. Give back any
+        # digit consumed past those.
+        self.pos -= len(digits) - min(len(digits), 2)
+        return (BACKREF,)
+
+    def _class(self, flags: int) -> Node:
+        start = self.pos
+        self.pos += 1
+        if self._peek() == "^":
+            self.pos += 1
+        if self._peek() == "]":
+            self.pos += 1
+        while True:
+            char = self._peek()
+            if not char:
+                raise ValueError(f"unterminated character set at {start}")
+            self.pos += 2 if char == "\\" else 1
+            if char == "]":
+                break
+        return (CLASS, self.source[start : self.pos], flags)
+
+    def _group(self, flags: int) -> Optional[Node]:
+        start = self.pos
+        self.pos += 1
+        kind = GROUP
+        inner = flags
+        if self._peek() == "?":
+            self.pos += 1
+            char = self._peek()
+            if char == ":" or char == ">":  # non-capturing / atomic
+                self.pos += 1
+            elif char == "P" and self._peek(1) == "<":
+                self.pos = self.source.index(">", self.pos) + 1
+            elif char == "P" and self._peek(1) == "=":
+                self.pos = self.source.index(")", self.pos) + 1
+                return (BACKREF,)
+            elif char in "=!":
+                kind = ASSERT
+                self.pos += 1
+            elif char == "<" and self._peek(1) in ("=", "!"):
+                kind = ASSERT
+                self.pos += 2
+            elif char == "#":
+                self.pos = self.source.index(")", self.pos) + 1
+                return None
+            else:
+                inner, scoped = self._inline_flags(flags)
+                if not scoped:  # ``(?i)``: already folded into the flags
+                    return None
+        branches = self._alternation(inner)
+        if self._peek() != ")":
+            raise ValueError(f"missing ')' for group at {start}")
+        self.pos += 1
+        return (kind, branches)
+
+    def _inline_flags(self, flags: int) -> Tuple[int, bool]:
+        """Read ``(?imsx-imsx:`` or ``(?aiLmsux)``; return (flags, scoped)."""
+        on = True
+        while True:
+            char = self._peek()
+            self.pos += 1
+            if char == ":":
+                return flags, True
+            if char == ")":
+                return flags, False
+            if char == "-":
+                on = False
+            elif char in _SCOPED_FLAGS:
+                flags = (
+                    flags | _SCOPED_FLAGS[char] if on else flags & ~_SCOPED_FLAGS[char]
+                )
+            elif char not in _GLOBAL_ONLY_FLAGS or not char:
+                raise ValueError(f"unsupported group syntax at {self.pos - 1}")
+
+
+def parse(pattern: str, flags: int = 0) -> Sequence:
+    """Parse ``pattern`` (as ``re.compile(pattern, flags)`` would read it).
+
+    Raises ``ValueError`` for syntax outside the supported subset
+    (conditional groups, and anything ``re`` itself rejects).
+    """
+    try:
+        return _Parser(pattern, flags).parse()
+    except (IndexError, KeyError) as e:  # truncated escapes and groups
+        raise ValueError(f"cannot parse pattern: {e}") from e
+
+
+# --- backtracking risk ----------------------------------------------------
+
+
+def _atom_source(node: Node) -> str:
+    """A standalone pattern for one LITERAL/CLASS node, its flags inline."""
+    body = re.escape(node[1]) if node[0] == LITERAL else node[1]
+    flags = node[2]
+    letters = "".join(
+        letter
+        for letter, flag in (("i", re.IGNORECASE), ("s", re.DOTALL))
+        if flags & flag
+    )
+    if flags & re.ASCII:
+        letters += "a"
+    return f"(?{letters}:{body})"
+
+
+@functools.lru_cache(maxsize=1)
+def _alphabet() -> str:
+    """Every BMP character but the surrogates, plus astral samples.
+
+    Searching it for a character two matchers both accept decides overlap
+    exactly for the BMP. Astral ranges in a hand-written class are rare;
+    the samples cover the categories (letter, digit, symbol, CJK) that the
+    escape classes distinguish there.
+    """
+    bmp = "".join(chr(c) for c in range(0x10000) if not 0xD800 <= c <= 0xDFFF)
+    return bmp + "\U0001d400\U0001d7ce\U0001f600\U00020000\U000e0041"
+
+
+@functools.lru_cache(maxsize=4096)
+def _sources_overlap(first: str, second: str) -> bool:
+    return re.search(f"(?={first}){second}", _alphabet()) is not None
+
+
+def _overlap(first: List[Node], second: List[Node]) -> bool:
+    """Whether any character matches an atom of both lists."""
+    return any(
+        _sources_overlap(_atom_source(a), _atom_source(b))
+        for a in first
+        for b in second
+    )
+
+
+def _atoms(node: Node) -> List[Node]:
+    """Every LITERAL/CLASS a node can consume (assertions excluded)."""
+    kind = node[0]
+    if kind in (LITERAL, CLASS):
+        return [node]
+    if kind == GROUP:
+        return [atom for branch in node[1] for item in branch for atom in _atoms(item)]
+    if kind == REPEAT:
+        return [atom for item in node[3] for atom in _atoms(item)]
+    return []
+
+
+def _nullable(items: Sequence) -> bool:
+    """Whether the sequence can match the empty string (conservatively)."""
+    for node in items:
+        kind = node[0]
+        if kind in (LITERAL, CLASS):
+            return False
+        if kind == REPEAT and node[1] > 0 and not _nullable(node[3]):
+            return False
+        if kind == GROUP and not any(_nullable(b) for b in node[1]):
+            return False
+    return True
+
+
+def _first_atoms(items: Sequence) -> Optional[List[Node]]:
+    """Atoms a match of ``items`` can start with; ``None`` if unknowable."""
+    first: List[Node] = []
+    for node in items:
+        kind = node[0]
+        if kind in (LITERAL, CLASS):
+            return first + [node]
+        if kind == BACKREF:
+            return None
+        if kind == GROUP:
+            for branch in node[1]:
+                branch_first = _first_atoms(branch)
+                if branch_first is None:
+                    return None
+                first += branch_first
+            if not any(_nullable(b) for b in node[1]):
+                return first
+        elif kind == REPEAT:
+            body_first = _first_atoms(node[3])
+            if body_first is None:
+                return None
+            first += body_first
+            if node[1] > 0 and not _nullable(node[3]):
+                return first
+    return first
+
+
+def _ambiguous_alternation(items: Sequence) -> bool:
+    """Whether two branches of an alternation can start on the same text."""
+    for node in items:
+        if node[0] != GROUP:
+            continue
+        branches = node[1]
+        if len(branches) > 1:
+            if any(_nullable(branch) for branch in branches):
+                return True
+            firsts = [_first_atoms(branch) for branch in branches]
+            known = [first for first in firsts if first is not None]
+            if len(known) < len(firsts):
+                return True
+            for i, first in enumerate(known):
+                if any(_overlap(first, other) for other in known[i + 1 :]):
+                    return True
+        if any(_ambiguous_alternation(branch) for branch in branches):
+            return True
+    return False
+
+
+def _flatten(items: Sequence) -> Iterator[Node]:
+    """Items with single-branch groups spliced in place."""
+    for node in items:
+        if node[0] == GROUP and len(node[1]) == 1:
+            yield from _flatten(node[1][0])
+        else:
+            yield node
+
+
+def _compounds(node: Node) -> bool:
+    """Whether ``node`` can take a large, variable number of characters."""
+    if node[0] == REPEAT:
+        return node[2] > _COMPOUNDING_MIN or any(_compounds(n) for n in node[3])
+    if node[0] == GROUP:
+        return any(_compounds(n) for branch in node[1] for n in branch)
+    return False
+
+
+def _anchors_start(node: Node, flags: int) -> bool:
+    return node[0] == AT and (
+        node[1] == "\\A" or (node[1] == "^" and not flags & re.MULTILINE)
+    )
+
+
+def _risky_sequence(
+    items: Sequence, flags: int, inside_repeat: bool, can_lead: bool
+) -> bool:
+    """Walk one sequence; alternatives are expanded into the text after them.
+
+    A repeat inside one branch of a group (or inside an optional part) can
+    compound with repeats after the group, so each branch is checked
+    followed by the rest of the sequence — and the check returns there,
+    since those expansions cover the rest.
+    """
+    elements = list(_flatten(items))
+    leading = can_lead
+    for index, node in enumerate(elements):
+        kind = node[0]
+        rest = elements[index + 1 :]
+        if kind == BACKREF:
+            return True
+        if kind == GROUP:
+            return any(
+                _risky_sequence(branch + rest, flags, inside_repeat, leading)
+                for branch in node[1]
+            )
+        if kind == REPEAT and node[2] <= 1:  # ``?`` / ``{0,1}``: with or without
+            return _risky_sequence(
+                node[3] + rest, flags, inside_repeat, leading
+            ) or _risky_sequence(rest, flags, inside_repeat, leading)
+        if kind == REPEAT:
+            if inside_repeat or _ambiguous_alternation(node[3]):
+                return True
+            if _risky_sequence(node[3], flags, True, leading):
+                return True
+            if _compounds(node) and _degree(elements, index) + leading >= _RISKY_DEGREE:
+                return True
+        elif kind == ASSERT:
+            if any(_risky_sequence(b, flags, inside_repeat, True) for b in node[1]):
+                return True
+        if _anchors_start(node, flags) or not _nullable([node]):
+            leading = False
+    return False
+
+
+def _degree(elements: List[Node], index: int) -> int:
+    """Compounding repeats from ``elements[index]`` on, while it could still
+    be consuming what follows it."""
+    atoms = _atoms(elements[index])
+    degree = 1
+    for node in elements[index + 1 :]:
+        if node[0] in (AT, ASSERT):
+            continue
+        if node[0] == BACKREF or not _overlap(atoms, _atoms(node)):
+            break
+        if _compounds(node):
+            degree += 1
+    return degree
+
+
+def backtracking_risk(tree: Sequence, flags: int = 0) -> bool:
+    """Whether a parsed pattern may backtrack super-quadratically.
+
+    ``flags`` are the compiled pattern's flags (only ``re.MULTILINE``
+    matters here: it lets ``^`` match mid-string, so it no longer anchors).
+    """
+    return _risky_sequence(tree, flags, inside_repeat=False, can_lead=True)
@@ -2,13 +2,14 @@
 
 import ipaddress
 import logging
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Literal, Optional
 
 from mcp.types import Icon
 
 from . import __version__
 from .async_operations import AsyncZimOperations
 from .cache import OpenZimMcpCache
+from .call_trace import CallTraceRecorder
 from .config import OpenZimMcpConfig
 from .constants import TOOL_MODE_SIMPLE, VALID_TRANSPORT_TYPES
 from .content_processor import ContentProcessor
@@ -355,6 +356,12 @@ class OpenZimMcpServer:
             subscriptions=self.subscription_bus,
             cache_hints=_cache_hints(config),
             archive_read_ttl_ms=config.resource_cache_ttl_seconds * 1000,
+            call_trace=(
+                CallTraceRecorder(config.call_trace_path)
+                if config.call_trace_path is not None
+                else None
+            ),
+            timings_enabled=config.meta.timings_enabled,
         )
         if self.subscription_bus is None:
             # Withholding the bus is not enough to withhold the capability:
@@ -465,6 +472,8 @@ class OpenZimMcpServer:
     def run(
         self,
         transport: Optional[Literal["stdio", "sse", "streamable-http"]] = None,
+        *,
+        http_runner: Optional[Callable[[Any, str, int], None]] = None,
     ) -> None:
         """
         Run the OpenZIM MCP server.
@@ -479,6 +488,9 @@ class OpenZimMcpServer:
                 raises ``OpenZimMcpConfigurationError`` rather than
                 silently advertising capabilities the running transport
                 cannot honour.
+            http_runner: Replaces the uvicorn runner of the streamable-HTTP
+                transport; takes ``(app, host, port)``. Multi-worker
+                children use it to listen on their Unix socket.
 
         Raises:
             OpenZimMcpConfigurationError: If transport type is invalid or
@@ -514,12 +526,32 @@ class OpenZimMcpServer:
                 f"Must be one of: {', '.join(sorted(VALID_TRANSPORT_TYPES))}"
             )
 
+        multi_worker = self.config.workers > 1
+        if multi_worker and transport != "streamable-http":
+            raise OpenZimMcpConfigurationError(
+                f"workers={self.config.workers} needs the 'http' transport; "
+                f"{self.config.transport!r} serves from one process."
+            )
+
         logger.info(f"Starting OpenZIM MCP server with transport: {transport}")
+        # Opt-in cache warmup (``warmup.enabled``) runs in the background, so
+        # the transport starts serving at once; a no-op when disabled. With
+        # several workers each warms its own cache, not this supervisor's.
+        prewarmer = getattr(self.zim_operations, "prewarmer", None)
+        if prewarmer is not None and not multi_worker:
+            prewarmer.warm_all()
         try:
-            if transport == "streamable-http":
+            if transport == "streamable-http" and multi_worker:
+                from .http_workers import serve_multi_worker
+
+                serve_multi_worker(self.config)
+            elif transport == "streamable-http":
                 from . import http_app
 
-                http_app.serve_streamable_http(self)
+                if http_runner is None:
+                    http_app.serve_streamable_http(self)
+                else:
+                    http_app.serve_streamable_http(self, runner=http_runner)
             else:
                 run_kwargs: dict[str, Any] = {}
                 if transport == "sse":
@@ -550,5 +582,9 @@ class OpenZimMcpServer:
             # abandoned rather than joined, so this never blocks.)
             from .timeout_utils import shutdown_timeout_executors
 
+            if prewarmer is not None:
+                prewarmer.stop()
+            if self.mcp.call_trace is not None:
+                self.mcp.call_trace.close()
             shutdown_timeout_executors()
             logger.info("OpenZIM MCP server stopped")
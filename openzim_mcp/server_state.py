@@ -26,8 +26,9 @@ from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, cast
 from .constants import CACHE_HIGH_HIT_RATE_THRESHOLD, CACHE_LOW_HIT_RATE_THRESHOLD
 from .responses import ToolErrorPayload, tool_error
 from .security import redact_paths_in_message, sanitize_path_for_error
+from .timings import stage_timing_stats
 from .tool_schemas import HealthStatus, ServerConfigurationResponse
-from .zim.archive import has_zim_signature, zim_signature_error
+from .zim.archive import archive_pool_stats, has_zim_signature, zim_signature_error
 
 if TYPE_CHECKING:
     from .server import OpenZimMcpServer
@@ -275,11 +276,34 @@ def _build_health_report(
                 "config_hash": server.config.get_config_hash()[:8] + "...",
             },
             "cache_performance": cache_stats,
+            # Hit/open/evict counters of the process-wide archive handle
+            # pool; a low ``hit_rate`` under steady load means ``max_open``
+            # is smaller than the working set of archives.
+            "archive_pool": archive_pool_stats(),
+            # Per-stage latency over the last spans of each stage (intent
+            # parse, archive open, Xapian, snippet render, bundle build,
+            # rerank, token count); see ``timings.py``. Empty until the
+            # first call.
+            "stage_timings": stage_timing_stats(),
             "health_checks": health_checks,
             "recommendations": recommendations,
             "warnings": warnings,
         }
 
+        # Ranked-hit sessions behind paginated full-text search; a low
+        # ``hit_rate`` with high ``evicted`` means ``search.session_max_ids``
+        # is too small for the paging traffic.
+        sessions = getattr(
+            getattr(server, "zim_operations", None), "search_sessions", None
+        )
+        if sessions is not None:
+            health_info["search_sessions"] = sessions.stats()
+        # Cache prewarming progress: ``state`` is ``running`` while a pass is
+        # under way, ``last_pass`` summarises the most recent archive.
+        prewarmer = getattr(getattr(server, "zim_operations", None), "prewarmer", None)
+        if prewarmer is not None:
+            health_info["prewarm"] = prewarmer.stats()
+
         # Surface simple-mode heuristic-branch counters so the operator
         # can see, in aggregate, which fallback paths are firing.
         simple_handler = getattr(server, "simple_tools_handler", None)
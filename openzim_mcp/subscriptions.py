@@ -149,6 +149,15 @@ class MtimeWatcher:
         dirs: list of allowed directories to watch.
         interval: polling interval in seconds.
         on_change: async callback ``(uri, change_type) -> None``.
+        on_replaced: optional sync callback ``(path) -> None``, called with
+            the filesystem path of each archive replaced in place (the same
+            set that publishes ``CHANGE_REPLACED``). Must not block: it runs
+            on the event loop. The cache prewarmer queues a pass here.
+        on_stale: optional blocking callback ``(paths) -> None``, run once per
+            pass in a worker thread with every archive replaced, reappeared
+            or removed on it, before ``on_replaced`` fires. The archive
+            generation registry re-stats them here, which purges the cache
+            entries of the generation that went away.
     """
 
     def __init__(
@@ -156,11 +165,15 @@ class MtimeWatcher:
         dirs: Iterable[str],
         interval: float,
         on_change: OnChange,
+        on_replaced: Optional[Callable[[str], None]] = None,
+        on_stale: Optional[Callable[[list[str]], None]] = None,
     ) -> None:
-        """Capture the watch list, interval, and dispatch callback."""
+        """Capture the watch list, interval, and dispatch callbacks."""
         self._dirs = [str(d) for d in dirs]
         self._interval = interval
         self._on_change = on_change
+        self._on_replaced = on_replaced
+        self._on_stale = on_stale
         # Snapshot maps path → (mtime, size). Both fields are compared on
         # each tick so that same-size replacements (different mtime) and
         # in-place rewrites (different size) are both detected. See the
@@ -327,9 +340,19 @@ class MtimeWatcher:
         # ``resources/list_changed``, replacement in place is
         # ``resources/updated``. Removals stay listing-only too — an
         # ``updated`` invites a re-read, and there is nothing left to read.
+        # Stale generations are dropped before anyone is told to re-read or
+        # re-warm, so neither can land on an entry of the old file. Removals
+        # count only from a complete scan, as in the bookkeeping below.
+        stale = changed | reappeared
+        if self._last_scan_complete:
+            stale |= removed
+        if stale and self._on_stale is not None:
+            await asyncio.to_thread(self._on_stale, sorted(stale))
         for path in sorted(changed | reappeared):
             for uri in _uri_spellings(path):
                 await self._on_change(uri, CHANGE_REPLACED)
+            if self._on_replaced is not None:
+                self._on_replaced(path)
         # Bookkeeping last, for the same reason ``_snapshot`` is assigned last:
         # a pass that dies mid-publish is retried wholesale on the next
         # interval, so it must not have consumed the state that retry needs.
@@ -13,10 +13,13 @@ Returns SynthesizeResponse (defined in tool_schemas.py).
 
 from __future__ import annotations
 
+import contextvars
+import functools
 import logging
 import re
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, cast
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -29,6 +32,8 @@ if TYPE_CHECKING:
 
 from openzim_mcp import bundle as _bundle_mod
 from openzim_mcp.text_utils import tokenize_for_relevance
+from openzim_mcp.timeout_utils import submit_to_pool
+from openzim_mcp.timings import span
 from openzim_mcp.title_promotion import (
     _TAIL_TOKEN_RE,
     accept_possessive_promotion,
@@ -50,6 +55,62 @@ from openzim_mcp.tool_schemas import (
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+# ---------------------------------------------------------------------------
+# Bounded concurrency for the I/O-bound stages
+# ---------------------------------------------------------------------------
+
+
+def _map_bounded(
+    func: Callable[[_T], _R], items: list[_T], *, max_workers: int
+) -> list[_R]:
+    """Apply ``func`` to every item, at most ``max_workers`` at a time.
+
+    Results come back in input order regardless of completion order, so a
+    concurrent stage hands the next stage exactly what the serial loop did.
+    Work runs on the dedicated ``synthesize`` pool (see ``timeout_utils``),
+    not on ``search_all``'s ``fanout`` pool, whose abandoned legs keep their
+    workers until libzim returns. The per-archive Xapian search and the
+    bundle build both spend most of their time in libzim with the GIL
+    released, so a handful of them overlap well.
+    ``max_workers <= 1`` (or a single item) runs inline on the caller's
+    thread — the pre-concurrency behaviour, with no pool hop.
+
+    ``func`` is expected to handle its own errors; an exception it does
+    raise propagates to the caller once every in-flight call has settled.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    results: list[Any] = [None] * len(items)
+    queue = deque(enumerate(items))
+    pending: dict[Future[_R], int] = {}
+    error: Optional[BaseException] = None
+    while queue or pending:
+        while error is None and queue and len(pending) < max_workers:
+            index, item = queue.popleft()
+            # Carry the request's contextvars (client id, etc.) onto the
+            # worker thread.
+            ctx = contextvars.copy_context()
+            future = submit_to_pool(
+                "synthesize", functools.partial(ctx.run, func, item)
+            )
+            pending[future] = index
+        if not pending:
+            break
+        done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+        for future in done:
+            index = pending.pop(future)
+            try:
+                results[index] = future.result()
+            except BaseException as exc:  # re-raised below, after the drain
+                error = error or exc
+    if error is not None:
+        raise error
+    return cast(list[_R], results)
+
 
 # ---------------------------------------------------------------------------
 # RRF helper — Reciprocal Rank Fusion
@@ -322,6 +383,27 @@ def _locate_passage(md: str, passage_text: str) -> int:
     return len(md)
 
 
+def _locate_in_bundle_text(text: _bundle_mod.BundleText, passage_text: str) -> int:
+    """``_locate_passage`` over a bundle's markdown, one chunk at a time.
+
+    Under the sectioned cache layout the chunks are loaded in document
+    order and the search stops at the first one holding the passage, so a
+    lead-section snippet — the usual synthesize hit — reads one chunk of
+    the article. A passage straddling a chunk boundary is found by the
+    whole-text search the loop falls back to. Under the whole layout there
+    is a single chunk and this is ``_locate_passage`` itself.
+    """
+    chunks = 0
+    for offset, chunk in text.chunks():
+        chunks += 1
+        pos = _locate_passage(chunk, passage_text)
+        if pos >= 0:
+            return offset + pos
+    if chunks > 1:
+        return _locate_passage(text.full(), passage_text)
+    return -1
+
+
 def _attribute_sections(
     passages: list[SynthesizePassage],
     *,
@@ -361,13 +443,13 @@ def _attribute_sections(
             attributed.append(passage)
             continue
 
-        md = bundle.get("rendered_markdown", "")
+        text = _bundle_mod.bundle_text(bundle)
         passage_text = passage["text_markdown"]
-        if not passage_text or not md:
+        if not passage_text or not len(text):
             attributed.append(passage)
             continue
 
-        pos = _locate_passage(md, passage_text)
+        pos = _locate_in_bundle_text(text, passage_text)
         if pos < 0:
             attributed.append(passage)
             continue
@@ -938,9 +1020,14 @@ def _do_per_archive_search(
     search_handler: Any,
     query: str,
     k: int,
+    max_workers: int = 1,
 ) -> tuple[list[list[dict]], list[str], dict[str, tuple[Archive, Path]]]:
     """Stage 1: run per-archive Xapian search for every archive in the list.
 
+    Archives are searched up to ``max_workers`` at a time; hits come back
+    in archive order either way, so fusion sees the same input as a serial
+    run.
+
     When two ZIM paths resolve to the same ``.stem`` (the user has
     ``foo/wikipedia.zim`` and ``bar/wikipedia.zim`` both configured), the
     raw stem can't act as a unique key for downstream bundle lookups —
@@ -951,7 +1038,6 @@ def _do_per_archive_search(
     keeps the suffix unambiguous to humans without hijacking a
     character that might appear in real ZIM filenames.
     """
-    per_archive_hits: list[list[dict]] = []
     archives_searched: list[str] = []
     archive_by_name: dict[str, tuple[Archive, Path]] = {}
     stem_counts: dict[str, int] = {}
@@ -971,11 +1057,14 @@ def _do_per_archive_search(
             )
         archives_searched.append(archive_name)
         archive_by_name[archive_name] = (archive, validated_path)
+
+    def search_one(archive_name: str) -> list[dict]:
+        archive, validated_path = archive_by_name[archive_name]
         # Failure isolation: one bad archive (no fulltext index, corrupt
         # clusters, transient I/O) must not take the whole multi-archive
         # synthesize down — degrade it to zero hits and keep the rest.
         try:
-            hits = _per_archive_search(
+            return _per_archive_search(
                 archive,
                 search_handler=search_handler,
                 query=query,
@@ -990,8 +1079,11 @@ def _do_per_archive_search(
                 validated_path,
                 e,
             )
-            hits = []
-        per_archive_hits.append(hits)
+            return []
+
+    per_archive_hits = _map_bounded(
+        search_one, archives_searched, max_workers=max_workers
+    )
     return per_archive_hits, archives_searched, archive_by_name
 
 
@@ -1714,6 +1806,7 @@ def _make_bundle_lookup(
     *,
     cache: OpenZimMcpCache,
     content_processor: ContentProcessor,
+    max_workers: int = 1,
 ) -> Callable[[str, str], Any]:
     """Build an (archive_name, path)→bundle closure used by attribution and
     citation lookups.
@@ -1723,25 +1816,52 @@ def _make_bundle_lookup(
     share entry paths (``A/Photosynthesis`` exists in every archive), so
     a path-only dict silently collapses entries from different archives
     and attributes citations to the wrong source.
+
+    With ``max_workers > 1`` every top hit's bundle is built up front,
+    concurrently, and the closure serves those results — including a
+    build's exception, re-raised at lookup so the callers' per-entry
+    failure handling is unchanged. Every later stage looks up every top
+    hit anyway, so nothing is built that would not have been.
     """
     archive_for_key: dict[tuple[str, str], tuple[Archive, Path]] = {
         (archive_name, hit["path"]): archive_by_name[archive_name]
         for archive_name, hit in top_hits
     }
 
-    def bundle_lookup(archive_name: str, entry_path: str) -> Any:
-        pair = archive_for_key.get((archive_name, entry_path))
-        if pair is None:
-            return None
-        archive_val, validated_path = pair
-        return _bundle_mod.get_or_build_bundle(
+    def build(key: tuple[str, str]) -> Any:
+        archive_val, validated_path = archive_for_key[key]
+        return _bundle_mod.get_or_build_bundle_view(
             archive_val,
-            entry_path,
+            key[1],
             cache=cache,
             validated_path=validated_path,
             content_processor=content_processor,
         )
 
+    def build_or_error(key: tuple[str, str]) -> Any:
+        try:
+            return build(key)
+        except Exception as exc:
+            return exc
+
+    prebuilt: dict[tuple[str, str], Any] = {}
+    keys = list(archive_for_key)
+    if max_workers > 1 and len(keys) > 1:
+        prebuilt = dict(
+            zip(keys, _map_bounded(build_or_error, keys, max_workers=max_workers))
+        )
+
+    def bundle_lookup(archive_name: str, entry_path: str) -> Any:
+        key = (archive_name, entry_path)
+        if key in prebuilt:
+            result = prebuilt[key]
+            if isinstance(result, Exception):
+                raise result
+            return result
+        if key not in archive_for_key:
+            return None
+        return build(key)
+
     return bundle_lookup
 
 
@@ -1801,7 +1921,9 @@ def _build_section_lookups(
 
 
 def _zero_hits_response(
-    query: str, archives_searched: list[str], fallback_used: str
+    query: str,
+    archives_searched: list[str],
+    fallback_used: str,
 ) -> SynthesizeResponse:
     from openzim_mcp.meta import build_meta as _build_meta
 
@@ -1953,172 +2075,190 @@ def synthesize_query(
     reranker is consulted after passage extraction and before section
     attribution. If the reranker extra is absent or disabled the
     parameter has no effect.
+
+    Each stage is a ``timings.span``, so it shows in ``_meta.timings`` (when
+    ``meta.timings_enabled``) and the per-stage histograms:
+    ``synthesize_search`` (per-archive BM25), ``synthesize_rank`` (fusion,
+    promotion and the relevance filters), ``synthesize_passages``
+    (extraction + rerank), ``synthesize_bundles`` (the concurrent top-hit
+    bundle builds; near zero when ``config.parallelism`` is 1, since bundles
+    then build lazily inside the next stage) and ``synthesize_assemble``
+    (attribution, budget, citations).
     """
-    per_archive_hits, archives_searched, archive_by_name = _do_per_archive_search(
-        archives,
-        search_handler=search_handler,
-        query=query,
-        k=config.per_archive_k,
-    )
-    top_hits, fallback_used = _select_top_hits(
-        per_archive_hits, archives_searched, top_n=config.top_n
-    )
-    # D3 / Op1: when BM25 ranks "List of songs about Berlin" above the
-    # canonical "Berlin" article for query="Berlin", title-index
-    # promotion replaces the top hit with the canonical entry — same
-    # shape as the simple-mode tell_me_about path. Applied AFTER
-    # fusion so multi-archive RRF still drives the lower-ranked
-    # ordering, but BEFORE passage extraction so the promoted entry
-    # flows through the same bundle / attribution stages as a normal hit.
-    top_hits = _promote_title_match(
-        top_hits,
-        query=query,
-        original_query=original_query,
-        archives=archives,
-        archives_searched=archives_searched,
-        search_handler=search_handler,
-    )
-    # O5 (beta): demote list articles after title promotion has run. The
-    # promotion's strong-match guard treats ``Berlin_(disambiguation)``
-    # as a candidate-extends-topic match for ``Berlin``, so demoting
-    # ``List_of_songs_about_Berlin`` to the bottom BEFORE promotion lets
-    # ``Berlin_(disambiguation)`` claim rank 0 and skip the canonical
-    # promotion. Demoting AFTER preserves the promotion's decision and
-    # only reorders the survivors.
-    top_hits = _demote_list_articles(top_hits)
-    # A11 G2 (post-a10): drop hits whose Xapian relevance score is
-    # < 25% of the top hit's score. ``tell me about cats`` was
-    # returning ``Rephlex_Records_discography`` at rank 2 with score
-    # equal to the top hit (1.0 each) because RRF normalizes scores
-    # — but the underlying Xapian relevance was a fraction of the
-    # canonical Cats article. Read the original Xapian score from
-    # the hit dict to apply the threshold before passage extraction
-    # wastes work on weak matches. Conservative: keep all hits when
-    # we can't compare scores (RRF-fused multi-archive sets where the
-    # underlying scores aren't on the same scale).
-    top_hits = _drop_low_relevance_tail(top_hits, fallback_used=fallback_used)
-    # Cross-archive relevance floor: RRF fuses by rank only, so a secondary
-    # archive's top hit can join top_n with no relevance bar (a Blackadder
-    # subtitle leaking into a "french revolution" synthesis). Drop secondary-
-    # archive hits whose entry path shares no query token, and cap per-archive
-    # contributions. The most on-topic archive (highest path overlap) and any
-    # title-promoted canonical are exempt.
-    top_hits = _drop_cross_archive_leakage(
-        top_hits,
-        query=query,
-        fallback_used=fallback_used,
-        max_secondary_archive_hits=config.max_secondary_archive_hits,
-        min_overlap=config.cross_archive_min_overlap,
-    )
-    response_query = original_query if original_query is not None else query
-    if not top_hits:
-        # Even with empty BM25 hits, a canonical title hit might still
-        # exist (rare: the title isn't in the full-text index but is in
-        # the title index). Try one more time before declaring 0-hit.
-        promoted = _promote_title_match(
-            [],
+    with span("synthesize_search"):
+        per_archive_hits, archives_searched, archive_by_name = _do_per_archive_search(
+            archives,
+            search_handler=search_handler,
+            query=query,
+            k=config.per_archive_k,
+            max_workers=config.parallelism,
+        )
+    with span("synthesize_rank"):
+        top_hits, fallback_used = _select_top_hits(
+            per_archive_hits, archives_searched, top_n=config.top_n
+        )
+        # D3 / Op1: when BM25 ranks "List of songs about Berlin" above the
+        # canonical "Berlin" article for query="Berlin", title-index
+        # promotion replaces the top hit with the canonical entry — same
+        # shape as the simple-mode tell_me_about path. Applied AFTER
+        # fusion so multi-archive RRF still drives the lower-ranked
+        # ordering, but BEFORE passage extraction so the promoted entry
+        # flows through the same bundle / attribution stages as a normal hit.
+        top_hits = _promote_title_match(
+            top_hits,
             query=query,
             original_query=original_query,
             archives=archives,
             archives_searched=archives_searched,
             search_handler=search_handler,
         )
-        if not promoted:
-            return _zero_hits_response(response_query, archives_searched, fallback_used)
-        top_hits = _demote_list_articles(promoted)
-
-    all_passages, hit_keys = _extract_passages_for_top_hits(top_hits)
-
-    # Phase D sub-D-1: rerank passage candidates before section attribution.
-    # Synthesize is the primary content-fragment-query surface; reranking
-    # here re-orders passages by semantic relevance before the attribution
-    # and budget-enforcement stages commit to a final ordering.
-    all_passages, hit_keys = _maybe_rerank_synthesize_passages(
-        all_passages,
-        hit_keys,
-        query=query,
-        top_hits=top_hits,
-        reranker_config=reranker_config,
-    )
-
-    bundle_lookup = _make_bundle_lookup(
-        top_hits,
-        archive_by_name,
-        cache=cache,
-        content_processor=content_processor,
-    )
-    attributed = _attribute_sections(
-        all_passages, bundle_lookup=bundle_lookup, hit_keys=hit_keys
-    )
-    # A14 (Change B): section-heading affinity boost. Promotes passages
-    # whose section heading shares tokens with the query past lexically-
-    # weaker BM25 leaders. No-op for article-level citations and for
-    # queries with no token overlap against any heading.
-    attributed = _boost_by_section_affinity(
-        attributed,
-        query=query,
-        bundle_lookup=bundle_lookup,
-        config=config,
-    )
-    if strip_links:
-        # Must run AFTER ``_attribute_sections`` / ``_boost_by_section_affinity``
-        # (they match ``text_markdown`` against the bundle's rendered_markdown,
-        # which still contains ``[text](href)`` — stripping first made
-        # ``_locate_passage`` return -1, so every citation collapsed to entry
-        # level and the affinity boost, whose gate needs a ``#`` in the cite_id,
-        # became a no-op) but BEFORE ``_enforce_budget`` (the cap must be
-        # measured on the text the caller receives, and a mid-string cut must
-        # not land inside a link construct).
-        attributed = [_strip_links_in_passage(p) for p in attributed]
-    pre_cap_chars = sum(len(p["text_markdown"]) for p in attributed)
-    capped = _enforce_budget(attributed, char_budget=config.output_char_budget)
-    truncated = sum(len(p["text_markdown"]) for p in capped) < pre_cap_chars
-    answer_md = _render_answer(capped)
-    archive_titles, section_titles = _build_section_lookups(top_hits, bundle_lookup)
-    citations = _build_citations(
-        capped,
-        archive_titles=archive_titles,
-        section_titles=section_titles,
-        # D8/Op4: in compact mode, fold rank/score into citations so
-        # the dropped passages[] array isn't a data loss.
-        include_rank_score=omit_passage_text,
-    )
-    # Real _meta envelope (not the hardcoded `{}` of earlier versions).
-    # ``rendered`` is the answer body — same convention as simple-mode
-    # responses, so ``_meta.chars``/``tokens_est`` reflect what the
-    # caller actually sees, not the JSON envelope cost.
-    from openzim_mcp.meta import build_meta as _build_meta
+        # O5 (beta): demote list articles after title promotion has run. The
+        # promotion's strong-match guard treats ``Berlin_(disambiguation)``
+        # as a candidate-extends-topic match for ``Berlin``, so demoting
+        # ``List_of_songs_about_Berlin`` to the bottom BEFORE promotion lets
+        # ``Berlin_(disambiguation)`` claim rank 0 and skip the canonical
+        # promotion. Demoting AFTER preserves the promotion's decision and
+        # only reorders the survivors.
+        top_hits = _demote_list_articles(top_hits)
+        # A11 G2 (post-a10): drop hits whose Xapian relevance score is
+        # < 25% of the top hit's score. ``tell me about cats`` was
+        # returning ``Rephlex_Records_discography`` at rank 2 with score
+        # equal to the top hit (1.0 each) because RRF normalizes scores
+        # — but the underlying Xapian relevance was a fraction of the
+        # canonical Cats article. Read the original Xapian score from
+        # the hit dict to apply the threshold before passage extraction
+        # wastes work on weak matches. Conservative: keep all hits when
+        # we can't compare scores (RRF-fused multi-archive sets where the
+        # underlying scores aren't on the same scale).
+        top_hits = _drop_low_relevance_tail(top_hits, fallback_used=fallback_used)
+        # Cross-archive relevance floor: RRF fuses by rank only, so a secondary
+        # archive's top hit can join top_n with no relevance bar (a Blackadder
+        # subtitle leaking into a "french revolution" synthesis). Drop secondary-
+        # archive hits whose entry path shares no query token, and cap per-archive
+        # contributions. The most on-topic archive (highest path overlap) and any
+        # title-promoted canonical are exempt.
+        top_hits = _drop_cross_archive_leakage(
+            top_hits,
+            query=query,
+            fallback_used=fallback_used,
+            max_secondary_archive_hits=config.max_secondary_archive_hits,
+            min_overlap=config.cross_archive_min_overlap,
+        )
+        response_query = original_query if original_query is not None else query
+        if not top_hits:
+            # Even with empty BM25 hits, a canonical title hit might still
+            # exist (rare: the title isn't in the full-text index but is in
+            # the title index). Try one more time before declaring 0-hit.
+            promoted = _promote_title_match(
+                [],
+                query=query,
+                original_query=original_query,
+                archives=archives,
+                archives_searched=archives_searched,
+                search_handler=search_handler,
+            )
+            if not promoted:
+                return _zero_hits_response(
+                    response_query, archives_searched, fallback_used
+                )
+            top_hits = _demote_list_articles(promoted)
+
+    with span("synthesize_passages"):
+        all_passages, hit_keys = _extract_passages_for_top_hits(top_hits)
+
+        # Phase D sub-D-1: rerank passage candidates before section attribution.
+        # Synthesize is the primary content-fragment-query surface; reranking
+        # here re-orders passages by semantic relevance before the attribution
+        # and budget-enforcement stages commit to a final ordering.
+        all_passages, hit_keys = _maybe_rerank_synthesize_passages(
+            all_passages,
+            hit_keys,
+            query=query,
+            top_hits=top_hits,
+            reranker_config=reranker_config,
+        )
 
-    # D7 (v2.0.0a9): synthesize is NOT resumable by content offset —
-    # the next "page" of the synthesized answer would require re-running
-    # the pipeline against a different starting passage, not slicing
-    # an already-rendered string. Pass ``content_chars=None`` so the
-    # meta envelope omits ``more_at_offset`` (the prior shape emitted a
-    # nonsensical value: ``len(answer_md)`` mixed with a ``total_chars``
-    # field that measured passage chars, not answer chars). The caller
-    # still sees ``truncated=True`` + ``total_chars`` as informational
-    # "how much was cut" signals.
-    meta = _build_meta(
-        rendered=answer_md,
-        truncated=truncated,
-        content_chars=None,
-        total_chars=pre_cap_chars if truncated else None,
-    )
-    # D8 / Op4 (v2.0.0a9): compact mode drops the passages array
-    # entirely. The passages were already structurally redundant
-    # after the earlier text-dedup pass (only cite_id/rank/score
-    # remained, and cite_id duplicates citations[].cite_id). To preserve
-    # the positional rank/score signal, fold those into the citation
-    # rows directly. Verbose mode (omit_passage_text=False) keeps the
-    # legacy passages array intact for callers doing downstream
-    # processing.
-    response_passages: list[SynthesizePassage] = capped
-    if omit_passage_text:
-        response_passages = []
-    considered_articles = _build_considered_articles(
-        top_hits, capped, archive_titles=archive_titles
-    )
-    considered_sections = _build_considered_sections(capped, bundle_lookup)
+    with span("synthesize_bundles"):
+        bundle_lookup = _make_bundle_lookup(
+            top_hits,
+            archive_by_name,
+            cache=cache,
+            content_processor=content_processor,
+            max_workers=config.parallelism,
+        )
+    with span("synthesize_assemble"):
+        attributed = _attribute_sections(
+            all_passages, bundle_lookup=bundle_lookup, hit_keys=hit_keys
+        )
+        # A14 (Change B): section-heading affinity boost. Promotes passages
+        # whose section heading shares tokens with the query past lexically-
+        # weaker BM25 leaders. No-op for article-level citations and for
+        # queries with no token overlap against any heading.
+        attributed = _boost_by_section_affinity(
+            attributed,
+            query=query,
+            bundle_lookup=bundle_lookup,
+            config=config,
+        )
+        if strip_links:
+            # Must run AFTER ``_attribute_sections`` / ``_boost_by_section_affinity``
+            # (they match ``text_markdown`` against the bundle's rendered_markdown,
+            # which still contains ``[text](href)`` — stripping first made
+            # ``_locate_passage`` return -1, so every citation collapsed to entry
+            # level and the affinity boost, whose gate needs a ``#`` in the cite_id,
+            # became a no-op) but BEFORE ``_enforce_budget`` (the cap must be
+            # measured on the text the caller receives, and a mid-string cut must
+            # not land inside a link construct).
+            attributed = [_strip_links_in_passage(p) for p in attributed]
+        pre_cap_chars = sum(len(p["text_markdown"]) for p in attributed)
+        capped = _enforce_budget(attributed, char_budget=config.output_char_budget)
+        truncated = sum(len(p["text_markdown"]) for p in capped) < pre_cap_chars
+        answer_md = _render_answer(capped)
+        archive_titles, section_titles = _build_section_lookups(top_hits, bundle_lookup)
+        citations = _build_citations(
+            capped,
+            archive_titles=archive_titles,
+            section_titles=section_titles,
+            # D8/Op4: in compact mode, fold rank/score into citations so
+            # the dropped passages[] array isn't a data loss.
+            include_rank_score=omit_passage_text,
+        )
+        # Real _meta envelope (not the hardcoded `{}` of earlier versions).
+        # ``rendered`` is the answer body — same convention as simple-mode
+        # responses, so ``_meta.chars``/``tokens_est`` reflect what the
+        # caller actually sees, not the JSON envelope cost.
+        from openzim_mcp.meta import build_meta as _build_meta
+
+        # D7 (v2.0.0a9): synthesize is NOT resumable by content offset —
+        # the next "page" of the synthesized answer would require re-running
+        # the pipeline against a different starting passage, not slicing
+        # an already-rendered string. Pass ``content_chars=None`` so the
+        # meta envelope omits ``more_at_offset`` (the prior shape emitted a
+        # nonsensical value: ``len(answer_md)`` mixed with a ``total_chars``
+        # field that measured passage chars, not answer chars). The caller
+        # still sees ``truncated=True`` + ``total_chars`` as informational
+        # "how much was cut" signals.
+        meta = _build_meta(
+            rendered=answer_md,
+            truncated=truncated,
+            content_chars=None,
+            total_chars=pre_cap_chars if truncated else None,
+        )
+        # D8 / Op4 (v2.0.0a9): compact mode drops the passages array
+        # entirely. The passages were already structurally redundant
+        # after the earlier text-dedup pass (only cite_id/rank/score
+        # remained, and cite_id duplicates citations[].cite_id). To preserve
+        # the positional rank/score signal, fold those into the citation
+        # rows directly. Verbose mode (omit_passage_text=False) keeps the
+        # legacy passages array intact for callers doing downstream
+        # processing.
+        response_passages: list[SynthesizePassage] = capped
+        if omit_passage_text:
+            response_passages = []
+        considered_articles = _build_considered_articles(
+            top_hits, capped, archive_titles=archive_titles
+        )
+        considered_sections = _build_considered_sections(capped, bundle_lookup)
     return cast(
         "SynthesizeResponse",
         {
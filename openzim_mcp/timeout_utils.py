@@ -16,12 +16,25 @@ regex ever running — degrading intent classification for requests against
 perfectly healthy archives.
 
 * ``"readyz"`` — the single-flight ``/readyz`` allowed-directory stat probe.
+* ``"fanout"`` — per-archive legs of a cross-archive fan-out (``search_all``).
+  Kept apart from ``"io"`` because each leg itself opens its archive through
+  ``run_with_timeout(pool="io")``: legs sharing the io pool could fill every
+  slot and then wait forever on the opens queued behind them.
+* ``"synthesize"`` — synthesize's concurrent search / bundle-build stages.
+  Kept apart from ``"fanout"`` because ``search_all`` abandons legs that
+  overrun and those keep their worker until libzim returns; synthesize waits
+  for all of its own work, so sharing that pool could block it forever
+  behind another call's stragglers.
 
 Worker threads are daemon threads (M21) so a worker stuck inside an
 uninterruptible libzim call can never block interpreter exit. Timed-out
 futures are cancelled (M22) so still-queued work is discarded rather than run
 to completion after the caller has already given up.
 
+Work is submitted under a copy of the caller's ``contextvars`` context, the
+way ``asyncio.to_thread`` runs it, so request-scoped state — the per-call
+stage timings and cache tally, the client id — follows a call into the pool.
+
 **The timeout bounds how long the CALLER waits, not how long the work runs.**
 CPython exposes no way to cancel a running thread, and a pure-``re`` call
 holds the GIL for the entire match, so a timed-out regex keeps running to
@@ -33,6 +46,7 @@ front doors) and the linear-pattern requirement documented on
 """
 
 import contextlib
+import contextvars
 import logging
 import os
 import threading
@@ -143,10 +157,17 @@ _REGEX_MAX_WORKERS = _env_int("OPENZIM_MCP_REGEX_MAX_WORKERS", 8)
 # permanently burned one worker of the same pool that serves every MCP tool
 # call — N unauthenticated ``/readyz`` hits wedged the entire server.
 _READYZ_MAX_WORKERS = 1
+# Fan-out legs release the GIL inside Xapian, so a handful of concurrent
+# searches overlap well; the per-call width is capped separately by
+# ``search.search_all_max_concurrency``.
+_FANOUT_MAX_WORKERS = _env_int("OPENZIM_MCP_FANOUT_MAX_WORKERS", 8)
+_SYNTHESIZE_MAX_WORKERS = _env_int("OPENZIM_MCP_SYNTHESIZE_MAX_WORKERS", 8)
 _POOL_SIZES: Dict[str, int] = {
     "io": _IO_MAX_WORKERS,
     "regex": _REGEX_MAX_WORKERS,
     "readyz": _READYZ_MAX_WORKERS,
+    "fanout": _FANOUT_MAX_WORKERS,
+    "synthesize": _SYNTHESIZE_MAX_WORKERS,
 }
 
 _EXECUTORS: Dict[str, ThreadPoolExecutor] = {}
@@ -167,7 +188,7 @@ def _make_executor(max_workers: int, name: str) -> ThreadPoolExecutor:
 
 
 def _get_executor(pool: str) -> ThreadPoolExecutor:
-    """Return the executor for ``pool`` ("io" / "regex" / "readyz"), lazily.
+    """Return the executor for ``pool`` (a key of ``_POOL_SIZES``).
 
     Lazy so ``import openzim_mcp.timeout_utils`` doesn't start threads in
     environments that never call ``run_with_timeout``.
@@ -219,7 +240,7 @@ def run_with_timeout(
         OpenZimMcpTimeoutError: (or subclass) If the operation exceeds the time limit
     """
     executor = _get_executor(pool)
-    future: Future[T] = executor.submit(func)
+    future: Future[T] = executor.submit(contextvars.copy_context().run, func)
     try:
         return future.result(timeout=timeout_seconds)
     except TimeoutError as e:
@@ -238,6 +259,35 @@ def run_with_timeout(
         raise timeout_exception(timeout_message) from e
 
 
+def submit_to_pool(pool: str, func: Callable[[], T]) -> "Future[T]":
+    """Submit ``func`` to the named pool and return its future.
+
+    For callers that manage their own deadlines over several futures (the
+    ``search_all`` fan-out) rather than one blocking ``run_with_timeout``
+    wait. The same caveat applies: cancelling the returned future only
+    discards it while still queued; a running worker finishes on its own.
+    """
+    return _get_executor(pool).submit(contextvars.copy_context().run, func)
+
+
+def executor_stats() -> Dict[str, Dict[str, int]]:
+    """Workers and queued work per started pool, for ``/metrics``.
+
+    Read without ``_EXECUTOR_LOCK`` (which only guards pool creation) and
+    through the executors' internals: ``ThreadPoolExecutor`` has no public
+    view of its backlog, and a growing ``queue_depth`` is exactly the
+    saturation signal the pools exist to contain.
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    for pool, executor in list(_EXECUTORS.items()):
+        stats[pool] = {
+            "max_workers": executor._max_workers,
+            "workers": len(executor._threads),
+            "queue_depth": executor._work_queue.qsize(),
+        }
+    return stats
+
+
 def shutdown_timeout_executors() -> None:
     """Best-effort shutdown of the timeout pools (M21).
 
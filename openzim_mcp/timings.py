@@ -0,0 +1,309 @@
+"""Per-stage latency spans for tool calls.
+
+A slow ``zim_query`` used to be one opaque number: the four seconds could
+have gone to intent parsing, an archive open, Xapian, snippet rendering, a
+bundle build, the reranker or the tokenizer behind ``_meta.tokens_est``,
+and nothing recorded which. The boundaries of those stages are wrapped in
+:func:`span` (or decorated with :func:`timed`), and every finished span
+feeds two sinks:
+
+* a process-wide :class:`StageTimings` registry, always on, holding per-stage
+  Prometheus-style cumulative histograms plus a rolling window of recent
+  durations. ``zim_health`` reports the window's percentiles under
+  ``stage_timings``; the HTTP transport serves the histograms as Prometheus
+  text on ``/metrics``.
+* the current call's :class:`CallTimings`, when one is being collected. With
+  ``meta.timings_enabled`` the tool dispatcher collects one per call and
+  ships it as ``_meta.timings``.
+
+The per-call collector rides a ``ContextVar`` the same way
+``request_context`` carries the client id: it follows ``await`` and the
+worker threads ``asyncio.to_thread`` and ``run_with_timeout`` start (both
+copy the context), so a stage run in a worker still lands on the call that
+asked for it. Stages can nest — ``archive_open`` runs inside a search, a
+bundle build inside a snippet — and each reports its own inclusive time,
+so the stage figures of one call do not sum to its total.
+
+A span costs two ``perf_counter`` reads, a ``ContextVar`` lookup and one
+short critical section; cheap enough to leave on the per-result paths.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+__all__ = [
+    "BUCKET_BOUNDS",
+    "CallTimings",
+    "Histogram",
+    "STAGE_TIMINGS",
+    "StageTimings",
+    "collect_timings",
+    "histogram_lines",
+    "render_prometheus",
+    "span",
+    "stage_timing_stats",
+    "timed",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Histogram bucket upper bounds, in seconds. Log-spaced from half a
+# millisecond (a warm title lookup) to ten seconds (a cold multi-GB open on a
+# network mount); everything slower lands in ``+Inf``.
+BUCKET_BOUNDS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Durations kept per stage for the rolling percentiles in ``zim_health``.
+# Recent enough to show a regression within minutes at moderate traffic;
+# small enough that a snapshot sorts it in well under a millisecond.
+WINDOW_SIZE = 1024
+
+
+class Histogram:
+    """Cumulative-ready latency histogram over ``BUCKET_BOUNDS``.
+
+    Not synchronised: the owner either guards it with its own lock or only
+    ever touches it from one thread.
+    """
+
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self) -> None:
+        """Start with every bucket empty."""
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count one duration in the first bucket whose bound it fits under."""
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+
+class _Stage(Histogram):
+    """A stage's histogram plus its window of recent durations."""
+
+    __slots__ = ("window",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.window: Deque[float] = deque(maxlen=WINDOW_SIZE)
+
+    def observe(self, seconds: float) -> None:
+        super().observe(seconds)
+        self.window.append(seconds)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class StageTimings:
+    """Thread-safe per-stage histograms for the whole process."""
+
+    def __init__(self) -> None:
+        """Start with no stages recorded."""
+        self._stages: Dict[str, _Stage] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record one finished span of ``stage``."""
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                entry = self._stages[stage] = _Stage()
+            entry.observe(seconds)
+
+    def snapshot(self, *, windows: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Cumulative counts and buckets per stage, copied under the lock.
+
+        ``windows=False`` skips copying the recent-durations windows, which
+        is all a Prometheus scrape needs and keeps its hold on the lock short.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "count": stage.count,
+                    "sum": stage.total,
+                    "buckets": list(stage.buckets),
+                    "window": list(stage.window) if windows else [],
+                }
+                for name, stage in sorted(self._stages.items())
+            }
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage totals and rolling-window percentiles, in milliseconds."""
+        report: Dict[str, Dict[str, Any]] = {}
+        for name, stage in self.snapshot().items():
+            window = sorted(stage["window"])
+            row: Dict[str, Any] = {
+                "count": stage["count"],
+                "mean_ms": round(stage["sum"] / stage["count"] * 1000.0, 3),
+                "window": len(window),
+            }
+            if window:
+                row.update(
+                    {
+                        "p50_ms": round(_percentile(window, 50) * 1000.0, 3),
+                        "p95_ms": round(_percentile(window, 95) * 1000.0, 3),
+                        "p99_ms": round(_percentile(window, 99) * 1000.0, 3),
+                        "max_ms": round(window[-1] * 1000.0, 3),
+                    }
+                )
+            report[name] = row
+        return report
+
+    def reset(self) -> None:
+        """Forget every stage (tests)."""
+        with self._lock:
+            self._stages.clear()
+
+
+STAGE_TIMINGS = StageTimings()
+
+
+def stage_timing_stats() -> Dict[str, Dict[str, Any]]:
+    """Rolling per-stage latency percentiles, for ``zim_health``."""
+    return STAGE_TIMINGS.stats()
+
+
+class CallTimings:
+    """Stage durations accumulated over one tool call.
+
+    Shared by reference with every worker thread the call's context was
+    copied into, hence the lock: a ``search_all`` fan-out adds spans from
+    several threads at once.
+    """
+
+    __slots__ = ("_lock", "_started", "stages")
+
+    def __init__(self) -> None:
+        """Start the call's clock."""
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add one span's duration to ``stage``'s running total."""
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def as_meta(self) -> Dict[str, Any]:
+        """The breakdown as shipped in ``_meta.timings``, in milliseconds."""
+        with self._lock:
+            stages = {k: round(v * 1000.0, 3) for k, v in sorted(self.stages.items())}
+        return {
+            "total_ms": round((time.perf_counter() - self._started) * 1000.0, 3),
+            "stages": stages,
+        }
+
+
+_call_var: contextvars.ContextVar[Optional[CallTimings]] = contextvars.ContextVar(
+    "openzim_mcp_call_timings", default=None
+)
+
+
+@contextmanager
+def collect_timings() -> Iterator[CallTimings]:
+    """Collect the spans finished inside the ``with`` block into one call."""
+    timings = CallTimings()
+    token = _call_var.set(timings)
+    try:
+        yield timings
+    finally:
+        _call_var.reset(token)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time the ``with`` block as one span of ``stage``.
+
+    Recorded whether the block returns or raises: a Xapian query that
+    times out spent its time all the same.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_TIMINGS.observe(stage, elapsed)
+        call = _call_var.get()
+        if call is not None:
+            call.add(stage, elapsed)
+
+
+def timed(stage: str) -> Callable[[F], F]:
+    """Decorate a function so each call is one span of ``stage``."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def histogram_lines(
+    name: str, labels: str, buckets: List[int], count: int, total: float
+) -> List[str]:
+    """Prometheus text lines for one labelled histogram series.
+
+    ``buckets`` are per-bucket counts as :class:`Histogram` keeps them; the
+    exposition format wants them cumulative. ``labels`` is the rendered
+    label list without braces, e.g. ``stage="xapian"``.
+    """
+    prefix = f"{labels}," if labels else ""
+    lines = []
+    cumulative = 0
+    for bound, bucket_count in zip(BUCKET_BOUNDS, buckets):
+        cumulative += bucket_count
+        lines.append(f'{name}_bucket{{{prefix}le="{bound!r}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {count}')
+    lines.append(f"{name}_sum{{{labels}}} {total!r}")
+    lines.append(f"{name}_count{{{labels}}} {count}")
+    return lines
+
+
+def render_prometheus(registry: Optional[StageTimings] = None) -> str:
+    """Render the stage histograms in the Prometheus text exposition format."""
+    registry = registry or STAGE_TIMINGS
+    name = "openzim_mcp_stage_duration_seconds"
+    lines = [
+        f"# HELP {name} Time spent in each stage of tool-call handling.",
+        f"# TYPE {name} histogram",
+    ]
+    for stage, data in registry.snapshot(windows=False).items():
+        lines.extend(
+            histogram_lines(
+                name, f'stage="{stage}"', data["buckets"], data["count"], data["sum"]
+            )
+        )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1 @@
+"""Offline title-index sidecar: builder, reader, and on-disk layout."""
@@ -0,0 +1,213 @@
+"""Build a title-index sidecar from a stream of title records.
+
+``build_from_title_stream`` is the pure, ZIM-free core (testable with
+synthetic streams). ``iter_title_records`` and ``build_title_index`` supply
+the real stream from an archive and orchestrate the two.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from openzim_mcp import __version__
+
+from .schema import FIELD_SEPARATOR, HEADER, MAGIC, OFFSET, SCHEMA_VERSION, fold_title
+
+logger = logging.getLogger(__name__)
+
+# One title record: (title, canonical_title, canonical_path, source_path).
+# ``title`` is the text the key is folded from; ``source_path`` is the entry
+# that carries it (a redirect, or the canonical entry itself).
+TitleRecord = Tuple[str, str, str, str]
+
+
+@dataclass
+class BuildStats:
+    """Summary of a completed build."""
+
+    record_count: int
+    bytes_written: int
+
+
+def _clean(field: str) -> str:
+    """Drop NULs so a field can never split a record."""
+    return field.replace("\x00", "")
+
+
+def build_from_title_stream(
+    out_path: str,
+    *,
+    archive_uuid: str,
+    records: Iterable[TitleRecord],
+    force: bool = False,
+    now_iso: Optional[str] = None,
+    builder_version: Optional[str] = None,
+) -> BuildStats:
+    """Fold, sort and write ``records`` to the sidecar at ``out_path``.
+
+    Several entries can fold to one key (``Paris``, ``PARIS`` and a
+    ``Paris_`` redirect). Distinct canonical paths under one key are all
+    kept — the reader ranks them at lookup time — but a canonical path
+    reached through several spellings of the same key is stored once,
+    preferring the spelling that is not a redirect. The write is atomic
+    (temp file + ``os.replace``).
+    """
+    if Path(out_path).exists() and not force:
+        raise FileExistsError(
+            f"{out_path} already exists; pass force=True to overwrite."
+        )
+    tmp_path = out_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    by_key: Dict[Tuple[bytes, str], Tuple[str, str, str]] = {}
+    for title, canonical_title, canonical_path, source_path in records:
+        key = fold_title(_clean(title))
+        if not key or not canonical_path:
+            continue
+        slot = (key.encode("utf-8"), canonical_path)
+        held = by_key.get(slot)
+        held_is_redirect = held is not None and held[2] != held[1]
+        if held is None or (held_is_redirect and source_path == canonical_path):
+            by_key[slot] = (
+                _clean(canonical_title),
+                _clean(canonical_path),
+                _clean(source_path),
+            )
+
+    offsets: List[int] = [0]
+    chunks: List[bytes] = []
+    position = 0
+    for (key_bytes, _path), (canonical_title, canonical_path, source_path) in sorted(
+        by_key.items()
+    ):
+        chunk = FIELD_SEPARATOR.join(
+            (
+                key_bytes,
+                canonical_title.encode("utf-8"),
+                canonical_path.encode("utf-8"),
+                source_path.encode("utf-8"),
+            )
+        )
+        chunks.append(chunk)
+        position += len(chunk)
+        offsets.append(position)
+
+    record_count = len(chunks)
+    meta = json.dumps(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "archive_uuid": archive_uuid,
+            "built_at": now_iso or datetime.now(timezone.utc).isoformat(),
+            "record_count": record_count,
+            "builder_version": builder_version or __version__,
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+    # Zero-pad so the offsets array starts 8-byte aligned.
+    meta += b"\0" * (-(HEADER.size + len(meta)) % 8)
+
+    try:
+        with open(tmp_path, "wb") as fh:
+            fh.write(
+                HEADER.pack(MAGIC, SCHEMA_VERSION, len(meta), record_count, position)
+            )
+            fh.write(meta)
+            fh.write(b"".join(OFFSET.pack(o) for o in offsets))
+            for chunk in chunks:
+                fh.write(chunk)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return BuildStats(
+        record_count=record_count, bytes_written=Path(out_path).stat().st_size
+    )
+
+
+def iter_title_records(archive: Any) -> Iterator[TitleRecord]:
+    """Yield one ``TitleRecord`` per titled content entry, redirects resolved.
+
+    Walks the open archive once via ``_get_entry_by_id`` over
+    ``entry_count`` and keeps the same content sources as the link-graph
+    builder (``_is_content_source``). A redirect contributes its own title
+    under its target's canonical title + path, so a lookup by any spelling
+    the archive knows lands on the article that serves it. Redirects that
+    end in a cycle or another redirect are skipped, as are entries that
+    fail to read — one bad entry never aborts the build.
+    """
+    # Imported here (not at module scope) so the pure builder core keeps no
+    # dependency on the ZIM layer.
+    from openzim_mcp.linkgraph.builder import _is_content_source
+    from openzim_mcp.zim.redirects import best_effort_redirect_chain
+
+    has_new_scheme = bool(getattr(archive, "has_new_namespace_scheme", False))
+    total = int(getattr(archive, "entry_count", 0) or 0)
+    for entry_id in range(total):
+        try:
+            entry = archive._get_entry_by_id(entry_id)
+            path = entry.path
+            title = entry.title or path
+        except Exception:  # nosec B112 - skip unreadable entry, keep walking
+            continue
+        if not _is_content_source(path, has_new_scheme=has_new_scheme):
+            continue
+        canonical = entry
+        if getattr(entry, "is_redirect", False):
+            canonical = best_effort_redirect_chain(entry)
+            if getattr(canonical, "is_redirect", False):
+                continue
+        try:
+            canonical_path = canonical.path
+            canonical_title = canonical.title or canonical_path
+        except Exception:  # nosec B112 - skip entry whose target won't read
+            continue
+        yield (title, canonical_title, canonical_path, path)
+
+
+def build_title_index(
+    archive_path: str,
+    out_path: Optional[str] = None,
+    *,
+    force: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> BuildStats:
+    """Open ``archive_path`` once, walk its titles, and write the sidecar.
+
+    Records are held in memory until the sort (the layout is a single sorted
+    array), so peak RSS scales with the title count — roughly 100 bytes per
+    title, a couple of GB for a full Wikipedia build. ``progress`` (if given)
+    is invoked as ``progress(processed, total)`` every 10,000 records.
+    """
+    from openzim_mcp.titleindex.reader import sidecar_path_for
+    from openzim_mcp.zim_operations import zim_archive
+
+    out = out_path or sidecar_path_for(archive_path)
+    with zim_archive(Path(archive_path)) as archive:
+        archive_uuid = str(archive.uuid)
+        total = int(getattr(archive, "entry_count", 0) or 0)
+
+        def _stream() -> Iterator[TitleRecord]:
+            for i, record in enumerate(iter_title_records(archive)):
+                if progress and i and i % 10_000 == 0:
+                    progress(i, total)
+                yield record
+
+        stats = build_from_title_stream(
+            out, archive_uuid=archive_uuid, records=_stream(), force=force
+        )
+        if total and not stats.record_count:
+            logger.warning(
+                "title-index build for %s produced 0 records despite %d archive "
+                "entries; title lookups will fall back to libzim probes",
+                archive_path,
+                total,
+            )
+        return stats
@@ -0,0 +1,201 @@
+"""Read-only access to a `<archive>.zim.titleindex` sidecar.
+
+``open_for`` returns ``None`` for an absent file OR a fingerprint mismatch
+(schema version / archive UUID), exactly like ``LinkGraphReader.open_for``:
+the caller treats both as "no index" and keeps its libzim probes. The file
+is ``mmap``-ed, so ``lookup`` and ``prefix`` are an in-memory binary search
+over the sorted keys with no per-query I/O beyond the pages they touch.
+
+``open_cached`` keeps one open reader per sidecar for the hot title-lookup
+path, revalidated by a single ``stat`` per call.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from .schema import FIELD_SEPARATOR, HEADER, MAGIC, OFFSET, SCHEMA_VERSION, fold_title
+
+
+def sidecar_path_for(archive_path: str | Path) -> str:
+    """Return the sibling sidecar path: ``<archive>.zim.titleindex``."""
+    return f"{archive_path}.titleindex"
+
+
+@dataclass(frozen=True)
+class TitleMatch:
+    """One indexed title: the canonical article plus the entry it came from.
+
+    ``source_path`` equals ``path`` unless the matched title belongs to a
+    redirect, in which case it is the redirect's own path.
+    """
+
+    title: str
+    path: str
+    source_path: str
+
+    @property
+    def is_redirect(self) -> bool:
+        """Whether the matched title was a redirect to ``path``."""
+        return self.source_path != self.path
+
+
+class _Keys:
+    """Sequence view of the sorted keys, for ``bisect`` over the mmap."""
+
+    def __init__(self, reader: "TitleIndexReader") -> None:
+        self._reader = reader
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def __getitem__(self, index: int) -> bytes:
+        start, end = self._reader._span(index)
+        cut = self._reader._mm.find(FIELD_SEPARATOR, start, end)
+        return self._reader._mm[start : end if cut < 0 else cut]
+
+
+class TitleIndexReader:
+    """Binary-search a title-index sidecar. Construct via ``open_for``."""
+
+    def __init__(self, mm: mmap.mmap, meta: dict, count: int, offsets_at: int):
+        """Wrap an mmap whose header and fingerprint were already checked."""
+        self._mm = mm
+        self.meta = meta
+        self._count = count
+        self._offsets_at = offsets_at
+        self._blob_at = offsets_at + (count + 1) * OFFSET.size
+        self._keys = _Keys(self)
+
+    @classmethod
+    def open_for(
+        cls, archive_path: str, *, live_archive_uuid: str
+    ) -> Optional["TitleIndexReader"]:
+        """Open the sidecar for ``archive_path`` if present and fingerprint-valid."""
+        path = sidecar_path_for(archive_path)
+        try:
+            with open(path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Absent, unreadable, or empty (mmap refuses a zero-length file).
+            return None
+        try:
+            magic, version, meta_len, count, blob_len = HEADER.unpack_from(mm, 0)
+            offsets_at = HEADER.size + meta_len
+            expected = offsets_at + (count + 1) * OFFSET.size + blob_len
+            if magic != MAGIC or version != SCHEMA_VERSION or len(mm) != expected:
+                raise ValueError("title index header mismatch")
+            meta = json.loads(mm[HEADER.size : offsets_at].rstrip(b"\0"))
+        except Exception:  # noqa: BLE001 — truncated header, bad meta JSON, ...
+            mm.close()
+            return None
+        if meta.get("archive_uuid") != live_archive_uuid:
+            mm.close()
+            return None
+        return cls(mm, meta, count, offsets_at)
+
+    def __len__(self) -> int:
+        """Number of indexed titles."""
+        return self._count
+
+    def _span(self, index: int) -> Tuple[int, int]:
+        at = self._offsets_at + index * OFFSET.size
+        (start,) = OFFSET.unpack_from(self._mm, at)
+        (end,) = OFFSET.unpack_from(self._mm, at + OFFSET.size)
+        return self._blob_at + start, self._blob_at + end
+
+    def _match(self, index: int) -> TitleMatch:
+        start, end = self._span(index)
+        _key, title, path, source = self._mm[start:end].split(FIELD_SEPARATOR)
+        return TitleMatch(
+            title=title.decode("utf-8"),
+            path=path.decode("utf-8"),
+            source_path=source.decode("utf-8"),
+        )
+
+    def lookup(self, title: str) -> List[TitleMatch]:
+        """Every indexed title that folds to the same key as ``title``."""
+        key = fold_title(title).encode("utf-8")
+        if not key:
+            return []
+        lo = bisect.bisect_left(self._keys, key)
+        hi = bisect.bisect_right(self._keys, key, lo)
+        return [self._match(i) for i in range(lo, hi)]
+
+    def prefix(self, prefix: str, *, limit: int) -> List[Tuple[str, TitleMatch]]:
+        """Up to ``limit`` ``(key, match)`` pairs whose key starts with ``prefix``.
+
+        Pairs come in key order, so a whole-word continuation (``"kant, "``,
+        ``"kant ("``) sorts ahead of a longer word (``"kantian"``).
+        """
+        key = fold_title(prefix).encode("utf-8")
+        if not key or limit < 1:
+            return []
+        out: List[Tuple[str, TitleMatch]] = []
+        index = bisect.bisect_left(self._keys, key)
+        while index < self._count and len(out) < limit:
+            found = self._keys[index]
+            if not found.startswith(key):
+                break
+            out.append((found.decode("utf-8"), self._match(index)))
+            index += 1
+        return out
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mm.close()
+
+
+# Open readers kept for the request path, keyed by sidecar path. Each entry
+# remembers the (mtime, size, inode) it was opened against and the archive
+# UUID it was fingerprinted for, so a rebuilt sidecar or a replaced archive
+# is reopened rather than served stale. Bounded because every archive in the
+# allowed directories can carry one.
+_CACHE_MAX = 32
+_cache: (
+    "OrderedDict[str, Tuple[Tuple[int, int, int], str, Optional[TitleIndexReader]]]"
+) = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def open_cached(
+    archive_path: Any, *, live_archive_uuid: str
+) -> Optional[TitleIndexReader]:
+    """Return a shared reader for ``archive_path``'s sidecar, or ``None``.
+
+    Costs one ``stat`` when the sidecar is absent (the common case) or
+    unchanged. A negative result for a present-but-stale sidecar is cached
+    too, so a stale file is not re-read on every lookup. Superseded readers
+    are dropped, not closed: another thread may still be mid-search on
+    one, and the mmap is released when the last reference goes.
+    """
+    path = sidecar_path_for(archive_path)
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        with _cache_lock:
+            _cache.pop(path, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _cache_lock:
+        held = _cache.get(path)
+        if held is not None and held[0] == stamp and held[1] == live_archive_uuid:
+            _cache.move_to_end(path)
+            return held[2]
+    reader = TitleIndexReader.open_for(
+        str(archive_path), live_archive_uuid=live_archive_uuid
+    )
+    with _cache_lock:
+        _cache[path] = (stamp, live_archive_uuid, reader)
+        _cache.move_to_end(path)
+        while len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return reader
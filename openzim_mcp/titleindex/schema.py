@@ -0,0 +1,51 @@
+"""On-disk layout and title folding for the title-index sidecar.
+
+The sidecar is one flat, little-endian file built to be ``mmap``-ed and
+binary-searched in place, so opening it costs a header read rather than a
+load:
+
+* ``HEADER`` — magic, schema version, the byte length of the JSON ``meta``
+  block, the record count, and the byte length of the record blob.
+* ``meta`` — JSON object with the archive UUID + schema version the reader
+  fingerprints against (strict staleness check, as for the link-graph
+  sidecar), plus build provenance. Zero-padded to an 8-byte boundary.
+* ``offsets`` — ``record_count + 1`` unsigned 64-bit offsets into the blob;
+  record ``i`` spans ``offsets[i]:offsets[i + 1]``.
+* ``blob`` — the records, sorted by folded key (byte order of the UTF-8
+  encoding, which is code-point order). Each record is four NUL-separated
+  UTF-8 fields: folded key, canonical title, canonical path, and the path of
+  the entry whose title produced the key (equal to the canonical path unless
+  that entry is a redirect).
+"""
+
+from __future__ import annotations
+
+import struct
+import unicodedata
+
+# Bump on any incompatible layout OR folding change: the reader rejects a
+# mismatch and forces an operator rebuild. A folding change counts because
+# keys written by an older ``fold_title`` would silently stop matching the
+# keys the running server computes for a query.
+SCHEMA_VERSION = 1
+
+MAGIC = b"OZMTITLE"
+
+# magic, schema_version, meta_len, record_count, blob_len
+HEADER = struct.Struct("<8sIIQQ")
+OFFSET = struct.Struct("<Q")
+
+FIELD_SEPARATOR = b"\x00"
+
+
+def fold_title(text: str) -> str:
+    """Return the lookup key for a title or a query.
+
+    Case-folded, accent-folded (NFKD with combining marks dropped, so
+    ``Zürich`` and ``Zurich`` share a key), ``_`` read as a space, and runs
+    of whitespace collapsed. The builder and every lookup go through this one
+    function; changing it requires a ``SCHEMA_VERSION`` bump.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.replace("_", " ").casefold().split())
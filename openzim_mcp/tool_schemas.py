@@ -46,6 +46,10 @@ class PageInfo(TypedDict):
 
 class MetaEnvelope(TypedDict, total=False):
     tokens_est: int
+    # Only on a sampled (not fully tokenised) estimate: ``"approx"`` and
+    # the estimate's relative error bound (``0.03`` = within 3%).
+    tokens_est_method: str
+    tokens_est_error: float
     chars: int
     truncated: bool
     more_at_offset: int
@@ -165,6 +169,11 @@ class RelatedArticle(TypedDict):
     # renderer treats it as optional (``N×`` suffix only when > 1), so it
     # stays NotRequired like ``link_text``.
     mention_count: NotRequired[int]
+    # Link-graph ranking only (``ranking == "link_graph"``): how many
+    # articles link to both the source and this target, and how many link
+    # targets the two share (see ``linkgraph.related``).
+    cocitation: NotRequired[int]
+    coupling: NotRequired[int]
 
 
 class NamespaceSummary(TypedDict):
@@ -370,6 +379,10 @@ class RelatedArticlesResponse(TypedDict):
     scan_truncated: NotRequired[bool]
     scan_total_internal: NotRequired[int]
     scan_limit: NotRequired[int]
+    # Related direction only: ``"link_graph"`` when the rows came from the
+    # link-graph sidecar (ranked by co-citation + coupling), otherwise
+    # ``"mention_count"`` (the article was parsed and its links counted).
+    ranking: NotRequired[str]
 
 
 class _BatchEntryItem(TypedDict):
@@ -718,10 +731,12 @@ class HealthStatus(TypedDict, total=False):
     below). Legacy ``server_tools.py`` callers were updated to import
     ``HealthStatus`` directly.
 
-    ``cache_performance`` and ``simple_tools_telemetry`` carry free-form
-    dicts whose shape is owned by the cache / simple-tools modules; the
-    server-tools surface intentionally doesn't pin them here so additions
-    in those modules don't ripple back into the response schema.
+    ``cache_performance``, ``archive_pool``, ``stage_timings``,
+    ``search_sessions`` and ``simple_tools_telemetry`` carry free-form dicts
+    whose shape is owned by the cache / archive-pool / timings /
+    search-session / simple-tools modules; the
+    server-tools surface intentionally doesn't pin them here so additions in
+    those modules don't ripple back into the response schema.
     """
 
     timestamp: str
@@ -730,6 +745,9 @@ class HealthStatus(TypedDict, total=False):
     uptime_info: UptimeInfo
     configuration: HealthConfiguration
     cache_performance: dict[str, Any]
+    archive_pool: dict[str, Any]
+    stage_timings: dict[str, Any]
+    search_sessions: dict[str, Any]
     simple_tools_telemetry: dict[str, Any]
     health_checks: HealthChecks
     recommendations: list[str]
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from ..exceptions import OpenZimMcpCursorMismatchError
 from ..linkgraph.reader import LinkGraphUnavailable
+from ..pagination import is_inbound_keyset
 from ..responses import tool_error
 from ._common import (
     cursor_context_mismatch,
@@ -134,6 +135,18 @@ def register(server: "OpenZimMcpServer") -> None:
                     if ep_error is not None:
                         return ep_error
                     eff_offset = int(state.get("o", 0) or 0)
+                    keyset = state.get("ka")
+                    if keyset is not None and not is_inbound_keyset(keyset):
+                        return tool_error(
+                            operation="cursor_decode",
+                            message=(
+                                "The `cursor` payload's `s.ka` (keyset resume "
+                                "point) is invalid. Drop the cursor and call "
+                                "again with an explicit `offset` (or no "
+                                "pagination arg)."
+                            ),
+                            context="field=ka",
+                        )
                 try:
                     return await ops.get_inbound_links_data(
                         zim_file_path,
@@ -141,6 +154,9 @@ def register(server: "OpenZimMcpServer") -> None:
                         limit=effective_limit(limit, state, 10),
                         offset=eff_offset,
                         cursor_archive_identity=state.get("ai") if state else None,
+                        # Keyset resume point; absent from cursors minted
+                        # before it existed, which then resume by offset.
+                        after=state.get("ka") if state else None,
                     )
                 except LinkGraphUnavailable as e:
                     return tool_error(
@@ -42,26 +42,31 @@ from libzim.suggestion import (  # type: ignore[import-untyped]
     SuggestionSearcher,
 )
 
+from openzim_mcp.archive_generations import ARCHIVE_GENERATIONS
 from openzim_mcp.archive_types import detect_archive_type
 from openzim_mcp.cache import OpenZimMcpCache
 from openzim_mcp.config import OpenZimMcpConfig
 from openzim_mcp.constants import DEFAULT_MAIN_PAGE_TRUNCATION
 from openzim_mcp.content_processor import ContentProcessor
-from openzim_mcp.defaults import CONTENT
+from openzim_mcp.defaults import CACHE, CONTENT
 from openzim_mcp.exceptions import (
     ArchiveOpenTimeoutError,
     OpenZimMcpArchiveError,
     OpenZimMcpEntryNotFoundError,
 )
-from openzim_mcp.meta import attach_meta
+from openzim_mcp.meta import TOKEN_ESTIMATOR, attach_meta
 from openzim_mcp.preset_data import ArchivePreset, resolve_preset_from_entries
 from openzim_mcp.security import PathValidator
 from openzim_mcp.timeout_utils import run_with_timeout
+from openzim_mcp.timings import span
 from openzim_mcp.zim._ops_base import _ArchiveAccessMixin, _json
+from openzim_mcp.zim.archive_pool import ArchiveHandlePool, open_signature
 from openzim_mcp.zim.content import _ContentMixin
 from openzim_mcp.zim.namespace import _NamespaceMixin
+from openzim_mcp.zim.prewarm import Prewarmer
 from openzim_mcp.zim.redirects import resolve_redirect_chain
 from openzim_mcp.zim.search import _SearchMixin
+from openzim_mcp.zim.search_sessions import SearchSessionCache
 from openzim_mcp.zim.structure import _StructureMixin
 
 if TYPE_CHECKING:
@@ -81,7 +86,9 @@ __all__ = [
     "SuggestionSearcher",
     "ZIM_MAGIC",
     "ZimOperations",
+    "archive_pool_stats",
     "check_archive_integrity",
+    "configure_archive_pool",
     "configure_libzim_caches",
     "has_zim_signature",
     "zim_archive",
@@ -338,6 +345,30 @@ def configure_libzim_caches(
         _LIBZIM_DIRENT_CACHE_MAX_COUNT = dirent_cache_max_count
 
 
+# Process-wide pool of open archive handles shared by every ``zim_archive``
+# call. Module scope for the same reason as the dirent-cache count above;
+# ``configure_archive_pool`` applies the limits from server config.
+_ARCHIVE_POOL = ArchiveHandlePool(
+    max_open=CACHE.ARCHIVE_POOL_MAX_OPEN,
+    idle_seconds=CACHE.ARCHIVE_POOL_IDLE_SECONDS,
+)
+
+
+def configure_archive_pool(max_open: int, idle_seconds: float) -> None:
+    """Apply the archive handle pool limits (``0`` max_open disables it)."""
+    _ARCHIVE_POOL.configure(max_open=max_open, idle_seconds=idle_seconds)
+
+
+def archive_pool_stats() -> Dict[str, Any]:
+    """Hit/open/evict counters of the archive handle pool, for ``zim_health``."""
+    return _ARCHIVE_POOL.stats()
+
+
+def archive_pool_counters() -> Dict[str, int]:
+    """The same counters read without the pool lock, for ``/metrics``."""
+    return _ARCHIVE_POOL.counters()
+
+
 _COUNTER_COMPLETE_RE = re.compile(r"=\d+\s*$")
 
 
@@ -455,6 +486,11 @@ def zim_archive(
 ) -> Generator[Archive, None, None]:
     """Context manager for ZIM archive operations with resource cleanup and timeout.
 
+    Handles come from the process-wide archive handle pool (see
+    ``zim/archive_pool.py``): repeated calls against the same unchanged file
+    reuse one open ``Archive`` and its warm dirent cache instead of paying
+    the open again.
+
     Args:
         file_path: Path to the ZIM file
         timeout_seconds: Maximum time to wait for archive to open (default: 30s)
@@ -489,22 +525,40 @@ def zim_archive(
                 logger.debug("dirent_cache_max_size unavailable: %s", e)
         return archive
 
-    try:
-        archive = run_with_timeout(
+    def open_with_timeout() -> Archive:
+        return run_with_timeout(
             open_archive,
             timeout_seconds,
             f"Timed out opening ZIM archive after {timeout_seconds}s: {file_path}",
             ArchiveOpenTimeoutError,
         )
+
+    try:
+        # A pooled handle is reused while the file's stat token is unchanged;
+        # an atomic replacement changes the token and the pool reopens. A hit
+        # skips the timeout pool entirely — there is nothing to wait on.
+        from openzim_mcp.bundle import archive_stat_token
+
+        with span("archive_open"):
+            signature = open_signature(
+                archive_stat_token(file_path),
+                _zim_ops_shim.Archive,
+                _LIBZIM_DIRENT_CACHE_MAX_COUNT,
+            )
+            archive = _ARCHIVE_POOL.acquire(
+                str(file_path), signature, open_with_timeout
+            )
     except ArchiveOpenTimeoutError as e:
         raise OpenZimMcpArchiveError(str(e)) from e
     except Exception as e:
         raise OpenZimMcpArchiveError(f"Failed to open ZIM archive: {file_path}") from e
 
-    logger.debug(f"Opened ZIM archive: {file_path}")
+    logger.debug(f"Acquired ZIM archive: {file_path}")
     try:
         yield archive
     finally:
+        # The pool owns the handle's lifetime; this caller's reference simply
+        # goes out of scope.
         logger.debug(f"Releasing ZIM archive: {file_path}")
 
 
@@ -548,6 +602,32 @@ class ZimOperations(
                 cluster_cache_max_size_bytes=cluster_bytes,
                 dirent_cache_max_count=dirent_count,
             )
+        configure_archive_pool(
+            max_open=config.cache.archive_pool_max_open,
+            idle_seconds=config.cache.archive_pool_idle_seconds,
+        )
+        ARCHIVE_GENERATIONS.configure(config.cache.stat_memo_seconds)
+        TOKEN_ESTIMATOR.configure(
+            config.meta.token_estimator, config.meta.token_approx_min_chars
+        )
+        # Ranked hit lists held between ``search_zim_file`` cursor pages.
+        # Like the result cache, sessions honour the ``cache.enabled``
+        # master switch: a cache-disabled server re-runs every page.
+        self.search_sessions = SearchSessionCache(
+            ttl_seconds=(
+                config.search.session_ttl_seconds if config.cache.enabled else 0.0
+            ),
+            max_ids=config.search.session_max_ids,
+        )
+        # Opt-in background warming of the bundle / snippet / path-mapping
+        # caches, started by the server and re-run by the mtime watcher
+        # when an archive is replaced (see ``zim/prewarm.py``).
+        self.prewarmer = Prewarmer(
+            self,
+            config.warmup,
+            cache_enabled=config.cache.enabled,
+            cache_slots=config.cache.max_size,
+        )
         logger.info("ZimOperations initialized")
 
     def _glob_zim_paths(self) -> List[Tuple[Path, List[Path]]]:
@@ -0,0 +1,225 @@
+"""Process-wide pool of open ``libzim.Archive`` handles.
+
+``zim_archive`` used to construct a fresh ``Archive`` on every call, so each
+tool call paid the header parse again and started from a cold dirent cache —
+thousands of times a minute against the same multi-GB file under load. The
+pool keeps one handle per validated path open between calls, so libzim's
+per-archive dirent cache (and the cluster reads it steers) stays warm across
+requests.
+
+A pooled handle is reused only while its *signature* still matches: the
+``archive_stat_token`` of the file (so an atomic replacement — the monthly
+Wikipedia refresh — reopens instead of serving the unlinked inode), the
+factory that opened it, and the dirent-cache size it was opened with. A
+mismatch retires the old handle and opens a new one.
+
+"Closing" a handle means dropping the pool's reference. python-libzim has no
+explicit close; the file is released when the last reference goes. A caller
+still inside ``with zim_archive(...)`` keeps its own reference, so evicting a
+handle that is in use never pulls it out from under that caller — the handle
+simply stops being handed to *new* callers and closes when the last one
+finishes.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ArchiveHandlePool", "open_signature"]
+
+
+@dataclass
+class _PooledHandle:
+    """One open archive plus the bookkeeping the pool decides on."""
+
+    archive: Any
+    signature: Hashable
+    last_used: float
+
+
+class ArchiveHandlePool:
+    """Thread-safe LRU pool of open archives keyed by validated path.
+
+    ``max_open`` caps how many handles stay open; beyond it the least
+    recently used handle is dropped. ``idle_seconds`` drops handles nobody
+    has asked for in that long, so an archive that was read once at startup
+    does not pin its file descriptor (and, on a replaced file, the old
+    inode's disk space) for the life of the process. ``max_open == 0``
+    disables pooling: every acquire opens a fresh handle, the pre-pool
+    behaviour.
+
+    Counters are cumulative for the process and surface through
+    ``zim_health`` under ``archive_pool``.
+    """
+
+    def __init__(self, max_open: int, idle_seconds: float) -> None:
+        """Create an empty pool with the given capacity and idle timeout."""
+        self._max_open = max(0, int(max_open))
+        self._idle_seconds = float(idle_seconds)
+        self._handles: "OrderedDict[str, _PooledHandle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._opens = 0
+        self._reopens = 0
+        self._evicted_lru = 0
+        self._evicted_idle = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether handles are kept open between calls at all."""
+        return self._max_open > 0
+
+    def configure(self, max_open: int, idle_seconds: float) -> None:
+        """Apply new limits, trimming the pool immediately if it shrank."""
+        with self._lock:
+            self._max_open = max(0, int(max_open))
+            self._idle_seconds = float(idle_seconds)
+            self._evict_idle_locked(time.monotonic())
+            self._enforce_capacity_locked()
+
+    def acquire(self, key: str, signature: Hashable, opener: Callable[[], Any]) -> Any:
+        """Return an open archive for ``key``, opening one on a miss.
+
+        ``opener`` runs outside the pool lock: an archive open can take
+        seconds on a cold network mount, and holding the lock across it would
+        serialise every other archive behind the slow one. Two threads that
+        miss on the same key concurrently may therefore both open; the first
+        to finish is pooled and the second thread's handle is used once and
+        dropped.
+
+        Exceptions from ``opener`` propagate unchanged and leave the pool
+        untouched.
+        """
+        if not self.enabled:
+            archive = opener()
+            with self._lock:
+                self._opens += 1
+            return archive
+
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle_locked(now)
+            handle = self._handles.get(key)
+            if handle is not None:
+                if handle.signature == signature:
+                    handle.last_used = now
+                    self._handles.move_to_end(key)
+                    self._hits += 1
+                    return handle.archive
+                # The file was replaced (or the opener / dirent setting
+                # changed) since this handle was opened. Retire it; any
+                # caller mid-read keeps its own reference.
+                del self._handles[key]
+                self._reopens += 1
+                logger.debug("Archive pool: reopening replaced archive %s", key)
+
+        archive = opener()
+
+        with self._lock:
+            self._opens += 1
+            existing = self._handles.get(key)
+            if existing is not None and existing.signature == signature:
+                # Lost an open race; keep the pooled handle so every caller
+                # converges on one set of warm caches.
+                existing.last_used = time.monotonic()
+                self._handles.move_to_end(key)
+                return existing.archive
+            self._handles[key] = _PooledHandle(
+                archive=archive, signature=signature, last_used=time.monotonic()
+            )
+            self._handles.move_to_end(key)
+            self._enforce_capacity_locked()
+        return archive
+
+    def discard(self, key: str) -> bool:
+        """Drop the pooled handle for ``key``, if any. Returns whether one was."""
+        with self._lock:
+            return self._handles.pop(key, None) is not None
+
+    def evict_idle(self) -> int:
+        """Drop every handle idle for longer than ``idle_seconds``."""
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def clear(self) -> None:
+        """Drop every pooled handle. Counters are left intact."""
+        with self._lock:
+            self._handles.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the pool's size and cumulative counters."""
+        with self._lock:
+            lookups = self._hits + self._opens
+            return {
+                "enabled": self.enabled,
+                "open_handles": len(self._handles),
+                "max_open": self._max_open,
+                "idle_seconds": self._idle_seconds,
+                "hits": self._hits,
+                "opens": self._opens,
+                "reopens": self._reopens,
+                "evicted_lru": self._evicted_lru,
+                "evicted_idle": self._evicted_idle,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def counters(self) -> Dict[str, int]:
+        """``stats`` without the lock, for the ``/metrics`` scrape.
+
+        Single-field reads are atomic under the GIL, so the scrape can
+        sample the pool without contending with the acquires every tool
+        call makes.
+        """
+        return {
+            "open_handles": len(self._handles),
+            "hits": self._hits,
+            "opens": self._opens,
+            "reopens": self._reopens,
+            "evicted_lru": self._evicted_lru,
+            "evicted_idle": self._evicted_idle,
+        }
+
+    def _evict_idle_locked(self, now: float) -> int:
+        """Drop idle handles from the LRU end (lock held).
+
+        The ``OrderedDict`` is kept in recency order, so the scan stops at
+        the first handle that is still fresh — O(evicted), not O(pool).
+        """
+        if self._idle_seconds <= 0:
+            return 0
+        evicted = 0
+        while self._handles:
+            key, handle = next(iter(self._handles.items()))
+            if now - handle.last_used <= self._idle_seconds:
+                break
+            del self._handles[key]
+            evicted += 1
+            logger.debug("Archive pool: closed idle archive %s", key)
+        self._evicted_idle += evicted
+        return evicted
+
+    def _enforce_capacity_locked(self) -> None:
+        """Drop least recently used handles until within ``max_open`` (lock held)."""
+        while len(self._handles) > self._max_open:
+            key, _handle = self._handles.popitem(last=False)
+            self._evicted_lru += 1
+            logger.debug("Archive pool: closed LRU archive %s", key)
+
+
+def open_signature(
+    stat_token: str, opener: Optional[Callable[..., Any]], dirent_count: Any
+) -> Hashable:
+    """Build the reuse signature for a pooled handle.
+
+    The opener's identity is part of it so a handle opened through one
+    ``Archive`` factory is never served to a caller that would have used
+    another (the test suite patches the factory per test).
+    """
+    return (stat_token, opener, dirent_count)
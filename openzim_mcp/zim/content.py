@@ -36,6 +36,7 @@ from openzim_mcp.exceptions import (
     OpenZimMcpValidationError,
 )
 from openzim_mcp.meta import attach_meta
+from openzim_mcp.timings import timed
 from openzim_mcp.zim._ops_base import _json
 from openzim_mcp.zim.redirects import resolve_redirect_chain
 
@@ -352,6 +353,7 @@ class _ContentMixin:
         ) -> "Tuple[Optional[ArchivePreset], Optional[str]]":
             """Resolve via ``ZimOperations`` on the concrete coordinator."""
 
+    @timed("snippet_render")
     def _get_entry_snippet(
         self,
         entry: Any,
@@ -396,24 +398,27 @@ class _ContentMixin:
             # the caller supplies ``validated_path``; create_snippet then runs
             # per-query over the cached text.
             render_cache_key: Optional[str] = None
+            lead_cache_key: Optional[str] = None
             entry_path_attr = getattr(entry, "path", "") or ""
             if validated_path and entry_path_attr:
                 try:
                     from openzim_mcp.bundle import archive_stat_token
 
-                    render_cache_key = (
-                        f"snippet_render:v1:{validated_path}:"
+                    key_tail = (
+                        f"{validated_path}:"
                         f"{archive_stat_token(Path(validated_path))}:"
                         f"{entry_path_attr}"
                     )
+                    render_cache_key = f"snippet_render:v1:{key_tail}"
+                    lead_cache_key = f"snippet_lead:v1:{key_tail}"
                 except Exception:
                     render_cache_key = None
+            entry_title = getattr(entry, "title", None) or ""
+            mp = max_paragraphs if max_paragraphs is not None else 2
             cached_content = (
                 self.cache.get(render_cache_key) if render_cache_key else None
             )
             if isinstance(cached_content, str):
-                entry_title = getattr(entry, "title", None) or ""
-                mp = max_paragraphs if max_paragraphs is not None else 2
                 return self.content_processor.create_snippet(
                     cached_content,
                     query=query,
@@ -421,6 +426,26 @@ class _ContentMixin:
                     max_paragraphs=mp,
                     snippet_length=snippet_length,
                 )
+            # A rendered lead answers most snippets at a fraction of the
+            # cost of a full render (see openzim_mcp.lead_snippet). A lead
+            # that has already been rendered once and cannot answer this
+            # query is not re-scanned; the full render below takes over.
+            lead_snippets = self.config.content.lead_snippets
+            cached_lead = (
+                self.cache.get(lead_cache_key)
+                if lead_snippets and lead_cache_key
+                else None
+            )
+            if isinstance(cached_lead, str):
+                snippet = self.content_processor.create_lead_snippet(
+                    cached_lead,
+                    query=query,
+                    title=entry_title,
+                    max_paragraphs=mp,
+                    snippet_length=snippet_length,
+                )
+                if snippet is not None:
+                    return snippet
 
             item = entry.get_item()
             mime = item.mimetype or ""
@@ -439,11 +464,36 @@ class _ContentMixin:
                     HTML_PARSER,
                     select_main_content,
                 )
+                from openzim_mcp.lead_snippet import (
+                    LEAD_SLACK_PARAGRAPHS,
+                    extract_lead_html,
+                )
 
-                soup = BeautifulSoup(
-                    bytes(item.content).decode("utf-8", errors="replace"),
-                    HTML_PARSER,
+                html = bytes(item.content).decode("utf-8", errors="replace")
+                lead_html = (
+                    extract_lead_html(html, mp + LEAD_SLACK_PARAGRAPHS)
+                    if lead_snippets and cached_lead is None
+                    else None
                 )
+                if lead_html is not None:
+                    lead = self.content_processor._render_soup_to_text(
+                        BeautifulSoup(lead_html, HTML_PARSER), compact=True
+                    )
+                    if lead_cache_key:
+                        try:
+                            self.cache.set(lead_cache_key, lead, ancillary=True)
+                        except Exception as exc:  # pragma: no cover
+                            logger.debug("snippet lead cache set failed: %s", exc)
+                    snippet = self.content_processor.create_lead_snippet(
+                        lead,
+                        query=query,
+                        title=entry_title,
+                        max_paragraphs=mp,
+                        snippet_length=snippet_length,
+                    )
+                    if snippet is not None:
+                        return snippet
+                soup = BeautifulSoup(html, HTML_PARSER)
                 content = self.content_processor._render_soup_to_text(
                     select_main_content(soup), compact=True
                 )
@@ -459,8 +509,6 @@ class _ContentMixin:
                     self.cache.set(render_cache_key, content, ancillary=True)
                 except Exception as exc:  # pragma: no cover - cache is best-effort
                     logger.debug("snippet render cache set failed: %s", exc)
-            entry_title = getattr(entry, "title", None) or ""
-            mp = max_paragraphs if max_paragraphs is not None else 2
             return self.content_processor.create_snippet(
                 content,
                 query=query,
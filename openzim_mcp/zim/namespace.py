@@ -157,6 +157,68 @@ def _scan_fill_c_namespace(
     return page_paths, next_row_offset, scan_exhausted, assets_skipped
 
 
+def _raw_namespace(path: str) -> str:
+    """Namespace token of an old-scheme path, uncanonicalised (``A/B`` -> ``A``)."""
+    return path.split("/", 1)[0] if "/" in path else path[:1]
+
+
+def _bisect_namespace_ranges(
+    entry_count: int, get_path: "Any"
+) -> Optional[Dict[str, Tuple[int, int]]]:
+    """Locate each namespace's ``[start, end)`` entry-id range by bisection.
+
+    An old-scheme archive's dirents are sorted by namespace and then by
+    path, and ``_get_entry_by_id`` walks them in that order, so every
+    namespace letter owns one contiguous run of ids. Starting from id 0,
+    each run's end is the first id whose namespace sorts after the run's
+    own, found by binary search — ``O(k log n)`` entry reads for ``k``
+    namespaces instead of the ``n`` a full scan costs, about 250 reads on
+    a 27M-entry archive.
+
+    ``get_path(entry_id)`` returns the entry's full path. Keys are raw
+    namespace tokens; the caller canonicalises them. Returns ``None`` when
+    an entry cannot be read or the ids turn out not to be namespace-sorted
+    (a namespace reappearing after a later one), so the caller falls back
+    to the scan or sampling it used before. Those checks only see the ids
+    the search reads, so they catch a mis-ordered archive rather than prove
+    a well-ordered one.
+    """
+    memo: Dict[int, str] = {}
+
+    def namespace_at(entry_id: int) -> str:
+        ns = memo.get(entry_id)
+        if ns is None:
+            ns = memo[entry_id] = _raw_namespace(str(get_path(entry_id)))
+        return ns
+
+    ranges: Dict[str, Tuple[int, int]] = {}
+    previous: Optional[str] = None
+    start = 0
+    try:
+        while start < entry_count:
+            ns = namespace_at(start)
+            if previous is not None and ns <= previous:
+                return None
+            lo, hi = start + 1, entry_count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if namespace_at(mid) <= ns:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            # The last id of the run must still be in it; a mismatch means
+            # the bisection skipped over a namespace out of order.
+            if namespace_at(lo - 1) != ns:
+                return None
+            ranges[ns] = (start, lo)
+            previous = ns
+            start = lo
+    except Exception as e:
+        logger.debug(f"Namespace range bisection failed: {e}")
+        return None
+    return ranges
+
+
 # Minimum sampled hits required before we project a per-namespace total
 # from the sampling ratio. Below this we report the lower-bound (sampled +
 # probed) instead of fabricating numbers from single-hit projections.
@@ -220,7 +282,9 @@ class _NamespaceMixin:
 
         try:
             with _zim_ops_mod.zim_archive(validated_path) as archive:
-                result = self._list_archive_namespaces(archive)
+                result = self._list_archive_namespaces(
+                    archive, archive_path=str(validated_path)
+                )
 
             # Attach _meta BEFORE caching so cold and warm reads return
             # bit-identical responses (Phase B #12 fix — re-attaching on
@@ -243,14 +307,65 @@ class _NamespaceMixin:
         """
         return _json(self.list_namespaces_data(zim_file_path))
 
-    def _list_archive_namespaces(self, archive: Archive) -> Dict[str, Any]:
+    def _namespace_ranges(
+        self, archive: Archive, archive_path: Optional[str] = None
+    ) -> Optional[Dict[str, Tuple[int, int]]]:
+        """Entry-id range of every namespace of a large old-scheme archive.
+
+        ``None`` for new-scheme archives (the iterable surface is all C, so
+        C's range is the whole id space and nothing else is on it), for
+        archives small enough that the full iteration is just as cheap and
+        does not rely on libzim's ordering, and when bisection fails (see
+        :func:`_bisect_namespace_ranges`). ``archive_path`` caches the
+        ranges under the archive's stat token, so they are computed once
+        per archive generation and dropped when the file is replaced.
+        """
+        if getattr(archive, "has_new_namespace_scheme", False):
+            return None
+        total_entries = int(archive.entry_count)
+        if total_entries <= NAMESPACE_MAX_SAMPLE_SIZE:
+            return None
+        cache_key: Optional[str] = None
+        if archive_path is not None:
+            from openzim_mcp.bundle import archive_stat_token
+
+            cache_key = (
+                f"ns_ranges:v1:{archive_path}:"
+                f"{archive_stat_token(Path(archive_path))}"
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return {ns: (int(span[0]), int(span[1])) for ns, span in cached.items()}
+        raw = _bisect_namespace_ranges(
+            total_entries, lambda entry_id: archive._get_entry_by_id(entry_id).path
+        )
+        if raw is None:
+            return None
+        ranges: Dict[str, Tuple[int, int]] = {}
+        for token, span in raw.items():
+            namespace = self._canonicalise_namespace(token) if token else "Unknown"
+            if namespace in ranges:
+                # Two raw tokens folding onto one letter (``a`` and ``A``)
+                # would need two ranges; leave that archive to the scan.
+                return None
+            ranges[namespace] = span
+        if cache_key is not None:
+            self.cache.set(cache_key, {ns: list(span) for ns, span in ranges.items()})
+        logger.debug(f"Bisected {len(ranges)} namespace ranges of {archive_path}")
+        return ranges
+
+    def _list_archive_namespaces(
+        self, archive: Archive, archive_path: Optional[str] = None
+    ) -> Dict[str, Any]:
         """List namespaces in the archive.
 
         For small archives (entry_count <= NAMESPACE_MAX_SAMPLE_SIZE) iterate
-        every entry by ID so the namespace inventory is exhaustive. For larger
-        archives, fall back to random sampling and return estimated counts.
-        Random sampling on small entry pools collides heavily, leaving
-        namespaces undiscovered and counts wildly off.
+        every entry by ID so the namespace inventory is exhaustive. Larger
+        old-scheme archives are counted from their namespace ranges (see
+        :meth:`_namespace_ranges`), which are exact as well. Only when those
+        cannot be built does the listing fall back to random sampling and
+        estimated counts. Random sampling on small entry pools collides
+        heavily, leaving namespaces undiscovered and counts wildly off.
 
         For new-scheme archives, the iterable surface only contains C
         entries; M is enumerated separately via ``archive.metadata_keys`` and
@@ -262,6 +377,9 @@ class _NamespaceMixin:
         logger.debug(f"Archive uses new namespace scheme: {has_new_scheme}")
 
         total_entries = archive.entry_count
+        ranges = self._namespace_ranges(archive, archive_path)
+        if ranges is not None:
+            return self._list_namespaces_from_ranges(archive, ranges, total_entries)
         full_iteration = total_entries <= NAMESPACE_MAX_SAMPLE_SIZE
 
         record = self._make_namespace_recorder(
@@ -315,6 +433,52 @@ class _NamespaceMixin:
             result["all_entry_count"] = int(all_entry_count)
         return result
 
+    @staticmethod
+    def _list_namespaces_from_ranges(
+        archive: Archive, ranges: Dict[str, Tuple[int, int]], total_entries: int
+    ) -> Dict[str, Any]:
+        """Namespace listing with exact per-namespace totals from id ranges.
+
+        Only the first five entries of each range are read, for the
+        ``sample_entries`` preview; ``sampled_entries`` counts those reads.
+        """
+        namespaces: Dict[str, Dict[str, Any]] = {}
+        read = 0
+        for namespace, (start, end) in ranges.items():
+            samples: List[Dict[str, str]] = []
+            for entry_id in range(start, min(start + 5, end)):
+                try:
+                    entry = archive._get_entry_by_id(entry_id)
+                    samples.append(
+                        {"path": entry.path, "title": entry.title or entry.path}
+                    )
+                except Exception as e:
+                    logger.debug(f"Error reading entry {entry_id}: {e}")
+                read += 1
+            namespaces[namespace] = {
+                "total": end - start,
+                "is_authoritative": True,
+                "description": _NAMESPACE_DESCRIPTIONS.get(
+                    namespace, f"Namespace '{namespace}'"
+                ),
+                "sample_entries": samples,
+                "sampled_count": len(samples),
+                "estimated_total": end - start,
+                "probed_count": 0,
+            }
+        result: Dict[str, Any] = {
+            "total_entries": total_entries,
+            "sampled_entries": read,
+            "has_new_namespace_scheme": False,
+            "is_total_authoritative": True,
+            "discovery_method": "namespace_index",
+            "namespaces": namespaces,
+        }
+        all_entry_count = getattr(archive, "all_entry_count", None)
+        if all_entry_count is not None:
+            result["all_entry_count"] = int(all_entry_count)
+        return result
+
     @staticmethod
     def _add_new_scheme_metadata_namespace(
         archive: Archive, namespaces: Dict[str, Dict[str, Any]]
@@ -969,6 +1133,38 @@ class _NamespaceMixin:
                 archive, namespace, limit, offset
             )
 
+        # Large old-scheme archive: each namespace is one id range, so the
+        # page is read straight out of it — exact total, O(limit) reads,
+        # no listing to build or sample.
+        ranges = self._namespace_ranges(archive, archive_path)
+        if ranges is not None:
+            start, end = ranges.get(namespace, (0, 0))
+            window = range(min(start + offset, end), min(start + offset + limit, end))
+            paths: List[str] = []
+            for entry_id in window:
+                try:
+                    paths.append(str(archive._get_entry_by_id(entry_id).path))
+                except Exception as e:
+                    logger.warning(f"Error reading entry id {entry_id}: {e}")
+            payload = self._new_scheme_browse_payload(
+                namespace=namespace,
+                total=end - start,
+                offset=offset,
+                limit=limit,
+                entries=[
+                    row
+                    for row in (
+                        self._materialise_browse_entry_safely(archive, path)
+                        for path in paths
+                    )
+                    if row is not None
+                ],
+                discovery_method="namespace_index",
+            )
+            # Resume by ids consumed, like the listing path below.
+            payload["scanned_count"] = len(window)
+            return payload
+
         # Discover entries in the namespace. The full listing is cached
         # separately from the per-page JSON (cache_key in browse_namespace),
         # so different (limit, offset) pages share one scan. The stat
@@ -1093,6 +1289,9 @@ class _NamespaceMixin:
         would be backwards here. ``done`` is derived from scan-exhaustion, so
         pagination still terminates correctly; the only cosmetic effect is that
         a media-rich archive reaches ``done`` before ``returned == total``.
+
+        The old-scheme namespace-range path shares the shape, with the range
+        length as its (equally exact) total.
         """
         return {
             "namespace": namespace,
@@ -1256,6 +1455,16 @@ class _NamespaceMixin:
         payload["scanned_count"] = len(present[offset : offset + limit])
         return payload
 
+    def _materialise_browse_entry_safely(
+        self, archive: Archive, entry_path: str
+    ) -> Optional[Dict[str, Any]]:
+        """Old-scheme ``_materialise_browse_entry`` that logs instead of raising."""
+        try:
+            return self._materialise_browse_entry(archive, entry_path, False)
+        except Exception as e:
+            logger.warning(f"Error processing entry {entry_path}: {e}")
+            return None
+
     def _materialise_browse_entry(
         self, archive: Archive, entry_path: str, has_new_scheme: bool
     ) -> Optional[Dict[str, Any]]:
@@ -1814,15 +2023,26 @@ class _NamespaceMixin:
                         ),
                     )
 
-                entries: List[Dict[str, Any]] = []
+                # A large old-scheme archive keeps the namespace in one id
+                # range: start there and stop at its end rather than scanning
+                # every other namespace's ids on the way. A namespace the
+                # archive lacks has an empty range at the end of the id space.
+                ranges = self._namespace_ranges(archive, str(validated))
+                scan_end = archive_entry_count
                 entry_id = scan_at
+                if ranges is not None:
+                    ns_start, scan_end = ranges.get(
+                        namespace, (archive_entry_count, archive_entry_count)
+                    )
+                    entry_id = max(scan_at, ns_start)
+                entries: List[Dict[str, Any]] = []
                 # Non-article asset filter applies ONLY to the new-scheme C
                 # surface, where every iterable entry (articles AND ZIMIT
                 # ``_zim_static`` infra, images, css, fonts, media) lives under
                 # C. Old-scheme or non-C walks (e.g. the ``I`` image namespace)
                 # must still surface their assets, so they are never filtered.
                 filter_assets = has_new_scheme and namespace == "C"
-                while entry_id < archive_entry_count and len(entries) < limit:
+                while entry_id < scan_end and len(entries) < limit:
                     try:
                         entry = archive._get_entry_by_id(entry_id)
                         path = entry.path
@@ -1848,7 +2068,7 @@ class _NamespaceMixin:
                         logger.debug(f"walk_namespace: entry {entry_id} skipped: {e}")
                     entry_id += 1
 
-                done = entry_id >= archive_entry_count
+                done = entry_id >= scan_end
                 # scanned_through_id reflects the last ID we examined regardless
                 # of whether it matched the filter. None if we never entered the
                 # loop (scan_at was already at/past the end).
@@ -1894,6 +2114,8 @@ class _NamespaceMixin:
                 ns_count_c = (
                     archive_entry_count if has_new_scheme and namespace == "C" else None
                 )
+                if ranges is not None:
+                    ns_count_c = scan_end - ns_start if namespace in ranges else 0
                 return cast(
                     "WalkNamespaceResponse",
                     attach_meta(
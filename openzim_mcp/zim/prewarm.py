@@ -0,0 +1,306 @@
+"""Background cache prewarming for freshly opened or replaced archives.
+
+Every bundle, snippet-render and path-mapping cache key embeds the
+archive's stat token (``bundle.archive_stat_token``), which is what makes
+an archive swap safe — and also why the first thousands of requests after
+a server start or a monthly ZIM replacement all miss. The prewarmer closes
+that gap: for each archive it is handed it ranks entries by a popularity
+signal (``WarmupConfig.signal``) and renders the top ones through the very
+functions the request path uses, so the keys it writes are the keys the
+first requests look up.
+
+Warming is strictly background work. It runs on one worker thread that
+asks the kernel for the lowest CPU priority (Linux honours a per-thread
+nice value; elsewhere the call is skipped), and because a niced thread
+still competes for the GIL once scheduled, it also duty-cycles itself to
+``cpu_share`` of one core. Each archive pass is capped at
+``time_budget_seconds`` of wall-clock time, and ``stop()`` abandons the
+pass between two entries. Progress surfaces through ``zim_health`` under
+``prewarm``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import openzim_mcp.zim_operations as _zim_ops_mod
+from openzim_mcp.config import WarmupConfig
+from openzim_mcp.zim.redirects import best_effort_redirect_chain
+
+__all__ = ["Prewarmer"]
+
+logger = logging.getLogger(__name__)
+
+# Cache keys one warmed entry writes (bundle, snippet render, path mapping).
+# ``top_n`` is capped so a pass never evicts what it warmed earlier.
+_KEYS_PER_ENTRY = 3
+
+
+def _lower_priority() -> None:
+    """Drop the calling thread to the lowest CPU scheduling priority.
+
+    On Linux ``setpriority(PRIO_PROCESS, tid)`` applies to that thread
+    alone; the request threads keep their priority.
+    """
+    if not hasattr(os, "setpriority"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except OSError as e:  # pragma: no cover — container without CAP_SYS_NICE
+        logger.debug("Could not lower prewarm thread priority: %s", e)
+
+
+class Prewarmer:
+    """Warm the caches of ``ops`` for the most popular entries of an archive.
+
+    ``schedule`` queues an archive (duplicates of a queued one are
+    dropped); ``warm_all`` queues every archive in the allowed directories.
+    Both are no-ops when warming is disabled, which includes a server whose
+    response cache is off — there would be nowhere to keep the result.
+    """
+
+    def __init__(
+        self, ops: Any, config: WarmupConfig, *, cache_enabled: bool, cache_slots: int
+    ) -> None:
+        """Bind to the ``ZimOperations`` whose caches are warmed."""
+        self._ops = ops
+        self._config = config
+        self.enabled = config.enabled and cache_enabled
+        self._top_n = max(1, min(config.top_n, cache_slots // _KEYS_PER_ENTRY))
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._state = "idle"
+        self._current: Optional[str] = None
+        self._archives_done = 0
+        self._warmed = 0
+        self._skipped = 0
+        self._budget_exhausted = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    def warm_all(self) -> None:
+        """Queue every ``.zim`` file in the allowed directories."""
+        if not self.enabled:
+            return
+        for _directory, candidates in self._ops._glob_zim_paths():
+            for path in sorted(candidates):
+                self.schedule(str(path))
+
+    def schedule(self, archive_path: str) -> None:
+        """Queue ``archive_path`` for warming on the background thread."""
+        if not self.enabled or self._stop.is_set():
+            return
+        with self._lock:
+            if archive_path in self._pending:
+                return
+            self._pending.add(archive_path)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="prewarm",
+                    initializer=_lower_priority,
+                )
+            self._executor.submit(self._run, archive_path)
+
+    def stop(self) -> None:
+        """Abandon queued and running passes; the running one stops at once."""
+        self._stop.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._pending.clear()
+            if self._state == "running":
+                self._state = "stopped"
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Progress counters for ``zim_health``."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "signal": self._config.signal,
+                "top_n": self._top_n,
+                "state": self._state,
+                "current_archive": self._current,
+                "queued": len(self._pending),
+                "archives_done": self._archives_done,
+                "entries_warmed": self._warmed,
+                "entries_skipped": self._skipped,
+                "budget_exhausted": self._budget_exhausted,
+                "last_pass": self._last,
+            }
+
+    def _run(self, archive_path: str) -> None:
+        """Executor job: one archive pass, with the bookkeeping around it."""
+        with self._lock:
+            self._pending.discard(archive_path)
+            if self._stop.is_set():
+                return
+            self._state = "running"
+            self._current = archive_path
+        try:
+            summary = self._warm_archive(archive_path)
+        except Exception as e:
+            # A broken archive must not take the worker (or the server) down.
+            logger.warning("Prewarming %s failed: %s", archive_path, e)
+            summary = {"archive": archive_path, "error": str(e)}
+        with self._lock:
+            self._archives_done += 1
+            self._last = summary
+            self._current = None
+            if self._state == "running":
+                self._state = "running" if self._pending else "idle"
+
+    def _warm_archive(self, archive_path: str) -> Dict[str, Any]:
+        """Warm the top entries of one archive within the time budget."""
+        started = time.monotonic()
+        budget = self._config.time_budget_seconds
+        validated_path = self._ops._validate_zim_path(archive_path)
+        warmed = skipped = 0
+        exhausted = False
+        with _zim_ops_mod.zim_archive(validated_path) as archive:
+            signal, candidates = self._candidates(archive, validated_path)
+            for entry_path in candidates:
+                if warmed >= self._top_n or self._stop.is_set():
+                    break
+                if budget and time.monotonic() - started >= budget:
+                    exhausted = True
+                    break
+                cpu_before = time.thread_time()
+                ok = self._warm_entry(archive, validated_path, entry_path)
+                with self._lock:
+                    if ok:
+                        self._warmed += 1
+                    else:
+                        self._skipped += 1
+                if ok:
+                    warmed += 1
+                else:
+                    skipped += 1
+                self._throttle(time.thread_time() - cpu_before)
+        if exhausted:
+            with self._lock:
+                self._budget_exhausted += 1
+        elapsed = round(time.monotonic() - started, 3)
+        logger.info(
+            "Prewarmed %d entries of %s (%s, %.1fs)",
+            warmed,
+            archive_path,
+            signal,
+            elapsed,
+        )
+        return {
+            "archive": archive_path,
+            "signal": signal,
+            "warmed": warmed,
+            "skipped": skipped,
+            "budget_exhausted": exhausted,
+            "elapsed_seconds": elapsed,
+        }
+
+    def _throttle(self, cpu_seconds: float) -> None:
+        """Sleep long enough that this thread stays at ``cpu_share``."""
+        share = self._config.cpu_share
+        if share < 1.0 and cpu_seconds > 0:
+            self._stop.wait(cpu_seconds * (1.0 / share - 1.0))
+
+    def _candidates(self, archive: Any, validated_path: Path) -> Tuple[str, List[str]]:
+        """Return the signal used and the entry paths to warm, best first.
+
+        The list may run past ``top_n``: entries that turn out absent or
+        not HTML are skipped, and the pass stops at ``top_n`` warmed.
+
+        An archive the configured signal has nothing for falls back to its
+        main page, so every archive gets at least its front door warmed.
+        """
+        signal = self._config.signal
+        paths: List[str] = []
+        if signal == "inbound_degree":
+            paths = self._from_link_graph(archive, validated_path)
+        elif signal == "access_log":
+            paths = self._from_access_log(validated_path)
+        if not paths:
+            signal = "main_page"
+            paths = self._from_main_page(archive)
+        return signal, list(dict.fromkeys(paths))
+
+    def _from_link_graph(self, archive: Any, validated_path: Path) -> List[str]:
+        """Most-linked entries, from a fingerprint-valid link-graph sidecar."""
+        from openzim_mcp.linkgraph.reader import open_cached
+
+        reader = open_cached(str(validated_path), live_archive_uuid=str(archive.uuid))
+        if reader is None:
+            return []
+        # Over-fetch: link targets the archive lacks are skipped, not warmed.
+        return reader.top_paths(self._top_n * 2)
+
+    def _from_access_log(self, validated_path: Path) -> List[str]:
+        """Most frequent entry paths of the configured access log."""
+        log_path = self._config.access_log_path
+        if log_path is None:
+            return []
+        names = {validated_path.name, validated_path.stem}
+        counts: Counter[str] = Counter()
+        try:
+            with open(log_path, encoding="utf-8", errors="replace") as fh:
+                for line in fh:
+                    archive_name, sep, entry_path = line.strip().rpartition("\t")
+                    if entry_path and (not sep or archive_name in names):
+                        counts[entry_path] += 1
+        except OSError as e:
+            logger.warning("Cannot read warmup access log %s: %s", log_path, e)
+            return []
+        return [path for path, _count in counts.most_common()]
+
+    def _from_main_page(self, archive: Any) -> List[str]:
+        """The main page, then its internal links in document order."""
+        from openzim_mcp.zim.structure import _StructureMixin
+
+        try:
+            main = best_effort_redirect_chain(archive.main_entry)
+            html = bytes(main.get_item().content).decode("utf-8", "replace")
+        except Exception as e:
+            logger.debug("No main page to warm from: %s", e)
+            return []
+        edges = _StructureMixin._parse_internal_link_edges(
+            html, source_path=main.path, archive=archive
+        )
+        return [main.path] + [target for target, _anchor in edges]
+
+    def _warm_entry(self, archive: Any, validated_path: Path, entry_path: str) -> bool:
+        """Fill the path-mapping, bundle and snippet caches for one entry.
+
+        Returns ``False`` for an entry that is absent, is not HTML, or
+        fails to render; those are counted as skipped, never raised.
+        """
+        from openzim_mcp.bundle import get_or_build_bundle
+
+        ops = self._ops
+        try:
+            entry = best_effort_redirect_chain(archive.get_entry_by_path(entry_path))
+            if not (entry.get_item().mimetype or "").startswith("text/html"):
+                return False
+            ops.cache.set(
+                ops._path_mapping_cache_key(validated_path, entry_path), entry.path
+            )
+            get_or_build_bundle(
+                archive,
+                entry.path,
+                cache=ops.cache,
+                validated_path=validated_path,
+                content_processor=ops.content_processor,
+                compact=True,
+            )
+            ops._get_entry_snippet(entry, validated_path=str(validated_path))
+        except Exception as e:
+            logger.debug("Prewarm skipped %s: %s", entry_path, e)
+            return False
+        return True
@@ -29,7 +29,11 @@ from openzim_mcp.exceptions import (
 )
 from openzim_mcp.meta import attach_meta
 from openzim_mcp.text_utils import strip_site_suffix, tokenize_for_relevance
+from openzim_mcp.timings import span
 from openzim_mcp.title_promotion import find_title_match
+from openzim_mcp.titleindex.reader import TitleIndexReader, TitleMatch
+from openzim_mcp.titleindex.reader import open_cached as open_title_index
+from openzim_mcp.titleindex.schema import fold_title
 from openzim_mcp.zim._ops_base import _json
 from openzim_mcp.zim.redirects import best_effort_redirect_chain
 
@@ -533,6 +537,23 @@ def _refinement_nudge() -> str:
     )
 
 
+def _search_all_error_row(file_info: Dict[str, Any], message: str) -> Dict[str, Any]:
+    """Per-file ``search_all`` row for an archive that could not be searched."""
+    return {
+        "zim_file_path": file_info.get("path"),
+        "name": file_info.get("name"),
+        "has_hits": False,
+        # H14: failure entries carry ``error=True`` plus an
+        # ``error_message`` / ``error_operation`` for context. ``result`` is
+        # None so the TypedDict shape stays uniform; callers branch on
+        # ``error`` instead of type-sniffing ``result``.
+        "result": None,
+        "error": True,
+        "error_operation": "search_zim_file",
+        "error_message": message,
+    }
+
+
 class _SearchMixin:
     """Search, suggestion, and title-resolution methods for ZimOperations.
 
@@ -876,11 +897,37 @@ class _SearchMixin:
             to decide whether the response is safe to cache. The payload
             shape is documented on ``search_zim_file_data``.
         """
-        query_obj = _zim_ops_mod.Query().set_query(query)
-        searcher = _zim_ops_mod.Searcher(archive)
-        search = searcher.search(query_obj)
 
-        total_results = search.getEstimatedMatches()
+        def _start_search() -> Tuple[Any, int]:
+            with span("xapian"):
+                query_obj = _zim_ops_mod.Query().set_query(query)
+                search = _zim_ops_mod.Searcher(archive).search(query_obj)
+                return search, search.getEstimatedMatches()
+
+        # Resume the ranked list an earlier page of this query left in the
+        # session cache, so a cursor hop slices held ids instead of re-running
+        # Xapian. The key carries the archive's stat token as well as its
+        # path, so an archive replaced in place starts a fresh session.
+        # Test-only callers (no ``validated_path``, or a stub ``self``)
+        # search directly.
+        sessions = getattr(self, "search_sessions", None)
+        session_key: Optional[Tuple[str, str, str]] = None
+        if validated_path is not None and sessions is not None and sessions.enabled:
+            from openzim_mcp.bundle import archive_stat_token
+
+            session_key = (
+                str(validated_path),
+                archive_stat_token(validated_path),
+                query,
+            )
+        if sessions is not None and session_key is not None:
+            hits = sessions.open(
+                session_key, page_size=limit, start_search=_start_search
+            )
+            search: Any = hits
+            total_results = hits.total
+        else:
+            search, total_results = _start_search()
 
         if total_results == 0 or offset >= total_results:
             return self._empty_search_page(
@@ -899,6 +946,9 @@ class _SearchMixin:
             validated_path=validated_path,
         )
 
+        if sessions is not None and session_key is not None:
+            sessions.save(session_key, search)
+
         returned_count = len(results)
         last_index = offset + consumed
         done = last_index >= total_results or exhausted
@@ -1018,7 +1068,8 @@ class _SearchMixin:
             want = min(limit - len(results), total_results - offset - consumed)
             if want <= 0:
                 break
-            batch = list(search.getResults(offset + consumed, want))
+            with span("xapian"):
+                batch = list(search.getResults(offset + consumed, want))
             if len(batch) < want:
                 exhausted = True
             for entry_id in batch:
@@ -1959,10 +2010,11 @@ class _SearchMixin:
         if namespace:
             namespace = self._canonicalise_namespace(namespace.strip())
 
-        query_obj = _zim_ops_mod.Query().set_query(query)
-        searcher = _zim_ops_mod.Searcher(archive)
-        search = searcher.search(query_obj)
-        total_results = search.getEstimatedMatches()
+        with span("xapian"):
+            query_obj = _zim_ops_mod.Query().set_query(query)
+            searcher = _zim_ops_mod.Searcher(archive)
+            search = searcher.search(query_obj)
+            total_results = search.getEstimatedMatches()
         if total_results == 0:
             return [], _FilteredScanState(
                 filtered_count=0,
@@ -2040,10 +2092,11 @@ class _SearchMixin:
         if namespace:
             namespace = self._canonicalise_namespace(namespace.strip())
 
-        query_obj = _zim_ops_mod.Query().set_query(query)
-        searcher = _zim_ops_mod.Searcher(archive)
-        search = searcher.search(query_obj)
-        total_results = search.getEstimatedMatches()
+        with span("xapian"):
+            query_obj = _zim_ops_mod.Query().set_query(query)
+            searcher = _zim_ops_mod.Searcher(archive)
+            search = searcher.search(query_obj)
+            total_results = search.getEstimatedMatches()
         if total_results == 0:
             return f'No search results found for "{echo_query}"', 0
 
@@ -2128,7 +2181,8 @@ class _SearchMixin:
             batch_end = min(
                 batch_start + _FILTERED_BATCH_SIZE, total_results, _FILTERED_MAX_SCAN
             )
-            batch = list(search.getResults(batch_start, batch_end - batch_start))
+            with span("xapian"):
+                batch = list(search.getResults(batch_start, batch_end - batch_start))
             scanned = batch_end
             if not batch:
                 break
@@ -2802,15 +2856,16 @@ class _SearchMixin:
           B. Shortest-prefix-title: scan all results and pick the
              shortest title that starts with the partial.
 
+        With a title-index sidecar both strategies give way to one range
+        scan of the sorted titles (``_canonical_via_title_index``): the
+        index sees every title with the prefix, not the ~25 the suggestion
+        probe surfaces, so it is authoritative when present.
+
         Returns ``None`` when neither resolves.
         """
         partial_clean = (partial_query or "").strip()
         if not partial_clean or len(partial_clean) < 2:
             return None
-        if result_paths is None:
-            result_paths = self._probe_suggestion_paths(archive, partial_clean)
-        if not result_paths:
-            return None
 
         partial_lower = partial_clean.lower()
         existing_paths = {
@@ -2822,6 +2877,16 @@ class _SearchMixin:
             if isinstance(e.get("text"), str)
         }
 
+        index = self._title_index_for(archive)
+        if index is not None:
+            return self._canonical_via_title_index(
+                index, partial_clean, existing_paths, existing_titles
+            )
+        if result_paths is None:
+            result_paths = self._probe_suggestion_paths(archive, partial_clean)
+        if not result_paths:
+            return None
+
         canonical = self._canonical_via_disambiguator_strip(
             archive,
             result_paths,
@@ -2839,6 +2904,41 @@ class _SearchMixin:
             existing_titles,
         )
 
+    # Keys examined by the sidecar's canonical-prefix scan. A short partial
+    # ("ph") can prefix hundreds of thousands of titles; the canonical is
+    # among the first few hundred in key order in practice, because a bare
+    # title sorts ahead of every longer title extending it.
+    _TITLE_INDEX_PREFIX_SCAN = 256
+
+    @staticmethod
+    def _canonical_via_title_index(
+        index: TitleIndexReader,
+        partial_clean: str,
+        existing_paths: set,
+        existing_titles: set,
+    ) -> Optional[Dict[str, str]]:
+        """Sidecar Strategy: the shortest indexed title with this prefix.
+
+        Redirect rows are skipped (their key is the redirect's spelling, not
+        the article's title). As in Strategy B, a shortest title already on
+        the page means there is no canonical gap to fill.
+        """
+        best: Optional[TitleMatch] = None
+        for _key, match in index.prefix(
+            partial_clean, limit=_SearchMixin._TITLE_INDEX_PREFIX_SCAN
+        ):
+            if match.is_redirect or not match.title:
+                continue
+            if _is_pseudo_namespace_entry(match.path, match.title, extended=True):
+                continue
+            if best is None or len(match.title) < len(best.title):
+                best = match
+        if best is None:
+            return None
+        if best.path in existing_paths or best.title.lower() in existing_titles:
+            return None
+        return {"text": best.title, "path": best.path, "type": "title_start_match"}
+
     @staticmethod
     def _probe_suggestion_paths(archive: Archive, partial_clean: str) -> List[str]:
         """Run a SuggestionSearcher probe and return result paths.
@@ -3175,6 +3275,10 @@ class _SearchMixin:
         # sweep that resolves every variant through the exact probes never
         # pays for it.
         title_index: Optional[Any] = None
+        # With a title-index sidecar each variant is a binary search (plus
+        # one entry read on a hit) instead of up to 11 libzim probes and a
+        # suggestion query, so the sweep costs microseconds per miss.
+        sidecar = self._title_index_for(archive)
         for variant in self._typo_variants(title):
             # Stop once the extra-probe budget after the first hit is spent,
             # or earlier if the best entry is already canonical and the
@@ -3191,13 +3295,16 @@ class _SearchMixin:
                 extra_probes += 1
 
             try:
-                entry = self._find_entry_fast_path(archive, variant)
-                if entry is None:
-                    if title_index is None:
-                        title_index = _zim_ops_mod.SuggestionSearcher(archive)
-                    entry = self._verify_variant_via_title_index(
-                        archive, variant, searcher=title_index
-                    )
+                if sidecar is not None:
+                    entry = self._title_index_entry(archive, sidecar, variant)
+                else:
+                    entry = self._find_entry_fast_path(archive, variant)
+                    if entry is None:
+                        if title_index is None:
+                            title_index = _zim_ops_mod.SuggestionSearcher(archive)
+                        entry = self._verify_variant_via_title_index(
+                            archive, variant, searcher=title_index
+                        )
             except Exception:  # nosec B112 - a variant that raises did not resolve
                 continue
             if entry is None:
@@ -3271,6 +3378,77 @@ class _SearchMixin:
                 return entry
         return None
 
+    @staticmethod
+    def _title_index_for(archive: Any) -> Optional[TitleIndexReader]:
+        """Return the archive's title-index sidecar reader, or ``None``.
+
+        ``None`` when no sidecar was built or it is stale (schema version or
+        archive UUID mismatch) — callers then keep their libzim probes.
+        """
+        try:
+            filename = archive.filename
+            live_uuid = str(archive.uuid)
+        except Exception:
+            return None
+        if not isinstance(filename, (str, Path)):
+            return None
+        return open_title_index(filename, live_archive_uuid=live_uuid)
+
+    @staticmethod
+    def _pick_title_match(
+        matches: List[TitleMatch], title: str
+    ) -> Optional[TitleMatch]:
+        """Choose among the index rows sharing ``title``'s folded key.
+
+        Folding merges titles libzim keeps apart (``Apple`` and ``APPLE``).
+        Rank them the way ``_find_entry_fast_path`` orders its case variants
+        (as typed, capitalized, title case, lower, upper), then prefer an
+        article's own title over a redirect to it.
+        """
+        if not matches:
+            return None
+        spelled = " ".join(title.replace("_", " ").split())
+        variants = [
+            spelled,
+            spelled.capitalize(),
+            spelled.title(),
+            spelled.lower(),
+            spelled.upper(),
+        ]
+
+        def _rank(match: TitleMatch) -> Tuple[int, bool]:
+            try:
+                position = variants.index(match.title)
+            except ValueError:
+                position = len(variants)
+            return position, match.is_redirect
+
+        return min(matches, key=_rank)
+
+    def _title_index_entry(
+        self, archive: Any, index: TitleIndexReader, variant: str
+    ) -> Optional[Any]:
+        """Resolve a typo ``variant`` through the title-index sidecar.
+
+        The sidecar counterpart of ``_find_entry_fast_path`` followed by
+        ``_verify_variant_via_title_index``: an exact folded-title match,
+        else the first of the next few keys that starts with the variant as
+        a whole word (the site-suffixed ``Diabetes | MedlinePlus`` case).
+        Returns the pre-redirect Entry; the caller walks the chain.
+        """
+        match = self._pick_title_match(index.lookup(variant), variant)
+        if match is None:
+            wanted = fold_title(variant)
+            for key, candidate in index.prefix(
+                variant, limit=self._TYPO_VERIFY_SUGGESTION_ROWS
+            ):
+                if _starts_with_whole_word(key, wanted):
+                    match = candidate
+                    break
+        if match is None:
+            return None
+        return archive.get_entry_by_path(match.source_path)
+
     @staticmethod
     def _follow_redirect_chain(entry: Any) -> Any:
         """Best-effort redirect walk — thin wrapper over the shared helper.
@@ -3301,6 +3479,23 @@ class _SearchMixin:
         The caller owns the loop control flow (break/continue) and the
         ``fast_path_hit`` flag.
         """
+        # A title-index sidecar answers every spelling the archive knows
+        # (case-, accent- and redirect-folded) with one binary search. Its
+        # miss still falls through to the libzim probes: the index holds
+        # titles, and the path variants below can reach an entry filed
+        # under a path its title does not spell.
+        index = self._title_index_for(archive)
+        if index is not None:
+            match = self._pick_title_match(index.lookup(title), title)
+            if match is not None:
+                return {
+                    "path": match.path,
+                    "title": match.title or title,
+                    "score": 1.0,
+                    "zim_file": file_path,
+                    "match_type": "redirect" if match.is_redirect else "direct",
+                    "pre_redirect_path": match.source_path,
+                }
         fast_hit_entry = self._find_entry_fast_path(archive, title)
         if fast_hit_entry is None:
             return None
@@ -3976,69 +4171,22 @@ class _SearchMixin:
             )
 
         files = self.list_zim_files_data()
-        per_file: List[Dict[str, Any]] = []
-        # H22: aggregate wall-clock budget across the fan-out.
-        # ``0`` disables.
+        # H22: aggregate wall-clock budget across the fan-out. ``0`` lifts
+        # it, but never past the hard ceiling.
         import time as _time
 
+        from openzim_mcp.defaults import SEARCH
+
+        search_cfg = getattr(self.config, "search", None)
         total_timeout = float(
-            getattr(
-                getattr(self.config, "search", None),
-                "search_all_total_timeout_seconds",
-                0.0,
-            )
-            or 0.0
+            getattr(search_cfg, "search_all_total_timeout_seconds", 0.0) or 0.0
+        )
+        ceiling = SEARCH.SEARCH_ALL_MAX_WAIT_SECONDS
+        budget = min(total_timeout, ceiling) if total_timeout > 0 else ceiling
+        deadline = _time.monotonic() + budget
+        per_file, budget_exceeded = self._fan_out_search_all(
+            files, query, limit_per_file, deadline
         )
-        deadline = _time.monotonic() + total_timeout if total_timeout > 0 else None
-        budget_exceeded = False
-        for file_info in files:
-            path = file_info.get("path")
-            if not path:
-                continue
-            # Stop iterating once the aggregate budget is gone — the threadpool
-            # slot frees instead of blocking on another full Xapian search.
-            if deadline is not None and _time.monotonic() >= deadline:
-                budget_exceeded = True
-                break
-            try:
-                payload = self.search_zim_file_data(path, query, limit_per_file, 0)
-                _total = payload.get("total", 0) or 0
-                per_file.append(
-                    {
-                        "zim_file_path": path,
-                        "name": file_info.get("name"),
-                        "result": payload,
-                        "has_hits": _total > 0,
-                        # H14: success entries carry ``error=False`` so the
-                        # per-file row is shape-stable across success and
-                        # failure. The legacy contract stuffed a
-                        # ``ToolErrorPayload`` into ``result`` for failures,
-                        # making ``results[].result`` heterogeneous —
-                        # sometimes a SearchResponse, sometimes an error
-                        # envelope. Splitting the error into a sibling key
-                        # keeps ``result`` a single TypedDict shape and gives
-                        # small models a single boolean to branch on.
-                        "error": False,
-                    }
-                )
-            except Exception as e:
-                logger.debug(f"search_all: skipped {path}: {e}")
-                per_file.append(
-                    {
-                        "zim_file_path": path,
-                        "name": file_info.get("name"),
-                        "has_hits": False,
-                        # H14: failure entries carry ``error=True`` plus an
-                        # ``error_message`` / ``error_operation`` for context.
-                        # ``result`` is None so the TypedDict shape stays
-                        # uniform; callers branch on ``error`` instead of
-                        # type-sniffing ``result``.
-                        "result": None,
-                        "error": True,
-                        "error_operation": "search_zim_file",
-                        "error_message": str(e),
-                    }
-                )
 
         files_searched = len(files)
         # H22: when the budget cut iteration short, ``done=True`` would
@@ -4077,6 +4225,151 @@ class _SearchMixin:
             ),
         )
 
+    def _fan_out_search_all(
+        self,
+        files: List[Dict[str, Any]],
+        query: str,
+        limit_per_file: int,
+        deadline: Optional[float],
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Search every archive concurrently; return rows in archive order.
+
+        Up to ``search_all_max_concurrency`` archives are in flight at once
+        on the dedicated ``fanout`` pool, so wall time approaches the slowest
+        single archive instead of the sum of all of them. Two deadlines
+        apply:
+
+        * per archive — a leg unfinished
+          ``search_all_per_archive_timeout_seconds`` after it was submitted
+          is abandoned and reported as a failed row, freeing its concurrency
+          slot for the next archive. Timing from submission rather than from
+          start means a leg stuck in the pool queue behind another call's
+          abandoned legs times out too;
+        * aggregate — once ``deadline`` passes, queued legs are cancelled,
+          running ones are abandoned, and the partial result is returned
+          with ``budget_exceeded=True``. Archives that never finished are
+          omitted, exactly as the serial loop omitted the ones it never
+          reached.
+
+        An abandoned leg keeps running on its daemon worker until libzim
+        returns (Python threads can't be interrupted); the caller just stops
+        waiting for it. Rows are re-sorted by archive-list position, so the
+        output order never depends on which archive happened to finish
+        first.
+        """
+        import contextvars
+        import functools
+        import time as _time
+        from collections import deque
+        from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+        from openzim_mcp.timeout_utils import submit_to_pool
+
+        search_cfg = getattr(self.config, "search", None)
+        concurrency = int(getattr(search_cfg, "search_all_max_concurrency", 1) or 1)
+        leg_timeout = float(
+            getattr(search_cfg, "search_all_per_archive_timeout_seconds", 0.0) or 0.0
+        )
+
+        queue = deque(
+            (index, file_info)
+            for index, file_info in enumerate(files)
+            if file_info.get("path")
+        )
+        rows: Dict[int, Dict[str, Any]] = {}
+        pending: Dict["Future[Dict[str, Any]]", int] = {}
+        submitted: Dict[int, float] = {}
+        budget_exceeded = False
+
+        while queue or pending:
+            # Checked before launching more work, as the serial loop checked
+            # before each archive.
+            if deadline is not None and _time.monotonic() >= deadline:
+                budget_exceeded = True
+                break
+            while queue and len(pending) < concurrency:
+                index, file_info = queue.popleft()
+                # Legs run on pool threads; carry the request's contextvars
+                # (client id for rate-limit buckets) across with them.
+                ctx = contextvars.copy_context()
+                future = submit_to_pool(
+                    "fanout",
+                    functools.partial(
+                        ctx.run,
+                        self._search_all_row,
+                        file_info,
+                        query,
+                        limit_per_file,
+                    ),
+                )
+                pending[future] = index
+                submitted[index] = _time.monotonic()
+
+            now = _time.monotonic()
+            waits = [deadline - now] if deadline is not None else []
+            if leg_timeout > 0:
+                waits.extend(submitted[i] + leg_timeout - now for i in pending.values())
+            timeout = max(0.0, min(waits)) if waits else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    rows[index] = future.result()
+                except Exception as e:  # leg() already converts search errors
+                    rows[index] = _search_all_error_row(files[index], str(e))
+
+            if leg_timeout > 0:
+                now = _time.monotonic()
+                for future, index in list(pending.items()):
+                    began = submitted[index]
+                    if now - began < leg_timeout:
+                        continue
+                    future.cancel()
+                    del pending[future]
+                    path = files[index].get("path")
+                    logger.warning(
+                        "search_all: abandoned %s after %.1fs (per-archive timeout)",
+                        path,
+                        now - began,
+                    )
+                    rows[index] = _search_all_error_row(
+                        files[index],
+                        f"Search timed out after {leg_timeout:g}s",
+                    )
+
+        for future in pending:
+            # Still-queued legs are discarded; running ones finish unobserved.
+            future.cancel()
+        return [rows[index] for index in sorted(rows)], budget_exceeded
+
+    def _search_all_row(
+        self, file_info: Dict[str, Any], query: str, limit_per_file: int
+    ) -> Dict[str, Any]:
+        """Search one archive for ``search_all``; failures become error rows."""
+        path = file_info.get("path")
+        if not isinstance(path, str) or not path:
+            return _search_all_error_row(file_info, "Archive listing has no path")
+        try:
+            payload = self.search_zim_file_data(path, query, limit_per_file, 0)
+        except Exception as e:
+            logger.debug(f"search_all: skipped {path}: {e}")
+            return _search_all_error_row(file_info, str(e))
+        _total = payload.get("total", 0) or 0
+        return {
+            "zim_file_path": path,
+            "name": file_info.get("name"),
+            "result": payload,
+            "has_hits": _total > 0,
+            # H14: success entries carry ``error=False`` so the per-file row
+            # is shape-stable across success and failure. The legacy contract
+            # stuffed a ``ToolErrorPayload`` into ``result`` for failures,
+            # making ``results[].result`` heterogeneous — sometimes a
+            # SearchResponse, sometimes an error envelope. Splitting the error
+            # into a sibling key keeps ``result`` a single TypedDict shape and
+            # gives small models a single boolean to branch on.
+            "error": False,
+        }
+
     def search_all(
         self,
         query: str,
@@ -4129,10 +4422,11 @@ class _SearchMixin:
         the synthesize hot path re-renders the same entries the EntryBundle
         already rendered (the snippet-vs-bundle double render M31 targeted).
         """
-        query_obj = _zim_ops_mod.Query().set_query(query)
-        searcher = _zim_ops_mod.Searcher(archive)
-        search = searcher.search(query_obj)
-        total_results = search.getEstimatedMatches()
+        with span("xapian"):
+            query_obj = _zim_ops_mod.Query().set_query(query)
+            searcher = _zim_ops_mod.Searcher(archive)
+            search = searcher.search(query_obj)
+            total_results = search.getEstimatedMatches()
         if total_results == 0:
             return []
         result_count = min(k, total_results)
@@ -0,0 +1,235 @@
+"""Short-lived cache of ranked full-text hit lists, for cursor pagination.
+
+Every ``search_zim_file`` page used to rebuild the Xapian ``Query`` and
+``Searcher`` and re-run ``searcher.search()``, so walking ten pages of one
+query ranked the same result set ten times (and each ``getResults`` past
+the first page makes Xapian compute the whole top ``offset + limit``
+again). A *session* keeps the ranked entry paths one search produced, keyed
+by archive identity and query string, so the next cursor hop slices them
+in O(page) and only goes back to Xapian when it runs past what is held.
+
+Sessions are bounded twice: a sliding TTL (a session a client stopped
+paging through lapses quickly) and a cap on the total number of ids held
+across all sessions, enforced by dropping the least recently used session.
+Counters surface through ``zim_health`` under ``search_sessions``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+__all__ = ["RankedHits", "SearchSessionCache"]
+
+# How many pages past the one being served a miss materialises. Xapian
+# computes the full top ``start + count`` for any ``getResults`` call, so
+# fetching a few pages ahead costs little more than fetching one and turns
+# the next few cursor hops into pure slices.
+PREFETCH_PAGES = 4
+
+
+@dataclass
+class _Session:
+    """One query's ranked ids plus what is known about the rest."""
+
+    ids: Tuple[str, ...]
+    total: int
+    complete: bool
+    expires_at: float
+
+
+class RankedHits:
+    """``Search``-compatible ``getResults`` view over a session's ids.
+
+    ``_collect_distinct_hits`` only ever calls ``getResults(start, count)``,
+    so it runs unchanged on top of this view. Reads inside the held ids are
+    slices; a read past them calls ``run_search`` once (lazily — a resumed
+    page that stays inside the held ids never touches Xapian) and extends
+    the ids by the request plus ``prefetch`` rows.
+    """
+
+    def __init__(
+        self,
+        ids: Tuple[str, ...],
+        *,
+        total: int,
+        complete: bool,
+        run_search: Callable[[], Any],
+        prefetch: int,
+        search: Any = None,
+    ) -> None:
+        """Wrap held ``ids``; ``search`` is an already-run live search, if any.
+
+        A view built without ``search`` is *resumed* from a held session.
+        """
+        self.ids = ids
+        self.total = total
+        self.complete = complete
+        self.resumed = search is None
+        self.extended = False
+        self._run_search = run_search
+        self._prefetch = max(0, prefetch)
+        self._search = search
+
+    def getResults(self, start: int, count: int) -> List[str]:  # noqa: N802
+        """Return up to ``count`` ranked entry paths from ``start``."""
+        end = start + count
+        if end > len(self.ids) and not self.complete:
+            self._extend(end)
+        return list(self.ids[start:end])
+
+    def _extend(self, end: int) -> None:
+        if self._search is None:
+            self._search = self._run_search()
+        held = len(self.ids)
+        want = min(end + self._prefetch, self.total) - held
+        if want <= 0:
+            return
+        batch = tuple(str(p) for p in self._search.getResults(held, want))
+        # The tuple is rebuilt rather than appended to: the session another
+        # thread may be slicing keeps its own, unchanged, tuple.
+        self.ids = self.ids + batch
+        self.extended = True
+        if len(batch) < want or len(self.ids) >= self.total:
+            self.complete = True
+
+
+class SearchSessionCache:
+    """Thread-safe LRU of ranked-id sessions with a sliding TTL.
+
+    ``ttl_seconds`` or ``max_ids`` of ``0`` disables the cache: the caller
+    skips ``open`` and searches directly, and ``save`` is a no-op — the
+    pre-session behaviour of re-running every page.
+    """
+
+    def __init__(self, ttl_seconds: float, max_ids: int) -> None:
+        """Create an empty cache with the given TTL and id budget."""
+        self._ttl = float(ttl_seconds)
+        self._max_ids = max(0, int(max_ids))
+        self._sessions: "OrderedDict[Hashable, _Session]" = OrderedDict()
+        self._ids_held = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+        self._extensions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether sessions are kept at all."""
+        return self._ttl > 0 and self._max_ids > 0
+
+    def open(
+        self,
+        key: Hashable,
+        *,
+        page_size: int,
+        start_search: Callable[[], Tuple[Any, int]],
+    ) -> RankedHits:
+        """Return a ranked view for ``key``, resuming a held session if any.
+
+        ``start_search`` runs the query and returns ``(search, estimated
+        total)``. On a miss it runs immediately (the caller needs the total
+        before paging); on a hit it runs only if the page reads past the
+        held ids.
+        """
+        prefetch = page_size * PREFETCH_PAGES
+        session = self._lookup(key)
+        if session is not None:
+            return RankedHits(
+                session.ids,
+                total=session.total,
+                complete=session.complete,
+                run_search=lambda: start_search()[0],
+                prefetch=prefetch,
+            )
+        search, total = start_search()
+        return RankedHits(
+            (),
+            total=total,
+            complete=total <= 0,
+            run_search=lambda: search,
+            prefetch=prefetch,
+            search=search,
+        )
+
+    def _lookup(self, key: Hashable) -> Optional[_Session]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None and session.expires_at <= now:
+                self._drop_locked(key)
+                self._expired += 1
+                session = None
+            if session is None:
+                self._misses += 1
+                return None
+            session.expires_at = now + self._ttl
+            self._sessions.move_to_end(key)
+            self._hits += 1
+            return session
+
+    def save(self, key: Hashable, view: RankedHits) -> None:
+        """Keep ``view``'s ids for the next page of ``key``.
+
+        A resumed view that never left its held ids changed nothing and is
+        not written back. A session larger than the whole budget keeps only
+        its first ``max_ids`` ids (the prefix every early page reads).
+        """
+        if not self.enabled or (view.resumed and not view.extended):
+            return
+        ids = view.ids
+        complete = view.complete
+        if len(ids) > self._max_ids:
+            ids = ids[: self._max_ids]
+            complete = False
+        with self._lock:
+            if view.resumed:
+                self._extensions += 1
+            self._drop_locked(key)
+            self._sessions[key] = _Session(
+                ids=ids,
+                total=view.total,
+                complete=complete,
+                expires_at=time.monotonic() + self._ttl,
+            )
+            self._ids_held += len(ids)
+            while self._ids_held > self._max_ids and len(self._sessions) > 1:
+                oldest = next(iter(self._sessions))
+                self._drop_locked(oldest)
+                self._evicted += 1
+
+    def _drop_locked(self, key: Hashable) -> None:
+        session = self._sessions.pop(key, None)
+        if session is not None:
+            self._ids_held -= len(session.ids)
+
+    def clear(self) -> None:
+        """Drop every session (counters are kept)."""
+        with self._lock:
+            self._sessions.clear()
+            self._ids_held = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "sessions": len(self._sessions),
+                "ids_held": self._ids_held,
+                "max_ids": self._max_ids,
+                "ttl_seconds": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "expired": self._expired,
+                "evicted": self._evicted,
+                "extensions": self._extensions,
+            }
@@ -20,6 +20,7 @@ from typing import (
     List,
     NamedTuple,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -37,7 +38,7 @@ from openzim_mcp.exceptions import (
     OpenZimMcpValidationError,
 )
 from openzim_mcp.meta import attach_meta
-from openzim_mcp.pagination import Cursor
+from openzim_mcp.pagination import Cursor, is_inbound_keyset
 from openzim_mcp.responses import ToolErrorPayload, tool_error
 from openzim_mcp.zim._ops_base import _json
 from openzim_mcp.zim.content import _strip_markdown_links_shared, reject_path_traversal
@@ -300,6 +301,7 @@ class _StructureMixin:
         *,
         validated_path: Path,
         compact: bool = True,
+        view: bool = False,
     ) -> Any:
         """``get_or_build_bundle`` with the libzim miss surfaced as not-found.
 
@@ -309,11 +311,17 @@ class _StructureMixin:
         Converting it here, at the single place the lookup happens, keeps
         all four surfaces on the same not-found classification as
         ``zim_get``.
+
+        ``view=True`` returns ``get_or_build_bundle_view`` instead, for
+        consumers that slice the markdown through ``bundle_text`` or never
+        read it: under the sectioned cache layout they then load only the
+        header and the chunks they touch.
         """
-        from openzim_mcp.bundle import get_or_build_bundle
+        from openzim_mcp.bundle import get_or_build_bundle, get_or_build_bundle_view
 
+        accessor = get_or_build_bundle_view if view else get_or_build_bundle
         try:
-            return get_or_build_bundle(
+            return accessor(
                 archive,
                 entry_path,
                 cache=self.cache,
@@ -660,7 +668,7 @@ class _StructureMixin:
         try:
             with _zim_ops_mod.zim_archive(validated_path) as archive:
                 bundle = self._build_bundle(
-                    archive, entry_path, validated_path=validated_path
+                    archive, entry_path, validated_path=validated_path, view=True
                 )
                 buckets = self._bucket_outbound_links(bundle)
                 all_links_for_kind = buckets.for_kind(kind)
@@ -849,7 +857,7 @@ class _StructureMixin:
 
         try:
             bundle = self._build_bundle(
-                archive, entry_path, validated_path=validated_path
+                archive, entry_path, validated_path=validated_path, view=True
             )
 
             payload: "TableOfContentsResponse" = cast(
@@ -955,7 +963,11 @@ class _StructureMixin:
         Returns a ToolErrorPayload if the section_id is not found in the bundle.
         """
         bundle = self._build_bundle(
-            archive, entry_path, validated_path=validated_path, compact=compact
+            archive,
+            entry_path,
+            validated_path=validated_path,
+            compact=compact,
+            view=True,
         )
 
         section_idx = next(
@@ -1112,7 +1124,9 @@ class _StructureMixin:
                 narrow_widened = True
             else:
                 char_end = narrowed_end
-        full_body = bundle["rendered_markdown"][section["char_start"] : char_end]
+        from openzim_mcp.bundle import bundle_text
+
+        full_body = bundle_text(bundle).slice(section["char_start"], char_end)
         # ``compact=True`` promises the ``zim_get(compact=True)`` slice shape.
         # The bundle's compact rendering carries the table placeholders but
         # not the link strip — ``zim_get`` applies that in the content layer
@@ -1133,6 +1147,28 @@ class _StructureMixin:
         full_len = len(full_body)
         truncated = full_len > cap
         body = full_body[:cap] if truncated else full_body
+        # An untruncated body is exactly a run of cached per-section token
+        # counts, so ``_meta.tokens_est`` sums those instead of encoding it.
+        # Without a cache the counts would be rebuilt — a whole-article
+        # encode — on every call, so the body is counted directly instead.
+        token_counts: Optional[Dict[str, int]] = None
+        if not truncated and self.config.cache.enabled:
+            from openzim_mcp.bundle import get_or_build_section_tokens, slice_tokens
+
+            counts = get_or_build_section_tokens(
+                bundle,
+                cache=self.cache,
+                validated_path=validated_path,
+                compact=compact,
+                render=_strip_markdown_links_shared if compact else str,
+            )
+            known = (
+                slice_tokens(counts, section["char_start"], char_end)
+                if counts is not None
+                else None
+            )
+            if known is not None:
+                token_counts = {"content_markdown": known}
 
         payload: "GetSectionResponse" = cast(
             "GetSectionResponse",
@@ -1168,6 +1204,7 @@ class _StructureMixin:
                 cast(Dict[str, Any], payload),
                 truncated=truncated,
                 total_chars=full_len if truncated else None,
+                token_counts=token_counts,
             ),
         )
 
@@ -1260,6 +1297,14 @@ class _StructureMixin:
           looking up ``path`` in the archive). Falls back to ``path`` when
           the entry is missing or the lookup fails.
         - ``link_text``: the original anchor text from the source article.
+
+        When the archive has a current link-graph sidecar carrying the
+        outbound tables, the answer comes from it instead
+        (``_related_from_link_graph``): no bundle, no HTML parse, no archive
+        lookup per row, and no 500-link sample cap. Rows are then ranked by
+        the edge's co-citation + coupling scores, which they carry as
+        ``cocitation`` / ``coupling``, in place of ``mention_count``; the
+        payload says which ranking it used as ``ranking``.
         """
         if limit < 1 or limit > 100:
             raise OpenZimMcpValidationError(
@@ -1277,6 +1322,10 @@ class _StructureMixin:
         validated_path = self._validate_zim_path(zim_file_path)
         validated_str = str(validated_path)
 
+        from_graph = self._related_from_link_graph(validated_str, entry_path, limit)
+        if from_graph is not None:
+            return from_graph
+
         outbound: List[Dict[str, Any]] = []
         outbound_error: Optional[str] = None
         links_scan_truncated = False
@@ -1399,6 +1448,7 @@ class _StructureMixin:
                 "limit": limit,
                 "returned_count": len(outbound),
             },
+            "ranking": "mention_count",
         }
         if outbound_error is not None:
             payload["outbound_error"] = outbound_error
@@ -1414,6 +1464,63 @@ class _StructureMixin:
         meta_reason = "scan_truncated" if links_scan_truncated else None
         return cast("RelatedArticlesResponse", attach_meta(payload, reason=meta_reason))
 
+    def _related_from_link_graph(
+        self, zim_file_path: str, entry_path: str, limit: int
+    ) -> "Optional[RelatedArticlesResponse]":
+        """Answer ``get_related_articles`` from the link-graph sidecar, if able.
+
+        One archive open (for the fingerprint and to canonicalize a redirect
+        spelling of ``entry_path``, exactly as the inbound direction does)
+        and one indexed query against the shared reader; titles come from
+        the sidecar. ``None`` — parse the article as before — when there is
+        no sidecar, it is stale or predates the outbound tables, or the
+        entry is unknown to either side (the parse path owns the not-found
+        reporting).
+        """
+        from openzim_mcp.linkgraph.reader import open_cached, sidecar_path_for
+
+        # The common no-sidecar case costs one stat, not an archive open.
+        if not Path(sidecar_path_for(zim_file_path)).is_file():
+            return None
+        try:
+            with _zim_ops_mod.zim_archive(Path(zim_file_path)) as archive:
+                live_uuid = str(archive.uuid)
+                entry, _spelling = _resolve_entry_spelling(archive, entry_path)
+                if entry is None:
+                    return None
+                source = _StructureMixin._canonical_target_path(archive, entry_path)
+        except OpenZimMcpArchiveError:
+            return None
+        reader = open_cached(zim_file_path, live_archive_uuid=live_uuid)
+        page = reader.query_related(source, limit=limit) if reader else None
+        if page is None:
+            return None
+        results: List[Dict[str, Any]] = [
+            {
+                "path": r["path"],
+                "title": r["title"],
+                "link_text": r["anchor_text"],
+                "cocitation": r["cocitation"],
+                "coupling": r["coupling"],
+            }
+            for r in page.rows
+            if r["path"] not in (entry_path, source)
+        ]
+        payload: Dict[str, Any] = {
+            "entry_path": entry_path,
+            "results": results,
+            "next_cursor": None,
+            "total": len(results),
+            "done": True,
+            "page_info": {
+                "offset": 0,
+                "limit": limit,
+                "returned_count": len(results),
+            },
+            "ranking": "link_graph",
+        }
+        return cast("RelatedArticlesResponse", attach_meta(payload, reason=None))
+
     def get_inbound_links_data(
         self,
         zim_file_path: str,
@@ -1422,6 +1529,7 @@ class _StructureMixin:
         offset: int = 0,
         *,
         cursor_archive_identity: Optional[str] = None,
+        after: Optional[Sequence[Any]] = None,
     ) -> "RelatedArticlesResponse":
         """Return the inbound linkers for ``entry_path`` from the sidecar.
 
@@ -1445,6 +1553,12 @@ class _StructureMixin:
         the search/get tools already use. The caller's spelling is echoed
         as ``entry_path`` (cursor ``ep`` matching relies on it); the
         canonical one is reported as ``resolved_path`` when it differs.
+
+        ``after`` is the cursor's ``ka`` — the ``(inbound_degree, path)`` of
+        the previous page's last row. When present the page is read by
+        keyset from that row instead of by ``offset``, so a deep page of a
+        hub article's linkers costs the same as the first; ``offset`` then
+        only feeds ``page_info`` and the next cursor.
         """
         if limit < 1 or limit > 100:
             raise OpenZimMcpValidationError(
@@ -1458,10 +1572,8 @@ class _StructureMixin:
         validated_path = self._validate_zim_path(zim_file_path)
         validated_str = str(validated_path)
 
-        from openzim_mcp.linkgraph.reader import (
-            LinkGraphReader,
-            LinkGraphUnavailable,
-        )
+        from openzim_mcp.linkgraph.reader import LinkGraphUnavailable
+        from openzim_mcp.linkgraph.reader import open_cached as open_link_graph
         from openzim_mcp.pagination import archive_identity
 
         # Cursor integrity: an inbound cursor issued for archive A must not
@@ -1488,7 +1600,9 @@ class _StructureMixin:
             # this method through a stub ``self`` exposing only the seams it
             # already needed.
             lookup_path = _StructureMixin._canonical_target_path(archive, entry_path)
-        reader = LinkGraphReader.open_for(validated_str, live_archive_uuid=live_uuid)
+        # Shared, process-wide reader: pooled connections that stay open
+        # across requests (never closed here).
+        reader = open_link_graph(validated_str, live_archive_uuid=live_uuid)
         if reader is None:
             raise LinkGraphUnavailable(
                 "Inbound links require a link-graph sidecar for this archive. "
@@ -1498,10 +1612,18 @@ class _StructureMixin:
                 "makes true of every sidecar built before it — and the build "
                 "refuses to overwrite without `--force`."
             )
-        try:
-            page = reader.query_inbound(lookup_path, limit=limit, offset=offset)
-        finally:
-            reader.close()
+        keyset: Optional[Tuple[int, str]] = None
+        if after is not None:
+            if not is_inbound_keyset(after):
+                raise OpenZimMcpValidationError(
+                    "The cursor's `ka` resume point is not an "
+                    "[inbound_degree, path] pair. Drop the cursor and call "
+                    "again with an explicit `offset`."
+                )
+            keyset = (int(after[0]), str(after[1]))
+        page = reader.query_inbound(
+            lookup_path, limit=limit, offset=offset, after=keyset
+        )
 
         # Not-found is decided AFTER the query, on both sources: the builder
         # deliberately keeps edges whose target the archive cannot verify
@@ -1535,6 +1657,7 @@ class _StructureMixin:
                     "l": limit,
                     "ep": entry_path,
                     "ai": archive_identity(validated_path),
+                    "ka": [page.rows[-1]["inbound_degree"], page.rows[-1]["path"]],
                 },
             )
         payload: Dict[str, Any] = {
@@ -43,6 +43,20 @@ def test_build_inverts_and_computes_degree(tmp_path: Path) -> None:
     conn.close()
 
 
+def test_build_assigns_node_ids_in_rank_order(tmp_path: Path) -> None:
+    """Node ids follow (inbound_degree desc, path asc) and no staging remains."""
+    archive = tmp_path / "x.zim"
+    out = sidecar_path_for(archive)
+    build_from_link_stream(out, archive_uuid="u1", link_stream=_stream())
+    conn = sqlite3.connect(out)
+    nodes = conn.execute("SELECT id, path, inbound_degree FROM nodes ORDER BY id")
+    ranked = [(path, degree) for _id, path, degree in nodes]
+    assert ranked == sorted(ranked, key=lambda pd: (-pd[1], pd[0]))
+    assert dict(conn.execute("SELECT key, value FROM meta"))["node_order"] == "rank"
+    conn.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [Path(out).name]
+
+
 def test_build_rejects_self_links_and_dedups(tmp_path: Path) -> None:
     """Self-links are dropped and duplicate targets within a source collapse."""
     out = sidecar_path_for(tmp_path / "x.zim")
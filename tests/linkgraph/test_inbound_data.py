@@ -198,6 +198,50 @@ def test_inbound_paginates_emits_cursor(
     assert full["next_cursor"] is None
 
 
+def test_inbound_cursor_carries_a_keyset_resume_point(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Following ``ka`` page by page yields the whole ranked list once."""
+    from openzim_mcp.pagination import Cursor
+
+    archive = tmp_path / "x.zim"
+    _build_sidecar(
+        archive,
+        uuid="u1",
+        stream=[(f"C/L{i}", [("C/T", "")]) for i in range(7)]
+        + [("C/X", [("C/L3", ""), ("C/L5", "")])],
+    )
+    _patch_archive_open(monkeypatch, uuid="u1")
+
+    def _page(offset: int, after=None):
+        return _StructureMixin.get_inbound_links_data(
+            _stub_self(archive),
+            str(archive),
+            "C/T",
+            limit=3,
+            offset=offset,
+            after=after,
+        )
+
+    seen: List[str] = []
+    page = _page(0)
+    while True:
+        seen.extend(r["path"] for r in page["results"])
+        if page["next_cursor"] is None:
+            break
+        state = Cursor.decode(page["next_cursor"], expected_tool="get_inbound_links")[
+            "s"
+        ]
+        last = page["results"][-1]
+        assert state["ka"] == [last["inbound_degree"], last["path"]]
+        page = _page(state["o"], after=state["ka"])
+
+    whole = _page(0)
+    assert seen[:3] == [r["path"] for r in whole["results"]]
+    assert seen[:2] == ["C/L3", "C/L5"]
+    assert sorted(seen) == sorted(f"C/L{i}" for i in range(7))
+
+
 def test_inbound_rejects_cursor_from_another_archive(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -227,3 +271,20 @@ def test_inbound_rejects_cursor_from_another_archive(
             offset=1,
             cursor_archive_identity="000000000000",
         )
+
+
+@pytest.mark.parametrize("after", [["x", "C/L1"], [1], [1, None], [None, "C/L1"]])
+def test_inbound_rejects_a_malformed_keyset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, after: list
+) -> None:
+    """A tampered ``ka`` raises a validation error, not ``ValueError``."""
+    from openzim_mcp.exceptions import OpenZimMcpValidationError
+
+    archive = tmp_path / "x.zim"
+    _build_sidecar(archive, uuid="u1", stream=[("C/L1", [("C/T", "")])])
+    _patch_archive_open(monkeypatch, uuid="u1")
+
+    with pytest.raises(OpenZimMcpValidationError, match="`ka`"):
+        _StructureMixin.get_inbound_links_data(
+            _stub_self(archive), str(archive), "C/T", limit=1, offset=1, after=after
+        )
@@ -10,12 +10,16 @@ from openzim_mcp.linkgraph.schema import SCHEMA_VERSION, create_schema
 
 
 def _make_sidecar(archive: Path, *, uuid: str, schema_version: int = SCHEMA_VERSION):
-    """Build a minimal sidecar: target T has linkers A(deg2), B(deg1)."""
+    """Build a minimal sidecar: target T has linkers A(deg2), B(deg1).
+
+    ``T``'s own ``inbound_degree`` matches its two edges: the reader reports
+    it as the page total.
+    """
     conn = sqlite3.connect(sidecar_path_for(archive))
     create_schema(conn)
     conn.executemany(
         "INSERT INTO nodes(id, path, inbound_degree) VALUES (?,?,?)",
-        [(1, "C/T", 0), (2, "C/A", 2), (3, "C/B", 1)],
+        [(1, "C/T", 2), (2, "C/A", 2), (3, "C/B", 1)],
     )
     conn.executemany(
         "INSERT INTO edges(target_id, source_id) VALUES (?,?)",
@@ -126,3 +130,122 @@ def test_query_inbound_includes_anchor_text(tmp_path: Path) -> None:
     assert page.total == 1
     assert page.rows[0]["path"] == "A/Src"
     assert page.rows[0]["anchor_text"] == "anchor for tgt"
+
+
+def _hub_stream(n: int):
+    """``n`` linkers of ``C/Hub`` with distinct-ish degrees (ties included)."""
+    stream = [(f"C/L{i:03d}", [("C/Hub", f"a{i}")]) for i in range(n)]
+    # Give every third linker extra inbound links so the ranking has
+    # several degree bands with path ties inside each.
+    for i in range(0, n, 3):
+        stream.append((f"C/Fan{i:03d}", [(f"C/L{i:03d}", "")]))
+    return stream
+
+
+def _walk_keyset(reader: LinkGraphReader, target: str, limit: int):
+    rows, after = [], None
+    while True:
+        page = reader.query_inbound(target, limit=limit, after=after)
+        rows.extend(page.rows)
+        if not page.rows:
+            return rows, page.total
+        after = (page.rows[-1]["inbound_degree"], page.rows[-1]["path"])
+
+
+def test_keyset_pages_match_offset_pages_on_a_built_sidecar(tmp_path: Path) -> None:
+    """Keyset resumption walks the same ranked list as LIMIT/OFFSET."""
+    from openzim_mcp.linkgraph.builder import build_from_link_stream
+
+    archive = tmp_path / "x.zim"
+    build_from_link_stream(
+        sidecar_path_for(archive), archive_uuid="u1", link_stream=_hub_stream(40)
+    )
+    reader = LinkGraphReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None
+    assert reader.meta["node_order"] == "rank"
+    whole = reader.query_inbound("C/Hub", limit=100, offset=0)
+    walked, total = _walk_keyset(reader, "C/Hub", 7)
+    assert walked == whole.rows
+    assert total == whole.total == 40
+    degrees = [r["inbound_degree"] for r in walked]
+    assert degrees == sorted(degrees, reverse=True)
+    reader.close()
+
+
+def test_keyset_with_an_unknown_path_resumes_at_the_offset(tmp_path: Path) -> None:
+    """A cursor path absent from the file falls back to its offset, not page 1."""
+    from openzim_mcp.linkgraph.builder import build_from_link_stream
+
+    archive = tmp_path / "x.zim"
+    build_from_link_stream(
+        sidecar_path_for(archive), archive_uuid="u1", link_stream=_hub_stream(20)
+    )
+    reader = LinkGraphReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None
+    by_offset = reader.query_inbound("C/Hub", limit=5, offset=10)
+    page = reader.query_inbound("C/Hub", limit=5, offset=10, after=(1, "C/Gone"))
+    assert page.rows == by_offset.rows
+    assert page.rows != reader.query_inbound("C/Hub", limit=5).rows
+    reader.close()
+
+
+def test_keyset_pages_on_a_sidecar_without_rank_order(tmp_path: Path) -> None:
+    """Sidecars built before rank-ordered ids resume by (degree, path) too."""
+    archive = tmp_path / "x.zim"
+    _make_sidecar(archive, uuid="u1")
+    reader = LinkGraphReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None
+    assert "node_order" not in reader.meta
+    page = reader.query_inbound("C/T", limit=1, after=(2, "C/A"))
+    assert [r["path"] for r in page.rows] == ["C/B"]
+    assert page.total == 2
+    reader.close()
+
+
+def test_open_cached_shares_one_reader_until_the_sidecar_changes(
+    tmp_path: Path,
+) -> None:
+    """Repeat calls reuse the reader; a rebuilt sidecar is reopened."""
+    import os
+
+    from openzim_mcp.linkgraph.builder import build_from_link_stream
+    from openzim_mcp.linkgraph.reader import open_cached
+
+    archive = tmp_path / "x.zim"
+    out = sidecar_path_for(archive)
+    build_from_link_stream(out, archive_uuid="u1", link_stream=_hub_stream(5))
+    first = open_cached(archive, live_archive_uuid="u1")
+    assert first is not None
+    assert open_cached(archive, live_archive_uuid="u1") is first
+    assert open_cached(archive, live_archive_uuid="other") is None
+
+    build_from_link_stream(
+        out, archive_uuid="u1", link_stream=_hub_stream(9), force=True
+    )
+    st = os.stat(out)
+    os.utime(out, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    rebuilt = open_cached(archive, live_archive_uuid="u1")
+    assert rebuilt is not None and rebuilt is not first
+    assert rebuilt.query_inbound("C/Hub", limit=1).total == 9
+
+
+def test_pooled_reader_serves_concurrent_threads(tmp_path: Path) -> None:
+    """One reader answers many threads at once through its connection pool."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from openzim_mcp.linkgraph.builder import build_from_link_stream
+
+    archive = tmp_path / "x.zim"
+    build_from_link_stream(
+        sidecar_path_for(archive), archive_uuid="u1", link_stream=_hub_stream(30)
+    )
+    reader = LinkGraphReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None
+    expected = reader.query_inbound("C/Hub", limit=30).rows
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pages = list(
+            pool.map(lambda _i: reader.query_inbound("C/Hub", limit=30).rows, range(64))
+        )
+    assert all(rows == expected for rows in pages)
+    reader.close()
@@ -0,0 +1,143 @@
+"""Tests for the sidecar's outbound tables and graph-native related articles."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+from libzim.writer import Creator
+
+from openzim_mcp.linkgraph.builder import build_from_link_stream, build_link_graph
+from openzim_mcp.linkgraph.reader import LinkGraphReader, sidecar_path_for
+from tests.conftest_v2_fixtures import _HtmlItem, make_zim_ops
+
+# S1 and S2 cite A and B together; A and B both cite C.
+_STREAM = [
+    ("A/S1", [("A/A", "a"), ("A/B", "b")], None, "Source one"),
+    ("A/S2", [("A/A", "a"), ("A/B", "b")], None, "Source two"),
+    ("A/A", [("A/B", "to B"), ("A/C", "to C")], None, "Alpha"),
+    ("A/B", [("A/C", "see C")], None, "Beta"),
+]
+
+
+def _scores(path: str) -> List[Tuple[str, str, int, int]]:
+    conn = sqlite3.connect(path)
+    try:
+        return list(conn.execute("""SELECT s.path, t.path, r.cocitation, r.coupling
+                 FROM related r
+                 JOIN nodes s ON s.id = r.source_id
+                 JOIN nodes t ON t.id = r.target_id
+                ORDER BY s.path, t.path"""))
+    finally:
+        conn.close()
+
+
+def test_scores_count_shared_linkers_and_shared_targets(tmp_path: Path) -> None:
+    """Co-citation and coupling are stored per edge; all-zero edges are not."""
+    out = str(tmp_path / "g.sqlite")
+    build_from_link_stream(out, archive_uuid="u1", link_stream=_STREAM)
+
+    assert _scores(out) == [
+        # S1, S2 link to both A and B; A and B both link to C.
+        ("A/A", "A/B", 2, 1),
+        # A links to both B and C.
+        ("A/B", "A/C", 1, 0),
+        # S1 and A both link to B (A/S2 likewise).
+        ("A/S1", "A/A", 0, 1),
+        ("A/S2", "A/A", 0, 1),
+    ]
+
+
+def test_query_related_ranks_by_score_and_titles_from_the_sidecar(
+    tmp_path: Path,
+) -> None:
+    """The most related target comes first and carries its stored title."""
+    archive = tmp_path / "x.zim"
+    build_from_link_stream(
+        sidecar_path_for(archive), archive_uuid="u1", link_stream=_STREAM
+    )
+    reader = LinkGraphReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None and reader.has_related
+
+    page = reader.query_related("A/A", limit=10)
+    assert page is not None
+    assert [(r["path"], r["title"], r["anchor_text"]) for r in page.rows] == [
+        ("A/B", "Beta", "to B"),
+        ("A/C", "A/C", "to C"),
+    ]
+    assert (page.rows[0]["cocitation"], page.rows[0]["coupling"]) == (2, 1)
+    assert page.total == 2
+    assert reader.query_related("A/Missing", limit=10) is None
+    reader.close()
+
+
+def test_query_related_is_none_on_a_sidecar_without_outbound_tables(
+    tmp_path: Path,
+) -> None:
+    """Files built before the outbound tables defer to the parse path."""
+    archive = tmp_path / "x.zim"
+    out = sidecar_path_for(archive)
+    build_from_link_stream(out, archive_uuid="u1", link_stream=_STREAM)
+    conn = sqlite3.connect(out)
+    conn.execute("DELETE FROM meta WHERE key = 'related_fanout'")
+    conn.commit()
+    conn.close()
+
+    reader = LinkGraphReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None and not reader.has_related
+    assert reader.query_related("A/A", limit=10) is None
+    reader.close()
+
+
+@pytest.fixture
+def linked_zim(tmp_path: Path) -> Path:
+    """Hub links to every page; the pages link in a ring."""
+    zim = tmp_path / "related.zim"
+    names = [f"Page_{i}" for i in range(6)]
+    with Creator(zim).config_indexing(False, "eng") as creator:
+        hub = "".join(f'<a href="{n}">{n}</a>' for n in names)
+        creator.add_item(
+            _HtmlItem("Hub", "The Hub", f"<html><body>{hub}</body></html>")
+        )
+        for i, name in enumerate(names):
+            ring = names[(i + 1) % len(names)]
+            creator.add_item(
+                _HtmlItem(
+                    name,
+                    f"Title {i}",
+                    f'<html><body><a href="{ring}">next</a>'
+                    f'<a href="Hub">hub</a></body></html>',
+                )
+            )
+        creator.set_mainpath("Hub")
+    return zim
+
+
+def test_related_articles_come_from_the_sidecar_when_present(
+    linked_zim: Path,
+) -> None:
+    """Same targets as the parse path, titled and ranked by the link graph."""
+    ops = make_zim_ops(str(linked_zim.parent))
+    parsed = ops.get_related_articles_data(str(linked_zim), "Page_0", limit=10)
+    assert parsed["ranking"] == "mention_count"
+
+    build_link_graph(str(linked_zim))
+    graph = ops.get_related_articles_data(str(linked_zim), "Page_0", limit=10)
+
+    assert graph["ranking"] == "link_graph"
+    assert {r["path"] for r in graph["results"]} == {
+        r["path"] for r in parsed["results"]
+    }
+    by_path = {r["path"]: r for r in graph["results"]}
+    assert by_path["Page_1"]["title"] == "Title 1"
+    assert by_path["Hub"]["title"] == "The Hub"
+    # Page_1: Hub cites both pages, both pages cite Hub. Hub: Page_5 cites
+    # both, both cite Page_1. Equal scores fall back to rank, where Hub (six
+    # linkers) leads.
+    assert [r["path"] for r in graph["results"]] == ["Hub", "Page_1"]
+    assert [(r["cocitation"], r["coupling"]) for r in graph["results"]] == [
+        (1, 1),
+        (1, 1),
+    ]
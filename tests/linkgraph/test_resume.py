@@ -0,0 +1,294 @@
+"""Tests for checkpointed (``--resume``) and diff-based (``--reuse``) builds."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Iterator, List, Tuple
+from unittest.mock import patch
+
+import pytest
+from libzim.writer import Creator
+
+import openzim_mcp.linkgraph.builder as builder_mod
+import openzim_mcp.linkgraph.sharded as sharded_mod
+from openzim_mcp.cli.build import build_main
+from openzim_mcp.linkgraph.builder import (
+    BuildStats,
+    build_from_link_stream,
+    build_link_graph,
+    load_checkpoint,
+    stage_path_for,
+)
+from openzim_mcp.linkgraph.reuse import prepare_reuse, reuse_path_for
+from openzim_mcp.linkgraph.sharded import shard_dir_for
+from tests.conftest_v2_fixtures import _HtmlItem
+
+Record = Tuple[str, List[Tuple[str, str]], bytes]
+
+
+def _stream(size: int) -> List[Record]:
+    return [
+        (
+            f"A/P{i:03d}",
+            [(f"A/P{(i * k + 1) % size:03d}", f"anchor {k}") for k in range(1, 4)],
+            bytes([i % 256]) * 16,
+        )
+        for i in range(size)
+    ]
+
+
+class _Killed(Exception):
+    pass
+
+
+def _dies_after(records: List[Record], count: int) -> Iterator[Record]:
+    for index, record in enumerate(records):
+        if index == count:
+            raise _Killed()
+        yield record
+
+
+def test_resumed_build_is_byte_identical_to_an_uninterrupted_one(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A build killed mid-stream resumes from its checkpoint, not from 0."""
+    monkeypatch.setattr(builder_mod, "_BATCH", 20)
+    records = _stream(60)
+    reference = str(tmp_path / "reference.sqlite")
+    build_from_link_stream(
+        reference,
+        archive_uuid="u1",
+        link_stream=records,
+        now_iso="T",
+        builder_version="v",
+    )
+
+    out = str(tmp_path / "resumed.sqlite")
+    consumed = [0]
+
+    def _position() -> int:
+        return consumed[0]
+
+    def _counting(stream: Iterator[Record]) -> Iterator[Record]:
+        for record in stream:
+            consumed[0] += 1
+            yield record
+
+    with pytest.raises(_Killed):
+        build_from_link_stream(
+            out,
+            archive_uuid="u1",
+            link_stream=_counting(_dies_after(records, 25)),
+            position=_position,
+        )
+    assert not Path(out).exists()
+    # Checkpoints fall between sources once 20 edges are pending (P000 has
+    # one distinct target, every other source three): after 8, 15 and 22.
+    position = load_checkpoint(out, archive_uuid="u1")
+    assert position == 22
+    assert load_checkpoint(out, archive_uuid="other") is None
+
+    build_from_link_stream(
+        out,
+        archive_uuid="u1",
+        link_stream=records[position:],
+        now_iso="T",
+        builder_version="v",
+        resume=True,
+    )
+    assert Path(out).read_bytes() == Path(reference).read_bytes()
+    assert not Path(stage_path_for(out)).exists()
+
+
+def test_stage_of_another_archive_is_discarded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Resuming against a different archive uuid starts over."""
+    monkeypatch.setattr(builder_mod, "_BATCH", 5)
+    records = _stream(20)
+    out = str(tmp_path / "g.sqlite")
+    with pytest.raises(_Killed):
+        build_from_link_stream(
+            out,
+            archive_uuid="old",
+            link_stream=_dies_after(records, 10),
+            position=lambda: 1,
+        )
+    stats = build_from_link_stream(
+        out, archive_uuid="new", link_stream=records, resume=True
+    )
+    fresh = build_from_link_stream(
+        str(tmp_path / "fresh.sqlite"), archive_uuid="new", link_stream=records
+    )
+    assert stats == BuildStats(fresh.node_count, fresh.edge_count, stats.bytes_written)
+    conn = sqlite3.connect(out)
+    assert conn.execute("SELECT COUNT(*) FROM source_hashes").fetchone()[0] == 20
+    conn.close()
+
+
+def _write_zim(path: Path, pages: List[Tuple[str, List[str]]]) -> None:
+    with Creator(path).config_indexing(False, "eng") as creator:
+        for name, links in pages:
+            body = "".join(f'<a href="{target}">to {target}</a>' for target in links)
+            creator.add_item(
+                _HtmlItem(name, name, f"<html><body><p>{body}</p></body></html>")
+            )
+        creator.set_mainpath(pages[0][0])
+
+
+def _pages(edited: bool) -> List[Tuple[str, List[str]]]:
+    names = [f"Page_{i:02d}" for i in range(12)]
+    pages = [
+        (name, [names[(i + 1) % 12], names[(i + 5) % 12]])
+        for i, name in enumerate(names)
+    ]
+    if edited:
+        pages[3] = (names[3], [names[0], "Page_New"])
+        pages.append(("Page_New", [names[3]]))
+    return pages
+
+
+def _dump_without_build_time(path: str) -> List[str]:
+    conn = sqlite3.connect(path)
+    try:
+        return [line for line in conn.iterdump() if "'built_at'" not in line]
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reuse_rebuild_matches_a_full_build(tmp_path: Path, workers: int) -> None:
+    """Unchanged entries are taken from the old sidecar; the result is the same."""
+    old_zim, new_zim = tmp_path / "old.zim", tmp_path / "new.zim"
+    _write_zim(old_zim, _pages(edited=False))
+    _write_zim(new_zim, _pages(edited=True))
+    previous = str(tmp_path / "old.sqlite")
+    build_link_graph(str(old_zim), previous)
+
+    full = str(tmp_path / "full.sqlite")
+    build_link_graph(str(new_zim), full)
+    diffed = str(tmp_path / "diffed.sqlite")
+    build_link_graph(str(new_zim), diffed, workers=workers, reuse=previous)
+
+    assert _dump_without_build_time(diffed) == _dump_without_build_time(full)
+    assert not Path(reuse_path_for(diffed)).exists()
+
+
+def test_reuse_counts_unchanged_sources(tmp_path: Path) -> None:
+    """Only the edited and the new page are parsed again."""
+    old_zim, new_zim = tmp_path / "old.zim", tmp_path / "new.zim"
+    _write_zim(old_zim, _pages(edited=False))
+    _write_zim(new_zim, _pages(edited=True))
+    previous = str(tmp_path / "old.sqlite")
+    build_link_graph(str(old_zim), previous)
+
+    with patch.object(builder_mod.logger, "info") as info:
+        build_link_graph(str(new_zim), str(tmp_path / "new.sqlite"), reuse=previous)
+    reused, changed = info.call_args.args[2:4]
+    assert (reused, changed) == (11, 2)
+
+
+def test_sharded_resume_parses_only_missing_shards(tmp_path: Path) -> None:
+    """Finished spills of an interrupted sharded build are kept and merged."""
+    zim = tmp_path / "links.zim"
+    _write_zim(zim, _pages(edited=False))
+    reference = str(tmp_path / "reference.sqlite")
+    build_link_graph(str(zim), reference)
+
+    out = str(tmp_path / "sharded.sqlite")
+    real_parse = sharded_mod._parse_shard
+    parsed: List[int] = []
+
+    def _first_shard_only(archive, start, stop, spill, reuse_path=None):
+        if start:
+            raise _Killed()
+        return real_parse(archive, start, stop, spill, reuse_path)
+
+    class _InlinePool:
+        """Runs submissions in-process so the patched parser is used."""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, *args):
+            from concurrent.futures import Future
+
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+                parsed.append(args[1])
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+            return future
+
+    with patch.object(sharded_mod, "ProcessPoolExecutor", _InlinePool):
+        with patch.object(sharded_mod, "_parse_shard", _first_shard_only):
+            with pytest.raises(_Killed):
+                build_link_graph(str(zim), out, workers=2)
+        assert Path(shard_dir_for(out)).is_dir()
+        assert parsed == [0]
+        build_link_graph(str(zim), out, workers=2, resume=True)
+
+    assert 0 not in parsed[1:]
+    assert _dump_without_build_time(out) == _dump_without_build_time(reference)
+    assert not Path(shard_dir_for(out)).exists()
+
+
+def test_cli_forwards_resume_and_reuse(tmp_path: Path) -> None:
+    """``--resume`` and ``--reuse`` reach the builder; both default off."""
+    archive = tmp_path / "wiki.zim"
+    archive.write_bytes(b"")
+    previous = tmp_path / "old.sqlite"
+    previous.write_bytes(b"")
+    with patch(
+        "openzim_mcp.cli.build.build_link_graph", return_value=BuildStats(0, 0, 0)
+    ) as mock_build:
+        assert build_main(["link-graph", str(archive)]) == 0
+        assert mock_build.call_args.kwargs["resume"] is False
+        assert mock_build.call_args.kwargs["reuse"] is None
+        assert (
+            build_main(
+                ["link-graph", str(archive), "--resume", "--reuse", str(previous)]
+            )
+            == 0
+        )
+        assert mock_build.call_args.kwargs["resume"] is True
+        assert mock_build.call_args.kwargs["reuse"] == str(previous)
+
+
+def test_reuse_of_a_missing_sidecar_fails_without_creating_it(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """A mistyped ``--reuse`` path is an error, not a silent full build."""
+    zim = tmp_path / "links.zim"
+    _write_zim(zim, _pages(edited=False))
+    missing = tmp_path / "missing.sqlite"
+    out = str(tmp_path / "new.sqlite")
+
+    with pytest.raises(FileNotFoundError, match="previous sidecar not found"):
+        build_link_graph(str(zim), out, reuse=str(missing))
+    assert build_main(["link-graph", str(zim), "--reuse", str(missing)]) == 1
+    assert "previous sidecar not found" in capsys.readouterr().err
+    assert not missing.exists()
+
+
+def test_reuse_opens_the_previous_sidecar_read_only(tmp_path: Path) -> None:
+    """Preparing the reuse index leaves the previous sidecar untouched."""
+    zim = tmp_path / "links.zim"
+    _write_zim(zim, _pages(edited=False))
+    previous = tmp_path / "old.sqlite"
+    build_link_graph(str(zim), str(previous))
+    before = previous.read_bytes()
+    previous.chmod(0o444)
+    try:
+        assert prepare_reuse(str(previous), str(tmp_path / "work.reuse")) == 12
+    finally:
+        previous.chmod(0o644)
+    assert previous.read_bytes() == before
@@ -0,0 +1,145 @@
+"""Tests for the sharded (``--workers``) link-graph build."""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+import pytest
+from libzim.writer import Creator
+
+from openzim_mcp.cli.build import build_main
+from openzim_mcp.linkgraph.builder import (
+    BuildStats,
+    build_from_link_stream,
+    build_link_graph,
+)
+from openzim_mcp.linkgraph.sharded import (
+    build_from_spills,
+    shard_dir_for,
+    shard_ranges,
+    write_spill,
+)
+from tests.conftest_v2_fixtures import _HtmlItem
+
+Stream = List[Tuple[str, List[Tuple[str, str]]]]
+
+
+def _random_stream(seed: int, size: int) -> Stream:
+    """Sources linking to each other, to red links, to themselves and twice."""
+    rng = random.Random(seed)
+    paths = [f"A/P{i:03d}" for i in range(size)]
+    pool = paths + ["A/Red_link", "A/Ünïcode"]
+    return [
+        (
+            path,
+            [
+                (rng.choice(pool + [path]), f"anchor {j}")
+                for j in range(rng.randint(0, 9))
+            ],
+        )
+        for path in paths
+    ]
+
+
+def test_shard_ranges_cover_every_id_once() -> None:
+    """Ranges are contiguous, non-empty and never outnumber the ids."""
+    assert shard_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert shard_ranges(2, 8) == [(0, 1), (1, 2)]
+    assert shard_ranges(0, 4) == []
+
+
+def test_merged_spills_are_byte_identical_to_the_serial_build(
+    tmp_path: Path,
+) -> None:
+    """Any split of the stream into shards yields the serial sidecar."""
+    stream = _random_stream(7, 400)
+    serial = str(tmp_path / "serial.sqlite")
+    build_from_link_stream(
+        serial, archive_uuid="u1", link_stream=stream, now_iso="T", builder_version="v"
+    )
+    spills = []
+    for index in range(5):
+        spill = str(tmp_path / f"shard-{index}.sqlite")
+        write_spill(spill, stream[index::5])
+        spills.append(spill)
+    merged = str(tmp_path / "merged.sqlite")
+    stats = build_from_spills(
+        merged, archive_uuid="u1", spill_paths=spills, now_iso="T", builder_version="v"
+    )
+
+    assert Path(merged).read_bytes() == Path(serial).read_bytes()
+    conn = sqlite3.connect(merged)
+    assert stats.edge_count == conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+    assert stats.node_count == conn.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+    conn.close()
+    assert not Path(merged + ".stage").exists()
+
+
+def test_build_from_spills_refuses_to_overwrite(tmp_path: Path) -> None:
+    """Without force, an existing sidecar is left alone."""
+    out = tmp_path / "x.sqlite"
+    out.write_bytes(b"keep")
+    with pytest.raises(FileExistsError):
+        build_from_spills(str(out), archive_uuid="u1", spill_paths=[])
+    assert out.read_bytes() == b"keep"
+
+
+def _dump_without_build_time(path: str) -> List[str]:
+    conn = sqlite3.connect(path)
+    try:
+        return [line for line in conn.iterdump() if "'built_at'" not in line]
+    finally:
+        conn.close()
+
+
+def test_worker_build_of_a_real_archive_matches_the_serial_build(
+    tmp_path: Path,
+) -> None:
+    """Two spawned workers produce the serial sidecar and clean up their spills."""
+    zim = tmp_path / "links.zim"
+    names = [f"Page_{i:02d}" for i in range(24)]
+    with Creator(zim).config_indexing(False, "eng") as creator:
+        for i, name in enumerate(names):
+            links = "".join(
+                f'<a href="{names[(i * k + 1) % len(names)]}">link {k}</a>'
+                for k in range(1, 4)
+            )
+            creator.add_item(
+                _HtmlItem(name, name, f"<html><body><p>{links}</p></body></html>")
+            )
+        creator.set_mainpath(names[0])
+
+    serial = str(tmp_path / "serial.sqlite")
+    sharded = str(tmp_path / "sharded.sqlite")
+    build_link_graph(str(zim), serial)
+    stats = build_link_graph(str(zim), sharded, workers=2)
+
+    assert stats.edge_count > 0
+    assert _dump_without_build_time(sharded) == _dump_without_build_time(serial)
+    assert not Path(shard_dir_for(sharded)).exists()
+
+
+def test_cli_forwards_workers(tmp_path: Path) -> None:
+    """``--workers N`` reaches the builder; the default is the serial build."""
+    archive = tmp_path / "wiki.zim"
+    archive.write_bytes(b"")
+    with patch(
+        "openzim_mcp.cli.build.build_link_graph", return_value=BuildStats(0, 0, 0)
+    ) as mock_build:
+        assert build_main(["link-graph", str(archive), "--workers", "6"]) == 0
+        assert mock_build.call_args.kwargs["workers"] == 6
+        assert build_main(["link-graph", str(archive)]) == 0
+        assert mock_build.call_args.kwargs["workers"] == 1
+
+
+def test_cli_rejects_zero_workers(tmp_path: Path) -> None:
+    """A worker count below one is an argument error, not a serial build."""
+    archive = tmp_path / "wiki.zim"
+    archive.write_bytes(b"")
+    with patch("openzim_mcp.cli.build.build_link_graph") as mock_build:
+        assert build_main(["link-graph", str(archive), "--workers", "0"]) == 2
+    mock_build.assert_not_called()
@@ -0,0 +1,210 @@
+"""Archive generation registry: stat memos and purge of replaced generations."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import weakref
+from pathlib import Path
+
+import pytest
+
+from openzim_mcp.archive_generations import (
+    ArchiveGenerations,
+    key_generation,
+    stat_memo,
+)
+from openzim_mcp.bundle import archive_stat_token
+from openzim_mcp.cache import OpenZimMcpCache
+from openzim_mcp.config import CacheConfig
+from openzim_mcp.subscriptions import MtimeWatcher
+
+
+def _archive(tmp_path: Path, payload: bytes = b"zim") -> Path:
+    path = tmp_path / "wiki.zim"
+    path.write_bytes(payload)
+    return path
+
+
+def _replace(path: Path, payload: bytes) -> None:
+    """Swap the file for new content with a distinct mtime."""
+    before = path.stat().st_mtime_ns
+    path.write_bytes(payload)
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+def _stats(registry: ArchiveGenerations) -> int:
+    return registry.counters()["stats"]
+
+
+def test_key_generation_reads_only_the_stat_token() -> None:
+    assert key_generation("bundle:v2g:/z/a.zim:1700:42:r1:A/B:compact") == "1700:42"
+    assert key_generation("snippet:/z/a.zim:0:0:r1") == "0:0"
+    # Offsets and limits are not a token without the epoch after them.
+    assert key_generation("zim_files_list:/z:0:50") is None
+
+
+def test_one_stat_per_call_and_ttl_memo_across_calls(tmp_path: Path) -> None:
+    path = _archive(tmp_path)
+    registry = ArchiveGenerations()
+    with stat_memo():
+        first = registry.generation(path)
+        assert all(registry.generation(str(path)) == first for _ in range(5))
+    assert _stats(registry) == 1
+    registry.generation(path)  # no memo and no TTL: stats again
+    assert _stats(registry) == 2
+
+    registry.configure(30.0)
+    _replace(path, b"newer zim")
+    assert registry.generation(path) == first  # within the TTL
+    assert registry.refresh(path) != first  # the watcher's path bypasses it
+    assert registry.counters()["changes"] == 1
+
+
+def test_memo_is_shared_with_worker_threads(tmp_path: Path) -> None:
+    path = _archive(tmp_path)
+    registry = ArchiveGenerations()
+
+    async def call() -> None:
+        with stat_memo():
+            registry.generation(path)
+            await asyncio.gather(
+                *(asyncio.to_thread(registry.generation, path) for _ in range(4))
+            )
+
+    asyncio.run(call())
+    assert _stats(registry) == 1
+
+
+def test_new_generation_purges_only_the_old_one(tmp_path: Path) -> None:
+    path = _archive(tmp_path)
+    other = tmp_path / "other.zim"
+    other.write_bytes(b"other")
+    cache = OpenZimMcpCache(
+        CacheConfig(enabled=True, max_size=50), enable_background_cleanup=False
+    )
+    old = archive_stat_token(path)
+    cache.set(f"bundle:v2g:{path}:{old}:A/One:compact", "one")
+    cache.set(f"snippet_render:v1:{path}:{old}:A/One", "two", ancillary=True)
+    cache.set(f"bundle:v2g:{other}:{archive_stat_token(other)}:A/One", "kept")
+    cache.set("zim_files_list", "kept too")
+
+    _replace(path, b"the monthly refresh")
+    new = archive_stat_token(path)
+    assert new != old
+    assert sorted(cache._cache) == sorted(
+        [f"bundle:v2g:{other}:{archive_stat_token(other)}:A/One", "zim_files_list"]
+    )
+    assert cache.counters()["generation_purged"] == 2
+    assert cache.stats()["generations"]["registry"]["changes"] >= 1
+
+    cache.set(f"bundle:v2g:{path}:{new}:A/One:compact", "fresh")
+    path.unlink()
+    assert archive_stat_token(path).startswith("0:0:")
+    assert f"bundle:v2g:{path}:{new}:A/One:compact" not in cache._cache
+
+
+def test_purge_reaches_the_shared_tier(tmp_path: Path) -> None:
+    path = _archive(tmp_path)
+    config = CacheConfig(enabled=True, shared_path=str(tmp_path / "shared.sqlite3"))
+    writer = OpenZimMcpCache(config, enable_background_cleanup=False)
+    reader = OpenZimMcpCache(config, enable_background_cleanup=False)
+    key = f"entry:v3:{path}:{archive_stat_token(path)}:A/One"
+    writer.set(key, "text")
+
+    _replace(path, b"the monthly refresh")
+    archive_stat_token(path)
+    assert reader.get(key) is None
+    writer.shutdown()
+    reader.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_watcher_refreshes_replaced_and_removed_paths(tmp_path: Path) -> None:
+    kept = _archive(tmp_path)
+    gone = tmp_path / "gone.zim"
+    gone.write_bytes(b"gone")
+    seen = []
+
+    async def on_change(uri: str, change_type: str) -> None:
+        return None
+
+    watcher = MtimeWatcher([str(tmp_path)], 60.0, on_change, on_stale=seen.append)
+    watcher._snapshot = watcher._scan()
+    await watcher._tick()
+    assert seen == []
+
+    _replace(kept, b"replaced")
+    gone.unlink()
+    await watcher._tick()
+    assert seen == [sorted([str(kept), str(gone)])]
+
+
+def test_discarded_cache_is_not_kept_alive(tmp_path: Path) -> None:
+    path = _archive(tmp_path)
+    registry = ArchiveGenerations()
+    cache = OpenZimMcpCache(CacheConfig(enabled=True), enable_background_cleanup=False)
+    registry.add_listener(cache.purge_generation)
+    registry.generation(path)
+    collected = weakref.ref(cache)
+    del cache
+    gc.collect()
+    assert collected() is None
+    _replace(path, b"after the cache went away")
+    registry.generation(path)  # the dead listener is skipped, not called
+    assert registry.counters()["changes"] == 1
+
+
+def test_http_watcher_runs_without_subscriptions_or_warmup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The purge hook must not depend on a bus or prewarmer being wired."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from starlette.applications import Starlette
+    from starlette.testclient import TestClient
+
+    import openzim_mcp.http_app as http_app
+    import openzim_mcp.subscriptions as subs
+    from openzim_mcp.config import OpenZimMcpConfig, WarmupConfig
+    from openzim_mcp.server import OpenZimMcpServer
+
+    stub = MagicMock()
+    stub.start = AsyncMock()
+    stub.stop = AsyncMock()
+    built: dict = {}
+
+    def _watcher(*args: object, **kwargs: object) -> MagicMock:
+        built.update(kwargs)
+        return stub
+
+    registry = MagicMock()
+    monkeypatch.setattr(subs, "MtimeWatcher", _watcher)
+    monkeypatch.setattr(http_app, "ARCHIVE_GENERATIONS", registry)
+    monkeypatch.setattr(http_app, "check_safe_startup", lambda c: None)
+
+    server = OpenZimMcpServer(
+        OpenZimMcpConfig(
+            allowed_directories=[str(tmp_path)],
+            transport="http",
+            subscriptions_enabled=False,
+            warmup=WarmupConfig(enabled=False),
+        )
+    )
+    assert server.subscription_bus is None
+    server.mcp.streamable_http_app = MagicMock(return_value=Starlette())
+
+    captured: dict = {}
+    http_app.serve_streamable_http(
+        server, runner=lambda app, host, port: captured.update(app=app)
+    )
+    with TestClient(captured["app"]):
+        pass
+
+    stub.start.assert_awaited_once()
+    stub.stop.assert_awaited_once()
+    assert built["on_replaced"] is None
+    path = _archive(tmp_path)
+    built["on_stale"]([str(path)])
+    registry.refresh.assert_called_once_with(path.resolve())
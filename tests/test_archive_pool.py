@@ -0,0 +1,217 @@
+"""Tests for the persistent archive handle pool behind ``zim_archive``.
+
+Covers the pool in isolation (LRU close, idle eviction, signature-driven
+reopen, disabled mode) and wired through ``zim_archive`` against a real
+archive, including an atomic replacement of the file on disk.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from libzim.writer import Creator
+
+import openzim_mcp.zim.archive as arch_mod
+from openzim_mcp.config import CacheConfig
+from openzim_mcp.zim.archive_pool import ArchiveHandlePool
+from openzim_mcp.zim_operations import zim_archive
+from tests.conftest_v2_fixtures import _HtmlItem
+
+
+def _build_zim(out: Path, body: str) -> Path:
+    with Creator(out).config_indexing(False, "eng") as creator:
+        creator.add_item(
+            _HtmlItem("A/One", "One", f"<html><body><p>{body}</p></body></html>")
+        )
+        creator.set_mainpath("A/One")
+    return out
+
+
+@pytest.fixture
+def isolated_pool(monkeypatch: pytest.MonkeyPatch) -> ArchiveHandlePool:
+    """Swap in a fresh module pool so counters start from zero."""
+    pool = ArchiveHandlePool(max_open=4, idle_seconds=600.0)
+    monkeypatch.setattr(arch_mod, "_ARCHIVE_POOL", pool)
+    return pool
+
+
+class TestArchiveHandlePool:
+    def test_hit_reuses_handle(self) -> None:
+        pool = ArchiveHandlePool(max_open=2, idle_seconds=600.0)
+        opener = MagicMock(side_effect=lambda: object())
+        first = pool.acquire("/a.zim", ("t1",), opener)
+        second = pool.acquire("/a.zim", ("t1",), opener)
+        assert first is second
+        assert opener.call_count == 1
+        stats = pool.stats()
+        assert stats["hits"] == 1
+        assert stats["opens"] == 1
+        assert stats["open_handles"] == 1
+
+    def test_signature_change_reopens(self) -> None:
+        pool = ArchiveHandlePool(max_open=2, idle_seconds=600.0)
+        opener = MagicMock(side_effect=lambda: object())
+        first = pool.acquire("/a.zim", ("t1",), opener)
+        second = pool.acquire("/a.zim", ("t2",), opener)
+        assert first is not second
+        assert pool.stats()["reopens"] == 1
+        assert pool.stats()["open_handles"] == 1
+
+    def test_lru_close_beyond_max_open(self) -> None:
+        pool = ArchiveHandlePool(max_open=2, idle_seconds=600.0)
+        opener = MagicMock(side_effect=lambda: object())
+        a = pool.acquire("/a.zim", ("t",), opener)
+        pool.acquire("/b.zim", ("t",), opener)
+        # Touch ``a`` so ``b`` is the least recently used.
+        assert pool.acquire("/a.zim", ("t",), opener) is a
+        pool.acquire("/c.zim", ("t",), opener)
+        stats = pool.stats()
+        assert stats["open_handles"] == 2
+        assert stats["evicted_lru"] == 1
+        assert pool.acquire("/a.zim", ("t",), opener) is a
+        assert opener.call_count == 3
+
+    def test_idle_eviction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import openzim_mcp.zim.archive_pool as pool_mod
+
+        clock = [1000.0]
+        monkeypatch.setattr(pool_mod.time, "monotonic", lambda: clock[0])
+        pool = ArchiveHandlePool(max_open=4, idle_seconds=10.0)
+        opener = MagicMock(side_effect=lambda: object())
+        pool.acquire("/a.zim", ("t",), opener)
+        clock[0] += 5
+        pool.acquire("/b.zim", ("t",), opener)
+        clock[0] += 6
+        assert pool.evict_idle() == 1
+        assert pool.stats()["open_handles"] == 1
+        assert pool.stats()["evicted_idle"] == 1
+
+    def test_disabled_pool_opens_every_call(self) -> None:
+        pool = ArchiveHandlePool(max_open=0, idle_seconds=600.0)
+        opener = MagicMock(side_effect=lambda: object())
+        first = pool.acquire("/a.zim", ("t",), opener)
+        second = pool.acquire("/a.zim", ("t",), opener)
+        assert first is not second
+        assert opener.call_count == 2
+        assert pool.stats()["open_handles"] == 0
+
+    def test_open_failure_leaves_pool_untouched(self) -> None:
+        pool = ArchiveHandlePool(max_open=2, idle_seconds=600.0)
+        with pytest.raises(RuntimeError):
+            pool.acquire("/a.zim", ("t",), MagicMock(side_effect=RuntimeError("x")))
+        assert pool.stats()["open_handles"] == 0
+
+    def test_configure_shrinks_pool(self) -> None:
+        pool = ArchiveHandlePool(max_open=3, idle_seconds=600.0)
+        opener = MagicMock(side_effect=lambda: object())
+        for name in ("/a.zim", "/b.zim", "/c.zim"):
+            pool.acquire(name, ("t",), opener)
+        pool.configure(max_open=1, idle_seconds=600.0)
+        assert pool.stats()["open_handles"] == 1
+
+    def test_concurrent_acquire_converges(self) -> None:
+        pool = ArchiveHandlePool(max_open=2, idle_seconds=600.0)
+        barrier = threading.Barrier(4)
+        results: list = []
+
+        def opener() -> object:
+            return object()
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(pool.acquire("/a.zim", ("t",), opener))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 4
+        assert pool.stats()["open_handles"] == 1
+        assert pool.acquire("/a.zim", ("t",), opener) in results
+
+
+class TestZimArchiveUsesPool:
+    def test_repeated_opens_hit_the_pool(
+        self, tmp_path: Path, isolated_pool: ArchiveHandlePool
+    ) -> None:
+        zim = _build_zim(tmp_path / "one.zim", "first")
+        with zim_archive(zim) as first:
+            pass
+        with zim_archive(zim) as second:
+            assert second is first
+        stats = isolated_pool.stats()
+        assert stats["opens"] == 1
+        assert stats["hits"] == 1
+
+    def test_atomic_replacement_reopens(
+        self, tmp_path: Path, isolated_pool: ArchiveHandlePool
+    ) -> None:
+        zim = _build_zim(tmp_path / "one.zim", "first")
+        with zim_archive(zim) as first:
+            assert b"first" in bytes(
+                first.get_entry_by_path("A/One").get_item().content
+            )
+
+        replacement = _build_zim(tmp_path / "staging.zim", "second version")
+        os.replace(replacement, zim)
+        # Force a distinct stat token even on coarse-mtime filesystems.
+        st = zim.stat()
+        os.utime(zim, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        with zim_archive(zim) as second:
+            assert second is not first
+            content = bytes(second.get_entry_by_path("A/One").get_item().content)
+            assert b"second version" in content
+        assert isolated_pool.stats()["reopens"] == 1
+
+    def test_open_failure_still_wrapped(
+        self, tmp_path: Path, isolated_pool: ArchiveHandlePool
+    ) -> None:
+        from openzim_mcp.exceptions import OpenZimMcpArchiveError
+
+        bogus = tmp_path / "bogus.zim"
+        bogus.write_bytes(b"not a zim")
+        with pytest.raises(OpenZimMcpArchiveError):
+            with zim_archive(bogus):
+                pass
+        assert isolated_pool.stats()["open_handles"] == 0
+
+    def test_copy_of_archive_gets_its_own_handle(
+        self, tmp_path: Path, isolated_pool: ArchiveHandlePool
+    ) -> None:
+        zim = _build_zim(tmp_path / "one.zim", "first")
+        copy = tmp_path / "copy.zim"
+        shutil.copy(zim, copy)
+        with zim_archive(zim) as a, zim_archive(copy) as b:
+            assert a is not b
+        assert isolated_pool.stats()["open_handles"] == 2
+
+
+class TestPoolConfig:
+    def test_defaults(self) -> None:
+        cfg = CacheConfig()
+        assert cfg.archive_pool_max_open == 16
+        assert cfg.archive_pool_idle_seconds == 600.0
+
+    def test_rejects_negative(self) -> None:
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            CacheConfig(archive_pool_max_open=-1)
+
+    def test_health_reports_pool_counters(self, test_config) -> None:
+        from openzim_mcp.server import OpenZimMcpServer
+        from openzim_mcp.server_state import _build_health_report
+
+        server = OpenZimMcpServer(test_config)
+        report = _build_health_report(server)
+        pool = report["archive_pool"]
+        for key in ("hits", "opens", "reopens", "evicted_lru", "evicted_idle"):
+            assert key in pool
+        assert pool["max_open"] == test_config.cache.archive_pool_max_open
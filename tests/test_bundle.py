@@ -408,3 +408,68 @@ def test_bundle_cache_key_distinguishes_compact_mode(tmp_path) -> None:
     p = tmp_path / "x.zim"
     p.touch()
     assert _bundle_cache_key(p, "A/Data", True) != _bundle_cache_key(p, "A/Data", False)
+
+
+MIXED_LINKS_HTML = """\
+<html><body><main>
+<h1>Mixed</h1>
+<video src="clip.webm"></video>
+<p>See <a href="A/One" title="One">one</a> and <a href="#notes">notes</a>.</p>
+<img src="a.png" alt="A"><audio src="s.ogg"></audio>
+<table class="infobox"><tr><th>Site</th>
+<td><a href="//example.org/x">ex</a><img src="flag.svg"></td></tr></table>
+<p><a href="javascript:void(0)">js</a><a href="">empty</a><a>no href</a>
+<a href="http://[bad/x">bad</a><object data="o.swf"></object>
+<embed src="e.swf"><source src="track.mp3"></p>
+<img src="b.png" title="B">
+</main><nav><a href="A/Nav">nav</a></nav></body></html>
+"""
+
+
+def _per_tag_links(html: str) -> dict:
+    """Link extraction as it ran before the single walk: re-parse, per-tag scans."""
+    from bs4 import BeautifulSoup, Tag
+
+    from openzim_mcp.content_processor import (
+        _MEDIA_SELECTORS,
+        _append_media_link,
+        _classify_anchor,
+        select_main_content,
+    )
+
+    root = select_main_content(BeautifulSoup(html, "html.parser"))
+    soup = BeautifulSoup(str(root), "html.parser")
+    data: dict = {"internal_links": [], "external_links": [], "media_links": []}
+    for link in soup.find_all("a", href=True):
+        _classify_anchor(link, data)
+    for tag, attr, media_type in _MEDIA_SELECTORS:
+        for element in soup.find_all(tag):
+            if isinstance(element, Tag):
+                _append_media_link(element, attr, media_type, data)
+    return data
+
+
+@pytest.mark.parametrize("html", [SAMPLE_HTML, INFOBOX_TABLE_HTML, MIXED_LINKS_HTML])
+def test_bundle_links_match_per_tag_extraction(cp: ContentProcessor, html) -> None:
+    """Links read off the parsed tree equal the old re-parse + per-tag scans."""
+    bundle = extract_entry_bundle(
+        _make_archive_with_entry(html), "A/Berlin", content_processor=cp
+    )
+    expected = _bundle_mod._build_link_buckets(_per_tag_links(html))
+    assert bundle["links"] == expected
+
+
+def test_bundle_size_bytes_tracks_json_length(cp: ContentProcessor) -> None:
+    """The producer-side size estimate stays close to the JSON length."""
+    import json
+
+    body = "".join(
+        f'<h2>S{i}</h2><p>{"word " * 200}<a href="A/L{i}">link {i}</a></p>'
+        for i in range(40)
+    )
+    for html in (SAMPLE_HTML, MIXED_LINKS_HTML, f"<html><body>{body}</body></html>"):
+        bundle = extract_entry_bundle(
+            _make_archive_with_entry(html), "A/Berlin", content_processor=cp
+        )
+        actual = len(json.dumps(bundle, ensure_ascii=False))
+        assert abs(_bundle_mod.bundle_size_bytes(bundle) - actual) <= 0.1 * actual
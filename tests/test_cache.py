@@ -1214,3 +1214,255 @@ class TestCacheClockSkewAndAtomicPersistence:
         assert a._persistence_path != b._persistence_path
         assert str(a._persistence_path) != _DEFAULT_PERSISTENCE_PATH
         assert str(a._persistence_path).startswith(_DEFAULT_PERSISTENCE_PATH)
+
+
+class TestCacheEntrySizing:
+    """Entry sizing without a second serialisation."""
+
+    def test_string_sized_without_json_encoding(self, monkeypatch):
+        import openzim_mcp.cache as cache_mod
+
+        def boom(*args, **kwargs):
+            raise AssertionError("json.dumps called to size a string")
+
+        monkeypatch.setattr(cache_mod.json, "dumps", boom)
+        cache = OpenZimMcpCache(
+            CacheConfig(enabled=True, max_size=10, ttl_seconds=60),
+            enable_background_cleanup=False,
+        )
+        cache.set("k", "x" * 1000)
+        assert cache.stats()["size_bytes"] == 1002
+
+    def test_producer_supplied_size_is_charged(self, monkeypatch):
+        import openzim_mcp.cache as cache_mod
+
+        def boom(*args, **kwargs):
+            raise AssertionError("json.dumps called despite size_bytes")
+
+        monkeypatch.setattr(cache_mod.json, "dumps", boom)
+        cache = OpenZimMcpCache(
+            CacheConfig(enabled=True, max_size=10, ttl_seconds=60),
+            enable_background_cleanup=False,
+        )
+        cache.set("k", {"body": "x" * 100, "links": [1, 2, 3]}, size_bytes=12345)
+        assert cache.stats()["size_bytes"] == 12345
+
+    def test_persistence_sizes_from_validation_encoding(self, temp_dir, monkeypatch):
+        """With persistence on, the validation dump doubles as the size."""
+        import json
+
+        import openzim_mcp.cache as cache_mod
+
+        calls = []
+        real_dumps = json.dumps
+
+        def counting(*args, **kwargs):
+            calls.append(1)
+            return real_dumps(*args, **kwargs)
+
+        cache = OpenZimMcpCache(
+            CacheConfig(
+                enabled=True,
+                max_size=10,
+                ttl_seconds=60,
+                persistence_enabled=True,
+                persistence_path=str(temp_dir / "sizing"),
+            ),
+            enable_background_cleanup=False,
+        )
+        monkeypatch.setattr(cache_mod.json, "dumps", counting)
+        value = {"body": "é" * 50}
+        cache.set("k", value)
+        assert len(calls) == 1
+        assert cache.stats()["size_bytes"] == len(real_dumps(value, ensure_ascii=False))
+
+
+class TestCacheCompactStorage:
+    """``compact_storage`` keeps large strings as UTF-8 / zlib bytes."""
+
+    ARTICLE = "Berlin is the capital of Germany — and its largest city. " * 400
+
+    def _cache(self, mode: str, **kwargs) -> OpenZimMcpCache:
+        config = CacheConfig(
+            enabled=True,
+            max_size=100,
+            ttl_seconds=60,
+            compact_storage=mode,
+            compact_min_chars=1024,
+            **kwargs,
+        )
+        return OpenZimMcpCache(config, enable_background_cleanup=False)
+
+    @pytest.mark.parametrize("mode", ["utf8", "zlib"])
+    def test_round_trips_strings_and_dict_fields(self, mode):
+        cache = self._cache(mode)
+        bundle = {"title": "Berlin", "rendered_markdown": self.ARTICLE, "n": 3}
+        cache.set("s", self.ARTICLE)
+        cache.set("b", bundle)
+        assert cache.get("s") == self.ARTICLE
+        assert cache.get("b") == bundle
+        # The caller's dict is never mutated by packing.
+        assert bundle["rendered_markdown"] == self.ARTICLE
+
+    def test_zlib_charges_stored_size(self):
+        plain = self._cache("off")
+        packed = self._cache("zlib")
+        for cache in (plain, packed):
+            cache.set("b", {"rendered_markdown": self.ARTICLE})
+        assert packed.stats()["size_bytes"] * 3 < plain.stats()["size_bytes"]
+
+    def test_zlib_fits_more_entries_in_byte_budget(self):
+        budget = 3 * len(self.ARTICLE)
+        plain = self._cache("off", max_bytes=budget)
+        packed = self._cache("zlib", max_bytes=budget)
+        for cache in (plain, packed):
+            for i in range(10):
+                cache.set(f"k{i}", {"rendered_markdown": self.ARTICLE + str(i)})
+        assert plain.stats()["size"] < 3
+        assert packed.stats()["size"] == 10
+
+    def test_short_strings_stay_plain(self):
+        cache = self._cache("zlib")
+        cache.set("k", {"title": "short"})
+        assert cache._cache["k"].packed is False
+
+    def test_persisted_snapshot_holds_plain_values(self, temp_dir):
+        path = str(temp_dir / "compact")
+        cache1 = self._cache("zlib", persistence_enabled=True, persistence_path=path)
+        cache1.set("b", {"rendered_markdown": self.ARTICLE})
+        cache1._save_to_disk()
+
+        plain = self._cache("off", persistence_enabled=True, persistence_path=path)
+        assert plain.get("b") == {"rendered_markdown": self.ARTICLE}
+        repacked = self._cache("zlib", persistence_enabled=True, persistence_path=path)
+        assert repacked._cache["b"].packed is True
+        assert repacked.get("b") == {"rendered_markdown": self.ARTICLE}
+
+    def test_rejects_unknown_mode(self):
+        from pydantic import ValidationError
+
+        with pytest.raises(ValidationError):
+            CacheConfig(compact_storage="lz4")
+
+
+class TestCacheSegments:
+    """Large entries live in a capped segment behind a TinyLFU admission gate."""
+
+    SMALL = "x" * 100
+    LARGE = "y" * 1900
+
+    def _cache(self, **kwargs) -> OpenZimMcpCache:
+        settings = dict(
+            enabled=True,
+            max_size=1000,
+            ttl_seconds=60,
+            max_bytes=10_000,
+            large_entry_bytes=1000,
+            large_segment_fraction=0.6,
+        )
+        settings.update(kwargs)
+        return OpenZimMcpCache(CacheConfig(**settings), enable_background_cleanup=False)
+
+    def test_large_burst_spares_small_keys(self):
+        cache = self._cache(admission_filter=False)
+        for i in range(10):
+            cache.set(f"path_mapping:{i}", self.SMALL)
+        for i in range(20):
+            cache.set(f"bundle:{i}", self.LARGE)
+        for i in range(10):
+            assert cache.get(f"path_mapping:{i}") == self.SMALL
+        segments = cache.stats()["segments"]
+        assert segments["large"]["size_bytes"] <= segments["large"]["max_bytes"]
+        assert segments["large"]["entries"] == 3
+        assert segments["small"]["entries"] == 10
+        # The three most recent bundles survived.
+        assert cache.get("bundle:19") == self.LARGE
+        assert cache.get("bundle:16") is None
+
+    def test_without_segmentation_burst_flushes_small_keys(self):
+        cache = self._cache(large_entry_bytes=0, admission_filter=False)
+        for i in range(10):
+            cache.set(f"path_mapping:{i}", self.SMALL)
+        for i in range(20):
+            cache.set(f"bundle:{i}", self.LARGE)
+        assert cache.get("path_mapping:0") is None
+        assert cache.stats()["segments"]["large"]["entries"] == 0
+
+    def test_admission_rejects_one_off_over_popular_victim(self):
+        cache = self._cache()
+        for i in range(3):
+            cache.set(f"bundle:{i}", self.LARGE)
+            for _ in range(3):
+                assert cache.get(f"bundle:{i}") == self.LARGE
+        # A scan of never-requested bundles cannot displace the hot ones.
+        for i in range(100, 110):
+            cache.set(f"bundle:{i}", self.LARGE)
+        for i in range(3):
+            assert cache.get(f"bundle:{i}") == self.LARGE
+        stats = cache.stats()
+        assert stats["admission"]["rejected"] == 10
+        assert stats["prefixes"]["bundle"]["admission_rejected"] == 10
+
+    def test_admission_lets_frequent_candidate_in(self):
+        cache = self._cache()
+        for i in range(3):
+            cache.set(f"bundle:{i}", self.LARGE)
+        for _ in range(3):
+            assert cache.get("bundle:new") is None
+        cache.set("bundle:new", self.LARGE)
+        assert cache.get("bundle:new") == self.LARGE
+        assert cache.get("bundle:0") is None
+        assert cache.stats()["admission"]["rejected"] == 0
+
+    def test_small_entries_bypass_admission(self):
+        cache = self._cache()
+        for i in range(100):
+            cache.set(f"entry:{i}", self.SMALL)
+        assert cache.stats()["admission"]["rejected"] == 0
+
+    def test_per_prefix_statistics(self):
+        cache = self._cache(admission_filter=False)
+        cache.set("entry:v3:a", self.SMALL)
+        cache.set("bundle:v2g:a", self.LARGE)
+        cache.get("entry:v3:a")
+        cache.get("entry:v3:missing")
+        cache.get("bundle:v2g:a")
+        prefixes = cache.stats()["prefixes"]
+        assert prefixes["entry"]["hits"] == 1
+        assert prefixes["entry"]["misses"] == 1
+        assert prefixes["entry"]["entries"] == 1
+        assert prefixes["bundle"]["hits"] == 1
+        assert (
+            prefixes["bundle"]["size_bytes"]
+            == cache.stats()["segments"]["large"]["size_bytes"]
+        )
+        cache.delete("bundle:v2g:a")
+        assert cache.stats()["prefixes"]["bundle"]["size_bytes"] == 0
+
+    def test_evictions_counted_per_prefix(self):
+        cache = self._cache(max_size=2, admission_filter=False)
+        cache.set("entry:1", self.SMALL)
+        cache.set("entry:2", self.SMALL)
+        cache.set("search_v2c:1", self.SMALL)
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["prefixes"]["entry"]["evictions"] == 1
+
+    def test_resize_moves_key_between_segments(self):
+        cache = self._cache(admission_filter=False)
+        cache.set("bundle:a", self.LARGE)
+        cache.set("bundle:a", self.SMALL)
+        segments = cache.stats()["segments"]
+        assert segments["large"] == {"entries": 0, "size_bytes": 0, "max_bytes": 6000}
+        assert segments["small"]["entries"] == 1
+        assert cache.stats()["size_bytes"] == segments["small"]["size_bytes"]
+
+    def test_clear_resets_segment_state(self):
+        cache = self._cache()
+        cache.set("bundle:a", self.LARGE)
+        cache.get("bundle:a")
+        cache.clear()
+        stats = cache.stats()
+        assert stats["segments"]["large"]["entries"] == 0
+        assert stats["prefixes"] == {}
+        assert stats["admission"]["rejected"] == 0
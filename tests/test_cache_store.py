@@ -0,0 +1,314 @@
+"""Tests for the SQLite snapshot backend (``persistence_backend="sqlite"``).
+
+Covers the store in isolation (checksums, incremental checkpoints, reset of
+unreadable files) and wired through ``OpenZimMcpCache``: lazy restore of the
+key index, checkpoints from the background cleanup thread, and recovery from
+corrupt rows.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from openzim_mcp.cache import OpenZimMcpCache, _StoredValue
+from openzim_mcp.cache_store import SharedCacheStore, SqliteCacheStore
+from openzim_mcp.config import CacheConfig
+
+
+def _config(path: Path, **kwargs) -> CacheConfig:
+    settings = dict(
+        enabled=True,
+        max_size=100,
+        ttl_seconds=60,
+        persistence_enabled=True,
+        persistence_backend="sqlite",
+        persistence_path=str(path),
+    )
+    settings.update(kwargs)
+    return CacheConfig(**settings)
+
+
+@pytest.fixture
+def make_cache(temp_dir):
+    """Build caches on one snapshot path and shut them all down afterwards."""
+    caches = []
+
+    def factory(**kwargs) -> OpenZimMcpCache:
+        kwargs.setdefault("enable_background_cleanup", False)
+        background = kwargs.pop("enable_background_cleanup")
+        interval = kwargs.pop("cleanup_interval", 60)
+        cache = OpenZimMcpCache(
+            _config(temp_dir / "snapshot", **kwargs),
+            enable_background_cleanup=background,
+            cleanup_interval=interval,
+        )
+        caches.append(cache)
+        return cache
+
+    yield factory
+    for cache in caches:
+        cache.shutdown()
+
+
+class TestSqliteCacheStore:
+    def test_checkpoint_round_trip(self, temp_dir):
+        store = SqliteCacheStore(temp_dir / "s.sqlite3")
+        store.checkpoint(
+            [("a", {"x": [1, "é"]}, time.time(), 60, False, 10)], [], reset=False
+        )
+        assert store.read_value("a") == {"x": [1, "é"]}
+        [row] = store.load_index()
+        assert (row.key, row.ttl_seconds, row.size_bytes) == ("a", 60, 10)
+        store.close()
+
+    def test_checkpoint_applies_deletes_and_reset(self, temp_dir):
+        store = SqliteCacheStore(temp_dir / "s.sqlite3")
+        now = time.time()
+        store.checkpoint(
+            [("a", 1, now, 60, False, 1), ("b", 2, now, 60, False, 1)],
+            [],
+            reset=False,
+        )
+        store.checkpoint([], ["a"], reset=False)
+        assert [r.key for r in store.load_index()] == ["b"]
+        store.checkpoint([("c", 3, now, 60, False, 1)], [], reset=True)
+        assert [r.key for r in store.load_index()] == ["c"]
+        store.close()
+
+    def test_corrupt_row_fails_checksum_and_is_deleted(self, temp_dir):
+        path = temp_dir / "s.sqlite3"
+        store = SqliteCacheStore(path)
+        store.checkpoint([("a", "value", time.time(), 60, False, 5)], [], reset=False)
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE entries SET value = X'00FF' WHERE key = 'a'")
+        with pytest.raises(LookupError):
+            store.read_value("a")
+        assert store.count() == 0
+        store.close()
+
+    def test_unreadable_file_starts_empty(self, temp_dir):
+        path = temp_dir / "s.sqlite3"
+        path.write_bytes(b"this is not a database" * 100)
+        store = SqliteCacheStore(path)
+        assert store.load_index() == []
+        store.close()
+
+
+class TestSqlitePersistence:
+    def test_file_uses_sqlite_extension(self, make_cache):
+        cache = make_cache()
+        assert cache._get_persistence_file().name == "snapshot.sqlite3"
+        assert cache.stats()["persistence_backend"] == "sqlite"
+
+    def test_restart_restores_index_and_loads_values_lazily(self, make_cache):
+        first = make_cache()
+        first.set("entry:a", {"body": "Berlin " * 100})
+        first.set("entry:b", "short")
+        first.shutdown()
+
+        second = make_cache()
+        assert second.stats()["total_entries"] == 2
+        # Nothing but the index was read at startup.
+        assert isinstance(second._cache["entry:a"].value, _StoredValue)
+        assert second.get("entry:a") == {"body": "Berlin " * 100}
+        assert not isinstance(second._cache["entry:a"].value, _StoredValue)
+        assert second.get("entry:a") == {"body": "Berlin " * 100}
+        assert second.stats()["lazy_loads"] == 1
+        assert second.stats()["hits"] == 2
+
+    def test_checkpoint_is_incremental(self, make_cache):
+        cache = make_cache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache._checkpoint()
+        assert cache.stats()["persistence_pending"] == {"dirty": 0, "deleted": 0}
+        cache.set("c", 3)
+        cache.delete("a")
+        assert cache.stats()["persistence_pending"] == {"dirty": 1, "deleted": 1}
+        cache._checkpoint()
+        assert sorted(r.key for r in cache._store.load_index()) == ["b", "c"]
+
+    def test_checkpoint_unpacks_outside_the_cache_lock(self, make_cache, monkeypatch):
+        import openzim_mcp.cache as cache_mod
+
+        cache = make_cache(compact_storage="zlib", compact_min_chars=16)
+        cache.set("a", "inflate me " * 50)
+        real_unpack = cache_mod._unpack_value
+        held = []
+
+        def unpack(value):
+            held.append(cache._lock._is_owned())
+            return real_unpack(value)
+
+        monkeypatch.setattr(cache_mod, "_unpack_value", unpack)
+        cache._checkpoint()
+        assert held == [False]
+        assert cache._store.read_value("a") == "inflate me " * 50
+
+    def test_checkpointed_entries_survive_without_shutdown(self, make_cache):
+        first = make_cache()
+        first.set("a", "kept")
+        first._checkpoint()
+        first.set("b", "lost with the process")
+        # A second process opens the file while the first is still running
+        # (or after it crashed): only checkpointed rows are visible.
+        second = make_cache()
+        assert second.get("a") == "kept"
+        assert second.get("b") is None
+
+    def test_corrupt_row_is_a_miss(self, make_cache, temp_dir):
+        first = make_cache()
+        first.set("a", "value")
+        first.shutdown()
+        with sqlite3.connect(temp_dir / "snapshot.sqlite3") as conn:
+            conn.execute("UPDATE entries SET checksum = checksum + 1")
+
+        second = make_cache()
+        assert second.get("a") is None
+        stats = second.stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 1
+        assert stats["lazy_load_failures"] == 1
+        assert stats["total_entries"] == 0
+
+    def test_expired_rows_are_dropped_on_restore(self, make_cache, temp_dir):
+        first = make_cache()
+        first.set("a", "value")
+        first.shutdown()
+        with sqlite3.connect(temp_dir / "snapshot.sqlite3") as conn:
+            conn.execute("UPDATE entries SET created_at = created_at - 3600")
+
+        second = make_cache()
+        assert second.stats()["total_entries"] == 0
+        second._checkpoint()
+        assert second._store.count() == 0
+
+    def test_clear_empties_the_store(self, make_cache):
+        cache = make_cache()
+        cache.set("a", 1)
+        cache._checkpoint()
+        cache.clear()
+        cache.set("b", 2)
+        cache._checkpoint()
+        assert [r.key for r in cache._store.load_index()] == ["b"]
+
+    def test_background_thread_checkpoints(self, make_cache):
+        cache = make_cache(enable_background_cleanup=True, cleanup_interval=0.05)
+        cache.set("a", 1)
+        deadline = time.monotonic() + 5
+        while cache._store.count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert cache._store.count() == 1
+
+    def test_restore_respects_tightened_caps(self, make_cache):
+        first = make_cache()
+        for i in range(5):
+            first.set(f"k{i}", i)
+        first.shutdown()
+        second = make_cache(max_size=2)
+        assert second.stats()["size"] == 2
+        assert second.get("k4") == 4
+        second._checkpoint()
+        assert second._store.count() == 2
+
+
+def test_json_backend_is_default():
+    assert CacheConfig().persistence_backend == "json"
+
+
+class TestSharedTier:
+    """The cross-process tier (``shared_path``), two caches standing in for
+    two worker processes."""
+
+    @pytest.fixture
+    def pair(self, temp_dir):
+        caches = [
+            OpenZimMcpCache(
+                CacheConfig(
+                    enabled=True,
+                    max_size=100,
+                    ttl_seconds=60,
+                    shared_path=str(temp_dir / "shared.sqlite3"),
+                ),
+                enable_background_cleanup=False,
+            )
+            for _ in range(2)
+        ]
+        yield caches
+        for cache in caches:
+            cache.shutdown()
+
+    def test_set_in_one_process_is_a_hit_in_the_other(self, pair):
+        writer, reader = pair
+        writer.set("bundle:wiki.zim@1:2:A", {"text": "é", "sections": [1, 2]})
+        assert reader.get("bundle:wiki.zim@1:2:A") == {
+            "text": "é",
+            "sections": [1, 2],
+        }
+        stats = reader.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 0
+        assert stats["shared"]["hits"] == 1
+        assert reader.counters()["shared_hits"] == 1
+        # The reader kept a local copy: the next hit never touches SQLite.
+        reader.get("bundle:wiki.zim@1:2:A")
+        assert reader.stats()["shared"]["hits"] == 1
+        assert reader.get("absent") is None
+        assert reader.stats()["misses"] == 1
+
+    def test_values_json_would_change_stay_local(self, pair):
+        writer, reader = pair
+        writer.set("tuple", ("a", 1))
+        writer.set("int_keys", {1: "x"})
+        writer.set("object", object())
+        assert reader.get("tuple") is None
+        assert reader.get("int_keys") is None
+        assert reader.get("object") is None
+        assert writer.stats()["shared"]["skipped"] == 3
+
+    def test_local_copy_keeps_the_writers_expiry(self, pair):
+        writer, reader = pair
+        writer.set("k", "v")
+        reader._shared._conn.execute(
+            "UPDATE shared_entries SET created_at = created_at - 50"
+        )
+        reader._shared._conn.commit()
+        assert reader.get("k") == "v"
+        assert reader._cache["k"].ttl_seconds == 60
+        assert time.monotonic() - reader._cache["k"].created_at >= 50
+
+    def test_expired_rows_miss_and_are_pruned(self, pair):
+        writer, reader = pair
+        writer.set("k", "v")
+        writer._shared._conn.execute(
+            "UPDATE shared_entries SET created_at = created_at - 120"
+        )
+        writer._shared._conn.commit()
+        assert reader.get("k") is None
+        assert writer._shared.prune() == 1
+
+    def test_delete_and_clear_reach_every_process(self, pair):
+        writer, reader = pair
+        writer.set("a", 1)
+        writer.set("b", 2)
+        writer.delete("a")
+        assert reader.get("a") is None
+        writer.clear()
+        assert reader.get("b") is None
+
+    def test_prune_drops_oldest_writes_past_the_cap(self, temp_dir):
+        store = SharedCacheStore(temp_dir / "shared.sqlite3", max_bytes=1)
+        for key in ("old", "mid", "new"):
+            assert store.put(
+                key, key * 50, ttl_seconds=60, ancillary=False, size_bytes=1
+            )
+        store.max_bytes = (
+            store._conn.execute(
+                "SELECT SUM(stored_bytes) FROM shared_entries"
+            ).fetchone()[0]
+            - 1
+        )
+        assert store.prune() == 1
+        assert store.get("old") is None and store.get("new") is not None
+        store.close()
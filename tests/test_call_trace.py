@@ -0,0 +1,159 @@
+"""Call-trace recording and the replay harness that consumes the traces."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from libzim.writer import Creator
+
+from benchmarks.replay import (
+    build_server,
+    load_trace,
+    percentile,
+    replay,
+    resolve_archives,
+)
+from benchmarks.workloads import synthetic_trace, write_trace
+from openzim_mcp.call_trace import (
+    CallTraceRecorder,
+    note_cache_lookup,
+    sanitize_arguments,
+    tally_cache_lookups,
+)
+from openzim_mcp.config import OpenZimMcpConfig
+from openzim_mcp.server import OpenZimMcpServer
+from tests.conftest_v2_fixtures import _HtmlItem
+
+
+@pytest.fixture
+def small_zim(tmp_path: Path) -> Path:
+    zim = tmp_path / "zims" / "small.zim"
+    zim.parent.mkdir()
+    with Creator(zim).config_indexing(True, "eng") as creator:
+        for i in range(12):
+            creator.add_item(
+                _HtmlItem(
+                    f"Page_{i}",
+                    f"Page {i}",
+                    f"<html><body><p>Page {i} lead.</p><h2>More</h2>"
+                    f'<p>Body <a href="Page_{(i + 1) % 12}">next</a></p>'
+                    "</body></html>",
+                )
+            )
+        creator.set_mainpath("Page_0")
+    return zim
+
+
+def test_sanitize_arguments_strips_archive_directories() -> None:
+    clean = sanitize_arguments(
+        {
+            "zim_file_path": "/srv/private/zims/wiki.zim",
+            "zim_file_paths": ["C:\\data\\a.zim", "/x/b.zim"],
+            "query": "line\nbreak\x00",
+            "limit": 5,
+            "filters": {"zim_file_path": "/deep/c.zim"},
+        }
+    )
+    assert clean["zim_file_path"] == "wiki.zim"
+    assert clean["zim_file_paths"] == ["a.zim", "b.zim"]
+    assert "\n" not in clean["query"] and "\x00" not in clean["query"]
+    assert clean["limit"] == 5
+    assert clean["filters"] == {"zim_file_path": "c.zim"}
+
+
+def test_tally_counts_only_inside_its_block_and_follows_threads() -> None:
+    note_cache_lookup(True)  # nothing tallied: a no-op
+    with tally_cache_lookups() as tally:
+        note_cache_lookup(True)
+        note_cache_lookup(False)
+        asyncio.run(asyncio.to_thread(note_cache_lookup, True))
+        # A bare thread does not copy the context and goes uncounted.
+        worker = threading.Thread(target=note_cache_lookup, args=(True,))
+        worker.start()
+        worker.join()
+    assert tally.as_dict() == {"hits": 2, "misses": 1}
+
+
+def test_recorder_appends_lines_and_stops_after_close(tmp_path: Path) -> None:
+    recorder = CallTraceRecorder(tmp_path / "nested" / "trace.jsonl")
+    recorder.record(
+        "zim_get", {"zim_file_path": "/a/b.zim"}, latency_ms=1.23456, ok=True
+    )
+    recorder.close()
+    recorder.record("zim_get", {}, latency_ms=1.0, ok=True)
+    recorder.close()
+    lines = (tmp_path / "nested" / "trace.jsonl").read_text().splitlines()
+    assert len(lines) == 1 and recorder.recorded == 1
+    record = json.loads(lines[0])
+    assert record["tool"] == "zim_get"
+    assert record["args"] == {"zim_file_path": "b.zim"}
+    assert record["latency_ms"] == 1.235
+    assert record["cache"] == {"hits": 0, "misses": 0}
+
+
+@pytest.mark.asyncio
+async def test_server_records_every_tool_call(small_zim: Path, tmp_path: Path) -> None:
+    trace_path = tmp_path / "trace.jsonl"
+    server = OpenZimMcpServer(
+        OpenZimMcpConfig(
+            allowed_directories=[str(small_zim.parent)],
+            tool_mode="advanced",
+            call_trace_path=trace_path,
+        )
+    )
+    args = {"zim_file_path": str(small_zim), "entry_path": "Page_3"}
+    await server.mcp.call_tool("zim_get", args)
+    await server.mcp.call_tool("zim_get", args)
+    await server.mcp.call_tool(
+        "zim_get", {"zim_file_path": "/nope.zim", "entry_path": "x"}
+    )
+    server.mcp.call_trace.close()
+
+    records = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert [r["tool"] for r in records] == ["zim_get"] * 3
+    assert records[0]["args"] == {"zim_file_path": "small.zim", "entry_path": "Page_3"}
+    assert records[0]["cache"]["misses"] >= 1
+    # The repeat is answered from the cache the first call filled.
+    assert records[1]["cache"] == {"hits": 1, "misses": 0}
+    assert records[0]["ok"] and records[1]["ok"] and not records[2]["ok"]
+
+
+def test_percentile_is_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_synthetic_trace_is_deterministic(small_zim: Path) -> None:
+    first = synthetic_trace(small_zim, calls=40, seed=3)
+    assert first == synthetic_trace(small_zim, calls=40, seed=3)
+    assert first != synthetic_trace(small_zim, calls=40, seed=4)
+    assert {r["args"]["zim_file_path"] for r in first} == {"small.zim"}
+    assert {r["tool"] for r in first} <= {
+        "zim_get",
+        "zim_search",
+        "zim_links",
+        "zim_query",
+    }
+
+
+def test_replay_resolves_names_and_reports(small_zim: Path, tmp_path: Path) -> None:
+    trace = tmp_path / "trace.jsonl"
+    write_trace(synthetic_trace(small_zim, calls=30, seed=1), trace)
+    records = resolve_archives(load_trace(trace), small_zim.parent.parent)
+    assert {r["args"]["zim_file_path"] for r in records} == {str(small_zim)}
+
+    server = build_server(small_zim.parent)
+    cold = asyncio.run(replay(server, records, concurrency=4)).summary()
+    warm = asyncio.run(replay(server, records, concurrency=4)).summary()
+    assert cold["calls"] == 30 and cold["errors"] == 0
+    assert sum(row["calls"] for row in cold["tools"].values()) == 30
+    assert warm["cache"]["hit_rate"] > cold["cache"]["hit_rate"]
+    assert warm["cache"]["misses"] == 0
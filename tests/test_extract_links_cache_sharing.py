@@ -78,18 +78,20 @@ def test_paged_requests_share_one_html_parse(ops_with_cache, temp_dir, big_links
     zim.touch()
 
     parse_calls = 0
-    real_extract = ops_with_cache.content_processor.extract_html_links
+    # The bundle reads links off its already-parsed tree, so the soup-level
+    # extractor is the one call per bundle build.
+    real_extract = ops_with_cache.content_processor._extract_links_from_soup
 
-    def counting_extract(html: str):
+    def counting_extract(soup):
         nonlocal parse_calls
         parse_calls += 1
-        return real_extract(html)
+        return real_extract(soup)
 
     with (
         patch("openzim_mcp.zim_operations.zim_archive") as mock_archive_ctx,
         patch.object(
             ops_with_cache.content_processor,
-            "extract_html_links",
+            "_extract_links_from_soup",
             side_effect=counting_extract,
         ),
     ):
@@ -25,7 +25,7 @@ def _stub_structure_mixin():
         def __init__(self):
             self.cache = MagicMock()
             self.cache.get = lambda k: None
-            self.cache.set = lambda k, v: None
+            self.cache.set = lambda k, v, **kw: None
             self.content_processor = MagicMock()
             config = MagicMock()
             config.content.max_content_length = 8000
@@ -56,6 +56,27 @@ def test_readyz_returns_503_when_dirs_unreadable(mock_server):
     assert resp.json()["status"] == "not_ready"
 
 
+def test_metrics_serves_prometheus_text(tmp_path):
+    """/metrics renders the server's counters and stage histograms."""
+    from openzim_mcp.config import OpenZimMcpConfig
+    from openzim_mcp.http_app import build_starlette_app
+    from openzim_mcp.server import OpenZimMcpServer
+    from openzim_mcp.timings import span
+
+    server = OpenZimMcpServer(
+        OpenZimMcpConfig(allowed_directories=[str(tmp_path)], transport="http")
+    )
+    with span("unit_metrics"):
+        pass
+    client = TestClient(build_starlette_app(server))
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'stage_duration_seconds_count{stage="unit_metrics"}' in resp.text
+    assert "openzim_mcp_cache_hits_total " in resp.text
+    assert "openzim_mcp_archive_handles_open " in resp.text
+
+
 def test_run_http_dispatches_to_serve_helper(monkeypatch, tmp_path):
     """server.run(streamable-http) routes through http_app.serve_streamable_http."""
     from openzim_mcp.config import OpenZimMcpConfig
@@ -363,9 +384,13 @@ def test_serve_streamable_http_runs_safe_check_and_serves(
         call.args[0]: call.kwargs["methods"]
         for call in server.mcp.custom_route.call_args_list
     }
-    assert registered == {"/healthz": ["GET"], "/readyz": ["GET"]}
+    assert registered == {
+        "/healthz": ["GET"],
+        "/readyz": ["GET"],
+        "/metrics": ["GET"],
+    }
     decorated = server.mcp.custom_route.return_value.call_args_list
-    assert len(decorated) == 2
+    assert len(decorated) == 3
     assert all(callable(call.args[0]) for call in decorated)
     # Transport config reaches the app builder as arguments (there is no
     # settings object to mutate ahead of the call).
@@ -0,0 +1,259 @@
+"""Multi-worker HTTP serving: session routing, metrics merge, the worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from libzim.writer import Creator
+
+from openzim_mcp.config import CacheConfig, OpenZimMcpConfig
+from openzim_mcp.exceptions import OpenZimMcpConfigurationError
+from openzim_mcp.http_workers import (
+    RouterForwardedHeaders,
+    SessionTable,
+    StickyRouter,
+    merge_worker_metrics,
+    serve_multi_worker,
+    worker_config,
+)
+from openzim_mcp.rate_limiter import RateLimitConfig
+from openzim_mcp.server import OpenZimMcpServer
+from tests.conftest_v2_fixtures import _HtmlItem
+
+_ACCEPT = {
+    "accept": "application/json, text/event-stream",
+    "content-type": "application/json",
+}
+_INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+
+
+def test_new_sessions_spread_and_known_sessions_stick() -> None:
+    table = SessionTable(3)
+    assert [table.route(None) for _ in range(3)] == [0, 1, 2]
+    table.started(0)
+    table.started(1)
+    assert table.route(None) == 2  # least in flight wins over rotation
+    table.learn("abc", 1)
+    assert all(table.route("abc") == 1 for _ in range(5))
+    # An unknown id still routes somewhere stable, for the worker's 404.
+    assert table.route("zzz") == table.route("zzz")
+    table.forget("abc")
+    assert len(table) == 0
+
+
+def test_session_table_is_bounded_and_forgets_restarted_workers() -> None:
+    table = SessionTable(2, max_sessions=2)
+    table.learn("a", 0)
+    table.learn("b", 1)
+    table.route("a")  # refresh: "b" is now the oldest
+    table.learn("c", 0)
+    assert len(table) == 2 and table.route("a") == 0
+    table.forget_worker(0)
+    assert len(table) == 0
+
+
+def test_merge_worker_metrics_groups_families_and_labels_workers() -> None:
+    text = (
+        "# HELP up_total Things.\n"
+        "# TYPE up_total counter\n"
+        'up_total{tool="x"} 1\n'
+        "# TYPE bare gauge\n"
+        "bare 2.0\n"
+        "empty_sum{} 3\n"
+    )
+    merged = merge_worker_metrics({0: text, 1: text}).splitlines()
+    assert merged.count("# TYPE up_total counter") == 1
+    type_at = merged.index("# TYPE up_total counter")
+    assert merged[type_at + 1 : type_at + 3] == [
+        'up_total{worker="0",tool="x"} 1',
+        'up_total{worker="1",tool="x"} 1',
+    ]
+    assert 'bare{worker="1"} 2.0' in merged
+    assert 'empty_sum{worker="0"} 3' in merged
+
+
+def test_worker_config_shares_one_cache_tier(tmp_path: Path) -> None:
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(tmp_path)],
+        transport="http",
+        workers=4,
+        cache=CacheConfig(persistence_enabled=True),
+    )
+    per_worker = worker_config(config, tmp_path)
+    assert per_worker.workers == 1
+    assert per_worker.cache.shared_path == str(tmp_path / "shared-cache.sqlite3")
+    assert not per_worker.cache.persistence_enabled
+
+    pinned = config.model_copy(
+        update={"cache": CacheConfig(shared_path=str(tmp_path / "mine.sqlite3"))}
+    )
+    assert worker_config(pinned, tmp_path).cache.shared_path == str(
+        tmp_path / "mine.sqlite3"
+    )
+
+
+def test_worker_config_divides_rate_limits(tmp_path: Path) -> None:
+    """N workers with their own buckets must not grant N times the budget."""
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(tmp_path)],
+        transport="http",
+        workers=4,
+        rate_limit=RateLimitConfig(
+            requests_per_second=10.0,
+            burst_size=20,
+            per_operation_limits={
+                "search": RateLimitConfig(requests_per_second=2.0, burst_size=2)
+            },
+        ),
+    )
+    limits = worker_config(config, tmp_path).rate_limit
+    assert limits.requests_per_second == 2.5
+    assert limits.burst_size == 5
+    search = limits.per_operation_limits["search"]
+    assert (search.requests_per_second, search.burst_size) == (0.5, 1)
+    assert config.rate_limit.requests_per_second == 10.0
+
+
+def _client_seen_by_worker(client: object, headers: list) -> tuple:
+    seen: dict = {}
+
+    async def app(scope, receive, send):
+        seen.update(client=scope["client"], scheme=scope["scheme"])
+
+    scope = {
+        "type": "http",
+        "client": client,
+        "scheme": "http",
+        "headers": headers,
+    }
+    asyncio.run(RouterForwardedHeaders(app)(scope, None, None))
+    return seen["client"], seen["scheme"]
+
+
+def test_worker_trusts_forwarding_headers_only_from_the_router_socket() -> None:
+    headers = [(b"x-forwarded-for", b"203.0.113.7"), (b"x-forwarded-proto", b"https")]
+    # Over the Unix socket (no peer address): the router's header is used.
+    assert _client_seen_by_worker(None, headers) == (("203.0.113.7", 0), "https")
+    # A network peer's own header is ignored.
+    peer = ("198.51.100.2", 5555)
+    assert _client_seen_by_worker(peer, headers) == (peer, "http")
+
+
+def test_workers_need_the_http_transport(tmp_path: Path) -> None:
+    server = OpenZimMcpServer(
+        OpenZimMcpConfig(allowed_directories=[str(tmp_path)], workers=2)
+    )
+    with pytest.raises(OpenZimMcpConfigurationError, match="'http' transport"):
+        server.run()
+
+
+@pytest.mark.asyncio
+async def test_router_answers_for_unreachable_and_oversized(tmp_path: Path) -> None:
+    router = StickyRouter([str(tmp_path / "missing.sock")], max_body_size=1024)
+    transport = httpx.ASGITransport(app=router)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://127.0.0.1:8000"
+    ) as client:
+        unreachable = await client.post("/mcp", json=_INITIALIZE, headers=_ACCEPT)
+        oversized = await client.post("/mcp", content=b"x" * 1025, headers=_ACCEPT)
+    await router.aclose()
+    assert unreachable.status_code == 502
+    assert oversized.status_code == 413
+    assert router.sessions.in_flight() == [0]
+
+
+def test_sessions_stay_on_the_worker_that_minted_them(tmp_path: Path) -> None:
+    """Two real worker processes behind the router, driven in-process."""
+    zim = tmp_path / "small.zim"
+    with Creator(zim).config_indexing(True, "eng") as creator:
+        for i in range(3):
+            creator.add_item(
+                _HtmlItem(
+                    f"Page_{i}",
+                    f"Page {i}",
+                    f"<html><body><p>Page {i} is about cats.</p></body></html>",
+                )
+            )
+        creator.set_mainpath("Page_0")
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(tmp_path)],
+        transport="http",
+        tool_mode="advanced",
+        workers=2,
+    )
+    seen = {}
+
+    async def drive(router: StickyRouter) -> None:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=router),
+            base_url="http://127.0.0.1:8000",
+        ) as client:
+            sessions = []
+            for _ in range(2):
+                response = await client.post("/mcp", json=_INITIALIZE, headers=_ACCEPT)
+                assert response.status_code == 200
+                sessions.append(response.headers["mcp-session-id"])
+            seen["owners"] = {s: router.sessions.route(s) for s in sessions}
+            for session in sessions:
+                headers = {
+                    **_ACCEPT,
+                    "mcp-session-id": session,
+                    "mcp-protocol-version": "2025-06-18",
+                }
+                await client.post(
+                    "/mcp",
+                    json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+                    headers=headers,
+                )
+                call = await client.post(
+                    "/mcp",
+                    json={
+                        "jsonrpc": "2.0",
+                        "id": 2,
+                        "method": "tools/call",
+                        "params": {
+                            "name": "zim_get",
+                            "arguments": {
+                                "zim_file_path": str(zim),
+                                "entry_path": "Page_1",
+                            },
+                        },
+                    },
+                    headers=headers,
+                )
+                # A session routed to the wrong worker would get a 404 here.
+                assert call.status_code == 200 and "Page 1" in call.text
+            seen["metrics"] = (await client.get("/metrics")).text
+            closed = await client.delete(
+                "/mcp", headers={**_ACCEPT, "mcp-session-id": sessions[0]}
+            )
+            assert closed.status_code == 200
+            seen["left"] = len(router.sessions)
+        await router.aclose()
+
+    serve_multi_worker(config, runner=lambda app, host, port: asyncio.run(drive(app)))
+    assert sorted(seen["owners"].values()) == [0, 1]
+    metrics = seen["metrics"]
+    assert 'openzim_mcp_worker_up{worker="0"} 1' in metrics
+    assert 'openzim_mcp_worker_up{worker="1"} 1' in metrics
+    # The second worker's call was answered from the tier the first filled.
+    assert "openzim_mcp_cache_shared_hits_total{worker=" in metrics
+    shared_hits = [
+        float(line.rsplit(" ", 1)[1])
+        for line in metrics.splitlines()
+        if line.startswith("openzim_mcp_cache_shared_hits_total{")
+    ]
+    assert sum(shared_hits) >= 1
+    assert seen["left"] == 1
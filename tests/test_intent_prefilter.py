@@ -0,0 +1,124 @@
+"""Equivalence of ``parse_intent``'s trigger-word prefilter.
+
+The compiled dispatch stage skips ``INTENT_PATTERNS`` rows whose required
+literals are absent from the query. It must never skip a row that would
+have matched: checked row by row, and end to end against the unfiltered
+scan, on every query in ``tests/dispatch_eval/probes.jsonl``.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+import openzim_mcp.intent_parser as ip
+from openzim_mcp.intent_parser import IntentParser
+from openzim_mcp.regex_shape import parse as parse_pattern
+
+PROBES = Path(__file__).parent / "dispatch_eval" / "probes.jsonl"
+
+
+def _probe_queries() -> list:
+    with PROBES.open(encoding="utf-8") as f:
+        return [json.loads(line)["query"] for line in f if line.strip()]
+
+
+PROBE_QUERIES = _probe_queries()
+
+# Surface forms the probe set under-represents: every intent's trigger,
+# mixed case, and non-ASCII text (which bypasses the prefilter).
+EXTRA_QUERIES = [
+    "LIST FILES",
+    "metadata for wikipedia.zim",
+    "details about this archive",
+    "Main Page",
+    "walk namespace C",
+    "section History of Rome",
+    "the early life section of Albert Einstein",
+    "outline of Berlin",
+    "table of contents for Paris",
+    "summarise evolution",
+    "links from Berlin",
+    "download image of the Eiffel tower",
+    "raw data for A/Berlin",
+    'autocomplete "evol"',
+    "search photosynthesis in namespace C",
+    "fetch entries A/One, A/Two",
+    "show the article about Rome",
+    "search all zim files for berlin",
+    "find article titled Berlin",
+    "what's the path for Berlin",
+    "what links to Paris",
+    "look for cats",
+    "tell me about ſearch engines",
+    "Qu'est-ce que la révolution française",
+]
+
+
+@pytest.mark.parametrize("query", PROBE_QUERIES + EXTRA_QUERIES)
+def test_prefilter_never_drops_a_matching_row(query: str) -> None:
+    lowered = query.lower()
+    kept = ip._intent_candidates(IntentParser.INTENT_PATTERNS, lowered)
+    for row in IntentParser.INTENT_PATTERNS:
+        if re.search(row[0], lowered, re.IGNORECASE):
+            assert row in kept, f"{row[1]} pattern skipped for {query!r}"
+
+
+def test_parse_intent_identical_with_and_without_prefilter(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    queries = PROBE_QUERIES + EXTRA_QUERIES
+    compiled = [IntentParser.parse_intent(q) for q in queries]
+    monkeypatch.setattr(ip, "_INTENT_PREFILTER", False)
+    scanned = [IntentParser.parse_intent(q) for q in queries]
+    assert compiled == scanned
+
+
+def test_prefilter_skips_rows() -> None:
+    kept = ip._intent_candidates(IntentParser.INTENT_PATTERNS, "photosynthesis")
+    assert len(kept) < len(IntentParser.INTENT_PATTERNS) // 2
+
+
+def test_non_ascii_query_scans_every_row() -> None:
+    patterns = IntentParser.INTENT_PATTERNS
+    assert ip._intent_candidates(patterns, "ſearch") is patterns
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        (r"\bmetadata\s+(?:for|about)\b", {"metadata"}),
+        (r"\b(main|home)\s+page\b", {"main", "home"}),
+        (r"\blinks?\s+to\b", {"link"}),
+        (r"\b(?:\w+)\s+foo|bar", {"foo", "bar"}),
+        (r"(?:ab)?\w+", None),
+        (r"\w+\s+(?:x|\d+)", None),
+    ],
+)
+def test_required_literals(pattern: str, expected) -> None:
+    found = ip._required_literals(parse_pattern(pattern, re.IGNORECASE))
+    assert (None if found is None else set(found)) == expected
+
+
+def test_table_recompiles_when_patterns_change() -> None:
+    patched = [(r"\bzebra\b", "search", 0.7, 3)]
+    assert ip._intent_candidates(patched, "a zebra") == patched
+    assert ip._intent_candidates(patched, "a horse") == []
+    kept = ip._intent_candidates(IntentParser.INTENT_PATTERNS, "search x")
+    assert ("search" in {row[1] for row in kept}) and len(kept) > 1
+
+
+@pytest.mark.parametrize("dispatch", ["scan", "prefilter"])
+def test_parse_intent_prefilter_benchmark(
+    benchmark, monkeypatch: pytest.MonkeyPatch, dispatch: str
+) -> None:
+    """``parse_intent`` over the probe set, with and without the prefilter."""
+    monkeypatch.setattr(ip, "_INTENT_PREFILTER", dispatch == "prefilter")
+    benchmark.group = "parse_intent_dispatch"
+
+    def run() -> None:
+        for query in PROBE_QUERIES:
+            IntentParser.parse_intent(query)
+
+    benchmark.pedantic(run, rounds=5, warmup_rounds=1)
@@ -0,0 +1,179 @@
+"""Tests for the inline fast path of the ``safe_regex_*`` helpers.
+
+Vetted-linear patterns on query-sized input run on the calling thread;
+patterns with nested repeats or backreferences, and over-long inputs, keep
+the pooled timeout. ``test_parse_intent_benchmark`` times ``parse_intent``
+through both paths (``make benchmark`` compares them).
+"""
+
+import re
+
+import pytest
+
+import openzim_mcp.intent_parser as ip
+from openzim_mcp.intent_parser import (
+    IntentParser,
+    safe_regex_findall,
+    safe_regex_search,
+    safe_regex_sub,
+)
+from openzim_mcp.regex_shape import parse as parse_pattern
+
+BENCH_QUERIES = [
+    "tell me about berlin",
+    "search for photosynthesis in wikipedia",
+    "get the history section of Rome",
+    "what links to Paris",
+    "list namespaces",
+    "show article A/Berlin",
+    "find articles titled evolution",
+    "population of france please",
+]
+
+
+@pytest.fixture
+def pool_calls(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Record every call that reaches the pooled ``run_with_timeout``."""
+    calls: list = []
+    real = ip.run_with_timeout
+
+    def spy(func, *args, **kwargs):
+        calls.append(kwargs.get("pool"))
+        return real(func, *args, **kwargs)
+
+    monkeypatch.setattr(ip, "run_with_timeout", spy)
+    return calls
+
+
+class TestVetting:
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"\bsearch\s+for\s+(.+)$",
+            r"namespace\s+([A-Za-z])\b",
+            r"^(?:a|b)+c*$",
+            r"(?=\w+)\w",
+        ],
+    )
+    def test_linear_patterns_pass(self, pattern: str) -> None:
+        assert ip._vet(pattern).linear
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            r"(a+)+$",
+            r"(?:\s+\w+)*x",
+            r"(\w+)\s+\1",
+            r"(?:(?:ab)*c)+",
+            # A repeated alternation whose branches can match the same text.
+            r"(a|a)*b",
+            r"(a|aa)*b",
+            # Unbounded repeats over the same characters compound.
+            r"\s*\s*\s*\s*\s*x",
+            r".*foo.*bar",
+            r"(?:\s+|a)\s*y",
+            r"\b(search|find)\s+.+\s+(in|within)\s+namespace\b",
+        ],
+    )
+    def test_risky_patterns_flagged(self, pattern: str) -> None:
+        assert not ip._vet(pattern).linear
+
+    def test_intent_table_parses_without_re_internals(self) -> None:
+        for pattern, *_rest in IntentParser.INTENT_PATTERNS:
+            assert parse_pattern(pattern, re.IGNORECASE)
+
+    def test_intent_table_vetting(self) -> None:
+        """The table is vetted here, not at import; only these stay pooled."""
+        pooled = [
+            pattern
+            for pattern, *_rest in IntentParser.INTENT_PATTERNS
+            if not ip._vet(pattern, re.IGNORECASE).linear
+        ]
+        assert pooled == [
+            r"\bsection\s+\S+.*\s+(?:of|in|from)\s+\S+",
+            r"\bthe\s+\S+.*\s+section\s+(?:of|in|from)\s+\S+",
+            r"\b(search|find|look)\s+.+\s+(in|within)\s+(namespace|type)\b",
+        ]
+
+    def test_intent_table_is_not_vetted_at_import(self) -> None:
+        import subprocess
+        import sys
+
+        code = (
+            "import openzim_mcp.intent_parser as ip; "
+            "assert ip._intent_table == [] and not ip._VETTED"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_compiles_once(self) -> None:
+        first = ip._vet(r"unique-pattern-\d+", re.IGNORECASE)
+        assert ip._vet(r"unique-pattern-\d+", re.IGNORECASE) is first
+
+    def test_intent_table_is_vetted_at_import(self) -> None:
+        for pattern, *_rest in IntentParser.INTENT_PATTERNS:
+            assert (pattern, re.IGNORECASE) in ip._VETTED
+
+
+class TestInlineFastPath:
+    def test_linear_pattern_runs_inline(self, pool_calls: list) -> None:
+        match = safe_regex_search(r"hello\s+(\w+)", "hello world")
+        assert match is not None and match.group(1) == "world"
+        assert safe_regex_findall(r"\d+", "a1b22") == ["1", "22"]
+        assert safe_regex_sub(re.compile(r"\s+"), " ", "a   b") == "a b"
+        assert pool_calls == []
+
+    def test_risky_pattern_uses_pool(self, pool_calls: list) -> None:
+        assert safe_regex_search(r"(a+)+b", "aaab") is not None
+        assert pool_calls == ["regex"]
+
+    def test_long_input_uses_pool(self, pool_calls: list) -> None:
+        text = "x" * (ip._INLINE_MAX_CHARS + 1)
+        assert safe_regex_sub(r"x", "y", text) == "y" * len(text)
+        assert pool_calls == ["regex"]
+
+    def test_results_match_plain_re(self) -> None:
+        text = "Search for Berlin in 'wikipedia.zim'"
+        pattern = r"search\s+for\s+(\w+)"
+        assert safe_regex_search(pattern, text, re.IGNORECASE).group(1) == (
+            re.search(pattern, text, re.IGNORECASE).group(1)
+        )
+        assert safe_regex_sub(pattern, "X", text, re.IGNORECASE) == re.sub(
+            pattern, "X", text, flags=re.IGNORECASE
+        )
+
+    def test_compile_errors_propagate(self) -> None:
+        with pytest.raises(re.error):
+            safe_regex_search(r"(unclosed", "text")
+
+    def test_parse_intent_matches_pooled_path(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        inline = [IntentParser.parse_intent(q) for q in BENCH_QUERIES]
+        monkeypatch.setattr(ip, "_INLINE_FAST_PATH", False)
+        pooled = [IntentParser.parse_intent(q) for q in BENCH_QUERIES]
+        assert inline == pooled
+
+    def test_parse_intent_stays_off_the_pool(self, pool_calls: list) -> None:
+        IntentParser.parse_intent("tell me about berlin")
+        # Only table patterns that fail vetting may reach the pool.
+        risky = sum(
+            1
+            for pattern, *_rest in IntentParser.INTENT_PATTERNS
+            if not ip._vet(pattern, re.IGNORECASE).linear
+        )
+        assert len(pool_calls) <= risky + 1
+
+
+@pytest.mark.parametrize("path", ["pooled", "inline"])
+def test_parse_intent_benchmark(
+    benchmark, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    """``parse_intent`` latency over a fixed query mix, per regex path."""
+    monkeypatch.setattr(ip, "_INLINE_FAST_PATH", path == "inline")
+    benchmark.group = "parse_intent"
+
+    def run() -> None:
+        for query in BENCH_QUERIES:
+            IntentParser.parse_intent(query)
+
+    benchmark.pedantic(run, rounds=20, warmup_rounds=2)
@@ -0,0 +1,148 @@
+"""Lead-only snippet rendering: the cut, its guards, and equivalence."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from bs4 import BeautifulSoup
+from libzim.writer import Creator
+
+from openzim_mcp.cache import OpenZimMcpCache
+from openzim_mcp.config import CacheConfig, ContentConfig, OpenZimMcpConfig
+from openzim_mcp.content_processor import (
+    HTML_PARSER,
+    ContentProcessor,
+    select_main_content,
+)
+from openzim_mcp.lead_snippet import LEAD_SLACK_PARAGRAPHS, extract_lead_html
+from openzim_mcp.security import PathValidator
+from openzim_mcp.zim.archive import zim_archive
+from openzim_mcp.zim_operations import ZimOperations
+from tests.conftest_v2_fixtures import _HtmlItem
+
+_LEAD = (
+    "<h1>Berlin</h1>"
+    '<div class="hatnote">For other uses, see Berlin (disambiguation).</div>'
+    '<table class="infobox"><tr><th>Country</th><td>Germany</td></tr>'
+    "<tr><td><p>Not a lead paragraph.</p></td></tr></table>"
+    "<figure><figcaption><p>Nor this caption.</p></figcaption></figure>"
+    '<p><b>Berlin</b> is the capital of <a href="Germany">Germany</a>.'
+    '<sup class="reference">[1]</sup></p>'
+    "<p>It straddles the banks of the Spree.</p>"
+    '<div class="navbox"><p>Navigation, not prose.</p></div>'
+    "<p>Its economy is based on high tech and services.</p>"
+    "<p>Berlin is a world city of culture.</p>"
+    "<p>The city has a continental climate.</p>"
+)
+_BODY = "".join(
+    f"<h2>Section {i}</h2><p>Paragraph {i} about the river Havel.</p>"
+    f"<table>{'<tr><td>cell</td></tr>' * 20}</table>"
+    for i in range(40)
+)
+
+
+def _page(lead: str = _LEAD, body: str = _BODY) -> str:
+    return f"<html><head><title>Berlin</title></head><body>{lead}{body}</body></html>"
+
+
+def _full(processor: ContentProcessor, html: str) -> str:
+    soup = select_main_content(BeautifulSoup(html, HTML_PARSER))
+    return processor._render_soup_to_text(soup, compact=True)
+
+
+def _lead_snippet(
+    processor: ContentProcessor, html: str, query: Optional[str], paragraphs: int
+) -> Optional[str]:
+    lead_html = extract_lead_html(html, paragraphs + LEAD_SLACK_PARAGRAPHS)
+    assert lead_html is not None
+    lead = processor._render_soup_to_text(
+        BeautifulSoup(lead_html, HTML_PARSER), compact=True
+    )
+    return processor.create_lead_snippet(
+        lead, query=query, title="Berlin", max_paragraphs=paragraphs
+    )
+
+
+def test_cut_counts_only_lead_paragraphs() -> None:
+    html = _page()
+    lead_html = extract_lead_html(html, 3)
+    assert lead_html is not None and html.startswith(lead_html)
+    # Table, caption and navbox paragraphs are skipped, not counted.
+    assert lead_html.endswith("<p>Its economy is based on high tech and services.</p>")
+    assert "Paragraph 0" not in lead_html
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        _page(lead="<main>" + _LEAD + "</main>"),
+        _page(
+            lead=_LEAD.replace('class="infobox"', 'class="wikitable"'),
+            body=_BODY + '<table class="infobox"><tr><td>x</td></tr></table>',
+        ),
+        _page(lead="<p>Only one paragraph.</p>", body=""),
+    ],
+    ids=["landmark", "infobox-after-cut", "too-short"],
+)
+def test_cut_refused_when_the_rest_could_change_the_render(html: str) -> None:
+    assert extract_lead_html(html, 5) is None
+
+
+@pytest.mark.parametrize("query", [None, "capital", "Spree economy", "the"])
+@pytest.mark.parametrize("paragraphs", [1, 2])
+def test_lead_snippet_matches_full_render(
+    query: Optional[str], paragraphs: int
+) -> None:
+    processor = ContentProcessor(snippet_length=300)
+    html = _page()
+    expected = processor.create_snippet(
+        _full(processor, html), query=query, title="Berlin", max_paragraphs=paragraphs
+    )
+    assert _lead_snippet(processor, html, query, paragraphs) == expected
+
+
+@pytest.mark.parametrize("query", ["Havel", "cell", "economical"])
+def test_lead_defers_when_the_hit_may_lie_past_the_cut(query: str) -> None:
+    assert _lead_snippet(ContentProcessor(), _page(), query, 2) is None
+
+
+def _ops(tmp_path: Path, lead_snippets: bool) -> ZimOperations:
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(tmp_path)],
+        cache=CacheConfig(enabled=True, max_size=50),
+        content=ContentConfig(lead_snippets=lead_snippets),
+    )
+    return ZimOperations(
+        config,
+        PathValidator(config.allowed_directories),
+        OpenZimMcpCache(config.cache),
+        ContentProcessor(snippet_length=config.content.snippet_length),
+    )
+
+
+def test_entry_snippet_renders_only_the_lead(tmp_path: Path) -> None:
+    zim = tmp_path / "berlin.zim"
+    with Creator(zim).config_indexing(True, "eng") as creator:
+        creator.add_item(_HtmlItem("Berlin", "Berlin", _page()))
+        creator.set_mainpath("Berlin")
+    lead_ops, full_ops = _ops(tmp_path, True), _ops(tmp_path, False)
+
+    def keys(ops: ZimOperations, prefix: str) -> list:
+        return [k for k in ops.cache._cache if str(k).startswith(prefix)]
+
+    with zim_archive(zim) as archive:
+        entry = archive.get_entry_by_path("Berlin")
+        for query in (None, "capital", "Havel"):
+            if query == "Havel":
+                assert keys(lead_ops, "snippet_lead:v1:")
+                assert not keys(lead_ops, "snippet_render:v1:")
+            assert lead_ops._get_entry_snippet(
+                entry, query=query, validated_path=str(zim)
+            ) == full_ops._get_entry_snippet(
+                entry, query=query, validated_path=str(zim)
+            )
+    # "Havel" lies past the lead, so that call alone paid for a full render.
+    assert keys(lead_ops, "snippet_render:v1:")
+    assert not keys(full_ops, "snippet_lead:v1:")
@@ -170,6 +170,23 @@ class TestMainModule:
         assert call_kwargs["host"] == "0.0.0.0"
         assert call_kwargs["port"] == 9000
 
+    @patch("openzim_mcp.main.OpenZimMcpServer")
+    @patch("openzim_mcp.main.OpenZimMcpConfig")
+    @patch(
+        "sys.argv",
+        ["openzim_mcp", "--transport", "http", "--workers", "4", "/test/dir"],
+    )
+    def test_main_http_with_workers(self, mock_config_class, mock_server_class):
+        """--workers passes through to config kwargs."""
+        from openzim_mcp.main import main
+
+        mock_config_class.return_value = MagicMock(transport="http")
+        mock_server_class.return_value = MagicMock()
+
+        main()
+
+        assert mock_config_class.call_args.kwargs["workers"] == 4
+
     @patch("openzim_mcp.main.OpenZimMcpServer")
     @patch("openzim_mcp.main.OpenZimMcpConfig")
     @patch("sys.argv", ["openzim_mcp", "--transport", "sse", "/test/dir"])
@@ -0,0 +1,122 @@
+"""Prometheus metrics: per-tool series and the lock-free component reads."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from libzim.writer import Creator
+
+from openzim_mcp.config import OpenZimMcpConfig
+from openzim_mcp.metrics import ToolMetrics, render_metrics
+from openzim_mcp.server import OpenZimMcpServer
+from openzim_mcp.timeout_utils import run_with_timeout
+from openzim_mcp.zim import archive as archive_module
+from tests.conftest_v2_fixtures import _HtmlItem
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> OpenZimMcpServer:
+    zim = tmp_path / "small.zim"
+    with Creator(zim).config_indexing(True, "eng") as creator:
+        for i in range(4):
+            creator.add_item(
+                _HtmlItem(
+                    f"Page_{i}",
+                    f"Page {i}",
+                    f"<html><body><p>Page {i} is about cats.</p></body></html>",
+                )
+            )
+        creator.set_mainpath("Page_0")
+    return OpenZimMcpServer(
+        OpenZimMcpConfig(allowed_directories=[str(tmp_path)], tool_mode="advanced")
+    )
+
+
+def _samples(text: str) -> Dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+def test_tool_metrics_count_outcomes_and_drain_in_flight() -> None:
+    metrics = ToolMetrics()
+    metrics.started("zim_get")
+    metrics.started("zim_get")
+    in_flight = _samples("\n".join(metrics.render()))
+    assert in_flight['openzim_mcp_tool_calls_in_flight{tool="zim_get"}'] == 2
+
+    metrics.finished("zim_get", 0.003, ok=True)
+    metrics.finished("zim_get", 20.0, ok=False)
+    samples = _samples("\n".join(metrics.render()))
+    assert samples['openzim_mcp_tool_calls_in_flight{tool="zim_get"}'] == 0
+    assert samples['openzim_mcp_tool_calls_total{tool="zim_get",outcome="ok"}'] == 1
+    assert samples['openzim_mcp_tool_calls_total{tool="zim_get",outcome="error"}'] == 1
+    bucket = 'openzim_mcp_tool_duration_seconds_bucket{tool="zim_get",le="%s"}'
+    assert samples[bucket % "0.005"] == 1
+    assert samples[bucket % "+Inf"] == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_feeds_tool_and_component_series(
+    server: OpenZimMcpServer, tmp_path: Path
+) -> None:
+    args = {"zim_file_path": str(tmp_path / "small.zim"), "entry_path": "Page_1"}
+    await server.mcp.call_tool("zim_get", args)
+    await server.mcp.call_tool("zim_get", args)
+    missing = {"zim_file_path": str(tmp_path / "nope.zim"), "entry_path": "x"}
+    assert (await server.mcp.call_tool("zim_get", missing)).is_error
+
+    samples = _samples(render_metrics(server))
+    ok = samples['openzim_mcp_tool_calls_total{tool="zim_get",outcome="ok"}']
+    errors = samples['openzim_mcp_tool_calls_total{tool="zim_get",outcome="error"}']
+    assert (ok, errors) == (2, 1)
+    assert samples['openzim_mcp_tool_calls_in_flight{tool="zim_get"}'] == 0
+    # The repeat was answered from the cache the first call filled.
+    assert samples["openzim_mcp_cache_hits_total"] >= 1
+    assert samples["openzim_mcp_rate_limit_enabled"] == 1
+    assert samples["openzim_mcp_archive_handles_open"] >= 1
+
+    run_with_timeout(lambda: None, 5.0, "timed out")  # starts the "io" pool
+    samples = _samples(render_metrics(server))
+    assert samples['openzim_mcp_thread_pool_queue_depth{pool="io"}'] == 0
+    assert samples['openzim_mcp_thread_pool_max_workers{pool="io"}'] >= 1
+
+
+def test_scrape_does_not_wait_on_component_locks(server: OpenZimMcpServer) -> None:
+    """A scrape completes while every hot-path lock is held elsewhere."""
+    locks = [
+        server.cache._lock,
+        server.rate_limiter._coarse_lock,
+        archive_module._ARCHIVE_POOL._lock,
+    ]
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold() -> None:
+        for lock in locks:
+            lock.acquire()
+        held.set()
+        release.wait(10)
+        for lock in reversed(locks):
+            lock.release()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    try:
+        assert held.wait(5)
+        scraped: Dict[str, str] = {}
+        scraper = threading.Thread(
+            target=lambda: scraped.update(text=render_metrics(server))
+        )
+        scraper.start()
+        scraper.join(5)
+        assert not scraper.is_alive()
+        assert "openzim_mcp_cache_entries" in scraped["text"]
+    finally:
+        release.set()
+        holder.join()
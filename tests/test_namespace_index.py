@@ -0,0 +1,133 @@
+"""Namespace range index: bisected id ranges of large old-scheme archives."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from openzim_mcp.cache import OpenZimMcpCache
+from openzim_mcp.config import CacheConfig, OpenZimMcpConfig
+from openzim_mcp.content_processor import ContentProcessor
+from openzim_mcp.security import PathValidator
+from openzim_mcp.zim.namespace import _bisect_namespace_ranges
+from openzim_mcp.zim_operations import ZimOperations
+
+
+class _Entry:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.title = path.split("/", 1)[1]
+        self.is_redirect = False
+
+    def get_item(self) -> Any:
+        raise RuntimeError("no content in this stub")
+
+
+class _OldSchemeArchive:
+    """Dirents sorted by namespace then path, and a counter of id reads."""
+
+    has_new_namespace_scheme = False
+
+    def __init__(self, paths: List[str]) -> None:
+        self._paths = paths
+        self.entry_count = len(paths)
+        self.reads = 0
+
+    def _get_entry_by_id(self, entry_id: int) -> _Entry:
+        self.reads += 1
+        return _Entry(self._paths[entry_id])
+
+    def get_entry_by_path(self, path: str) -> _Entry:
+        return _Entry(path)
+
+
+_PATHS = sorted(
+    ["-/style.css", "-/app.js"]
+    + [f"A/Article_{i:05d}" for i in range(3000)]
+    + [f"I/img_{i:04d}.png" for i in range(400)]
+    + ["M/Language", "M/Title"]
+)
+
+
+def test_bisection_finds_every_range_in_logarithmic_reads() -> None:
+    reads: List[int] = []
+
+    def get_path(entry_id: int) -> str:
+        reads.append(entry_id)
+        return _PATHS[entry_id]
+
+    ranges = _bisect_namespace_ranges(len(_PATHS), get_path)
+    assert ranges == {"-": (0, 2), "A": (2, 3002), "I": (3002, 3402), "M": (3402, 3404)}
+    assert len(set(reads)) < 60
+
+
+def test_bisection_refuses_ids_that_are_not_namespace_sorted() -> None:
+    paths = ["A/x", "A/y", "B/z", "A/w"]
+    assert _bisect_namespace_ranges(len(paths), paths.__getitem__) is None
+
+
+@pytest.fixture
+def ops_and_archive(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple]:
+    zim = tmp_path / "old.zim"
+    zim.write_bytes(b"stub")
+    archive = _OldSchemeArchive(_PATHS)
+
+    @contextmanager
+    def fake_archive(*args: Any, **kwargs: Any) -> Iterator[_OldSchemeArchive]:
+        yield archive
+
+    monkeypatch.setattr("openzim_mcp.zim_operations.zim_archive", fake_archive)
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(tmp_path)],
+        cache=CacheConfig(enabled=True, max_size=50),
+    )
+    ops = ZimOperations(
+        config,
+        PathValidator(config.allowed_directories),
+        OpenZimMcpCache(config.cache),
+        ContentProcessor(),
+    )
+    yield ops, archive, str(zim)
+
+
+def test_listing_reports_exact_totals(ops_and_archive: tuple) -> None:
+    ops, archive, zim = ops_and_archive
+    data: Dict[str, Any] = ops.list_namespaces_data(zim)
+    assert data["discovery_method"] == "namespace_index"
+    assert data["is_total_authoritative"] is True
+    assert {ns: row["total"] for ns, row in data["namespaces"].items()} == {
+        "-": 2,
+        "A": 3000,
+        "I": 400,
+        "M": 2,
+    }
+    assert archive.reads < 100
+    assert any(key.startswith("ns_ranges:v1:") for key in ops.cache._cache)
+
+
+def test_browse_pages_read_only_the_window(ops_and_archive: tuple) -> None:
+    ops, archive, zim = ops_and_archive
+    ops.list_namespaces_data(zim)  # builds and caches the ranges
+    archive.reads = 0
+    page = ops.browse_namespace_data(zim, "I", limit=10, offset=395)
+    assert page["total"] == 400
+    assert page["sampling_based"] is False
+    assert [row["path"] for row in page["results"]] == _PATHS[3397:3402]
+    assert page["done"] is True
+    assert archive.reads == 5
+
+
+def test_walk_starts_and_stops_at_the_range(ops_and_archive: tuple) -> None:
+    ops, archive, zim = ops_and_archive
+    ops.list_namespaces_data(zim)
+    archive.reads = 0
+    page = ops.walk_namespace_data(zim, "M", limit=50)
+    assert [row["path"] for row in page["results"]] == ["M/Language", "M/Title"]
+    assert page["done"] is True
+    assert page["namespace_entry_count"] == 2
+    assert archive.reads == 2
+    absent = ops.walk_namespace_data(zim, "X", limit=50)
+    assert absent["results"] == [] and absent["done"] is True
@@ -0,0 +1,231 @@
+"""Tests for the background cache prewarmer (``zim/prewarm.py``)."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from libzim.writer import Creator
+
+from openzim_mcp.bundle import _bundle_cache_key, archive_stat_token
+from openzim_mcp.cache import OpenZimMcpCache
+from openzim_mcp.config import (
+    CacheConfig,
+    ContentConfig,
+    LoggingConfig,
+    OpenZimMcpConfig,
+    WarmupConfig,
+)
+from openzim_mcp.content_processor import ContentProcessor
+from openzim_mcp.linkgraph.builder import build_link_graph
+from openzim_mcp.security import PathValidator
+from openzim_mcp.zim_operations import ZimOperations
+from tests.conftest_v2_fixtures import _HtmlItem
+
+
+@pytest.fixture
+def popular_zim(tmp_path: Path) -> Path:
+    """Home links to A, B, C; every page links to C, and B to A as well."""
+    zim = tmp_path / "popular.zim"
+    links = {
+        "Home": ["Page_A", "Page_B", "Page_C"],
+        "Page_A": ["Page_C"],
+        "Page_B": ["Page_A", "Page_C"],
+        "Page_C": ["Home"],
+        "Page_D": ["Page_C"],
+    }
+    with Creator(zim).config_indexing(False, "eng") as creator:
+        for name, targets in links.items():
+            body = "".join(f'<a href="{t}">{t}</a>' for t in targets)
+            creator.add_item(
+                _HtmlItem(
+                    name,
+                    f"Title {name}",
+                    f"<html><body><p>About {name}.</p><p>{body}</p></body></html>",
+                )
+            )
+        creator.set_mainpath("Home")
+    return zim
+
+
+def _ops(zim_dir: Path, **warmup: Any) -> ZimOperations:
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(zim_dir)],
+        cache=CacheConfig(enabled=True, max_size=100, ttl_seconds=300),
+        content=ContentConfig(snippet_length=200),
+        logging=LoggingConfig(level="WARNING"),
+        warmup=WarmupConfig(enabled=True, cpu_share=1.0, **warmup),
+    )
+    return ZimOperations(
+        config,
+        PathValidator(config.allowed_directories),
+        OpenZimMcpCache(config.cache),
+        ContentProcessor(snippet_length=200),
+    )
+
+
+def _warmed(ops: ZimOperations, zim: Path) -> List[str]:
+    """Entries whose bundle, snippet render and path mapping are all cached."""
+    validated = Path(ops._validate_zim_path(str(zim)))
+    token = archive_stat_token(validated)
+    return [
+        path
+        for path in ("Home", "Page_A", "Page_B", "Page_C", "Page_D")
+        if ops.cache.get(_bundle_cache_key(validated, path, True)) is not None
+        and ops.cache.get(f"snippet_render:v1:{validated}:{token}:{path}") is not None
+        and ops.cache.get(ops._path_mapping_cache_key(validated, path)) == path
+    ]
+
+
+def _wait_idle(ops: ZimOperations, archives: int) -> dict:
+    for _ in range(200):
+        stats = ops.prewarmer.stats()
+        if stats["archives_done"] >= archives and stats["state"] == "idle":
+            return stats
+        time.sleep(0.02)
+    raise AssertionError(f"prewarm did not finish: {ops.prewarmer.stats()}")
+
+
+def test_main_page_signal_warms_the_front_page_and_its_links(
+    popular_zim: Path,
+) -> None:
+    """Warmed entries are served from the caches the request path reads."""
+    ops = _ops(popular_zim.parent, signal="main_page")
+    ops.prewarmer.warm_all()
+    stats = _wait_idle(ops, 1)
+    ops.prewarmer.stop()
+
+    assert _warmed(ops, popular_zim) == ["Home", "Page_A", "Page_B", "Page_C"]
+    assert stats["entries_warmed"] == 4
+    assert stats["last_pass"]["signal"] == "main_page"
+    assert stats["last_pass"]["budget_exhausted"] is False
+
+
+def test_inbound_degree_signal_warms_the_most_linked_entries(
+    popular_zim: Path,
+) -> None:
+    """With a sidecar, the most-linked entries are warmed first."""
+    build_link_graph(str(popular_zim))
+    ops = _ops(popular_zim.parent, signal="inbound_degree", top_n=2)
+    summary = ops.prewarmer._warm_archive(str(popular_zim))
+
+    assert summary["signal"] == "inbound_degree"
+    # Page_C has four linkers, Page_A two; everything else one or none.
+    assert _warmed(ops, popular_zim) == ["Page_A", "Page_C"]
+
+
+def test_inbound_degree_without_a_sidecar_falls_back_to_the_main_page(
+    popular_zim: Path,
+) -> None:
+    """An archive without a link graph still gets its front door warmed."""
+    ops = _ops(popular_zim.parent, signal="inbound_degree", top_n=1)
+    summary = ops.prewarmer._warm_archive(str(popular_zim))
+
+    assert summary["signal"] == "main_page"
+    assert _warmed(ops, popular_zim) == ["Home"]
+
+
+def test_access_log_signal_replays_the_most_frequent_paths(
+    popular_zim: Path, tmp_path: Path
+) -> None:
+    """Lines for other archives are ignored; absent paths are skipped."""
+    log = tmp_path / "access.log"
+    log.write_text(
+        "Page_D\n"
+        "popular.zim\tPage_D\n"
+        "popular\tMissing\n"
+        "popular\tMissing\n"
+        "popular\tMissing\n"
+        "other.zim\tPage_B\n"
+        "other.zim\tPage_B\n"
+        "other.zim\tPage_B\n"
+        "Page_A\n",
+        encoding="utf-8",
+    )
+    ops = _ops(popular_zim.parent, signal="access_log", access_log_path=log, top_n=2)
+    summary = ops.prewarmer._warm_archive(str(popular_zim))
+
+    assert (summary["signal"], summary["warmed"], summary["skipped"]) == (
+        "access_log",
+        2,
+        1,
+    )
+    assert _warmed(ops, popular_zim) == ["Page_A", "Page_D"]
+
+
+def test_time_budget_stops_the_pass(popular_zim: Path) -> None:
+    """An exhausted budget ends the pass and is reported."""
+    ops = _ops(popular_zim.parent, signal="main_page", time_budget_seconds=1e-9)
+    summary = ops.prewarmer._warm_archive(str(popular_zim))
+
+    assert summary["budget_exhausted"] is True
+    assert summary["warmed"] == 0
+    assert ops.prewarmer.stats()["budget_exhausted"] == 1
+
+
+def test_disabled_without_the_flag_or_the_cache(popular_zim: Path) -> None:
+    """Warmup is opt-in, and pointless with the response cache off."""
+    config = OpenZimMcpConfig(allowed_directories=[str(popular_zim.parent)])
+    ops = ZimOperations(
+        config,
+        PathValidator(config.allowed_directories),
+        OpenZimMcpCache(config.cache),
+        ContentProcessor(),
+    )
+    assert not ops.prewarmer.enabled
+    ops.prewarmer.warm_all()
+    assert ops.prewarmer.stats()["queued"] == 0
+
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(popular_zim.parent)],
+        cache=CacheConfig(enabled=False),
+        warmup=WarmupConfig(enabled=True),
+    )
+    ops = ZimOperations(
+        config,
+        PathValidator(config.allowed_directories),
+        OpenZimMcpCache(config.cache),
+        ContentProcessor(),
+    )
+    assert ops.prewarmer.stats()["enabled"] is False
+
+
+def test_top_n_is_capped_by_the_cache_size(popular_zim: Path) -> None:
+    """A pass never writes more keys than the cache holds."""
+    config = OpenZimMcpConfig(
+        allowed_directories=[str(popular_zim.parent)],
+        cache=CacheConfig(enabled=True, max_size=10),
+        warmup=WarmupConfig(enabled=True, top_n=500),
+    )
+    ops = ZimOperations(
+        config,
+        PathValidator(config.allowed_directories),
+        OpenZimMcpCache(config.cache),
+        ContentProcessor(),
+    )
+    assert ops.prewarmer.stats()["top_n"] == 3
+
+
+@pytest.mark.asyncio
+async def test_watcher_reports_replaced_archives(tmp_path: Path) -> None:
+    """``on_replaced`` hears each in-place replacement, not new files."""
+    from openzim_mcp.subscriptions import MtimeWatcher
+
+    target = tmp_path / "archive.zim"
+    target.write_bytes(b"v1")
+    replaced: List[str] = []
+
+    async def emit(uri: str, change_type: str) -> None:
+        pass
+
+    watcher = MtimeWatcher(
+        [str(tmp_path)], interval=60, on_change=emit, on_replaced=replaced.append
+    )
+    watcher._snapshot = watcher._scan()
+    target.write_bytes(b"v2-with-different-length")
+    (tmp_path / "new.zim").write_bytes(b"")
+    await watcher._tick()
+
+    assert replaced == [str(target)]
@@ -1,5 +1,7 @@
 """Tests for search_all tool."""
 
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -155,3 +157,225 @@ class TestSearchAll:
             "limit": result["files_searched"],
             "returned_count": len(result["results"]),
         }
+
+
+def _hit_payload(path: str, lim: int) -> dict:
+    return {
+        "query": "q",
+        "results": [{"path": "A/X", "title": path, "snippet": "..."}],
+        "next_cursor": None,
+        "total": 1,
+        "done": True,
+        "page_info": {"offset": 0, "limit": lim, "returned_count": 1},
+    }
+
+
+class TestSearchAllFanOut:
+    """Concurrent fan-out: ordering, deadlines, and context propagation."""
+
+    @pytest.fixture
+    def server(self, test_config: OpenZimMcpConfig) -> OpenZimMcpServer:
+        """Create a test server instance."""
+        return OpenZimMcpServer(test_config)
+
+    def _archives(self, server: OpenZimMcpServer, names: list) -> None:
+        server.zim_operations.list_zim_files_data = MagicMock(
+            return_value=[{"path": f"/zim/{n}.zim", "name": f"{n}.zim"} for n in names]
+        )
+
+    def test_archives_searched_concurrently(self, server: OpenZimMcpServer):
+        """Four 0.3s searches finish in about one search's time, not four."""
+        self._archives(server, ["a", "b", "c", "d"])
+
+        def fake(path, q, lim, off):
+            time.sleep(0.3)
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        started = time.monotonic()
+        result = server.zim_operations.search_all_data("q", limit_per_file=5)
+        assert time.monotonic() - started < 0.9
+        assert result["files_with_hits"] == 4
+
+    def test_result_order_follows_archive_list(self, server: OpenZimMcpServer):
+        """Rows keep archive-list order even when later archives finish first."""
+        names = ["slow", "medium", "fast"]
+        self._archives(server, names)
+        delays = {"slow": 0.3, "medium": 0.15, "fast": 0.0}
+
+        def fake(path, q, lim, off):
+            time.sleep(delays[path.split("/")[-1][:-4]])
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        result = server.zim_operations.search_all_data("q", limit_per_file=5)
+        assert [r["name"] for r in result["results"]] == [f"{n}.zim" for n in names]
+
+    def test_concurrency_one_is_serial(self, server: OpenZimMcpServer):
+        """``search_all_max_concurrency=1`` never overlaps two archives."""
+        server.config.search.search_all_max_concurrency = 1
+        self._archives(server, ["a", "b", "c"])
+        lock = threading.Lock()
+        active = [0, 0]  # current, peak
+
+        def fake(path, q, lim, off):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        result = server.zim_operations.search_all_data("q", limit_per_file=5)
+        assert active[1] == 1
+        assert result["files_searched"] == 3
+
+    def test_per_archive_timeout_reports_straggler(self, server: OpenZimMcpServer):
+        """A leg past its own deadline becomes an error row; the rest succeed."""
+        server.config.search.search_all_per_archive_timeout_seconds = 0.2
+        self._archives(server, ["stuck", "ok"])
+        release = threading.Event()
+
+        def fake(path, q, lim, off):
+            if "stuck" in path:
+                release.wait(5)
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        try:
+            started = time.monotonic()
+            result = server.zim_operations.search_all_data("q", limit_per_file=5)
+            assert time.monotonic() - started < 2.0
+        finally:
+            release.set()
+        stuck, ok = result["results"]
+        assert stuck["error"] is True
+        assert "timed out" in stuck["error_message"]
+        assert ok["error"] is False
+        assert result["files_failed"] == 1
+        assert result["budget_exceeded"] is False
+
+    def test_aggregate_budget_cancels_stragglers(self, server: OpenZimMcpServer):
+        """Once the total budget expires the partial result comes back."""
+        server.config.search.search_all_total_timeout_seconds = 0.3
+        server.config.search.search_all_per_archive_timeout_seconds = 0.0
+        self._archives(server, ["fast", "stuck"])
+        release = threading.Event()
+
+        def fake(path, q, lim, off):
+            if "stuck" in path:
+                release.wait(5)
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        try:
+            started = time.monotonic()
+            result = server.zim_operations.search_all_data("q", limit_per_file=5)
+            assert time.monotonic() - started < 2.0
+        finally:
+            release.set()
+        assert result["budget_exceeded"] is True
+        assert result["done"] is False
+        assert [r["name"] for r in result["results"]] == ["fast.zim"]
+        assert result["files_available"] == 2
+
+    def test_queued_leg_times_out_behind_a_saturated_pool(
+        self, server: OpenZimMcpServer
+    ):
+        """The per-archive deadline runs from submission, queue time included."""
+        from openzim_mcp import timeout_utils
+
+        server.config.search.search_all_per_archive_timeout_seconds = 0.2
+        self._archives(server, ["a"])
+        server.zim_operations.search_zim_file_data = MagicMock(
+            side_effect=lambda path, q, lim, off: _hit_payload(path, lim)
+        )
+        release = threading.Event()
+        stuck = [
+            timeout_utils.submit_to_pool("fanout", release.wait)
+            for _ in range(timeout_utils._FANOUT_MAX_WORKERS)
+        ]
+        try:
+            started = time.monotonic()
+            result = server.zim_operations.search_all_data("q", limit_per_file=5)
+            assert time.monotonic() - started < 2.0
+        finally:
+            release.set()
+            for future in stuck:
+                future.result(timeout=5)
+        [row] = result["results"]
+        assert row["error"] is True
+        assert "timed out" in row["error_message"]
+
+    def test_disabled_budgets_still_stop_at_the_ceiling(
+        self, server: OpenZimMcpServer, monkeypatch: pytest.MonkeyPatch
+    ):
+        """With both timeouts at 0 the wait is capped, not unbounded."""
+        import dataclasses
+
+        from openzim_mcp import defaults
+
+        monkeypatch.setattr(
+            defaults,
+            "SEARCH",
+            dataclasses.replace(defaults.SEARCH, SEARCH_ALL_MAX_WAIT_SECONDS=0.3),
+        )
+        server.config.search.search_all_total_timeout_seconds = 0.0
+        server.config.search.search_all_per_archive_timeout_seconds = 0.0
+        self._archives(server, ["fast", "stuck"])
+        release = threading.Event()
+
+        def fake(path, q, lim, off):
+            if "stuck" in path:
+                release.wait(5)
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        try:
+            started = time.monotonic()
+            result = server.zim_operations.search_all_data("q", limit_per_file=5)
+            assert time.monotonic() - started < 2.0
+        finally:
+            release.set()
+        assert result["budget_exceeded"] is True
+        assert [r["name"] for r in result["results"]] == ["fast.zim"]
+
+    def test_legs_inherit_request_context(self, server: OpenZimMcpServer):
+        """The caller's client id is visible inside every fan-out leg."""
+        from openzim_mcp.request_context import client_id_var, current_client_id
+
+        self._archives(server, ["a", "b"])
+        seen: list = []
+
+        def fake(path, q, lim, off):
+            seen.append(current_client_id())
+            return _hit_payload(path, lim)
+
+        server.zim_operations.search_zim_file_data = MagicMock(side_effect=fake)
+        token = client_id_var.set("client-42")
+        try:
+            server.zim_operations.search_all_data("q", limit_per_file=5)
+        finally:
+            client_id_var.reset(token)
+        assert seen == ["client-42", "client-42"]
+
+
+class TestSearchAllConfig:
+    """Fan-out knobs on ``SearchConfig``."""
+
+    def test_defaults(self) -> None:
+        from openzim_mcp.config import SearchConfig
+
+        cfg = SearchConfig()
+        assert cfg.search_all_max_concurrency == 8
+        assert cfg.search_all_per_archive_timeout_seconds == 10.0
+
+    def test_rejects_zero_concurrency(self) -> None:
+        from pydantic import ValidationError
+
+        from openzim_mcp.config import SearchConfig
+
+        with pytest.raises(ValidationError):
+            SearchConfig(search_all_max_concurrency=0)
@@ -0,0 +1,206 @@
+"""Search sessions: ranked hits held between ``search_zim_file`` cursor pages.
+
+Unit tests drive ``SearchSessionCache`` with a counting fake search; the
+integration tests page a real full-text-indexed ZIM built with libzim's
+``Creator`` and check that later pages are sliced from the session rather
+than re-running Xapian, with results identical to a session-less server.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+from libzim.writer import Creator
+
+import openzim_mcp.zim_operations as zim_ops_mod
+from openzim_mcp.zim.search_sessions import PREFETCH_PAGES, SearchSessionCache
+from tests.conftest_v2_fixtures import _HtmlItem, make_zim_ops
+
+
+class _CountingSearch:
+    """``Search`` stand-in over a fixed ranked list, counting reads."""
+
+    def __init__(self, ids: List[str]) -> None:
+        self.ids = ids
+        self.reads: List[Tuple[int, int]] = []
+
+    def getResults(self, start: int, count: int) -> List[str]:  # noqa: N802
+        self.reads.append((start, count))
+        return self.ids[start : start + count]
+
+
+def _starter(ids: List[str], runs: List[_CountingSearch]):
+    def _start() -> Tuple[Any, int]:
+        search = _CountingSearch(ids)
+        runs.append(search)
+        return search, len(ids)
+
+    return _start
+
+
+IDS = [f"A/Article_{i:03d}" for i in range(100)]
+
+
+def test_second_page_is_a_slice_of_the_held_session() -> None:
+    cache = SearchSessionCache(ttl_seconds=60, max_ids=1_000)
+    runs: List[_CountingSearch] = []
+
+    first = cache.open("k", page_size=10, start_search=_starter(IDS, runs))
+    assert first.getResults(0, 10) == IDS[:10]
+    cache.save("k", first)
+    # One Xapian read covered the page plus the prefetch window.
+    assert runs[0].reads == [(0, 10 + 10 * PREFETCH_PAGES)]
+
+    second = cache.open("k", page_size=10, start_search=_starter(IDS, runs))
+    assert second.getResults(10, 10) == IDS[10:20]
+    cache.save("k", second)
+
+    assert len(runs) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["ids_held"] == 10 + 10 * PREFETCH_PAGES
+
+
+def test_reading_past_the_held_ids_reruns_once_and_extends() -> None:
+    cache = SearchSessionCache(ttl_seconds=60, max_ids=1_000)
+    runs: List[_CountingSearch] = []
+    view = cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+    view.getResults(0, 5)
+    cache.save("k", view)
+
+    resumed = cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+    assert resumed.getResults(40, 5) == IDS[40:45]
+    cache.save("k", resumed)
+
+    assert len(runs) == 2
+    assert runs[1].reads == [(25, 20 + 5 * PREFETCH_PAGES)]
+    assert cache.stats()["extensions"] == 1
+    assert cache.stats()["ids_held"] == 45 + 5 * PREFETCH_PAGES
+
+
+def test_session_expires_after_its_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    import openzim_mcp.zim.search_sessions as sessions_mod
+
+    now = [1_000.0]
+    monkeypatch.setattr(sessions_mod.time, "monotonic", lambda: now[0])
+    cache = SearchSessionCache(ttl_seconds=30, max_ids=1_000)
+    runs: List[_CountingSearch] = []
+    view = cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+    view.getResults(0, 5)
+    cache.save("k", view)
+
+    now[0] += 31
+    cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+
+    assert len(runs) == 2
+    stats = cache.stats()
+    assert (stats["expired"], stats["sessions"], stats["ids_held"]) == (1, 0, 0)
+
+
+def test_id_budget_evicts_least_recently_used_session() -> None:
+    cache = SearchSessionCache(ttl_seconds=60, max_ids=40)
+    runs: List[_CountingSearch] = []
+    for key in ("a", "b"):
+        view = cache.open(key, page_size=5, start_search=_starter(IDS, runs))
+        view.getResults(0, 5)
+        cache.save(key, view)
+
+    stats = cache.stats()
+    assert (stats["sessions"], stats["evicted"]) == (1, 1)
+    assert stats["ids_held"] <= 40
+    # ``a`` was dropped; ``b`` still answers without a new search.
+    cache.open("b", page_size=5, start_search=_starter(IDS, runs))
+    assert len(runs) == 2
+
+
+def test_session_larger_than_the_budget_keeps_its_prefix() -> None:
+    cache = SearchSessionCache(ttl_seconds=60, max_ids=8)
+    runs: List[_CountingSearch] = []
+    view = cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+    view.getResults(0, 5)
+    cache.save("k", view)
+
+    assert cache.stats()["ids_held"] == 8
+    resumed = cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+    assert resumed.getResults(5, 5) == IDS[5:10]
+    assert len(runs) == 2
+
+
+def test_disabled_cache_never_holds_anything() -> None:
+    cache = SearchSessionCache(ttl_seconds=0, max_ids=1_000)
+    assert cache.enabled is False
+    runs: List[_CountingSearch] = []
+    view = cache.open("k", page_size=5, start_search=_starter(IDS, runs))
+    view.getResults(0, 5)
+    cache.save("k", view)
+    assert cache.stats()["sessions"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Real archive
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def fulltext_zim(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    out = tmp_path_factory.mktemp("search-sessions") / "sessions.zim"
+    with Creator(out).config_indexing(True, "eng") as creator:
+        for i in range(30):
+            creator.add_item(
+                _HtmlItem(
+                    f"A/Volcano_{i:02d}",
+                    f"Volcano {i:02d}",
+                    "<html><body><p>"
+                    + "volcano " * (i + 1)
+                    + f"eruption number {i}.</p></body></html>",
+                )
+            )
+        creator.set_mainpath("A/Volcano_00")
+    return out
+
+
+def _walk(ops, zim: Path, query: str, limit: int) -> List[str]:
+    paths: List[str] = []
+    offset = 0
+    while True:
+        page = ops.search_zim_file_data(str(zim), query, limit, offset)
+        paths.extend(r["path"] for r in page["results"])
+        if page["done"]:
+            return paths
+        offset += page["page_info"].get("source_consumed", len(page["results"]))
+
+
+def test_paging_a_real_archive_slices_held_sessions(
+    fulltext_zim: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ops = make_zim_ops(str(fulltext_zim.parent))
+    searches = []
+    real_searcher = zim_ops_mod.Searcher
+
+    def _counting_searcher(archive):
+        searches.append(archive)
+        return real_searcher(archive)
+
+    monkeypatch.setattr(zim_ops_mod, "Searcher", _counting_searcher)
+    paged = _walk(ops, fulltext_zim, "volcano", 3)
+
+    assert len(paged) == 30
+    assert len(set(paged)) == 30
+    # Page one ran Xapian with a prefetch window; page five ran past it
+    # and extended the session once; every other page was a slice.
+    assert len(searches) == 2
+    stats = ops.search_sessions.stats()
+    assert stats["hits"] == 9
+    assert stats["extensions"] == 1
+
+
+def test_sessions_do_not_change_results(fulltext_zim: Path) -> None:
+    with_sessions = make_zim_ops(str(fulltext_zim.parent))
+    without = make_zim_ops(str(fulltext_zim.parent))
+    without.search_sessions = SearchSessionCache(ttl_seconds=0, max_ids=0)
+
+    assert _walk(with_sessions, fulltext_zim, "eruption", 4) == _walk(
+        without, fulltext_zim, "eruption", 4
+    )
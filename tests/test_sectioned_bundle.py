@@ -0,0 +1,185 @@
+"""Sectioned bundle layout: a small header plus lazily loaded section chunks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from openzim_mcp import bundle as bundle_mod
+from openzim_mcp.bundle import (
+    BundleText,
+    bundle_size_bytes,
+    bundle_text,
+    get_or_build_bundle,
+    get_or_build_bundle_view,
+)
+from openzim_mcp.cache import OpenZimMcpCache
+from openzim_mcp.config import CacheConfig, OpenZimMcpConfig
+from openzim_mcp.content_processor import ContentProcessor
+from openzim_mcp.security import PathValidator
+from openzim_mcp.synthesize import _locate_in_bundle_text
+from openzim_mcp.zim_operations import ZimOperations
+
+_TITLES = ["History", "Geography", "Climate", "Economy", "Culture", "Sport"]
+
+
+def _article() -> Dict[str, Any]:
+    parts = ["Berlin is the capital of Germany. " * 20 + "\n\n"]
+    sections: List[Dict[str, Any]] = []
+    for title in _TITLES:
+        heading_start = sum(map(len, parts))
+        heading = f"## {title}\n\n"
+        body = f"The {title.lower()} of Berlin is described here. " * 15 + "\n\n"
+        parts += [heading, body]
+        sections.append(
+            {
+                "id": title,
+                "title": title,
+                "level": 2,
+                "heading_start": heading_start,
+                "char_start": heading_start + len(heading),
+                "char_end": heading_start + len(heading) + len(body),
+            }
+        )
+    markdown = "".join(parts)
+    return {
+        "entry_path": "A/Berlin",
+        "title": "Berlin",
+        "content_type": "text/html",
+        "word_count": len(markdown.split()),
+        "char_count": len(markdown),
+        "rendered_markdown": markdown,
+        "sections": sections,
+        "links": {"internal": [], "external": [], "media": []},
+        "infobox": None,
+    }
+
+
+class _Recorder:
+    """Counts entry extractions and records the cache keys read."""
+
+    def __init__(self, cache: OpenZimMcpCache) -> None:
+        self.builds = 0
+        self.reads: List[str] = []
+        self._get = cache.get
+        cache.get = self.get  # type: ignore[method-assign]
+
+    def extract(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        self.builds += 1
+        return _article()
+
+    def get(self, key: str) -> Any:
+        self.reads.append(key)
+        return self._get(key)
+
+
+@pytest.fixture
+def sectioned(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple:
+    zim = tmp_path / "wiki.zim"
+    zim.write_bytes(b"zim")
+    cache = OpenZimMcpCache(
+        CacheConfig(
+            enabled=True, bundle_layout="sectioned", bundle_chunk_min_chars=256
+        ),
+        enable_background_cleanup=False,
+    )
+    recorder = _Recorder(cache)
+    monkeypatch.setattr(bundle_mod, "extract_entry_bundle", recorder.extract)
+    return cache, recorder, zim
+
+
+def _view(cache: OpenZimMcpCache, zim: Path) -> Any:
+    return get_or_build_bundle_view(
+        None, "A/Berlin", cache=cache, validated_path=zim, content_processor=None
+    )
+
+
+def test_section_read_loads_only_its_chunk(sectioned: tuple) -> None:
+    cache, recorder, zim = sectioned
+    _view(cache, zim)  # builds and stores header + chunks
+    recorder.reads.clear()
+    view = _view(cache, zim)
+    climate = next(s for s in view["sections"] if s["id"] == "Climate")
+    body = bundle_text(view).slice(climate["char_start"], climate["char_end"])
+
+    markdown = _article()["rendered_markdown"]
+    assert body == markdown[climate["char_start"] : climate["char_end"]]
+    assert view["rendered_markdown"] == ""
+    assert recorder.builds == 1
+    chunk_reads = [k for k in recorder.reads if k.startswith("bundle_chunk:v1:")]
+    assert len(chunk_reads) == 1
+    assert len(view["chunk_bounds"]) == len(_TITLES) + 2
+
+    head_key = next(k for k in cache._cache if k.startswith("bundle_head:v1:"))
+    assert cache._cache[head_key].size_bytes < bundle_size_bytes(_article()) // 4
+
+
+def test_evicted_chunk_is_rebuilt(sectioned: tuple) -> None:
+    cache, recorder, zim = sectioned
+    _view(cache, zim)
+    last = max(
+        (k for k in cache._cache if k.startswith("bundle_chunk:v1:")),
+        key=lambda k: int(k.rsplit(":", 1)[1]),
+    )
+    cache.delete(last)
+    view = _view(cache, zim)
+    assert bundle_text(view).full() == _article()["rendered_markdown"]
+    assert recorder.builds == 2
+    assert last in cache._cache
+
+
+def test_whole_bundle_is_reassembled(sectioned: tuple) -> None:
+    cache, recorder, zim = sectioned
+    _view(cache, zim)
+    whole = get_or_build_bundle(
+        None, "A/Berlin", cache=cache, validated_path=zim, content_processor=None
+    )
+    assert whole == _article()
+    assert recorder.builds == 1
+    assert bundle_size_bytes(whole) > len(whole["rendered_markdown"])
+
+
+def test_both_layouts_serve_the_same_section(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(bundle_mod, "extract_entry_bundle", lambda *a, **k: _article())
+    zim = tmp_path / "wiki.zim"
+    zim.write_bytes(b"zim")
+    outputs = []
+    for layout in ("whole", "sectioned"):
+        config = OpenZimMcpConfig(
+            allowed_directories=[str(tmp_path)],
+            cache=CacheConfig.model_validate(
+                {"enabled": True, "bundle_layout": layout}
+            ),
+        )
+        ops = ZimOperations(
+            config,
+            PathValidator(config.allowed_directories),
+            OpenZimMcpCache(config.cache, enable_background_cleanup=False),
+            ContentProcessor(),
+        )
+        for _ in range(2):  # cold build, then served from the cache
+            section = ops._get_section_data(None, zim, "A/Berlin", "Economy", None)
+            outputs.append(section["content_markdown"])
+    assert len(set(outputs)) == 1
+    assert outputs[0].startswith("The economy of Berlin")
+
+
+def test_passage_search_stops_at_the_first_matching_chunk() -> None:
+    markdown = _article()["rendered_markdown"]
+    bounds = [0, 700, 1400, len(markdown)]
+    loaded: List[int] = []
+
+    def load(index: int) -> str:
+        loaded.append(index)
+        return markdown[bounds[index] : bounds[index + 1]]
+
+    lead = "Berlin is the capital of Germany."
+    assert _locate_in_bundle_text(BundleText(bounds, load), lead) == 0
+    assert loaded == [0]
+    # A passage straddling a chunk boundary is found in the whole text.
+    straddle = markdown[690:720]
+    assert _locate_in_bundle_text(BundleText(bounds, load), straddle) == 690
@@ -211,7 +211,8 @@ async def test_inbound_resume_keeps_the_cursor_page_size(
     register_zim_links(server)
     fn, _ = server._tools_store["zim_links"]
     cursor = Cursor.encode(
-        tool="get_inbound_links", state={"o": 2, "l": 2, "ep": "A/Cat", "ai": "qq"}
+        tool="get_inbound_links",
+        state={"o": 2, "l": 2, "ep": "A/Cat", "ai": "qq", "ka": [3, "A/Dog"]},
     )
 
     await fn(
@@ -219,10 +220,39 @@ async def test_inbound_resume_keeps_the_cursor_page_size(
     )
 
     ops.get_inbound_links_data.assert_awaited_once_with(
-        "/x.zim", "A/Cat", limit=2, offset=2, cursor_archive_identity="qq"
+        "/x.zim",
+        "A/Cat",
+        limit=2,
+        offset=2,
+        cursor_archive_identity="qq",
+        after=[3, "A/Dog"],
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "keyset", [["3", "A/Dog"], [3], [None, "A/Dog"], [3, 7], [True, "A/Dog"], "x"]
+)
+async def test_inbound_malformed_keyset_is_a_cursor_error(
+    server: MagicMock, monkeypatch: pytest.MonkeyPatch, keyset: Any
+) -> None:
+    """A tampered ``ka`` is reported as a cursor error, not a generic failure."""
+    ops = _patch_async_ops(monkeypatch, get_inbound_links_data={"results": []})
+    register_zim_links(server)
+    fn, _ = server._tools_store["zim_links"]
+    cursor = Cursor.encode(
+        tool="get_inbound_links",
+        state={"o": 2, "l": 2, "ep": "A/Cat", "ka": keyset},
+    )
+
+    result = await fn(
+        zim_file_path="/x.zim", entry_path="A/Cat", direction="inbound", cursor=cursor
+    )
+
+    assert result["operation"] == "cursor_decode"
+    ops.get_inbound_links_data.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_inbound_without_cursor_keeps_the_wrapper_default(
     server: MagicMock, monkeypatch: pytest.MonkeyPatch
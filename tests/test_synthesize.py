@@ -537,10 +537,14 @@ def test_synthesize_query_multi_archive_uses_rrf_fusion(
     a1 = MagicMock()
     a2 = MagicMock()
     search_handler = MagicMock()
-    search_handler.search_top_k.side_effect = [
-        [{"path": "A/Berlin", "snippet": "", "score": 0.9}],
-        [{"path": "A/Berlin", "snippet": "", "score": 0.5}],  # both archives have it
-    ]
+    # Keyed by archive, not call order: archives are searched concurrently.
+    hits_by_archive = {
+        id(a1): [{"path": "A/Berlin", "snippet": "", "score": 0.9}],
+        id(a2): [{"path": "A/Berlin", "snippet": "", "score": 0.5}],  # both have it
+    }
+    search_handler.search_top_k.side_effect = lambda archive, q, **kw: (
+        hits_by_archive[id(archive)]
+    )
     cache = MagicMock()
 
     monkeypatch.setattr(
@@ -752,22 +756,26 @@ def test_synthesize_drops_off_topic_cross_archive_leak(
     wiki = MagicMock()
     blackadder = MagicMock()
     search_handler = MagicMock()
-    search_handler.search_top_k.side_effect = [
-        [
+    # Keyed by archive, not call order: archives are searched concurrently.
+    hits_by_archive = {
+        id(wiki): [
             {
                 "path": "A/French_Revolution",
                 "snippet": "The French Revolution was a period of upheaval.",
                 "score": 0.9,
             }
         ],
-        [
+        id(blackadder): [
             {
                 "path": "A/Blackadder_Goes_Forth",
                 "snippet": "Baldrick has a cunning plan",
                 "score": 0.5,
             }
         ],
-    ]
+    }
+    search_handler.search_top_k.side_effect = lambda archive, q, **kw: (
+        hits_by_archive[id(archive)]
+    )
     monkeypatch.setattr(
         "openzim_mcp.bundle.get_or_build_bundle",
         lambda archive, path, **kw: None,
@@ -1009,3 +1017,227 @@ def test_strip_links_still_strips_the_passage_text(monkeypatch) -> None:
     assert "](" not in body
     assert "Germany" in body
     assert "](" not in stripped["answer_markdown"]
+
+
+# ---------------------------------------------------------------------------
+# Concurrent retrieval stages + per-stage timings
+# ---------------------------------------------------------------------------
+
+
+def test_map_bounded_preserves_input_order() -> None:
+    """Results come back in input order even when later items finish first."""
+    import time
+
+    from openzim_mcp.synthesize import _map_bounded
+
+    def work(delay: float) -> float:
+        time.sleep(delay)
+        return delay
+
+    delays = [0.2, 0.1, 0.0, 0.05]
+    assert _map_bounded(work, delays, max_workers=4) == delays
+
+
+def test_map_bounded_caps_concurrency() -> None:
+    import threading
+    import time
+
+    from openzim_mcp.synthesize import _map_bounded
+
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def work(_: int) -> None:
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+
+    _map_bounded(work, list(range(6)), max_workers=2)
+    assert active[1] == 2
+
+
+def test_map_bounded_propagates_error_after_drain() -> None:
+    from openzim_mcp.synthesize import _map_bounded
+
+    finished: list[int] = []
+
+    def work(i: int) -> int:
+        if i == 0:
+            raise ValueError("boom")
+        finished.append(i)
+        return i
+
+    with pytest.raises(ValueError, match="boom"):
+        _map_bounded(work, [0, 1, 2], max_workers=3)
+    # Items already in flight settle before the error surfaces.
+    assert sorted(finished) == [1, 2]
+
+
+def test_map_bounded_does_not_queue_behind_a_saturated_fanout_pool() -> None:
+    """Stuck ``search_all`` legs on the fanout pool cannot stall synthesize."""
+    import threading
+
+    from openzim_mcp import timeout_utils
+    from openzim_mcp.synthesize import _map_bounded
+
+    release = threading.Event()
+    stuck = [
+        timeout_utils.submit_to_pool("fanout", release.wait)
+        for _ in range(timeout_utils._FANOUT_MAX_WORKERS)
+    ]
+    try:
+        done = threading.Event()
+        result: list[list[int]] = []
+
+        def run() -> None:
+            result.append(_map_bounded(lambda i: i * 2, [1, 2, 3], max_workers=3))
+            done.set()
+
+        threading.Thread(target=run, daemon=True).start()
+        assert done.wait(timeout=5)
+        assert result == [[2, 4, 6]]
+    finally:
+        release.set()
+        for future in stuck:
+            future.result(timeout=5)
+
+
+def test_per_archive_search_runs_concurrently_in_archive_order() -> None:
+    """Three 0.2s archive searches overlap; hits stay aligned to archives."""
+    import time
+    from unittest.mock import MagicMock
+
+    from openzim_mcp.synthesize import _do_per_archive_search
+
+    archives = [(MagicMock(), Path(f"wiki{i}.zim")) for i in range(3)]
+    index_of = {id(a): i for i, (a, _) in enumerate(archives)}
+
+    def search_top_k(archive: Any, query: str, **kw: Any) -> list[dict]:
+        i = index_of[id(archive)]
+        time.sleep(0.2 - i * 0.05)  # later archives finish first
+        return [{"path": f"A/Doc{i}", "snippet": "", "score": 1.0}]
+
+    handler = MagicMock()
+    handler.search_top_k.side_effect = search_top_k
+    started = time.monotonic()
+    hits, names, _ = _do_per_archive_search(
+        archives, search_handler=handler, query="q", k=5, max_workers=3
+    )
+    assert time.monotonic() - started < 0.45
+    assert names == ["wiki0", "wiki1", "wiki2"]
+    assert [h[0]["path"] for h in hits] == ["A/Doc0", "A/Doc1", "A/Doc2"]
+
+
+def test_bundle_lookup_prebuilds_and_replays_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Concurrent prebuild serves each bundle once; a failed build re-raises."""
+    from unittest.mock import MagicMock
+
+    from openzim_mcp.synthesize import _make_bundle_lookup
+
+    calls: list[str] = []
+
+    def fake_build(archive: Any, path: str, **kw: Any) -> dict:
+        calls.append(path)
+        if path == "A/Bad":
+            raise RuntimeError("corrupt cluster")
+        return {"entry_path": path}
+
+    monkeypatch.setattr("openzim_mcp.bundle.get_or_build_bundle", fake_build)
+    archive_by_name = {"wiki": (MagicMock(), Path("wiki.zim"))}
+    top_hits = [("wiki", {"path": "A/Good"}), ("wiki", {"path": "A/Bad"})]
+    lookup = _make_bundle_lookup(
+        top_hits,
+        archive_by_name,
+        cache=MagicMock(),
+        content_processor=MagicMock(),
+        max_workers=4,
+    )
+    assert sorted(calls) == ["A/Bad", "A/Good"]
+    assert lookup("wiki", "A/Good") == {"entry_path": "A/Good"}
+    assert lookup("wiki", "A/Good") == {"entry_path": "A/Good"}
+    with pytest.raises(RuntimeError, match="corrupt cluster"):
+        lookup("wiki", "A/Bad")
+    assert lookup("wiki", "A/Missing") is None
+    assert len(calls) == 2
+
+
+def test_synthesize_stages_are_timing_spans(
+    cp: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from unittest.mock import MagicMock
+
+    from openzim_mcp.synthesize import synthesize_query
+    from openzim_mcp.timings import collect_timings
+
+    search_handler = MagicMock()
+    search_handler.search_top_k.return_value = [
+        {"path": "A/Berlin", "snippet": "Berlin body text", "score": 0.9},
+    ]
+    monkeypatch.setattr(
+        "openzim_mcp.bundle.get_or_build_bundle",
+        lambda archive, path, **kw: None,
+    )
+    with collect_timings() as call:
+        response = synthesize_query(
+            "berlin",
+            archives=[(MagicMock(), Path("wiki.zim"))],
+            search_handler=search_handler,
+            cache=MagicMock(),
+            content_processor=cp,
+            config=SynthesizeConfig(),
+        )
+    stages = call.as_meta()["stages"]
+    assert {
+        "synthesize_search",
+        "synthesize_rank",
+        "synthesize_passages",
+        "synthesize_bundles",
+        "synthesize_assemble",
+    } <= set(stages)
+    assert all(v >= 0 for v in stages.values())
+    # One breakdown only: the spans, not a second ``stage_ms`` map.
+    assert "stage_ms" not in response["_meta"]
+
+
+def test_synthesize_parallelism_one_matches_default(
+    cp: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Serial and concurrent runs produce the same response body."""
+    from unittest.mock import MagicMock
+
+    from openzim_mcp.synthesize import synthesize_query
+
+    a1, a2 = MagicMock(), MagicMock()
+    hits_by_archive = {
+        id(a1): [
+            {"path": "A/Berlin", "snippet": "Berlin is a city.", "score": 0.9},
+            {"path": "A/Spree", "snippet": "Berlin lies on the Spree.", "score": 0.4},
+        ],
+        id(a2): [{"path": "A/Berlin", "snippet": "Berlin, capital.", "score": 0.7}],
+    }
+    search_handler = MagicMock()
+    search_handler.search_top_k.side_effect = lambda archive, q, **kw: (
+        hits_by_archive[id(archive)]
+    )
+    monkeypatch.setattr(
+        "openzim_mcp.bundle.get_or_build_bundle",
+        lambda archive, path, **kw: None,
+    )
+
+    def run(parallelism: int) -> dict:
+        response = synthesize_query(
+            "berlin",
+            archives=[(a1, Path("wiki1.zim")), (a2, Path("wiki2.zim"))],
+            search_handler=search_handler,
+            cache=MagicMock(),
+            content_processor=cp,
+            config=SynthesizeConfig(parallelism=parallelism),
+        )
+        return dict(response)
+
+    assert run(1) == run(4)
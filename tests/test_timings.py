@@ -0,0 +1,124 @@
+"""Per-stage latency spans: registry, per-call collection and exposure."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from libzim.writer import Creator
+
+from openzim_mcp.config import MetaConfig, OpenZimMcpConfig
+from openzim_mcp.server import OpenZimMcpServer
+from openzim_mcp.timeout_utils import run_with_timeout
+from openzim_mcp.timings import (
+    STAGE_TIMINGS,
+    StageTimings,
+    collect_timings,
+    render_prometheus,
+    span,
+    timed,
+)
+from tests.conftest_v2_fixtures import _HtmlItem
+
+
+@pytest.fixture
+def small_zim(tmp_path: Path) -> Path:
+    zim = tmp_path / "small.zim"
+    with Creator(zim).config_indexing(True, "eng") as creator:
+        for i in range(5):
+            creator.add_item(
+                _HtmlItem(
+                    f"Page_{i}",
+                    f"Page {i}",
+                    f"<html><body><p>Page {i} is about cats.</p>"
+                    "<h2>More</h2><p>Body.</p></body></html>",
+                )
+            )
+        creator.set_mainpath("Page_0")
+    return zim
+
+
+def test_spans_reach_the_call_through_worker_threads() -> None:
+    @timed("unit_worker")
+    def work() -> int:
+        return 7
+
+    with collect_timings() as call:
+        with span("unit_outer"):
+            assert run_with_timeout(work, 5.0, "timed out") == 7
+            asyncio.run(asyncio.to_thread(work))
+    meta = call.as_meta()
+    assert set(meta["stages"]) == {"unit_outer", "unit_worker"}
+    assert meta["total_ms"] >= meta["stages"]["unit_outer"]
+    # Outside any collected call the span still feeds the registry.
+    work()
+    assert STAGE_TIMINGS.stats()["unit_worker"]["count"] >= 3
+
+
+def test_span_records_a_raising_block() -> None:
+    registry_before = STAGE_TIMINGS.stats().get("unit_raise", {}).get("count", 0)
+    with pytest.raises(ValueError):
+        with span("unit_raise"):
+            raise ValueError("boom")
+    assert STAGE_TIMINGS.stats()["unit_raise"]["count"] == registry_before + 1
+
+
+def test_stats_and_prometheus_histogram_agree() -> None:
+    registry = StageTimings()
+    for seconds in (0.0002, 0.003, 0.003, 0.2, 30.0):
+        registry.observe("xapian", seconds)
+    stats = registry.stats()["xapian"]
+    assert stats["count"] == 5 and stats["window"] == 5
+    assert stats["p50_ms"] == 3.0 and stats["max_ms"] == 30000.0
+
+    text = render_prometheus(registry)
+    assert "# TYPE openzim_mcp_stage_duration_seconds histogram" in text
+    buckets = {
+        line.split('le="')[1].split('"')[0]: int(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line.startswith("openzim_mcp_stage_duration_seconds_bucket")
+    }
+    # Cumulative: each bucket counts everything at or below its bound.
+    assert buckets["0.0005"] == 1
+    assert buckets["0.005"] == 3
+    assert buckets["0.25"] == 4
+    assert buckets["10.0"] == 4
+    assert buckets["+Inf"] == 5
+    assert 'openzim_mcp_stage_duration_seconds_count{stage="xapian"} 5' in text
+
+
+@pytest.mark.asyncio
+async def test_meta_timings_only_when_enabled(small_zim: Path) -> None:
+    def server(enabled: bool) -> OpenZimMcpServer:
+        return OpenZimMcpServer(
+            OpenZimMcpConfig(
+                allowed_directories=[str(small_zim.parent)],
+                tool_mode="advanced",
+                meta=MetaConfig(timings_enabled=enabled),
+            )
+        )
+
+    args = {"zim_file_path": str(small_zim), "entry_path": "Page_1"}
+    plain = await server(False).mcp.call_tool("zim_get", args)
+    assert "timings" not in json.loads(plain.content[0].text)["_meta"]
+
+    timed_server = server(True)
+    result = await timed_server.mcp.call_tool("zim_get", args)
+    timings = json.loads(result.content[0].text)["_meta"]["timings"]
+    assert "archive_open" in timings["stages"]
+    assert timings["total_ms"] > 0
+
+    # A markdown return has no envelope; the breakdown rides the result meta.
+    answer = await timed_server.mcp.call_tool(
+        "zim_query",
+        {"zim_file_path": str(small_zim), "query": "tell me about Page 2"},
+    )
+    assert not answer.is_error
+    stages = answer.meta["timings"]["stages"]
+    assert {"intent_parse", "archive_open"} <= set(stages)
+
+    health = await timed_server.mcp.call_tool("zim_health", {})
+    body = json.loads(health.content[0].text)
+    assert "intent_parse" in body["health"]["stage_timings"]
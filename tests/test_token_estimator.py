@@ -0,0 +1,169 @@
+"""Tiered ``_meta.tokens_est``: sampled estimates, memo, and known counts."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from openzim_mcp import meta
+from openzim_mcp.bundle import get_or_build_section_tokens, slice_tokens
+from openzim_mcp.cache import OpenZimMcpCache
+from openzim_mcp.config import CacheConfig, MetaConfig
+from openzim_mcp.defaults import META
+from openzim_mcp.meta import (
+    TOKEN_ESTIMATOR,
+    TokenEstimator,
+    attach_meta,
+    build_meta,
+    json_string_tokens,
+)
+
+needs_tokenizer = pytest.mark.skipif(
+    meta._get_encoder() is None, reason="cl100k_base BPE file unavailable"
+)
+
+_WORDS = {
+    "en": "the river city capital was founded in century by settlers trade "
+    "industrial population museum university government parliament".split(),
+    "ru": "город река столица был основан веке торговля население музей "
+    "университет правительство парламент".split(),
+}
+
+
+def _article(lang: str, chars: int) -> str:
+    rng = random.Random(lang)
+    parts = []
+    while sum(map(len, parts)) < chars:
+        if rng.random() < 0.05:
+            parts.append(f"\n## {rng.choice(_WORDS[lang]).title()}\n\n")
+        else:
+            sentence = " ".join(rng.choices(_WORDS[lang], k=rng.randint(6, 16)))
+            parts.append(sentence.capitalize() + f" [{rng.randint(1, 99)}]. ")
+    return "".join(parts)[:chars]
+
+
+@pytest.fixture
+def estimator() -> Iterator[TokenEstimator]:
+    TOKEN_ESTIMATOR.reset()
+    yield TOKEN_ESTIMATOR
+    TOKEN_ESTIMATOR.configure("auto", META.TOKEN_APPROX_MIN_CHARS)
+    TOKEN_ESTIMATOR.reset()
+
+
+@needs_tokenizer
+@pytest.mark.parametrize("lang", ["en", "ru"])
+def test_sample_lands_within_its_reported_bound(lang: str) -> None:
+    text = json.dumps({"content": _article(lang, 120_000)}, ensure_ascii=False)
+    estimate = meta._sampled_tokens_est(text)
+    assert estimate is not None
+    count, error = estimate
+    exact = meta._raw_tokens_est(text)
+    assert exact is not None
+    assert abs(count - exact) <= error * exact
+    assert 0.02 <= error < 0.2
+
+
+@needs_tokenizer
+def test_auto_samples_only_large_responses(estimator: TokenEstimator) -> None:
+    small = build_meta(rendered=_article("en", 2_000))
+    large = build_meta(rendered=_article("en", 40_000))
+    assert "tokens_est_method" not in small and "tokens_est_error" not in small
+    assert large["tokens_est_method"] == "approx"
+    assert large["tokens_est_error"] >= 0.02
+    assert estimator.counters() == {"exact": 1, "approx": 1, "memo_hits": 0}
+
+    estimator.configure("exact", META.TOKEN_APPROX_MIN_CHARS)
+    assert "tokens_est_method" not in build_meta(rendered=_article("en", 40_000))
+    estimator.configure("approx", META.TOKEN_APPROX_MIN_CHARS)
+    assert build_meta(rendered=_article("en", 20_000))["tokens_est_method"] == "approx"
+    # Too short to sample: counted exactly whatever the mode.
+    assert "tokens_est_method" not in build_meta(rendered=_article("en", 5_000))
+
+
+@needs_tokenizer
+def test_exact_counts_of_large_strings_are_memoised(
+    estimator: TokenEstimator,
+) -> None:
+    estimator.configure("exact", META.TOKEN_APPROX_MIN_CHARS)
+    text = _article("en", 10_000)
+    first = build_meta(rendered=text)
+    assert build_meta(rendered="".join(list(text))) == first
+    assert estimator.counters() == {"exact": 1, "approx": 0, "memo_hits": 1}
+
+
+@needs_tokenizer
+def test_known_field_count_replaces_encoding(estimator: TokenEstimator) -> None:
+    estimator.configure("exact", META.TOKEN_APPROX_MIN_CHARS)
+    body = _article("en", 20_000)
+    known = json_string_tokens(body)
+    assert known is not None
+    hinted = attach_meta(
+        {"title": "City", "content_markdown": body},
+        token_counts={"content_markdown": known},
+    )["_meta"]
+    full = attach_meta({"title": "City", "content_markdown": body})["_meta"]
+    assert hinted["chars"] == full["chars"]
+    assert hinted["tokens_est"] == pytest.approx(full["tokens_est"], abs=3)
+
+
+@needs_tokenizer
+def test_section_counts_sum_to_the_slice(tmp_path: Path) -> None:
+    markdown = "Lead.\n\n## One\n\nFirst [link](A/x) body.\n\n### Sub\n\nMore.\n"
+    one = markdown.index("## One")
+    sub = markdown.index("### Sub")
+    bundle = {
+        "entry_path": "A/City",
+        "rendered_markdown": markdown,
+        "sections": [
+            {
+                "id": "One",
+                "title": "One",
+                "level": 2,
+                "heading_start": one,
+                "char_start": one + 8,
+                "char_end": len(markdown),
+            },
+            {
+                "id": "Sub",
+                "title": "Sub",
+                "level": 3,
+                "heading_start": sub,
+                "char_start": sub + 8,
+                "char_end": len(markdown),
+            },
+        ],
+    }
+    cache = OpenZimMcpCache(CacheConfig(enabled=True), enable_background_cleanup=False)
+    counts = get_or_build_section_tokens(
+        bundle,  # type: ignore[arg-type]
+        cache=cache,
+        validated_path=tmp_path / "city.zim",
+        compact=False,
+        render=str,
+    )
+    assert counts is not None
+    body = markdown[one + 8 :]
+    assert slice_tokens(counts, one + 8, len(markdown)) == pytest.approx(
+        json_string_tokens(body), abs=2
+    )
+    assert slice_tokens(counts, one + 9, len(markdown)) is None
+    assert any(key.startswith("bundle_tokens:v1:") for key in cache._cache)
+
+
+def test_unavailable_tokenizer_omits_the_estimate(
+    estimator: TokenEstimator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(meta, "_get_encoder", lambda: None)
+    estimator.configure("approx", META.TOKEN_APPROX_MIN_CHARS)
+    assert "tokens_est" not in build_meta(rendered=_article("en", 40_000))
+
+
+def test_unknown_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        TokenEstimator().configure("fast", 1024)
+    with pytest.raises(ValueError):
+        MetaConfig(token_estimator="fast")  # type: ignore[arg-type]
@@ -62,7 +62,12 @@ async def test_inbound_dispatches_to_data_method(
     fn, _ = server._tools_store["zim_links"]
     await fn(zim_file_path="/x.zim", entry_path="A/Cat", direction="inbound")
     ops.get_inbound_links_data.assert_awaited_once_with(
-        "/x.zim", "A/Cat", limit=10, offset=0, cursor_archive_identity=None
+        "/x.zim",
+        "A/Cat",
+        limit=10,
+        offset=0,
+        cursor_archive_identity=None,
+        after=None,
     )
 
 
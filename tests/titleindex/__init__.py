@@ -0,0 +1 @@
+"""Tests for the title-index sidecar package."""
@@ -0,0 +1,52 @@
+"""Tests for `openzim-mcp build title-index`."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import libzim.reader
+
+from openzim_mcp.cli.build import build_main
+from openzim_mcp.titleindex.builder import BuildStats
+from openzim_mcp.titleindex.reader import TitleIndexReader
+from tests.titleindex.test_title_lookup import _build_zim
+
+
+def test_build_title_index_end_to_end(tmp_path, capsys):
+    """A real archive builds a fingerprinted sidecar next to it."""
+    zim = _build_zim(tmp_path / "titles.zim")
+    assert build_main(["title-index", str(zim), "--quiet"]) == 0
+    assert "titles" in capsys.readouterr().out
+    uuid = str(libzim.reader.Archive(zim).uuid)
+    reader = TitleIndexReader.open_for(str(zim), live_archive_uuid=uuid)
+    assert reader is not None and reader.lookup("Zurich")
+    reader.close()
+
+
+def test_build_title_index_forwards_output_and_force(tmp_path):
+    archive = tmp_path / "wiki.zim"
+    archive.write_bytes(b"")
+    out = str(tmp_path / "elsewhere.titleindex")
+    with patch(
+        "openzim_mcp.cli.build.build_title_index", return_value=BuildStats(3, 64)
+    ) as mock_build:
+        rc = build_main(["title-index", str(archive), "--output", out, "--force"])
+    assert rc == 0
+    assert mock_build.call_args.args == (str(archive), out)
+    assert mock_build.call_args.kwargs["force"] is True
+
+
+def test_build_title_index_existing_sidecar_mentions_force(tmp_path, capsys):
+    zim = _build_zim(tmp_path / "titles.zim")
+    assert build_main(["title-index", str(zim), "--quiet"]) == 0
+    assert build_main(["title-index", str(zim), "--quiet"]) == 1
+    assert "pass --force" in capsys.readouterr().err
+
+
+def test_build_title_index_preflight(tmp_path, capsys):
+    assert build_main(["title-index", str(tmp_path / "nope.zim")]) == 1
+    assert "archive not found" in capsys.readouterr().err
+    bogus = tmp_path / "bogus.zim"
+    bogus.write_bytes(b"not a zim file at all")
+    assert build_main(["title-index", str(bogus)]) == 1
+    assert "not a valid ZIM archive" in capsys.readouterr().err
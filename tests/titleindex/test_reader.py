@@ -0,0 +1,154 @@
+"""Tests for the title-index builder core and reader (synthetic streams)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from openzim_mcp.titleindex import reader as reader_mod
+from openzim_mcp.titleindex.builder import build_from_title_stream
+from openzim_mcp.titleindex.reader import (
+    TitleIndexReader,
+    open_cached,
+    sidecar_path_for,
+)
+from openzim_mcp.titleindex.schema import HEADER, fold_title
+
+RECORDS = [
+    ("Zürich", "Zürich", "A/Zurich", "A/Zurich"),
+    ("Albert Einstein", "Albert Einstein", "A/Albert_Einstein", "A/Albert_Einstein"),
+    ("Einstein", "Albert Einstein", "A/Albert_Einstein", "A/Einstein"),
+    ("Apple", "Apple", "A/Apple", "A/Apple"),
+    ("APPLE", "APPLE", "A/APPLE", "A/APPLE"),
+    ("Kant, Immanuel", "Kant, Immanuel", "A/Kant", "A/Kant"),
+    ("Kantian ethics", "Kantian ethics", "A/Kantian_ethics", "A/Kantian_ethics"),
+    # Redirect whose folded key equals its target's: stored once, as the
+    # article's own title.
+    ("ZURICH", "Zürich", "A/Zurich", "A/ZURICH"),
+]
+
+
+def _build(archive: Path, records=RECORDS, *, uuid: str = "u1", **kwargs) -> str:
+    out = sidecar_path_for(archive)
+    build_from_title_stream(out, archive_uuid=uuid, records=records, **kwargs)
+    return out
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Zürich", "zurich"),
+        ("Climate_change", "climate change"),
+        ("  Straße   Nord ", "strasse nord"),
+        ("Ｐａｒｉｓ", "paris"),
+        ("Crème brûlée", "creme brulee"),
+    ],
+)
+def test_fold_title(text: str, expected: str) -> None:
+    assert fold_title(text) == expected
+
+
+def test_sidecar_path_is_sibling(tmp_path: Path) -> None:
+    archive = tmp_path / "wikipedia.zim"
+    assert sidecar_path_for(archive) == str(tmp_path / "wikipedia.zim.titleindex")
+
+
+def test_lookup_folds_case_and_accents(tmp_path: Path) -> None:
+    archive = tmp_path / "x.zim"
+    _build(archive)
+    reader = TitleIndexReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None
+    [match] = reader.lookup("zurich")
+    assert (match.title, match.path, match.is_redirect) == ("Zürich", "A/Zurich", False)
+    [redirect] = reader.lookup("EINSTEIN")
+    assert redirect.path == "A/Albert_Einstein"
+    assert redirect.source_path == "A/Einstein" and redirect.is_redirect
+    assert {m.path for m in reader.lookup("apple")} == {"A/Apple", "A/APPLE"}
+    assert reader.lookup("Pear") == []
+    assert len(reader) == 7
+    assert reader.meta["archive_uuid"] == "u1"
+    reader.close()
+
+
+def test_meta_is_zero_padded_to_eight_bytes(tmp_path: Path) -> None:
+    data = Path(_build(tmp_path / "x.zim")).read_bytes()
+    meta_len = HEADER.unpack_from(data, 0)[2]
+    assert (HEADER.size + meta_len) % 8 == 0
+    meta = data[HEADER.size : HEADER.size + meta_len]
+    padding = meta[meta.rindex(b"}") + 1 :]
+    assert padding == b"\0" * len(padding)
+
+
+def test_prefix_is_in_key_order_and_bounded(tmp_path: Path) -> None:
+    archive = tmp_path / "x.zim"
+    _build(archive)
+    reader = TitleIndexReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None
+    keys = [key for key, _ in reader.prefix("Kant", limit=10)]
+    assert keys == ["kant, immanuel", "kantian ethics"]
+    assert len(reader.prefix("Kant", limit=1)) == 1
+    assert reader.prefix("Zz", limit=10) == []
+    reader.close()
+
+
+def test_build_refuses_to_overwrite_without_force(tmp_path: Path) -> None:
+    archive = tmp_path / "x.zim"
+    _build(archive)
+    with pytest.raises(FileExistsError):
+        _build(archive)
+    _build(archive, RECORDS[:1], force=True)
+    reader = TitleIndexReader.open_for(str(archive), live_archive_uuid="u1")
+    assert reader is not None and len(reader) == 1
+    reader.close()
+
+
+def test_open_for_returns_none_when_absent(tmp_path: Path) -> None:
+    assert (
+        TitleIndexReader.open_for(str(tmp_path / "x.zim"), live_archive_uuid="u1")
+        is None
+    )
+
+
+def test_open_for_returns_none_on_uuid_mismatch(tmp_path: Path) -> None:
+    archive = tmp_path / "x.zim"
+    _build(archive, uuid="built-uuid")
+    assert TitleIndexReader.open_for(str(archive), live_archive_uuid="other") is None
+
+
+@pytest.mark.parametrize("damage", ["truncate", "schema", "empty"])
+def test_open_for_returns_none_on_damaged_file(tmp_path: Path, damage: str) -> None:
+    archive = tmp_path / "x.zim"
+    out = Path(_build(archive))
+    data = out.read_bytes()
+    if damage == "truncate":
+        out.write_bytes(data[:-3])
+    elif damage == "schema":
+        magic, _version, *rest = HEADER.unpack_from(data)
+        out.write_bytes(HEADER.pack(magic, 999, *rest) + data[HEADER.size :])
+    else:
+        out.write_bytes(b"")
+    assert TitleIndexReader.open_for(str(archive), live_archive_uuid="u1") is None
+
+
+def test_open_cached_reuses_and_reopens_after_rebuild(tmp_path: Path) -> None:
+    archive = tmp_path / "x.zim"
+    assert open_cached(archive, live_archive_uuid="u1") is None
+    out = _build(archive)
+    first = open_cached(archive, live_archive_uuid="u1")
+    assert first is not None
+    assert open_cached(archive, live_archive_uuid="u1") is first
+    # A different live UUID (the archive was replaced) is re-fingerprinted.
+    assert open_cached(archive, live_archive_uuid="u2") is None
+
+    _build(archive, RECORDS[:2], force=True)
+    st = os.stat(out)
+    os.utime(out, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = open_cached(archive, live_archive_uuid="u1")
+    assert second is not None and second is not first and len(second) == 2
+    # The superseded reader stays usable for a search already in flight.
+    assert first.lookup("zurich")
+    os.remove(out)
+    assert open_cached(archive, live_archive_uuid="u1") is None
+    assert sidecar_path_for(archive) not in reader_mod._cache
@@ -0,0 +1,158 @@
+"""Title lookups answered from a real archive's title-index sidecar.
+
+Builds a small ZIM with libzim's ``Creator``, runs ``build_title_index`` on
+it, and drives ``find_entry_by_title_data``, the typo sweep and the
+canonical-prefix probe through the sidecar.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from libzim.writer import Creator, Hint
+
+import openzim_mcp.zim_operations as zim_ops_mod
+from openzim_mcp.titleindex.builder import build_title_index, iter_title_records
+from openzim_mcp.titleindex.reader import sidecar_path_for
+from openzim_mcp.zim_operations import zim_archive
+from tests.conftest_v2_fixtures import _HtmlItem, make_zim_ops
+
+ARTICLES = [
+    ("A/Zurich", "Zürich"),
+    ("A/Albert_Einstein", "Albert Einstein"),
+    ("A/Apple", "Apple"),
+    ("A/APPLE", "APPLE"),
+    ("A/Photosynthesis", "Photosynthesis"),
+    ("A/Photosynthesis_(song)", "Photosynthesis (song)"),
+    ("A/Photosynthetic_efficiency", "Photosynthetic efficiency"),
+    ("A/medlineplus-diabetes", "Diabetes | MedlinePlus"),
+]
+
+
+def _build_zim(out: Path) -> Path:
+    with Creator(out).config_indexing(False, "eng") as creator:
+        for path, title in ARTICLES:
+            creator.add_item(
+                _HtmlItem(path, title, f"<html><body><p>{title}</p></body></html>")
+            )
+        creator.add_redirection(
+            "A/Einstein", "Einstein", "A/Albert_Einstein", {Hint.FRONT_ARTICLE: 1}
+        )
+        creator.set_mainpath("A/Zurich")
+    return out
+
+
+@pytest.fixture(scope="module")
+def indexed_zim(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    zim = _build_zim(tmp_path_factory.mktemp("titleindex") / "titles.zim")
+    build_title_index(str(zim))
+    return zim
+
+
+def _no_suggestions(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _refuse(*_args, **_kwargs):
+        raise AssertionError("libzim suggestion search used despite the sidecar")
+
+    monkeypatch.setattr(zim_ops_mod, "SuggestionSearcher", _refuse)
+
+
+def test_iter_title_records_resolves_redirects(indexed_zim: Path) -> None:
+    with zim_archive(indexed_zim) as archive:
+        records = set(iter_title_records(archive))
+    assert ("Einstein", "Albert Einstein", "A/Albert_Einstein", "A/Einstein") in records
+    assert ("Zürich", "Zürich", "A/Zurich", "A/Zurich") in records
+
+
+def test_accent_and_case_folded_title_is_a_direct_hit(indexed_zim: Path) -> None:
+    ops = make_zim_ops(str(indexed_zim.parent))
+    data = ops.find_entry_by_title_data(str(indexed_zim), "zurich")
+    top = data["results"][0]
+    assert (top["path"], top["title"], top["score"]) == ("A/Zurich", "Zürich", 1.0)
+    assert top["match_type"] == "direct"
+    assert data["fast_path_hit"] is True
+
+
+def test_redirect_title_reports_canonical_and_pre_redirect_path(
+    indexed_zim: Path,
+) -> None:
+    ops = make_zim_ops(str(indexed_zim.parent))
+    top = ops.find_entry_by_title_data(str(indexed_zim), "einstein")["results"][0]
+    assert top["path"] == "A/Albert_Einstein"
+    assert top["match_type"] == "redirect"
+    assert top["pre_redirect_path"] == "A/Einstein"
+
+
+def test_folded_collision_ranks_like_the_case_variant_probe(
+    indexed_zim: Path,
+) -> None:
+    ops = make_zim_ops(str(indexed_zim.parent))
+    with zim_archive(indexed_zim) as archive:
+        assert ops._fast_path_row(archive, "apple", "f")["path"] == "A/Apple"
+        assert ops._fast_path_row(archive, "APPLE", "f")["path"] == "A/APPLE"
+
+
+def test_typo_sweep_runs_on_the_sidecar(
+    indexed_zim: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ops = make_zim_ops(str(indexed_zim.parent))
+    _no_suggestions(monkeypatch)
+    with zim_archive(indexed_zim) as archive:
+        best, verified = ops._find_entry_typo_fallback_with_suggestions(
+            archive, "Photosynthesys", suggestion_limit=3
+        )
+        assert best is not None and best.path == "A/Photosynthesis"
+        assert verified[0] == "Photosynthesis"
+        # Whole-word prefix: "Diabetes" verifies the site-suffixed title.
+        best, _ = ops._find_entry_typo_fallback_with_suggestions(
+            archive, "Diabetis", suggestion_limit=3
+        )
+        assert best is not None and best.path == "A/medlineplus-diabetes"
+
+
+def test_canonical_prefix_from_the_sidecar(
+    indexed_zim: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ops = make_zim_ops(str(indexed_zim.parent))
+    _no_suggestions(monkeypatch)
+    with zim_archive(indexed_zim) as archive:
+        canonical = ops._find_canonical_prefix_match(archive, "photosynth", [])
+        assert canonical == {
+            "text": "Photosynthesis",
+            "path": "A/Photosynthesis",
+            "type": "title_start_match",
+        }
+        existing = [{"text": "Photosynthesis", "path": "A/Photosynthesis"}]
+        assert ops._find_canonical_prefix_match(archive, "photosynth", existing) is None
+
+
+def test_stale_sidecar_is_ignored(tmp_path: Path) -> None:
+    zim = _build_zim(tmp_path / "titles.zim")
+    build_title_index(str(zim))
+    # Rebuilding the archive gives it a new UUID; the old sidecar is stale.
+    zim.unlink()
+    _build_zim(zim)
+    ops = make_zim_ops(str(tmp_path))
+    with zim_archive(zim) as archive:
+        assert ops._title_index_for(archive) is None
+        assert ops._fast_path_row(archive, "Apple", "f")["path"] == "A/Apple"
+    assert Path(sidecar_path_for(zim)).exists()
+
+
+@pytest.mark.parametrize("lookup", ["probes", "sidecar"])
+def test_typo_sweep_benchmark(
+    benchmark, indexed_zim: Path, monkeypatch: pytest.MonkeyPatch, lookup: str
+) -> None:
+    """A zero-hit typo sweep, through libzim probes vs the sidecar."""
+    ops = make_zim_ops(str(indexed_zim.parent))
+    if lookup == "probes":
+        monkeypatch.setattr(type(ops), "_title_index_for", staticmethod(lambda a: None))
+    benchmark.group = "typo_sweep"
+    with zim_archive(indexed_zim) as archive:
+        benchmark.pedantic(
+            ops._find_entry_typo_fallback_with_suggestions,
+            args=(archive, "Quarkonium"),
+            kwargs={"suggestion_limit": 3},
+            rounds=5,
+            warmup_rounds=1,
+        )